@@ -19,6 +19,10 @@
 
 
 import os
+import time
+import shutil
+import tempfile
+import weakref
 import xarray as xr
 import numpy as np
 import pandas as pd
@@ -32,11 +36,31 @@ import luto.economics.non_agricultural.quantity as non_ag_quantity
 
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Literal, Optional
 from affine import Affine
+from joblib import Parallel, delayed
+from scipy import sparse
 from scipy.interpolate import interp1d
 
-from luto.tools.spatializers import upsample_array
+from luto.tools.spatializers import upsample_array, get_bilinear_interp_matrix
+from luto.tools.npy_store import get_checked_npy_store_path, read_npy_store, write_npy_store
+from luto.tools.excel_tables import read_excel_sheet
+from luto.tools.trajectory import Trajectory
+from luto.tools.region_index import RegionIndex
+from luto.tools.array_table import ArrayTable
+from luto.tools.lu_lookup import get_lu_lookup
+from luto.tools.year_layers import read_year_layer
+
+
+# Data attribute holding the per-land-use parameter tables of each table-driven agricultural management option.
+AG_MAN_DATA_ATTRS = {
+    'Asparagopsis taxiformis': 'ASPARAGOPSIS_DATA',
+    'Precision Agriculture': 'PRECISION_AGRICULTURE_DATA',
+    'Ecological Grazing': 'ECOLOGICAL_GRAZING_DATA',
+    'AgTech EI': 'AGTECH_EI_DATA',
+    'Biochar': 'BIOCHAR_DATA',
+}
 
 
 def dict2matrix(d, fromlist, tolist):
@@ -49,15 +73,18 @@ def dict2matrix(d, fromlist, tolist):
     return A
 
 
-def get_base_am_vars(ncells, ncms, n_ag_lus):
+def get_base_am_vars(ncells, ncms):
     """
     Get the 2010 agricultural management option vars.
     It is assumed that no agricultural management options were used in 2010,
     so get zero arrays in the correct format.
+
+    Like all agricultural management arrays, each option only stores the land uses it applies to,
+    i.e., [m, r, j_idx] where j_idx indexes `settings.AG_MANAGEMENTS_TO_LAND_USES[am]`.
     """
     am_vars = {}
-    for am in settings.AG_MANAGEMENTS_TO_LAND_USES:
-        am_vars[am] = np.zeros((ncms, ncells, n_ag_lus))
+    for am, am_lus in settings.AG_MANAGEMENTS_TO_LAND_USES.items():
+        am_vars[am] = np.zeros((ncms, ncells, len(am_lus)), dtype=np.float32)
 
     return am_vars
 
@@ -105,10 +132,116 @@ def lumap2non_ag_l_mk(lumap, num_non_ag_land_uses: int):
     return x_rk.astype(bool)
 
 
+
+def read_masked_hdf(fpath: str, cell_idx: np.ndarray, npy_store_path: Optional[str] = None) -> tuple[str, pd.DataFrame, float]:
+    """
+    Read the cell-level layer `fpath` (HDF5 table), keeping only the rows (cells) in `cell_idx`.
+    If `npy_store_path` is given, the layer is read from its memory-mapped copy in the npy store instead.
+
+    Returns the file name, the dataframe, and the time taken to read it (seconds).
+    """
+    start = time.time()
+    if npy_store_path is not None:
+        df = read_npy_store(npy_store_path, cell_idx)
+    else:
+        df = pd.read_hdf(fpath, where=cell_idx)
+    return os.path.basename(fpath), df, time.time() - start
+
+
+def get_input_store_path(fpath: str) -> Optional[str]:
+    """
+    Return the npy store path of the cell-level layer `fpath` if `settings.INPUT_STORE` is 'npy', otherwise None.
+    The layer is converted again if `fpath` has changed since it was added to the npy store.
+    """
+    if settings.INPUT_STORE == 'npy':
+        return get_checked_npy_store_path(fpath)
+    elif settings.INPUT_STORE == 'hdf':
+        return None
+    else:
+        raise ValueError(f"Unknown INPUT_STORE: {settings.INPUT_STORE}. Must be 'hdf' or 'npy'.")
+
+
+def write_masked_hdf(fpath: str, cell_idx: np.ndarray, out_dir: str) -> tuple[str, str, float]:
+    """
+    Read the cell-level layer `fpath` (HDF5 table), keeping only the rows (cells) in `cell_idx`, and write it
+    to `out_dir` in the npy store format. Worker processes return the layer by path, instead of pickling it.
+
+    Returns the file name, `out_dir`, and the time taken to read and write it (seconds).
+    """
+    start = time.time()
+    write_npy_store(pd.read_hdf(fpath, where=cell_idx), out_dir)
+    return os.path.basename(fpath), out_dir, time.time() - start
+
+
+class MaskedLayers(dict):
+    """
+    {file name: (npy store directory, rows to read)} of the cell-level layers prepared by `read_masked_hdfs`.
+
+    `pop(file name)` reads a layer into memory when it is consumed, so only the layers in use are held.
+    Layers written to the temporary directory `tmp_dir` are deleted once read, and `tmp_dir` is removed
+    together with this object.
+    """
+
+    def __init__(self, tmp_dir: Optional[str] = None):
+        super().__init__()
+        self.tmp_dir = tmp_dir
+        if tmp_dir is not None:
+            weakref.finalize(self, shutil.rmtree, tmp_dir, True)
+
+    def pop(self, fname: str) -> pd.Series | pd.DataFrame:
+        store_dir, cell_idx = super().pop(fname)
+        layer = read_npy_store(store_dir, cell_idx)
+        if self.tmp_dir is not None:
+            # Detach from the memory-mapped files before deleting them
+            layer = layer.copy(deep=True)
+            shutil.rmtree(store_dir, ignore_errors=True)
+        return layer
+
+
+def read_masked_hdfs(fpaths: list[str], mask: np.ndarray) -> MaskedLayers:
+    """
+    Prepare the cell-level layers in `fpaths` to be read for the cells in `mask`; see `MaskedLayers`.
+
+    Layers in the npy store (`settings.INPUT_STORE` is 'npy') are only gathered from their memory-mapped
+    columns when consumed. HDF5 layers are read by up to `settings.READ_THREADS` worker processes (if
+    `settings.PARALLEL_READ`), which write the masked cells to a temporary npy store under
+    `settings.DATA_CACHE_DIR`; the time taken to read each file is reported.
+    """
+    cell_idx = np.flatnonzero(mask)
+    store_paths = {fpath: get_input_store_path(fpath) for fpath in fpaths}
+
+    if settings.INPUT_STORE == 'npy':
+        layers = MaskedLayers()
+        for fpath, store_path in store_paths.items():
+            layers[os.path.basename(fpath)] = (store_path, cell_idx)
+        return layers
+
+    n_jobs = min(settings.READ_THREADS, len(fpaths)) if settings.PARALLEL_READ else 1
+    start = time.time()
+
+    os.makedirs(settings.DATA_CACHE_DIR, exist_ok=True)
+    layers = MaskedLayers(tempfile.mkdtemp(prefix='masked_layers_', dir=settings.DATA_CACHE_DIR))
+    timings = {}
+    tasks = [
+        delayed(write_masked_hdf)(fpath, cell_idx, os.path.join(layers.tmp_dir, str(i)))
+        for i, fpath in enumerate(fpaths)
+    ]
+    for fname, out_dir, elapsed in Parallel(n_jobs=n_jobs, return_as='generator_unordered')(tasks):
+        layers[fname] = (out_dir, slice(None))
+        timings[fname] = elapsed
+
+    for fname, elapsed in sorted(timings.items(), key=lambda x: x[1], reverse=True):
+        print(f"\t\t{fname:<60} {elapsed:6.1f}s", flush=True)
+    print(f"\t\tRead {len(fpaths)} files from the {settings.INPUT_STORE} store in {time.time() - start:.1f}s (sum of file times {sum(timings.values()):.1f}s)", flush=True)
+
+    return layers
+
+
 @dataclass
 class Data:
     """
-    Contains all data required for the LUTO model to run. Loads all data upon initialisation.
+    Contains all data required for the LUTO model to run. Loads all data upon initialisation,
+    except optional layers which are only loaded when enabled in settings or first accessed.
     """
 
     def __init__(self) -> None:
@@ -134,6 +267,11 @@ class Data:
         self.prod_data = {}
         self.obj_vals = {}
 
+        # Place holder for the year-independent solver inputs to avoid recalculating them for every solve,
+        # and for the inputs that only depend on the base year land-use map, to only update the changed cells.
+        self.SOLVER_BASE_YR_CONSTANTS = {}      # {name: value}; see `input_data.get_base_yr_constant`
+        self.SOLVER_LUMAP_COMPONENTS = {}       # {name: (lumap, value)}; see `input_data.get_lumap_component`
+
         print('')
         print(f'Beginning data initialisation at RES{settings.RESFACTOR}...')
 
@@ -203,16 +341,63 @@ class Data:
             )
 
 
+        ###############################################################
+        # Read cell-level layers.
+        ###############################################################
+        print("\tReading cell-level layers...", flush=True)
+
+        # These layers only depend on MASK, so they are all prepared up front (HDF5 layers are read
+        # concurrently if settings.PARALLEL_READ) and then loaded as they are consumed by the derivations below.
+        masked_layers = read_masked_hdfs(
+            [
+                os.path.join(settings.INPUT_DIR, fname) for fname in [
+                    "agec_crops.h5",
+                    "agec_lvstk.h5",
+                    "climate_change_impacts_" + settings.RCP + "_CO2_FERT_" + settings.CO2_FERT.upper() + ".h5",
+                    "feed_req.h5",
+                    "pasture_kg_dm_ha.h5",
+                    "safe_pur_natl.h5",
+                    "safe_pur_modl.h5",
+                    "soil_carbon_t_ha.h5",
+                    "stream_length_m_cell.h5",
+                    "agGHG_crops.h5",
+                    "agGHG_lvstk.h5",
+                    "agGHG_irrpast.h5",
+                    "ep_est_cost_ha.h5",
+                    "cp_est_cost_ha.h5",
+                    "fire_risk.h5",
+                    "ep_block_avg_t_co2_ha_yr.h5",
+                    "ep_belt_avg_t_co2_ha_yr.h5",
+                    "ep_rip_avg_t_co2_ha_yr.h5",
+                    "cp_block_avg_t_co2_ha_yr.h5",
+                    "cp_belt_avg_t_co2_ha_yr.h5",
+                    "water_licence_price.h5",
+                    "water_delivery_price.h5",
+                    "rivreg_id.h5",
+                    "draindiv_id.h5",
+                    "water_yield_baselines.h5",
+                    "natural_land_t_co2_ha.h5",
+                    "cell_savanna_burning.h5",
+                    "bio_OVERALL_PRIORITY_RANK_AND_AREA_CONNECTIVITY.h5",
+                    "cell_BECCS_df.h5",
+                ]
+            ],
+            self.MASK,
+        )
+
+
+
         ###############################################################
         # Load agricultural crop and livestock data.
         ###############################################################
         print("\tLoading agricultural crop and livestock data...", flush=True)
-        self.AGEC_CROPS = pd.read_hdf(os.path.join(settings.INPUT_DIR, "agec_crops.h5"), where=self.MASK)
-        self.AGEC_LVSTK = pd.read_hdf(os.path.join(settings.INPUT_DIR, "agec_lvstk.h5"), where=self.MASK)
+        # Stored as float32 column blocks indexed by column label, e.g., AGEC_CROPS['Yield', 'dry', 'Winter cereals'], AGEC_LVSTK['F1', 'BEEF'].
+        self.AGEC_CROPS = ArrayTable.from_frame(masked_layers.pop("agec_crops.h5"))
+        self.AGEC_LVSTK = ArrayTable.from_frame(masked_layers.pop("agec_lvstk.h5"))
         
         # Price multipliers for livestock and crops over the years.
-        self.CROP_PRICE_MULTIPLIERS = pd.read_excel(os.path.join(settings.INPUT_DIR, "ag_price_multipliers.xlsx"), sheet_name="AGEC_CROPS", index_col="Year")
-        self.LVSTK_PRICE_MULTIPLIERS = pd.read_excel(os.path.join(settings.INPUT_DIR, "ag_price_multipliers.xlsx"), sheet_name="AGEC_LVSTK", index_col="Year")
+        self.CROP_PRICE_MULTIPLIERS = read_excel_sheet(os.path.join(settings.INPUT_DIR, "ag_price_multipliers.xlsx"), "AGEC_CROPS", index_col="Year")
+        self.LVSTK_PRICE_MULTIPLIERS = read_excel_sheet(os.path.join(settings.INPUT_DIR, "ag_price_multipliers.xlsx"), "AGEC_LVSTK", index_col="Year")
 
 
 
@@ -371,22 +556,22 @@ class Data:
         ###############################################################
         # Cost multiplier data.
         ###############################################################
-        cost_mult_excel = pd.ExcelFile(os.path.join(settings.INPUT_DIR, 'cost_multipliers.xlsx'))
-        self.AC_COST_MULTS = pd.read_excel(cost_mult_excel, "AC_multiplier", index_col="Year")
-        self.QC_COST_MULTS = pd.read_excel(cost_mult_excel, "QC_multiplier", index_col="Year")
-        self.FOC_COST_MULTS = pd.read_excel(cost_mult_excel, "FOC_multiplier", index_col="Year")
-        self.FLC_COST_MULTS = pd.read_excel(cost_mult_excel, "FLC_multiplier", index_col="Year")
-        self.FDC_COST_MULTS = pd.read_excel(cost_mult_excel, "FDC_multiplier", index_col="Year")
-        self.WP_COST_MULTS = pd.read_excel(cost_mult_excel, "WP_multiplier", index_col="Year")["Water_delivery_price_multiplier"].to_dict()
-        self.WATER_LICENSE_COST_MULTS = pd.read_excel(cost_mult_excel, "Water License Cost multiplier", index_col="Year")["Water_license_cost_multiplier"].to_dict()
-        self.EST_COST_MULTS = pd.read_excel(cost_mult_excel, "Establishment cost multiplier", index_col="Year")["Establishment_cost_multiplier"].to_dict()
-        self.MAINT_COST_MULTS = pd.read_excel(cost_mult_excel, "Maintennance cost multiplier", index_col="Year")["Maintennance_cost_multiplier"].to_dict()
-        self.TRANS_COST_MULTS = pd.read_excel(cost_mult_excel, "Transitions cost multiplier", index_col="Year")["Transitions_cost_multiplier"].to_dict()
-        self.SAVBURN_COST_MULTS = pd.read_excel(cost_mult_excel, "Savanna burning cost multiplier", index_col="Year")["Savanna_burning_cost_multiplier"].to_dict()
-        self.IRRIG_COST_MULTS = pd.read_excel(cost_mult_excel, "Irrigation cost multiplier", index_col="Year")["Irrigation_cost_multiplier"].to_dict()
-        self.BECCS_COST_MULTS = pd.read_excel(cost_mult_excel, "BECCS cost multiplier", index_col="Year")["BECCS_cost_multiplier"].to_dict()
-        self.BECCS_REV_MULTS = pd.read_excel(cost_mult_excel, "BECCS revenue multiplier", index_col="Year")["BECCS_revenue_multiplier"].to_dict()
-        self.FENCE_COST_MULTS = pd.read_excel(cost_mult_excel, "Fencing cost multiplier", index_col="Year")["Fencing_cost_multiplier"].to_dict()
+        cost_mult_excel = os.path.join(settings.INPUT_DIR, 'cost_multipliers.xlsx')
+        self.AC_COST_MULTS = read_excel_sheet(cost_mult_excel, "AC_multiplier", index_col="Year")
+        self.QC_COST_MULTS = read_excel_sheet(cost_mult_excel, "QC_multiplier", index_col="Year")
+        self.FOC_COST_MULTS = read_excel_sheet(cost_mult_excel, "FOC_multiplier", index_col="Year")
+        self.FLC_COST_MULTS = read_excel_sheet(cost_mult_excel, "FLC_multiplier", index_col="Year")
+        self.FDC_COST_MULTS = read_excel_sheet(cost_mult_excel, "FDC_multiplier", index_col="Year")
+        self.WP_COST_MULTS = read_excel_sheet(cost_mult_excel, "WP_multiplier", index_col="Year")["Water_delivery_price_multiplier"].to_dict()
+        self.WATER_LICENSE_COST_MULTS = read_excel_sheet(cost_mult_excel, "Water License Cost multiplier", index_col="Year")["Water_license_cost_multiplier"].to_dict()
+        self.EST_COST_MULTS = read_excel_sheet(cost_mult_excel, "Establishment cost multiplier", index_col="Year")["Establishment_cost_multiplier"].to_dict()
+        self.MAINT_COST_MULTS = read_excel_sheet(cost_mult_excel, "Maintennance cost multiplier", index_col="Year")["Maintennance_cost_multiplier"].to_dict()
+        self.TRANS_COST_MULTS = read_excel_sheet(cost_mult_excel, "Transitions cost multiplier", index_col="Year")["Transitions_cost_multiplier"].to_dict()
+        self.SAVBURN_COST_MULTS = read_excel_sheet(cost_mult_excel, "Savanna burning cost multiplier", index_col="Year")["Savanna_burning_cost_multiplier"].to_dict()
+        self.IRRIG_COST_MULTS = read_excel_sheet(cost_mult_excel, "Irrigation cost multiplier", index_col="Year")["Irrigation_cost_multiplier"].to_dict()
+        self.BECCS_COST_MULTS = read_excel_sheet(cost_mult_excel, "BECCS cost multiplier", index_col="Year")["BECCS_cost_multiplier"].to_dict()
+        self.BECCS_REV_MULTS = read_excel_sheet(cost_mult_excel, "BECCS revenue multiplier", index_col="Year")["BECCS_revenue_multiplier"].to_dict()
+        self.FENCE_COST_MULTS = read_excel_sheet(cost_mult_excel, "Fencing cost multiplier", index_col="Year")["Fencing_cost_multiplier"].to_dict()
 
 
 
@@ -434,14 +619,27 @@ class Data:
         ###############################################################
         print("\tLoading climate change data...", flush=True)
 
-        self.CLIMATE_CHANGE_IMPACT = pd.read_hdf(
-            os.path.join(settings.INPUT_DIR, "climate_change_impacts_" + settings.RCP + "_CO2_FERT_" + settings.CO2_FERT.upper() + ".h5"), where=self.MASK
+        climate_change_impact = masked_layers.pop(
+            "climate_change_impacts_" + settings.RCP + "_CO2_FERT_" + settings.CO2_FERT.upper() + ".h5"
         )
 
+        # Convert the impact multipliers [cell, (lm, lu, year)] to a dense tensor [year, lm, cell, ag lu] once, so that
+        # they can be interpolated for all land uses at once. There is no climate change impact in 2010 (i.e., the
+        # multipliers are ones), so 2010 is an anchor year but is not stored in the tensor. Land uses without impact
+        # data (e.g., dryland Pears/Rice do not occur) and missing values are given a multiplier of one.
+        cci_years = sorted({t[2] for t in climate_change_impact.columns})
+        self.CLIMATE_CHANGE_IMPACT_YEARS = np.array([2010] + cci_years)
+        self.CLIMATE_CHANGE_IMPACT_MRJ = np.ones((len(cci_years), self.NLMS, self.NCELLS, self.N_AG_LUS), dtype=np.float32)
+        for lm, lu, yr in climate_change_impact.columns:
+            if lu in self.DESC2AGLU:
+                self.CLIMATE_CHANGE_IMPACT_MRJ[cci_years.index(yr), self.LANDMANS.index(lm), :, self.DESC2AGLU[lu]] = (
+                    climate_change_impact[lm, lu, yr].fillna(1).to_numpy(dtype=np.float32)
+                )
+
         ###############################################################
-        # No-Go areas; Regional adoption constraints.
+        # No-Go areas.
         ###############################################################
-        print("\tLoading no-go areas and regional adoption zones...", flush=True)
+        print("\tLoading no-go areas...", flush=True)
    
         ##################### No-go areas
         self.NO_GO_LANDUSE_AG = []
@@ -487,41 +685,17 @@ class Data:
         
 
         
-        ##################### Regional adoption zones
-        if settings.REGIONAL_ADOPTION_CONSTRAINTS != "on":
-            self.REGIONAL_ADOPTION_ZONES = None
-            self.REGIONAL_ADOPTION_TARGETS = None
-        else:
-            self.REGIONAL_ADOPTION_ZONES = pd.read_hdf(
-                os.path.join(settings.INPUT_DIR, "regional_adoption_zones.h5"), where=self.MASK
-            )[settings.REGIONAL_ADOPTION_ZONE].to_numpy()
-        
-            regional_adoption_targets = pd.read_excel(os.path.join(settings.INPUT_DIR, "regional_adoption_zones.xlsx"), sheet_name=settings.REGIONAL_ADOPTION_ZONE)
-            self.REGIONAL_ADOPTION_TARGETS = regional_adoption_targets.iloc[
-                [idx for idx, row in regional_adoption_targets.iterrows() if
-                    all([row['ADOPTION_PERCENTAGE_2030']>=0, 
-                        row['ADOPTION_PERCENTAGE_2050']>=0, 
-                        row['ADOPTION_PERCENTAGE_2100']>=0])
-                ]
-            ]
-
         ###############################################################
         # Livestock related data.
         ###############################################################
         print("\tLoading livestock related data...", flush=True)
 
         self.FEED_REQ = np.nan_to_num(
-            pd.read_hdf(os.path.join(settings.INPUT_DIR, "feed_req.h5"), where=self.MASK).to_numpy()
+            masked_layers.pop("feed_req.h5").to_numpy()
         )
-        self.PASTURE_KG_DM_HA = pd.read_hdf(
-            os.path.join(settings.INPUT_DIR, "pasture_kg_dm_ha.h5"), where=self.MASK
-        ).to_numpy()
-        self.SAFE_PUR_NATL = pd.read_hdf(
-            os.path.join(settings.INPUT_DIR, "safe_pur_natl.h5"), where=self.MASK
-        ).to_numpy()
-        self.SAFE_PUR_MODL = pd.read_hdf(
-            os.path.join(settings.INPUT_DIR, "safe_pur_modl.h5"), where=self.MASK
-        ).to_numpy()
+        self.PASTURE_KG_DM_HA = masked_layers.pop("pasture_kg_dm_ha.h5").to_numpy()
+        self.SAFE_PUR_NATL = masked_layers.pop("safe_pur_natl.h5").to_numpy()
+        self.SAFE_PUR_MODL = masked_layers.pop("safe_pur_modl.h5").to_numpy()
 
 
 
@@ -530,124 +704,14 @@ class Data:
         ###############################################################
         print("\tLoading agricultural management options' data...", flush=True)
 
-        # Asparagopsis taxiformis data
-        asparagopsis_file = os.path.join(settings.INPUT_DIR, "20250415_Bundle_MR.xlsx")
-        self.ASPARAGOPSIS_DATA = {}
-        self.ASPARAGOPSIS_DATA["Beef - modified land"] = pd.read_excel(
-            asparagopsis_file, sheet_name="MR bundle (ext cattle)", index_col="Year"
-        )
-        self.ASPARAGOPSIS_DATA["Sheep - modified land"] = pd.read_excel(
-            asparagopsis_file, sheet_name="MR bundle (sheep)", index_col="Year"
-        )
-        self.ASPARAGOPSIS_DATA["Dairy - natural land"] = pd.read_excel(
-            asparagopsis_file, sheet_name="MR bundle (dairy)", index_col="Year"
-        )
-        self.ASPARAGOPSIS_DATA["Dairy - modified land"] = self.ASPARAGOPSIS_DATA[
-            "Dairy - natural land"
-        ]
-
-        # Precision agriculture data
-        prec_agr_file = os.path.join(settings.INPUT_DIR, "20231101_Bundle_AgTech_NE.xlsx")
-        self.PRECISION_AGRICULTURE_DATA = {}
-        int_cropping_data = pd.read_excel(
-            prec_agr_file, sheet_name="AgTech NE bundle (int cropping)", index_col="Year"
-        )
-        cropping_data = pd.read_excel(
-            prec_agr_file, sheet_name="AgTech NE bundle (cropping)", index_col="Year"
-        )
-        horticulture_data = pd.read_excel(
-            prec_agr_file, sheet_name="AgTech NE bundle (horticulture)", index_col="Year"
-        )
-
-        for lu in [
-            "Hay",
-            "Summer cereals",
-            "Summer legumes",
-            "Summer oilseeds",
-            "Winter cereals",
-            "Winter legumes",
-            "Winter oilseeds",
-        ]:
-            # Cropping land uses
-            self.PRECISION_AGRICULTURE_DATA[lu] = cropping_data
-
-        for lu in ["Cotton", "Other non-cereal crops", "Rice", "Sugar", "Vegetables"]:
-            # Intensive Cropping land uses
-            self.PRECISION_AGRICULTURE_DATA[lu] = int_cropping_data
-
-        for lu in [
-            "Apples",
-            "Citrus",
-            "Grapes",
-            "Nuts",
-            "Pears",
-            "Plantation fruit",
-            "Stone fruit",
-            "Tropical stone fruit",
-        ]:
-            # Horticulture land uses
-            self.PRECISION_AGRICULTURE_DATA[lu] = horticulture_data
-
-        # Ecological grazing data
-        eco_grazing_file = os.path.join(settings.INPUT_DIR, "20231107_ECOGRAZE_Bundle.xlsx")
-        self.ECOLOGICAL_GRAZING_DATA = {}
-        self.ECOLOGICAL_GRAZING_DATA["Beef - modified land"] = pd.read_excel(
-            eco_grazing_file, sheet_name="Ecograze bundle (ext cattle)", index_col="Year"
-        )
-        self.ECOLOGICAL_GRAZING_DATA["Sheep - modified land"] = pd.read_excel(
-            eco_grazing_file, sheet_name="Ecograze bundle (sheep)", index_col="Year"
-        )
-        self.ECOLOGICAL_GRAZING_DATA["Dairy - modified land"] = pd.read_excel(
-            eco_grazing_file, sheet_name="Ecograze bundle (dairy)", index_col="Year"
-        )
-
         # Load soil carbon data, convert C to CO2e (x 44/12), and average over years
         self.SOIL_CARBON_AVG_T_CO2_HA = (
-            pd.read_hdf(os.path.join(settings.INPUT_DIR, "soil_carbon_t_ha.h5"), where=self.MASK).to_numpy(dtype=np.float32) 
+            masked_layers.pop("soil_carbon_t_ha.h5").to_numpy(dtype=np.float32) 
             * (44 / 12) 
             / settings.SOC_AMORTISATION
         )
 
 
-        # Load AgTech EI data
-        prec_agr_file = os.path.join(settings.INPUT_DIR, '20231107_Bundle_AgTech_EI.xlsx')
-        self.AGTECH_EI_DATA = {}
-        int_cropping_data = pd.read_excel( prec_agr_file, sheet_name='AgTech EI bundle (int cropping)', index_col='Year' )
-        cropping_data = pd.read_excel( prec_agr_file, sheet_name='AgTech EI bundle (cropping)', index_col='Year' )
-        horticulture_data = pd.read_excel( prec_agr_file, sheet_name='AgTech EI bundle (horticulture)', index_col='Year' )
-
-        for lu in ['Hay', 'Summer cereals', 'Summer legumes', 'Summer oilseeds',
-                'Winter cereals', 'Winter legumes', 'Winter oilseeds']:
-            # Cropping land uses
-            self.AGTECH_EI_DATA[lu] = cropping_data
-
-        for lu in ['Cotton', 'Other non-cereal crops', 'Rice', 'Sugar', 'Vegetables']:
-            # Intensive Cropping land uses
-            self.AGTECH_EI_DATA[lu] = int_cropping_data
-
-        for lu in ['Apples', 'Citrus', 'Grapes', 'Nuts', 'Pears',
-                'Plantation fruit', 'Stone fruit', 'Tropical stone fruit']:
-            # Horticulture land uses
-            self.AGTECH_EI_DATA[lu] = horticulture_data
-
-        # Load BioChar data
-        biochar_file = os.path.join(settings.INPUT_DIR, '20240918_Bundle_BC.xlsx')
-        self.BIOCHAR_DATA = {}
-        cropping_data = pd.read_excel( biochar_file, sheet_name='Biochar (cropping)', index_col='Year' )
-        horticulture_data = pd.read_excel( biochar_file, sheet_name='Biochar (horticulture)', index_col='Year' )
-
-        for lu in ['Hay', 'Summer cereals', 'Summer legumes', 'Summer oilseeds',
-                'Winter cereals', 'Winter legumes', 'Winter oilseeds']:
-            # Cropping land uses
-            self.BIOCHAR_DATA[lu] = cropping_data
-
-        for lu in ['Apples', 'Citrus', 'Grapes', 'Nuts', 'Pears',
-                'Plantation fruit', 'Stone fruit', 'Tropical stone fruit']:
-            # Horticulture land uses
-            self.BIOCHAR_DATA[lu] = horticulture_data
-
-
-
         ###############################################################
         # Productivity data.
         ###############################################################
@@ -657,6 +721,9 @@ class Data:
         fpath = os.path.join(settings.INPUT_DIR, "yieldincreases_bau2022.csv")
         self.BAU_PROD_INCR = pd.read_csv(fpath, header=[0, 1]).astype(np.float32)
 
+        # Place holder for the agricultural quantities of the most recently used years to avoid recalculating them every time.
+        self.AG_Q_BY_YR = {}                    # {yr_idx: {key: array}}; see `ag_quantity.get_quantity_cache`
+
 
 
 
@@ -667,9 +734,7 @@ class Data:
         print("\tLoading auxiliary spatial layers data...", flush=True)
 
         # Load stream length data in metres of stream per cell
-        self.STREAM_LENGTH = pd.read_hdf(
-            os.path.join(settings.INPUT_DIR, "stream_length_m_cell.h5"), where=self.MASK
-        ).to_numpy()
+        self.STREAM_LENGTH = masked_layers.pop("stream_length_m_cell.h5").to_numpy()
 
         # Calculate the proportion of the area of each cell within stream buffer (convert REAL_AREA from ha to m2 and divide m2 by m2)
         self.RP_PROPORTION =  (
@@ -689,9 +754,10 @@ class Data:
 
 
         # Load greenhouse gas emissions from agriculture
-        self.AGGHG_CROPS = pd.read_hdf(os.path.join(settings.INPUT_DIR, "agGHG_crops.h5"), where=self.MASK)
-        self.AGGHG_LVSTK = pd.read_hdf(os.path.join(settings.INPUT_DIR, "agGHG_lvstk.h5"), where=self.MASK)
-        self.AGGHG_IRRPAST = pd.read_hdf(os.path.join(settings.INPUT_DIR, "agGHG_irrpast.h5"), where=self.MASK)
+        # Stored as float32 column blocks indexed by column label, e.g., AGGHG_CROPS['CO2E_KG_HA_SOIL', 'dry', 'Winter cereals'], AGGHG_LVSTK['BEEF', 'CO2E_KG_HEAD_ENTERIC'].
+        self.AGGHG_CROPS = ArrayTable.from_frame(masked_layers.pop("agGHG_crops.h5"))
+        self.AGGHG_LVSTK = ArrayTable.from_frame(masked_layers.pop("agGHG_lvstk.h5"))
+        self.AGGHG_IRRPAST = ArrayTable.from_frame(masked_layers.pop("agGHG_irrpast.h5"))
 
 
         # Raw transition cost matrix. In AUD/ha and ordered lexicographically.
@@ -710,16 +776,16 @@ class Data:
         print("\tLoading non-agricultural data...", flush=True)
 
         # Load plantings economic data
-        self.EP_EST_COST_HA = pd.read_hdf(os.path.join(settings.INPUT_DIR, "ep_est_cost_ha.h5"), where=self.MASK).to_numpy(dtype=np.float32)
-        self.CP_EST_COST_HA = pd.read_hdf(os.path.join(settings.INPUT_DIR, "cp_est_cost_ha.h5"), where=self.MASK).to_numpy(dtype=np.float32)
+        self.EP_EST_COST_HA = masked_layers.pop("ep_est_cost_ha.h5").to_numpy(dtype=np.float32)
+        self.CP_EST_COST_HA = masked_layers.pop("cp_est_cost_ha.h5").to_numpy(dtype=np.float32)
 
         # Load fire risk data (reduced carbon sequestration by this amount)
-        fr_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, "fire_risk.h5"), where=self.MASK)
+        fr_df = masked_layers.pop("fire_risk.h5")
         fr_dict = {"low": "FD_RISK_PERC_5TH", "med": "FD_RISK_MEDIAN", "high": "FD_RISK_PERC_95TH"}
         fire_risk = fr_df[fr_dict[settings.FIRE_RISK]]
 
         # Load environmental plantings (block) GHG sequestration (aboveground carbon discounted by settings.RISK_OF_REVERSAL and settings.FIRE_RISK)
-        ep_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, "ep_block_avg_t_co2_ha_yr.h5"), where=self.MASK)
+        ep_df = masked_layers.pop("ep_block_avg_t_co2_ha_yr.h5")
         self.EP_BLOCK_AVG_T_CO2_HA = (
             ep_df.EP_BLOCK_AG_AVG_T_CO2_HA_YR * (fire_risk / 100) * (1 - settings.RISK_OF_REVERSAL)
             + ep_df.EP_BLOCK_BG_AVG_T_CO2_HA_YR
@@ -727,21 +793,21 @@ class Data:
 
 
         # Load environmental plantings (belt) GHG sequestration (aboveground carbon discounted by settings.RISK_OF_REVERSAL and settings.FIRE_RISK)
-        ep_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, "ep_belt_avg_t_co2_ha_yr.h5"), where=self.MASK)
+        ep_df = masked_layers.pop("ep_belt_avg_t_co2_ha_yr.h5")
         self.EP_BELT_AVG_T_CO2_HA = (
             (ep_df.EP_BELT_AG_AVG_T_CO2_HA_YR * (fire_risk / 100) * (1 - settings.RISK_OF_REVERSAL))
             + ep_df.EP_BELT_BG_AVG_T_CO2_HA_YR
         ).to_numpy(dtype=np.float32)
 
         # Load environmental plantings (riparian) GHG sequestration (aboveground carbon discounted by settings.RISK_OF_REVERSAL and settings.FIRE_RISK)
-        ep_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, "ep_rip_avg_t_co2_ha_yr.h5"), where=self.MASK)
+        ep_df = masked_layers.pop("ep_rip_avg_t_co2_ha_yr.h5")
         self.EP_RIP_AVG_T_CO2_HA = (
             (ep_df.EP_RIP_AG_AVG_T_CO2_HA_YR * (fire_risk / 100) * (1 - settings.RISK_OF_REVERSAL))
             + ep_df.EP_RIP_BG_AVG_T_CO2_HA_YR
         ).to_numpy(dtype=np.float32)
 
         # Load carbon plantings (block) GHG sequestration (aboveground carbon discounted by settings.RISK_OF_REVERSAL and settings.FIRE_RISK)
-        cp_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, "cp_block_avg_t_co2_ha_yr.h5"), where=self.MASK)
+        cp_df = masked_layers.pop("cp_block_avg_t_co2_ha_yr.h5")
         self.CP_BLOCK_AVG_T_CO2_HA = (
             (cp_df.CP_BLOCK_AG_AVG_T_CO2_HA_YR * (fire_risk / 100) * (1 - settings.RISK_OF_REVERSAL))
             + cp_df.CP_BLOCK_BG_AVG_T_CO2_HA_YR
@@ -749,7 +815,7 @@ class Data:
 
 
         # Load farm forestry [i.e. carbon plantings (belt)] GHG sequestration (aboveground carbon discounted by settings.RISK_OF_REVERSAL and settings.FIRE_RISK)
-        cp_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, "cp_belt_avg_t_co2_ha_yr.h5"), where=self.MASK)
+        cp_df = masked_layers.pop("cp_belt_avg_t_co2_ha_yr.h5")
         self.CP_BELT_AVG_T_CO2_HA = (
             (cp_df.CP_BELT_AG_AVG_T_CO2_HA_YR * (fire_risk / 100) * (1 - settings.RISK_OF_REVERSAL))
             + cp_df.CP_BELT_BG_AVG_T_CO2_HA_YR
@@ -774,53 +840,35 @@ class Data:
         # Initialize water constraints to avoid recalculating them every time.
         self.WATER_YIELD_LIMITS = None
 
-        # Water requirements by land use -- LVSTK.
-        wreq_lvstk_dry = pd.DataFrame()
-        wreq_lvstk_irr = pd.DataFrame()
+        # Water requirements by land use; the rj-indexed arrays have zeroes where j is not livestock/crops.
+        self.WREQ_DRY_RJ = np.zeros((self.NCELLS, self.N_AG_LUS), dtype=np.float32)
+        self.WREQ_IRR_RJ = np.zeros((self.NCELLS, self.N_AG_LUS), dtype=np.float32)
 
-        # The rj-indexed arrays have zeroes where j is not livestock.
-        for lu in self.AGRICULTURAL_LANDUSES:
+        for j, lu in enumerate(self.AGRICULTURAL_LANDUSES):
             if lu in self.LU_LVSTK:
                 # First find out which animal is involved.
                 animal, _ = ag_quantity.lvs_veg_types(lu)
                 # Water requirements per head are for drinking and irrigation.
-                wreq_lvstk_dry[lu] = self.AGEC_LVSTK["WR_DRN", animal] * settings.LIVESTOCK_DRINKING_WATER
-                wreq_lvstk_irr[lu] = (
-                    self.AGEC_LVSTK["WR_IRR", animal] + self.AGEC_LVSTK["WR_DRN", animal] * settings.LIVESTOCK_DRINKING_WATER
-                )
-            else:
-                wreq_lvstk_dry[lu] = 0.0
-                wreq_lvstk_irr[lu] = 0.0
-
-        # Water requirements by land use -- CROPS.
-        wreq_crops_irr = pd.DataFrame()
-
-        # The rj-indexed arrays have zeroes where j is not a crop.
-        for lu in self.AGRICULTURAL_LANDUSES:
-            if lu in self.LU_CROPS:
-                wreq_crops_irr[lu] = self.AGEC_CROPS["WR", "irr", lu]
-            else:
-                wreq_crops_irr[lu] = 0.0
-
-        # Add together as they have nans where not lvstk/crops
-        self.WREQ_DRY_RJ = np.nan_to_num(wreq_lvstk_dry.to_numpy(dtype=np.float32))
-        self.WREQ_IRR_RJ = np.nan_to_num(wreq_crops_irr.to_numpy(dtype=np.float32)) + np.nan_to_num(
-            wreq_lvstk_irr.to_numpy(dtype=np.float32)
-        )
+                wreq_drink = self.AGEC_LVSTK["WR_DRN", animal] * settings.LIVESTOCK_DRINKING_WATER
+                self.WREQ_DRY_RJ[:, j] = np.nan_to_num(wreq_drink)
+                self.WREQ_IRR_RJ[:, j] = np.nan_to_num(self.AGEC_LVSTK["WR_IRR", animal] + wreq_drink)
+            elif lu in self.LU_CROPS:
+                self.WREQ_IRR_RJ[:, j] = np.nan_to_num(self.AGEC_CROPS["WR", "irr", lu])
 
         # Spatially explicit costs of a water licence per ML.
         self.WATER_LICENCE_PRICE = np.nan_to_num(
-                pd.read_hdf(os.path.join(settings.INPUT_DIR, "water_licence_price.h5"), where=self.MASK).to_numpy()
+                masked_layers.pop("water_licence_price.h5").to_numpy()
             )
 
         # Spatially explicit costs of water delivery per ML.
         self.WATER_DELIVERY_PRICE = np.nan_to_num(
-                pd.read_hdf(os.path.join(settings.INPUT_DIR, "water_delivery_price.h5"), where=self.MASK).to_numpy()
+                masked_layers.pop("water_delivery_price.h5").to_numpy()
             )
        
 
         # River regions.
-        self.RIVREG_ID = pd.read_hdf(os.path.join(settings.INPUT_DIR, "rivreg_id.h5"), where=self.MASK).to_numpy()  # River region ID mapped.
+        self.RIVREG_ID = masked_layers.pop("rivreg_id.h5").to_numpy()  # River region ID mapped.
+        self.RIVREG_INDEX = RegionIndex(self.RIVREG_ID, self.REAL_AREA)  # Cells and area of each river region.
  
         rr = pd.read_hdf(os.path.join(settings.INPUT_DIR, "rivreg_lut.h5"))
         self.RIVREG_DICT = dict(
@@ -831,7 +879,8 @@ class Data:
         )  # River region ID and water use limits
 
         # Drainage divisions
-        self.DRAINDIV_ID = pd.read_hdf(os.path.join(settings.INPUT_DIR, "draindiv_id.h5"), where=self.MASK).to_numpy()  # Drainage div ID mapped.
+        self.DRAINDIV_ID = masked_layers.pop("draindiv_id.h5").to_numpy()  # Drainage div ID mapped.
+        self.DRAINDIV_INDEX = RegionIndex(self.DRAINDIV_ID, self.REAL_AREA)  # Cells and area of each drainage division.
 
         dd = pd.read_hdf(os.path.join(settings.INPUT_DIR, "draindiv_lut.h5"))
         self.DRAINDIV_DICT = dict(
@@ -843,7 +892,7 @@ class Data:
 
 
         # Water yields -- run off from a cell into catchment by deep-rooted, shallow-rooted, and natural land
-        water_yield_baselines = pd.read_hdf(os.path.join(settings.INPUT_DIR, "water_yield_baselines.h5"), where=self.MASK)
+        water_yield_baselines = masked_layers.pop("water_yield_baselines.h5")
         self.WATER_YIELD_HIST_DR = water_yield_baselines['WATER_YIELD_HIST_DR_ML_HA'].to_numpy(dtype = np.float32)
         self.WATER_YIELD_HIST_SR = water_yield_baselines["WATER_YIELD_HIST_SR_ML_HA"].to_numpy(dtype = np.float32)
         self.DEEP_ROOTED_PROPORTION = water_yield_baselines['DEEP_ROOTED_PROPORTION'].to_numpy(dtype = np.float32)
@@ -851,12 +900,9 @@ class Data:
             'WATER_YIELD_HIST_DR_ML_HA * DEEP_ROOTED_PROPORTION + WATER_YIELD_HIST_SR_ML_HA * (1 - DEEP_ROOTED_PROPORTION)'
         ).to_numpy(dtype = np.float32)
 
-        wyield_fname_dr = os.path.join(settings.INPUT_DIR, 'water_yield_ssp' + str(settings.SSP) + '_2010-2100_dr_ml_ha.h5')
-        wyield_fname_sr = os.path.join(settings.INPUT_DIR, 'water_yield_ssp' + str(settings.SSP) + '_2010-2100_sr_ml_ha.h5')
-        
-        # Read water yield data
-        self.WATER_YIELD_DR_FILE = pd.read_hdf(wyield_fname_dr, where=self.MASK).T.values
-        self.WATER_YIELD_SR_FILE = pd.read_hdf(wyield_fname_sr, where=self.MASK).T.values
+        # Read water yield data; (year, cell) arrays memory-mapped from a year-major copy, so only the years used are read from disk
+        self.WATER_YIELD_DR_FILE = read_year_layer(os.path.join(settings.INPUT_DIR, 'water_yield_ssp' + str(settings.SSP) + '_2010-2100_dr_ml_ha.h5'), np.flatnonzero(self.MASK))
+        self.WATER_YIELD_SR_FILE = read_year_layer(os.path.join(settings.INPUT_DIR, 'water_yield_ssp' + str(settings.SSP) + '_2010-2100_sr_ml_ha.h5'), np.flatnonzero(self.MASK))
         
 
         # Water yield from outside LUTO study area.
@@ -907,7 +953,7 @@ class Data:
         '''
     
         # Load the natural land carbon data.
-        nat_land_CO2 = pd.read_hdf(os.path.join(settings.INPUT_DIR, "natural_land_t_co2_ha.h5"), where=self.MASK)
+        nat_land_CO2 = masked_layers.pop("natural_land_t_co2_ha.h5")
         # Get the carbon sequestration in each natural land types
         co2e_stock_unall_natural = np.array(
             nat_land_CO2['NATURAL_LAND_TREES_DEBRIS_SOIL_TCO2_HA'] - (nat_land_CO2['NATURAL_LAND_AGB_DEBRIS_TCO2_HA'] * fire_risk.to_numpy() / 100),
@@ -990,18 +1036,15 @@ class Data:
             self.CARBON_PRICES = {yr: settings.CARBON_PRICE_COSTANT for yr in range(2010, 2101)}
         else:
             carbon_price_sheet = settings.CARBON_PRICES_FIELD or "Default"
-            carbon_price_usecols = "A,B"
+            carbon_price_usecols = [0, 1]          # Columns A and B
             carbon_price_col_names = ["Year", "Carbon_price_$_tCO2e"]
             carbon_price_sheet_index_col = "Year" # if carbon_price_sheet != "Default" else 0
-            carbon_price_sheet_header = 0         # if carbon_price_sheet != "Default" else None
-
-            self.CARBON_PRICES: dict[int, float] = pd.read_excel(
-                os.path.join(settings.INPUT_DIR, 'carbon_prices.xlsx'),
-                sheet_name=carbon_price_sheet,
-                usecols=carbon_price_usecols,
-                names=carbon_price_col_names,
-                header=carbon_price_sheet_header,
-                index_col=carbon_price_sheet_index_col,
+
+            self.CARBON_PRICES: dict[int, float] = (
+                read_excel_sheet(os.path.join(settings.INPUT_DIR, 'carbon_prices.xlsx'), carbon_price_sheet)
+                .iloc[:, carbon_price_usecols]
+                .set_axis(carbon_price_col_names, axis=1)
+                .set_index(carbon_price_sheet_index_col)
             )["Carbon_price_$_tCO2e"].to_dict()
             
 
@@ -1013,8 +1056,8 @@ class Data:
 
         # If GHG_LIMITS_TYPE == 'file' then import the Excel spreadsheet and import the results to a python dictionary {year: target (tCO2e), ...}
         if settings.GHG_LIMITS_TYPE == "file":
-            self.GHG_TARGETS = pd.read_excel(
-                os.path.join(settings.INPUT_DIR, "GHG_targets.xlsx"), sheet_name="Data", index_col="YEAR"
+            self.GHG_TARGETS = read_excel_sheet(
+                os.path.join(settings.INPUT_DIR, "GHG_targets.xlsx"), "Data", index_col="YEAR"
             )
             self.GHG_TARGETS = self.GHG_TARGETS[settings.GHG_LIMITS_FIELD].to_dict()
 
@@ -1042,7 +1085,7 @@ class Data:
         print("\tLoading savanna burning data...", flush=True)
 
         # Read in the dataframe
-        savburn_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, 'cell_savanna_burning.h5'), where=self.MASK)
+        savburn_df = masked_layers.pop('cell_savanna_burning.h5')
 
         # Load the columns as numpy arrays
         self.SAVBURN_ELIGIBLE =  savburn_df.ELIGIBLE_AREA.to_numpy()                    # 1 = areas eligible for early dry season savanna burning under the ERF, 0 = ineligible          
@@ -1067,7 +1110,7 @@ class Data:
         in order to enhance biodiversity and ecosystem functions and services, ecological integrity and connectivity.
         """
 
-        biodiv_raw = pd.read_hdf(os.path.join(settings.INPUT_DIR, 'bio_OVERALL_PRIORITY_RANK_AND_AREA_CONNECTIVITY.h5'), where=self.MASK)
+        biodiv_raw = masked_layers.pop('bio_OVERALL_PRIORITY_RANK_AND_AREA_CONNECTIVITY.h5')
         biodiv_contribution_lookup = pd.read_csv(os.path.join(settings.INPUT_DIR, 'bio_OVERALL_CONTRIBUTION_OF_LANDUSES.csv'))                              # TODO: rename: degrade -> AG_BIO_CONTRIBUTION
         
         
@@ -1117,14 +1160,14 @@ class Data:
         # ------------------ Habitat condition impacts for habitat conservation (GBF2) in 'priority degraded areas' regions ---------------
         
         # Get the mask of 'priority degraded areas' for habitat conservation
-        conservation_performance_curve = pd.read_excel(os.path.join(settings.INPUT_DIR, 'BIODIVERSITY_GBF2_conservation_performance.xlsx'), sheet_name=f'ssp{settings.SSP}'
+        conservation_performance_curve = read_excel_sheet(os.path.join(settings.INPUT_DIR, 'BIODIVERSITY_GBF2_conservation_performance.xlsx'), f'ssp{settings.SSP}'
         ).set_index('AREA_COVERAGE_PERCENT')['PRIORITY_RANK'].to_dict()
         
         self.BIO_PRIORITY_DEGRADED_AREAS_MASK = (
             bio_contribution_raw >= conservation_performance_curve[settings.GBF2_PRIORITY_DEGRADED_AREAS_PERCENTAGE_CUT]
         )
         
-        self.BIO_PRIORITY_DEGRADED_AREAS_LY_BASE_YR = np.vectorize(self.BIO_HABITAT_CONTRIBUTION_LOOK_UP.get, otypes=[np.float32])(self.LUMAP) * self.BIO_PRIORITY_DEGRADED_AREAS_MASK
+        self.BIO_PRIORITY_DEGRADED_AREAS_LY_BASE_YR = get_lu_lookup(self.BIO_HABITAT_CONTRIBUTION_LOOK_UP, dtype=np.float32)[self.LUMAP] * self.BIO_PRIORITY_DEGRADED_AREAS_MASK
         
 
         
@@ -1135,9 +1178,9 @@ class Data:
         print("\tLoading vegetation data...", flush=True)
         
         # Read in the pre-1750 vegetation statistics, and get NVIS class names and areas
-        self.GBF3_BASELINE_AREA_AND_USERDEFINE_TARGETS = pd.read_excel(
+        self.GBF3_BASELINE_AREA_AND_USERDEFINE_TARGETS = read_excel_sheet(
             settings.INPUT_DIR + '/BIODIVERSITY_GBF3_SCORES_AND_TARGETS.xlsx',
-            sheet_name = f'NVIS_{settings.NVIS_TARGET_CLASS}'
+            f'NVIS_{settings.NVIS_TARGET_CLASS}'
         ).sort_values(by='group', ascending=True)
         
 
@@ -1153,29 +1196,22 @@ class Data:
         self.BIO_GBF3_BASELINE_SCORE_ALL_AUSTRALIA = self.GBF3_BASELINE_AREA_AND_USERDEFINE_TARGETS['AREA_WEIGHTED_SCORE_ALL_AUSTRALIA_HA'].to_numpy()
         self.BIO_GBF3_BASELINE_SCORE_OUTSIDE_LUTO = self.GBF3_BASELINE_AREA_AND_USERDEFINE_TARGETS['AREA_WEIGHTED_SCORE_OUTSIDE_LUTO_NATURAL_HA'].to_numpy()
         self.BIO_GBF3_N_CLASSES = self.BIO_GBF3_BASELINE_SCORE_ALL_AUSTRALIA.shape[0]
+
+        # Target percentage trajectory of each NVIS class; the base year percentage is capped by the 2030 target
+        GBF3_targets = self.GBF3_BASELINE_AREA_AND_USERDEFINE_TARGETS
+        self.BIO_GBF3_TARGET_TRAJECTORY = Trajectory(
+            [2010, 2030, 2050, 2100],
+            np.column_stack([
+                np.minimum(GBF3_targets['BASE_YR_PERCENT'], GBF3_targets['USER_DEFINED_TARGET_PERCENT_2030']),
+                GBF3_targets['USER_DEFINED_TARGET_PERCENT_2030'],
+                GBF3_targets['USER_DEFINED_TARGET_PERCENT_2050'],
+                GBF3_targets['USER_DEFINED_TARGET_PERCENT_2100'],
+            ])
+        )
       
 
-        # Read in vegetation layer data
-        NVIS_layers = xr.load_dataarray(settings.INPUT_DIR + f"/NVIS_{settings.NVIS_TARGET_CLASS.split('_')[0]}.nc") 
-        NVIS_layers = np.array([self.get_exact_resfactored_average_arr(arr) for arr in NVIS_layers], dtype=np.float32) / 100.0  # divide by 100 to get the percentage of the area in each cell that is covered by the vegetation type
 
-        # Apply Savanna Burning penalties
-        self.NVIS_LAYERS_LDS = np.where(
-            self.SAVBURN_ELIGIBLE,
-            NVIS_layers * settings.BIO_CONTRIBUTION_LDS,
-            NVIS_layers
-        )
-        
-        # Container storing which cells apply to each major vegetation group
-        epsilon = 1e-5
-        self.MAJOR_VEG_INDECES = {
-            v: np.where(NVIS_layers[v] > epsilon)[0]
-            for v in range(NVIS_layers.shape[0])
-        }
-            
-            
- 
-        
+
         ##########################################################################
         #  Biodiersity environmental significance (GBF4)                         #
         ##########################################################################
@@ -1233,28 +1269,33 @@ class Data:
         self.BIO_GBF4_SNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY_AND_MAYBE = BIO_GBF4_SNES_score.query(f'SCIENTIFIC_NAME in {self.BIO_GBF4_SNES_LIKELY_AND_MAYBE_SEL}')
         self.BIO_GBF4_ECNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY = BIO_GBF4_ECNES_score.query(f'COMMUNITY in {self.BIO_GBF4_ECNES_LIKELY_SEL}')
         self.BIO_GBF4_ECNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY_AND_MAYBE = BIO_GBF4_ECNES_score.query(f'COMMUNITY in {self.BIO_GBF4_ECNES_LIKELY_AND_MAYBE_SEL}')
+
+        # Target percentage trajectories and baseline scores, ordered as 'LIKELY' layers followed by 'LIKELY_MAYBE' layers
+        (
+            self.BIO_GBF4_SNES_TARGET_TRAJECTORY,
+            self.BIO_GBF4_SNES_BASELINE_SCORE_ALL_AUSTRALIA,
+            self.BIO_GBF4_SNES_BASELINE_SCORE_OUTSIDE_LUTO
+        ) = self.get_GBF4_target_trajectory(
+            self.BIO_GBF4_SNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY,
+            self.BIO_GBF4_SNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY_AND_MAYBE
+        )
+        (
+            self.BIO_GBF4_ECNES_TARGET_TRAJECTORY,
+            self.BIO_GBF4_ECNES_BASELINE_SCORE_ALL_AUSTRALIA,
+            self.BIO_GBF4_ECNES_BASELINE_SCORE_OUTSIDE_LUTO
+        ) = self.get_GBF4_target_trajectory(
+            self.BIO_GBF4_ECNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY,
+            self.BIO_GBF4_ECNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY_AND_MAYBE
+        )
         
-        BIO_GBF4_SPECIES_raw = xr.open_dataarray(f'{settings.INPUT_DIR}/bio_GBF4_SNES.nc', chunks={'species':1})
-        snes_arr_likely = BIO_GBF4_SPECIES_raw.sel(species=self.BIO_GBF4_SNES_LIKELY_SEL, presence='LIKELY')
-        snes_arr_likely_maybe = BIO_GBF4_SPECIES_raw.sel(species=self.BIO_GBF4_SNES_LIKELY_AND_MAYBE_SEL, presence='LIKELY_AND_MAYBE')
-        snes_arr = xr.concat([snes_arr_likely, snes_arr_likely_maybe], dim='species')
-        self.BIO_GBF4_SPECIES_LAYERS = np.array([self.get_exact_resfactored_average_arr(arr) for arr in snes_arr])
-                
-        BIO_GBF4_COMUNITY_raw = xr.open_dataarray(f'{settings.INPUT_DIR}/bio_GBF4_ECNES.nc', chunks={'species':1})
-        ecnes_arr_likely = BIO_GBF4_COMUNITY_raw.sel(species=self.BIO_GBF4_ECNES_LIKELY_SEL, cell=self.MASK, presence='LIKELY').compute()
-        ecnes_arr_likely_maybe = BIO_GBF4_COMUNITY_raw.sel(species=self.BIO_GBF4_ECNES_LIKELY_AND_MAYBE_SEL, cell=self.MASK, presence='LIKELY_AND_MAYBE').compute()
-        ecnes_arr = xr.concat([ecnes_arr_likely, ecnes_arr_likely_maybe], dim='species')
-        self.BIO_GBF4_COMUNITY_LAYERS = np.array([self.get_exact_resfactored_average_arr(arr) for arr in ecnes_arr])
-        
-  
-        
+
+
         ##########################################################################
         # Biodiersity species suitability under climate change (GBF8)            #
         ##########################################################################
         print("\tLoading Species suitability data...", flush=True)
         
         # Read in the species data from Carla Archibald (noted as GBF-8)
-        BIO_GBF8_SPECIES_raw = xr.open_dataset(f'{settings.INPUT_DIR}/bio_GBF8_ssp{settings.SSP}_EnviroSuit.nc', chunks={'year':1,'species':1})['data']        
         bio_GBF8_baseline_score = pd.read_csv(settings.INPUT_DIR + '/BIODIVERSITY_GBF8_SCORES.csv').sort_values(by='species', ascending=True)
         bio_GBF8_target_percent = pd.read_csv(settings.INPUT_DIR + '/BIODIVERSITY_GBF8_TARGET.csv').sort_values(by='species', ascending=True)
         
@@ -1269,11 +1310,35 @@ class Data:
         self.BIO_GBF8_BASELINE_SCORE_AND_TARGET_PERCENT_SPECIES = bio_GBF8_target_percent.query(f'species in {self.BIO_GBF8_SEL_SPECIES}')
         self.BIO_GBF8_BASELINE_SCORE_GROUPS = pd.read_csv(settings.INPUT_DIR + '/BIODIVERSITY_GBF8_TARGET_group.csv')
         
-        self.BIO_GBF8_SPECIES_LAYER = BIO_GBF8_SPECIES_raw.sel(species=self.BIO_GBF8_SEL_SPECIES).compute()
         self.N_GBF8_SPECIES = len(self.BIO_GBF8_SEL_SPECIES)
-        
-        self.BIO_GBF8_GROUPS_LAYER = xr.load_dataset(f'{settings.INPUT_DIR}/bio_GBF8_ssp{settings.SSP}_EnviroSuit_group.nc')['data']
-        self.BIO_GBF8_GROUPS_NAMES = [i.capitalize() for i in self.BIO_GBF8_GROUPS_LAYER['group'].values]
+
+        # Target percentage trajectory of each species for all Australia
+        GBF8_targets = self.BIO_GBF8_BASELINE_SCORE_AND_TARGET_PERCENT_SPECIES
+        self.BIO_GBF8_TARGET_TRAJECTORY = Trajectory(
+            [2010, 2030, 2050, 2100],
+            GBF8_targets[[
+                'HABITAT_SUITABILITY_BASELINE_PERCENT',
+                'USER_DEFINED_TARGET_PERCENT_2030',
+                'USER_DEFINED_TARGET_PERCENT_2050',
+                'USER_DEFINED_TARGET_PERCENT_2100'
+            ]]
+        )
+
+        # Suitability score trajectory of each species/group for the Outside LUTO natural land; the baseline score is taken as the 1990 score
+        self.BIO_GBF8_OUTSIDE_LUTO_TRAJECTORY = {
+            'species': self.get_GBF8_outside_LUTO_trajectory(
+                self.BIO_GBF8_OUTSDIE_LUTO_SCORE_SPECIES.pivot(index='species', columns='year'),
+                GBF8_targets['HABITAT_SUITABILITY_BASELINE_SCORE_OUTSIDE_LUTO']
+            ),
+            'group': self.get_GBF8_outside_LUTO_trajectory(
+                self.BIO_GBF8_OUTSDIE_LUTO_SCORE_GROUPS.pivot(index='group', columns='year'),
+                self.BIO_GBF8_BASELINE_SCORE_GROUPS['HABITAT_SUITABILITY_BASELINE_SCORE_OUTSIDE_LUTO']
+            ),
+        }
+
+        # Place holders for the GBF8 interpolation weights and layers to avoid recalculating them every time.
+        self.GBF8_INTERP = {}                   # {level: (years, raw layers [year, layer, y*x], cell interpolation matrix, cells outside grid)}
+        self.GBF8_LAYERS_BY_YR = {}             # {(yr, level): layers [layer, cell]}; only the most recent years are kept
         
 
         ###############################################################
@@ -1282,7 +1347,7 @@ class Data:
         print("\tLoading BECCS data...", flush=True)
 
         # Load dataframe
-        beccs_df = pd.read_hdf(os.path.join(settings.INPUT_DIR, 'cell_BECCS_df.h5'), where=self.MASK)
+        beccs_df = masked_layers.pop('cell_BECCS_df.h5')
 
         # Capture as numpy arrays
         self.BECCS_COSTS_AUD_HA_YR = beccs_df['BECCS_COSTS_AUD_HA_YR'].to_numpy()
@@ -1299,13 +1364,43 @@ class Data:
 
         self.HIR_MASK = np.load(os.path.join(settings.INPUT_DIR, "hir_mask.npy"))[self.MASK].astype(bool)
 
+        # Coefficients of the agricultural management options by (option, column); filled on first use by `get_ag_man_coefs`.
+        self.AG_MAN_COEFS = {}
+
+
+
+        ###############################################################
+        # Preload enabled optional layers.
+        ###############################################################
+        print("\tLoading optional data layers for enabled targets and management options...", flush=True)
+
+        optional_layers = {
+            'REGIONAL_ADOPTION_ZONE_INDEX': settings.REGIONAL_ADOPTION_CONSTRAINTS == 'on',
+            'REGIONAL_ADOPTION_ZONES': settings.REGIONAL_ADOPTION_CONSTRAINTS == 'on',
+            'REGIONAL_ADOPTION_TARGETS': settings.REGIONAL_ADOPTION_CONSTRAINTS == 'on',
+            'REGIONAL_ADOPTION_TARGET_TRAJECTORY': settings.REGIONAL_ADOPTION_CONSTRAINTS == 'on',
+            'ASPARAGOPSIS_DATA': settings.AG_MANAGEMENTS['Asparagopsis taxiformis'],
+            'PRECISION_AGRICULTURE_DATA': settings.AG_MANAGEMENTS['Precision Agriculture'],
+            'ECOLOGICAL_GRAZING_DATA': settings.AG_MANAGEMENTS['Ecological Grazing'],
+            'AGTECH_EI_DATA': settings.AG_MANAGEMENTS['AgTech EI'],
+            'BIOCHAR_DATA': settings.AG_MANAGEMENTS['Biochar'],
+            'NVIS_LAYERS_LDS': settings.BIODIVERSTIY_TARGET_GBF_3 == 'on',
+            'BIO_GBF4_SPECIES_LAYERS': settings.BIODIVERSTIY_TARGET_GBF_4_SNES == 'on',
+            'BIO_GBF4_COMUNITY_LAYERS': settings.BIODIVERSTIY_TARGET_GBF_4_ECNES == 'on',
+            'BIO_GBF8_SPECIES_LAYER': settings.BIODIVERSTIY_TARGET_GBF_8 == 'on',
+            'BIO_GBF8_GROUPS_LAYER': settings.BIODIVERSTIY_TARGET_GBF_8 == 'on',
+        }
+        for layer, enabled in optional_layers.items():
+            if enabled:
+                getattr(self, layer)
+
 
 
         ###############################################################
         # Calculate base year production 
         ###############################################################
 
-        self.AG_MAN_L_MRJ_DICT = get_base_am_vars(self.NCELLS, self.NLMS, self.N_AG_LUS)
+        self.AG_MAN_L_MRJ_DICT = get_base_am_vars(self.NCELLS, self.NLMS)
         self.add_ag_man_dvars(self.YR_CAL_BASE, self.AG_MAN_L_MRJ_DICT)
         
         print(f"\tCalculating base year productivity...", flush=True)
@@ -1317,6 +1412,255 @@ class Data:
         
            
 
+
+    ###############################################################
+    # Optional data layers.
+    #
+    # These are only needed when the corresponding target, constraint
+    # or agricultural management is switched on, so they are loaded
+    # on first access and memoised on the instance. Enabled layers are
+    # preloaded at the end of `__init__`.
+    ###############################################################
+
+    @cached_property
+    def REGIONAL_ADOPTION_ZONE_INDEX(self) -> dict[str, RegionIndex]:
+        # Index every zoning (ABARES_AAGIS, LGA_CODE, NRM_CODE, IBRA_ID, SLA_5DIGIT), not just the one constrained
+        fpath = os.path.join(settings.INPUT_DIR, "regional_adoption_zones.h5")
+        _, zones, _ = read_masked_hdf(fpath, np.flatnonzero(self.MASK), get_input_store_path(fpath))
+        return {zone: RegionIndex(zones[zone].to_numpy(), self.REAL_AREA) for zone in zones.columns}
+
+    @cached_property
+    def REGIONAL_ADOPTION_ZONES(self) -> np.ndarray:
+        return self.REGIONAL_ADOPTION_ZONE_INDEX[settings.REGIONAL_ADOPTION_ZONE].region_id
+
+    @cached_property
+    def REGIONAL_ADOPTION_TARGETS(self) -> pd.DataFrame:
+        regional_adoption_targets = read_excel_sheet(os.path.join(settings.INPUT_DIR, "regional_adoption_zones.xlsx"), settings.REGIONAL_ADOPTION_ZONE)
+        return regional_adoption_targets.iloc[
+            [idx for idx, row in regional_adoption_targets.iterrows() if
+                all([row['ADOPTION_PERCENTAGE_2030']>=0, 
+                    row['ADOPTION_PERCENTAGE_2050']>=0, 
+                    row['ADOPTION_PERCENTAGE_2100']>=0])
+            ]
+        ]
+
+    @cached_property
+    def REGIONAL_ADOPTION_TARGET_TRAJECTORY(self) -> Trajectory:
+        targets = self.REGIONAL_ADOPTION_TARGETS
+        return Trajectory(
+            [2010, 2030, 2050, 2100],
+            targets[['BASE_LANDUSE_AREA_PERCENT', 'ADOPTION_PERCENTAGE_2030', 'ADOPTION_PERCENTAGE_2050', 'ADOPTION_PERCENTAGE_2100']]
+        )
+
+    @cached_property
+    def ASPARAGOPSIS_DATA(self) -> dict[str, pd.DataFrame]:
+        asparagopsis_file = os.path.join(settings.INPUT_DIR, "20250415_Bundle_MR.xlsx")
+        asparagopsis_data = {}
+        asparagopsis_data["Beef - modified land"] = read_excel_sheet(
+            asparagopsis_file, "MR bundle (ext cattle)", index_col="Year"
+        )
+        asparagopsis_data["Sheep - modified land"] = read_excel_sheet(
+            asparagopsis_file, "MR bundle (sheep)", index_col="Year"
+        )
+        asparagopsis_data["Dairy - natural land"] = read_excel_sheet(
+            asparagopsis_file, "MR bundle (dairy)", index_col="Year"
+        )
+        asparagopsis_data["Dairy - modified land"] = asparagopsis_data[
+            "Dairy - natural land"
+        ]
+        return asparagopsis_data
+
+    @cached_property
+    def PRECISION_AGRICULTURE_DATA(self) -> dict[str, pd.DataFrame]:
+        prec_agr_file = os.path.join(settings.INPUT_DIR, "20231101_Bundle_AgTech_NE.xlsx")
+        prec_agr_data = {}
+        int_cropping_data = read_excel_sheet(
+            prec_agr_file, "AgTech NE bundle (int cropping)", index_col="Year"
+        )
+        cropping_data = read_excel_sheet(
+            prec_agr_file, "AgTech NE bundle (cropping)", index_col="Year"
+        )
+        horticulture_data = read_excel_sheet(
+            prec_agr_file, "AgTech NE bundle (horticulture)", index_col="Year"
+        )
+
+        for lu in [
+            "Hay",
+            "Summer cereals",
+            "Summer legumes",
+            "Summer oilseeds",
+            "Winter cereals",
+            "Winter legumes",
+            "Winter oilseeds",
+        ]:
+            # Cropping land uses
+            prec_agr_data[lu] = cropping_data
+
+        for lu in ["Cotton", "Other non-cereal crops", "Rice", "Sugar", "Vegetables"]:
+            # Intensive Cropping land uses
+            prec_agr_data[lu] = int_cropping_data
+
+        for lu in [
+            "Apples",
+            "Citrus",
+            "Grapes",
+            "Nuts",
+            "Pears",
+            "Plantation fruit",
+            "Stone fruit",
+            "Tropical stone fruit",
+        ]:
+            # Horticulture land uses
+            prec_agr_data[lu] = horticulture_data
+
+        return prec_agr_data
+
+    @cached_property
+    def ECOLOGICAL_GRAZING_DATA(self) -> dict[str, pd.DataFrame]:
+        eco_grazing_file = os.path.join(settings.INPUT_DIR, "20231107_ECOGRAZE_Bundle.xlsx")
+        eco_grazing_data = {}
+        eco_grazing_data["Beef - modified land"] = read_excel_sheet(
+            eco_grazing_file, "Ecograze bundle (ext cattle)", index_col="Year"
+        )
+        eco_grazing_data["Sheep - modified land"] = read_excel_sheet(
+            eco_grazing_file, "Ecograze bundle (sheep)", index_col="Year"
+        )
+        eco_grazing_data["Dairy - modified land"] = read_excel_sheet(
+            eco_grazing_file, "Ecograze bundle (dairy)", index_col="Year"
+        )
+        return eco_grazing_data
+
+    @cached_property
+    def AGTECH_EI_DATA(self) -> dict[str, pd.DataFrame]:
+        agtech_ei_file = os.path.join(settings.INPUT_DIR, '20231107_Bundle_AgTech_EI.xlsx')
+        agtech_ei_data = {}
+        int_cropping_data = read_excel_sheet( agtech_ei_file, 'AgTech EI bundle (int cropping)', index_col='Year' )
+        cropping_data = read_excel_sheet( agtech_ei_file, 'AgTech EI bundle (cropping)', index_col='Year' )
+        horticulture_data = read_excel_sheet( agtech_ei_file, 'AgTech EI bundle (horticulture)', index_col='Year' )
+
+        for lu in ['Hay', 'Summer cereals', 'Summer legumes', 'Summer oilseeds',
+                'Winter cereals', 'Winter legumes', 'Winter oilseeds']:
+            # Cropping land uses
+            agtech_ei_data[lu] = cropping_data
+
+        for lu in ['Cotton', 'Other non-cereal crops', 'Rice', 'Sugar', 'Vegetables']:
+            # Intensive Cropping land uses
+            agtech_ei_data[lu] = int_cropping_data
+
+        for lu in ['Apples', 'Citrus', 'Grapes', 'Nuts', 'Pears',
+                'Plantation fruit', 'Stone fruit', 'Tropical stone fruit']:
+            # Horticulture land uses
+            agtech_ei_data[lu] = horticulture_data
+
+        return agtech_ei_data
+
+    @cached_property
+    def BIOCHAR_DATA(self) -> dict[str, pd.DataFrame]:
+        biochar_file = os.path.join(settings.INPUT_DIR, '20240918_Bundle_BC.xlsx')
+        biochar_data = {}
+        cropping_data = read_excel_sheet( biochar_file, 'Biochar (cropping)', index_col='Year' )
+        horticulture_data = read_excel_sheet( biochar_file, 'Biochar (horticulture)', index_col='Year' )
+
+        for lu in ['Hay', 'Summer cereals', 'Summer legumes', 'Summer oilseeds',
+                'Winter cereals', 'Winter legumes', 'Winter oilseeds']:
+            # Cropping land uses
+            biochar_data[lu] = cropping_data
+
+        for lu in ['Apples', 'Citrus', 'Grapes', 'Nuts', 'Pears',
+                'Plantation fruit', 'Stone fruit', 'Tropical stone fruit']:
+            # Horticulture land uses
+            biochar_data[lu] = horticulture_data
+
+        return biochar_data
+
+    def get_ag_man_coefs(self, am: str, column: str, yr_idx: int) -> np.ndarray:
+        """
+        Return the coefficient `column` of the agricultural management option `am` in year `yr_idx`
+        for each of its land uses (ordered as in `settings.AG_MANAGEMENTS_TO_LAND_USES[am]`), shape (j,).
+
+        The per-land-use tables of `am` (e.g., `BIOCHAR_DATA`) are converted into a (year, land use)
+        array once per column. If a table has no column named exactly `column`, the column with the
+        same name in a different case is used (the sheets spell both 'CO2E_KG_HA_IRRIG' and 'CO2e_KG_HA_IRRIG').
+        """
+        if (am, column) not in self.AG_MAN_COEFS:
+            tables = getattr(self, AG_MAN_DATA_ATTRS[am])
+            coefs = []
+            for lu in settings.AG_MANAGEMENTS_TO_LAND_USES[am]:
+                table = tables[lu]
+                if column not in table.columns:
+                    table = table.rename(columns={col: column for col in table.columns if str(col).upper() == column.upper()})
+                coefs.append(table[column].rename(lu))
+            coefs = pd.concat(coefs, axis=1, join='inner')
+            self.AG_MAN_COEFS[am, column] = (
+                {yr: i for i, yr in enumerate(coefs.index)},
+                coefs.to_numpy(dtype=np.float64)
+            )
+
+        yr_rows, coefs = self.AG_MAN_COEFS[am, column]
+        return coefs[yr_rows[self.YR_CAL_BASE + yr_idx]]
+
+    def _load_NVIS_layers(self) -> None:
+        """
+        Load the NVIS layers and set both `NVIS_LAYERS_LDS` and `MAJOR_VEG_INDECES`,
+        so the raw layers are only read and resfactored once.
+        """
+        NVIS_layers = xr.load_dataarray(settings.INPUT_DIR + f"/NVIS_{settings.NVIS_TARGET_CLASS.split('_')[0]}.nc") 
+        NVIS_layers = self.get_exact_resfactored_average_stack(NVIS_layers).astype(np.float32) / 100.0  # divide by 100 to get the percentage of the area in each cell that is covered by the vegetation type
+
+        # Apply Savanna Burning penalties
+        self.__dict__['NVIS_LAYERS_LDS'] = np.where(
+            self.SAVBURN_ELIGIBLE,
+            NVIS_layers * settings.BIO_CONTRIBUTION_LDS,
+            NVIS_layers
+        )
+        
+        # Container storing which cells apply to each major vegetation group
+        epsilon = 1e-5
+        self.__dict__['MAJOR_VEG_INDECES'] = {
+            v: np.where(NVIS_layers[v] > epsilon)[0]
+            for v in range(NVIS_layers.shape[0])
+        }
+
+    @cached_property
+    def NVIS_LAYERS_LDS(self) -> np.ndarray:
+        self._load_NVIS_layers()
+        return self.__dict__['NVIS_LAYERS_LDS']
+
+    @cached_property
+    def MAJOR_VEG_INDECES(self) -> dict[int, np.ndarray]:
+        self._load_NVIS_layers()
+        return self.__dict__['MAJOR_VEG_INDECES']
+
+    @cached_property
+    def BIO_GBF4_SPECIES_LAYERS(self) -> np.ndarray:
+        BIO_GBF4_SPECIES_raw = xr.open_dataarray(f'{settings.INPUT_DIR}/bio_GBF4_SNES.nc', chunks={'species':1})
+        snes_arr_likely = BIO_GBF4_SPECIES_raw.sel(species=self.BIO_GBF4_SNES_LIKELY_SEL, presence='LIKELY')
+        snes_arr_likely_maybe = BIO_GBF4_SPECIES_raw.sel(species=self.BIO_GBF4_SNES_LIKELY_AND_MAYBE_SEL, presence='LIKELY_AND_MAYBE')
+        snes_arr = xr.concat([snes_arr_likely, snes_arr_likely_maybe], dim='species')
+        return self.get_exact_resfactored_average_stack(snes_arr)
+
+    @cached_property
+    def BIO_GBF4_COMUNITY_LAYERS(self) -> np.ndarray:
+        BIO_GBF4_COMUNITY_raw = xr.open_dataarray(f'{settings.INPUT_DIR}/bio_GBF4_ECNES.nc', chunks={'species':1})
+        ecnes_arr_likely = BIO_GBF4_COMUNITY_raw.sel(species=self.BIO_GBF4_ECNES_LIKELY_SEL, presence='LIKELY')
+        ecnes_arr_likely_maybe = BIO_GBF4_COMUNITY_raw.sel(species=self.BIO_GBF4_ECNES_LIKELY_AND_MAYBE_SEL, presence='LIKELY_AND_MAYBE')
+        ecnes_arr = xr.concat([ecnes_arr_likely, ecnes_arr_likely_maybe], dim='species')
+        return self.get_exact_resfactored_average_stack(ecnes_arr)
+
+    @cached_property
+    def BIO_GBF8_SPECIES_LAYER(self) -> xr.DataArray:
+        BIO_GBF8_SPECIES_raw = xr.open_dataset(f'{settings.INPUT_DIR}/bio_GBF8_ssp{settings.SSP}_EnviroSuit.nc', chunks={'year':1,'species':1})['data']
+        return BIO_GBF8_SPECIES_raw.sel(species=self.BIO_GBF8_SEL_SPECIES).compute()
+
+    @cached_property
+    def BIO_GBF8_GROUPS_LAYER(self) -> xr.DataArray:
+        return xr.load_dataset(f'{settings.INPUT_DIR}/bio_GBF8_ssp{settings.SSP}_EnviroSuit_group.nc')['data']
+
+    @cached_property
+    def BIO_GBF8_GROUPS_NAMES(self) -> list[str]:
+        return [i.capitalize() for i in self.BIO_GBF8_GROUPS_LAYER['group'].values]
+
+
     def get_coord(self, index_ij: np.ndarray, trans):
         """
         Calculate the coordinates [[lon,...],[lat,...]] based on
@@ -1400,65 +1744,86 @@ class Data:
         E.g., given a resfactor of 5, then each resfactored dvar cell will cover a 5x5 area.
         If there are 9 Apple cells in the 5x5 area, then the dvar cell for it will be 9/25. 
         
+        The fractions of all (m, j) pairs are counted in a single bincount over the key
+        `r * (NLMS * N_AG_LUS) + m * N_AG_LUS + j`, where r is the resfactored cell each
+        full resolution cell falls in.
         """
         if settings.RESFACTOR == 1:
             return lumap2ag_l_mrj(self.LUMAP_NO_RESFACTOR, self.LMMAP_NO_RESFACTOR)[:, self.MASK, :]
 
+        # Keep agricultural land cells within an included resfactored cell
+        ag_cells = (self.LUMAP_NO_RESFACTOR != self.MASK_LU_CODE) & (self.RESFACTOR_CELL_IDX >= 0)
+        r_fullres = self.RESFACTOR_CELL_IDX[ag_cells]
 
-        lumap_resample_avg = np.zeros((len(self.LANDMANS), self.NCELLS, self.N_AG_LUS), dtype=np.float32)  
-        for idx_lu in self.DESC2AGLU.values():
-            for idx_w, _ in enumerate(self.LANDMANS):
-                arr_lu_lm = self.LUMAP_NO_RESFACTOR * self.LMMAP_NO_RESFACTOR
-                lumap_resample_avg[idx_w, :, idx_lu] = self.get_exact_resfactored_average_arr(arr_lu_lm)
-                
-        return lumap_resample_avg
+        # Count the full resolution cells of each (r, m, j) and divide by the agricultural land cells of each r
+        key = (
+            r_fullres * (self.NLMS * self.N_AG_LUS)
+            + self.LMMAP_NO_RESFACTOR[ag_cells].astype(np.int64) * self.N_AG_LUS
+            + self.LUMAP_NO_RESFACTOR[ag_cells]
+        )
+        lu_count_rmj = np.bincount(key, minlength=self.NCELLS * self.NLMS * self.N_AG_LUS).reshape(self.NCELLS, self.NLMS, self.N_AG_LUS)
+        cell_count_r = np.bincount(r_fullres, minlength=self.NCELLS)
+
+        with np.errstate(divide='ignore', invalid='ignore'):                    # Ignore the division by zero warning
+            lumap_rmj = (lu_count_rmj / cell_count_r[:, None, None]).astype(np.float32)
+            lumap_rmj[~np.isfinite(lumap_rmj)] = 0                              # Set the NaN and Inf to 0
+
+        return lumap_rmj.transpose(1, 0, 2).copy()
     
     
-    def get_exact_resfactored_lumap_mrj(self):
+    @cached_property
+    def RESFACTOR_CELL_IDX(self) -> np.ndarray:
         """
-        Rather than picking the center cell when resfactoring the lumap, this function
-        calculate the exact value of each land-use cell based from lumap to create dvars.
-        
-        E.g., given a resfactor of 5, then each resfactored dvar cell will cover a 5x5 area.
-        If there are 9 Apple cells in the 5x5 area, then the dvar cell for it will be 9/25. 
-        
+        Index (r) of the resfactored cell that each full resolution land cell falls in,
+        or -1 if that resfactored cell is not included in the model.
         """
-        if settings.RESFACTOR == 1:
-            return lumap2ag_l_mrj(self.LUMAP_NO_RESFACTOR, self.LMMAP_NO_RESFACTOR)[:, self.MASK, :]
+        mask_arr_2d_resfactor = (self.LUMAP_2D_RESFACTORED != self.NODATA) & (self.LUMAP_2D_RESFACTORED != self.MASK_LU_CODE)
+        r_arr_2d_resfactored = np.full(self.LUMAP_2D_RESFACTORED.shape, -1, dtype=np.int64)
+        r_arr_2d_resfactored[mask_arr_2d_resfactor] = np.arange(self.NCELLS)
+        return upsample_array(self, r_arr_2d_resfactored, settings.RESFACTOR)[self.NLUM_MASK == 1]
+
+
+    @cached_property
+    def RESFACTOR_AVG_MAT(self) -> sparse.csr_array:
+        """
+        Sparse (resfactored cell r, full resolution land cell) operator that averages full
+        resolution values over the agricultural land cells of each resfactored cell.
+
+        Built once per Data object (and saved with the Data cache), so resfactoring a layer
+        is a single sparse matrix product.
+        """
+        in_r = self.RESFACTOR_CELL_IDX >= 0
+        ag_cell_count_r = np.bincount(
+            self.RESFACTOR_CELL_IDX[in_r & (self.LUMAP_NO_RESFACTOR != self.MASK_LU_CODE)], minlength=self.NCELLS
+        )
+        weight_r = np.divide(1, ag_cell_count_r, out=np.zeros(self.NCELLS), where=ag_cell_count_r > 0)
+
+        cols = np.flatnonzero(in_r)
+        rows = self.RESFACTOR_CELL_IDX[cols]
+        return sparse.csr_array((weight_r[rows], (rows, cols)), shape=(self.NCELLS, in_r.size))
+
 
-        lumap_mrj = np.zeros((self.NLMS, self.NCELLS, self.N_AG_LUS), dtype=np.float32)
-        for idx_lu in self.DESC2AGLU.values():
-            for idx_w, _ in enumerate(self.LANDMANS):
-                # Get the cells with the same ID and water supply
-                lu_arr = (self.LUMAP_NO_RESFACTOR == idx_lu) * (self.LMMAP_NO_RESFACTOR == idx_w)
-                lumap_mrj[idx_w, :, idx_lu] = self.get_exact_resfactored_average_arr(lu_arr)        
-                    
-        return lumap_mrj
-    
-    
     def get_exact_resfactored_average_arr(self, arr: np.ndarray) -> np.ndarray:
-            
-        arr_2d = np.zeros_like(self.LUMAP_2D_FULLRES, dtype=np.float32)      # Create a 2D array of zeros with the same shape as the LUMAP_2D_FULLRES
-        np.place(arr_2d, self.NLUM_MASK == 1, arr)                           # Place the values of arr in the 2D array where the LUMAP_2D_RESFACTORED is equal to idx_lu
-        
-        mask_arr_2d_resfactor = (self.LUMAP_2D_RESFACTORED != self.NODATA) & (self.LUMAP_2D_RESFACTORED != self.MASK_LU_CODE) 
-        mask_arr_2d_fullres = (self.LUMAP_2D_FULLRES != self.NODATA) & (self.LUMAP_2D_FULLRES != self.MASK_LU_CODE)
+        """
+        Average the full resolution land cell values `arr` over each resfactored cell.
 
-        # Create a 2D array of IDs for the LUMAP_2D_RESFACTORED
-        id_arr_2d_resfactored = np.arange(self.LUMAP_2D_RESFACTORED.size).reshape(self.LUMAP_2D_RESFACTORED.shape)
-        id_arr_2d_fullres = upsample_array(self, id_arr_2d_resfactored, settings.RESFACTOR)
+        `arr` is either 1D (land cells) or 2D (layers, land cells); the result has the
+        same leading shape with NCELLS resfactored cells.
+        """
+        return (self.RESFACTOR_AVG_MAT @ np.asarray(arr).T).T
 
-        # Calculate the average value for each cell in the resfactored array
-        cell_count = np.bincount(id_arr_2d_fullres.flatten(), mask_arr_2d_fullres.flatten(), minlength=self.LUMAP_2D_RESFACTORED.size)
-        cell_sum = np.bincount(id_arr_2d_fullres.flatten(), arr_2d.flatten(), minlength=self.LUMAP_2D_RESFACTORED.size)
-        with np.errstate(divide='ignore', invalid='ignore'):                    # Ignore the division by zero warning
-            cell_avg = cell_sum / cell_count
-            cell_avg[~np.isfinite(cell_avg)] = 0                                # Set the NaN and Inf to 0
-            
-        # Reshape the 1D avg array to 2D array
-        cell_avg_2d = cell_avg.reshape(self.LUMAP_2D_RESFACTORED.shape)
-    
-        return cell_avg_2d[np.nonzero(mask_arr_2d_resfactor)]
+
+    def get_exact_resfactored_average_stack(self, stack, batch_size: int = 32) -> np.ndarray:
+        """
+        Resfactor a (layers, land cells) stack, e.g., an xarray DataArray backed by dask,
+        in batches of `batch_size` layers so only one batch is held at full resolution.
+        """
+        if len(stack) == 0:
+            return np.empty((0, self.NCELLS))
+        return np.concatenate([
+            self.get_exact_resfactored_average_arr(stack[i:i + batch_size])
+            for i in range(0, len(stack), batch_size)
+        ])
  
     # Get the habitat condition score within priority degraded areas for base year (2010)
     def get_GBF2_target_for_yr_cal(self, yr_cal:int) -> float:
@@ -1505,72 +1870,46 @@ class Data:
         Interpolate the user-defined targets to get target at the given year
         '''
         
-        GBF3_target_percents = []
-        for _,row in self.GBF3_BASELINE_AREA_AND_USERDEFINE_TARGETS.iterrows():
-            f = interp1d(
-                [2010, 2030, 2050, 2100],
-                [min(row['BASE_YR_PERCENT'],row['USER_DEFINED_TARGET_PERCENT_2030']), 
-                 row['USER_DEFINED_TARGET_PERCENT_2030'], 
-                 row['USER_DEFINED_TARGET_PERCENT_2050'], 
-                 row['USER_DEFINED_TARGET_PERCENT_2100']
-                ],
-                kind="linear",
-                fill_value="extrapolate",
-            )
-            GBF3_target_percents.append(f(yr).item())
+        GBF3_target_percents = self.BIO_GBF3_TARGET_TRAJECTORY(yr)
         
-        limit_score_all_AUS = self.BIO_GBF3_BASELINE_SCORE_ALL_AUSTRALIA * (np.array(GBF3_target_percents) / 100)  # Convert the percentage to proportion
+        limit_score_all_AUS = self.BIO_GBF3_BASELINE_SCORE_ALL_AUSTRALIA * (GBF3_target_percents / 100)  # Convert the percentage to proportion
         limit_score_inside_LUTO = limit_score_all_AUS - self.BIO_GBF3_BASELINE_SCORE_OUTSIDE_LUTO
             
         return np.where(limit_score_inside_LUTO < 0, 0, limit_score_inside_LUTO)
 
     
-    def get_GBF4_SNES_target_inside_LUTO_by_year(self, yr:int):
-        
-        # Check the layer name
-        snes_df_likely = self.BIO_GBF4_SNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY
-        snes_df_likely_maybe = self.BIO_GBF4_SNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY_AND_MAYBE
-        snes_df = pd.concat([snes_df_likely, snes_df_likely_maybe], ignore_index=True)
+    @staticmethod
+    def get_GBF4_target_trajectory(df_likely: pd.DataFrame, df_likely_maybe: pd.DataFrame):
+        '''
+        Get the target percentage trajectory, the all Australia baseline score and the Outside LUTO natural baseline score
+        of the 'LIKELY' layers (`df_likely`) followed by the 'LIKELY_MAYBE' layers (`df_likely_maybe`).
+        '''
+        trajectory_percents, baseline_all_aus, baseline_out_LUTO = [], [], []
+        for layer, df in [('LIKELY', df_likely), ('LIKELY_MAYBE', df_likely_maybe)]:
+            trajectory_percents.append(df[[
+                f'HABITAT_SIGNIFICANCE_BASELINE_PERCENT_{layer}',
+                f'USER_DEFINED_TARGET_PERCENT_2030_{layer}',
+                f'USER_DEFINED_TARGET_PERCENT_2050_{layer}',
+                f'USER_DEFINED_TARGET_PERCENT_2100_{layer}'
+            ]].to_numpy(dtype=np.float64))
+            baseline_all_aus.append(df[f'HABITAT_SIGNIFICANCE_BASELINE_ALL_AUSTRALIA_{layer}'].to_numpy(dtype=np.float64))
+            baseline_out_LUTO.append(df[f'HABITAT_SIGNIFICANCE_BASELINE_OUT_LUTO_NATURAL_{layer}'].to_numpy(dtype=np.float64))
+
+        return (
+            Trajectory([2010, 2030, 2050, 2100], np.vstack(trajectory_percents)),
+            np.concatenate(baseline_all_aus),
+            np.concatenate(baseline_out_LUTO)
+        )
 
-        targets = []
-        for idx,row in snes_df.iterrows():
-            layer = self.BIO_GBF4_PRESENCE_SNES_SEL[idx]
-            f = interp1d(
-                [2010, 2030, 2050, 2100],
-                [row[f'HABITAT_SIGNIFICANCE_BASELINE_PERCENT_{layer}'], row[f'USER_DEFINED_TARGET_PERCENT_2030_{layer}'], row[f'USER_DEFINED_TARGET_PERCENT_2050_{layer}'], row[f'USER_DEFINED_TARGET_PERCENT_2100_{layer}']],
-                kind = "linear",
-                fill_value = "extrapolate",
-            )
-            
-            score_all_aus = row[f'HABITAT_SIGNIFICANCE_BASELINE_ALL_AUSTRALIA_{layer}'] * f(yr) / 100  # Convert the percentage to proportion
-            score_out_LUTO = row[f'HABITAT_SIGNIFICANCE_BASELINE_OUT_LUTO_NATURAL_{layer}'] 
-            targets.append(score_all_aus - score_out_LUTO)
 
-        return np.array(targets).astype(np.float32)
+    def get_GBF4_SNES_target_inside_LUTO_by_year(self, yr:int):
+        score_all_aus = self.BIO_GBF4_SNES_BASELINE_SCORE_ALL_AUSTRALIA * self.BIO_GBF4_SNES_TARGET_TRAJECTORY(yr) / 100  # Convert the percentage to proportion
+        return (score_all_aus - self.BIO_GBF4_SNES_BASELINE_SCORE_OUTSIDE_LUTO).astype(np.float32)
 
         
     def get_GBF4_ECNES_target_inside_LUTO_by_year(self, yr:int):
-        
-        # Check the layer name
-        ecnes_df_likely = self.BIO_GBF4_ECNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY
-        ecnes_df_likely_maybe = self.BIO_GBF4_ECNES_BASELINE_SCORE_TARGET_PERCENT_LIKELY_AND_MAYBE
-        ecnes_df = pd.concat([ecnes_df_likely, ecnes_df_likely_maybe], ignore_index=True)
-
-        targets = []
-        for idx,row in ecnes_df.iterrows():
-            layer = self.BIO_GBF4_PRESENCE_ECNES_SEL[idx]
-            f = interp1d(
-                [2010, 2030, 2050, 2100],
-                [row[f'HABITAT_SIGNIFICANCE_BASELINE_PERCENT_{layer}'], row[f'USER_DEFINED_TARGET_PERCENT_2030_{layer}'], row[f'USER_DEFINED_TARGET_PERCENT_2050_{layer}'], row[f'USER_DEFINED_TARGET_PERCENT_2100_{layer}']],
-                kind = "linear",
-                fill_value = "extrapolate",
-            )
-            
-            score_all_aus = row[f'HABITAT_SIGNIFICANCE_BASELINE_ALL_AUSTRALIA_{layer}'] * f(yr) / 100  # Convert the percentage to proportion
-            score_out_LUTO = row[f'HABITAT_SIGNIFICANCE_BASELINE_OUT_LUTO_NATURAL_{layer}']
-            targets.append(score_all_aus - score_out_LUTO)  
-                      
-        return np.array(targets).astype(np.float32)
+        score_all_aus = self.BIO_GBF4_ECNES_BASELINE_SCORE_ALL_AUSTRALIA * self.BIO_GBF4_ECNES_TARGET_TRAJECTORY(yr) / 100  # Convert the percentage to proportion
+        return (score_all_aus - self.BIO_GBF4_ECNES_BASELINE_SCORE_OUTSIDE_LUTO).astype(np.float32)
     
     
     def get_GBF8_bio_layers_by_yr(self, yr: int, level:Literal['species', 'group']='species'):
@@ -1579,7 +1918,8 @@ class Data:
         
         The raw biodiversity suitability score [2D (shape, 808*978), (dtype, uint8, 0-100)] represents the 
         suitability of each cell for each species/group.  Here it is LINEARLY interpolated to the given year,
-        then LINEARLY interpolated to the given spatial coordinates.
+        then LINEARLY interpolated to the given spatial coordinates. The bilinear weights are precomputed
+        (see `get_GBF8_interp`), and the layers of the most recent years are memoised.
         
         Because the coordinates are the controid of the `self.MASK` array, so the spatial interpolation is 
         simultaneously a masking process. 
@@ -1600,28 +1940,55 @@ class Data:
             The biodiversity suitability score for each species at the given year.
         '''
         
-        input_lr = self.BIO_GBF8_SPECIES_LAYER if level == 'species' else self.BIO_GBF8_GROUPS_LAYER
-        
-        current_species_val = input_lr.interp(                          # Here the year interpolation is done first                      
-            year=yr,
-            method='linear', 
-            kwargs={'fill_value': 'extrapolate'}
-        ).interp(                                                       # Then the spatial interpolation and masking is done
-            x=xr.DataArray(self.COORD_LON_LAT[0], dims='cell'),
-            y=xr.DataArray(self.COORD_LON_LAT[1], dims='cell'),
-            method='linear'                                             # Use LINEAR interpolation
-        ).drop_vars(['year']).values
+        if (yr, level) in self.GBF8_LAYERS_BY_YR:
+            return self.GBF8_LAYERS_BY_YR[(yr, level)]
+
+        years, raw_layers, interp_mat, outside_cells = self.get_GBF8_interp(level)
+
+        # Linearly interpolate (or extrapolate) between the two bracketing years on the raw grid
+        i = np.clip(np.searchsorted(years, yr, side='right') - 1, 0, len(years) - 2)
+        w = (yr - years[i]) / (years[i + 1] - years[i])
+        current_grid_val = (1 - w) * raw_layers[i] + w * raw_layers[i + 1]
+
+        # Then the spatial interpolation and masking is done with the precomputed bilinear weights
+        current_species_val = (interp_mat @ current_grid_val.T).T
+        current_species_val[:, outside_cells] = np.nan
         
         # Apply Savanna Burning penalties
         current_species_val = np.where(
             self.SAVBURN_ELIGIBLE,
             current_species_val * settings.BIO_CONTRIBUTION_LDS,
             current_species_val
-        )
+        ).astype(np.float32)
+
+        # Keep the layers of the most recent years, as each year is requested several times in a row
+        if len(self.GBF8_LAYERS_BY_YR) >= 4:
+            self.GBF8_LAYERS_BY_YR.pop(next(iter(self.GBF8_LAYERS_BY_YR)))
+        self.GBF8_LAYERS_BY_YR[(yr, level)] = current_species_val
         
-        return current_species_val.astype(np.float32)
+        return current_species_val
     
 
+    def get_GBF8_interp(self, level:Literal['species', 'group']='species'):
+        '''
+        Get the raw GBF8 layers of the given level as a [year, layer, y*x] array, together with the sparse
+        bilinear interpolation matrix from the raw grid to the cell coordinates (`COORD_LON_LAT`) and the
+        cells outside the raw grid. These are computed once per level.
+        '''
+        if level not in self.GBF8_INTERP:
+            input_lr = self.BIO_GBF8_SPECIES_LAYER if level == 'species' else self.BIO_GBF8_GROUPS_LAYER
+            layer_dim = [d for d in input_lr.dims if d not in ('year', 'y', 'x')][0]
+            input_lr = input_lr.transpose('year', layer_dim, 'y', 'x')
+
+            interp_mat, outside_cells = get_bilinear_interp_matrix(
+                input_lr['x'].values, input_lr['y'].values, self.COORD_LON_LAT[0], self.COORD_LON_LAT[1]
+            )
+            raw_layers = input_lr.values.reshape(input_lr.sizes['year'], input_lr.sizes[layer_dim], -1)
+            self.GBF8_INTERP[level] = (input_lr['year'].values, raw_layers, interp_mat, outside_cells)
+
+        return self.GBF8_INTERP[level]
+
+
     def get_GBF8_target_inside_LUTO_by_yr(self, yr: int):
         '''
         Get the biodiversity suitability score (area weighted [ha]) for each species at the given year for the Inside LUTO natural land.
@@ -1636,51 +2003,35 @@ class Data:
         Get the biodiversity suitability score (area weighted [ha]) for each species at the given year for all Australia.
         '''
         # Get the target percentage for each species at the given year
-        target_pct = []
-        for _,row in self.BIO_GBF8_BASELINE_SCORE_AND_TARGET_PERCENT_SPECIES.iterrows():
-            f = interp1d(
-                [2010, 2030, 2050, 2100],
-                [row['HABITAT_SUITABILITY_BASELINE_PERCENT'], row[f'USER_DEFINED_TARGET_PERCENT_2030'], row[f'USER_DEFINED_TARGET_PERCENT_2050'], row[f'USER_DEFINED_TARGET_PERCENT_2100']],
-                kind="linear",
-                fill_value="extrapolate",
-            )
-            target_pct.append(f(yr).item()) 
+        target_pct = self.BIO_GBF8_TARGET_TRAJECTORY(yr)
             
         # Calculate the target biodiversity suitability score for each species at the given year for all Australia
-        target_scores_all_AUS = self.BIO_GBF8_BASELINE_SCORE_AND_TARGET_PERCENT_SPECIES['HABITAT_SUITABILITY_BASELINE_SCORE_ALL_AUSTRALIA'] * (np.array(target_pct) / 100) # Convert the percentage to proportion
+        target_scores_all_AUS = self.BIO_GBF8_BASELINE_SCORE_AND_TARGET_PERCENT_SPECIES['HABITAT_SUITABILITY_BASELINE_SCORE_ALL_AUSTRALIA'] * (target_pct / 100) # Convert the percentage to proportion
         return target_scores_all_AUS.values
     
     
+    @staticmethod
+    def get_GBF8_outside_LUTO_trajectory(proj_score: pd.DataFrame, base_score: pd.Series) -> Trajectory:
+        '''
+        Get the suitability score trajectory for the Outside LUTO natural land from the projected scores
+        (pivoted to [species/group, (score, year)]) and the baseline score (taken as the 1990 score).
+        '''
+        proj_score = proj_score.droplevel(0, axis=1)
+        return Trajectory(
+            [1990, 2030, 2050, 2070, 2090],
+            np.column_stack([base_score.to_numpy(), proj_score[[2030, 2050, 2070, 2090]].to_numpy()])
+        )
+
+
     def get_GBF8_score_outside_natural_LUTO_by_yr(self, yr: int, level:Literal['species', 'group']='species'):
         '''
         Get the biodiversity suitability score (area weighted [ha]) for each species at the given year for the Outside LUTO natural land.
         '''
-        
-        if level == 'species':
-            base_score = self.BIO_GBF8_BASELINE_SCORE_AND_TARGET_PERCENT_SPECIES['HABITAT_SUITABILITY_BASELINE_SCORE_OUTSIDE_LUTO']
-            proj_score = self.BIO_GBF8_OUTSDIE_LUTO_SCORE_SPECIES.pivot(index='species', columns='year').reset_index()
-        elif level == 'group':
-            base_score = self.BIO_GBF8_BASELINE_SCORE_GROUPS['HABITAT_SUITABILITY_BASELINE_SCORE_OUTSIDE_LUTO']
-            proj_score = self.BIO_GBF8_OUTSDIE_LUTO_SCORE_GROUPS.pivot(index='group', columns='year').reset_index()
-        else:
+        if level not in self.BIO_GBF8_OUTSIDE_LUTO_TRAJECTORY:
             raise ValueError("Invalid level. Must be 'species' or 'group'")
         
-        # Put the base score to the proj_score
-        proj_score.columns = proj_score.columns.droplevel() 
-        proj_score[1990] = base_score.values
-        
         # Interpolate the suitability score for each species/group at the given year
-        outside_natural_scores = []
-        for _,row in proj_score.iterrows():
-            f = interp1d(
-                [1990, 2030, 2050, 2070, 2090],
-                [row[1990], row[2030], row[2050], row[2070], row[2090]],
-                kind="linear",
-                fill_value="extrapolate",
-            )
-            outside_natural_scores.append(f(yr).item())
-        
-        return  outside_natural_scores
+        return self.BIO_GBF8_OUTSIDE_LUTO_TRAJECTORY[level](yr)
 
 
     
@@ -1697,17 +2048,11 @@ class Data:
         if settings.REGIONAL_ADOPTION_CONSTRAINTS != "on":
             return ()
         
-        reg_adop_limits = []
-        for _,row in self.REGIONAL_ADOPTION_TARGETS.iterrows():
-            f = interp1d(
-                [2010, 2030, 2050, 2100],
-                [row['BASE_LANDUSE_AREA_PERCENT'], row['ADOPTION_PERCENTAGE_2030'], row['ADOPTION_PERCENTAGE_2050'], row['ADOPTION_PERCENTAGE_2100']],
-                kind="linear",
-                fill_value="extrapolate",
-            )
-            reg_adop_limits.append((row[settings.REGIONAL_ADOPTION_ZONE], row['TARGET_LANDUSE'], f(yr).item()))
-            
-        return reg_adop_limits
+        return list(zip(
+            self.REGIONAL_ADOPTION_TARGETS[settings.REGIONAL_ADOPTION_ZONE],
+            self.REGIONAL_ADOPTION_TARGETS['TARGET_LANDUSE'],
+            self.REGIONAL_ADOPTION_TARGET_TRAJECTORY(yr).tolist()
+        ))
     
     def get_regional_adoption_limit_ha_by_year(self, yr: int):
         """
@@ -1722,9 +2067,10 @@ class Data:
             return ()
         
         reg_adop_limits = self.get_regional_adoption_percent_by_year(yr)
+        reg_index = self.REGIONAL_ADOPTION_ZONE_INDEX[settings.REGIONAL_ADOPTION_ZONE]
         reg_adop_limits_ha = []
         for reg, landuse, pct in reg_adop_limits:
-            reg_total_area_ha = ((self.REGIONAL_ADOPTION_ZONES == reg) * self.REAL_AREA).sum()
+            reg_total_area_ha = reg_index.area(reg)
             reg_adop_limits_ha.append((reg, landuse, reg_total_area_ha * pct / 100))
             
         return reg_adop_limits_ha
@@ -1812,7 +2158,7 @@ class Data:
         else:
             ag_X_mrj = lumap2ag_l_mrj(lumap, lmmap)
             non_ag_X_rk = lumap2non_ag_l_mk(lumap, len(settings.NON_AG_LAND_USES.keys()))
-            ag_man_X_mrj = get_base_am_vars(self.NCELLS, self.NLMS, self.N_AG_LUS)
+            ag_man_X_mrj = get_base_am_vars(self.NCELLS, self.NLMS)
 
         # Calculate year index (i.e., number of years since 2010)
         yr_idx = yr_cal - self.YR_CAL_BASE
@@ -1844,13 +2190,15 @@ class Data:
                 continue
             
             am_j_list = [self.DESC2AGLU[lu] for lu in am_lus]
-            current_ag_man_X_mrp = np.zeros(ag_q_mrp.shape, dtype=np.float32)
-            for j in am_j_list:
+            am_p_list = ag_quantity.get_ag_man_products(self.LU2PR, am_j_list)
+            am_p_idx = {p: p_idx for p_idx, p in enumerate(am_p_list)}
+            current_ag_man_X_mrp = np.zeros((self.NLMS, self.NCELLS, am_p_list.size), dtype=np.float32)
+            for j_idx, j in enumerate(am_j_list):
                 for p in j2p[j]:
-                    current_ag_man_X_mrp[:, :, p] = ag_man_X_mrj[am][:, :, j]
+                    current_ag_man_X_mrp[:, :, am_p_idx[p]] = ag_man_X_mrj[am][:, :, j_idx]
 
             ag_man_q_p = np.einsum('mrp,mrp->p', ag_man_q_mrp[am], current_ag_man_X_mrp)
-            ag_man_q_c += np.einsum('cp,p->c', self.PR2CM.astype(bool), ag_man_q_p)
+            ag_man_q_c += np.einsum('cp,p->c', self.PR2CM[:, am_p_list].astype(bool), ag_man_q_p)
 
         # Return total commodity production as numpy array.
         total_q_c = ag_q_c + non_ag_q_c + ag_man_q_c
@@ -1882,10 +2230,14 @@ class Data:
         yr_idx: int,
         water_dr_yield: Optional[np.ndarray] = None,
         water_sr_yield: Optional[np.ndarray] = None,
+        dtype: Optional[np.dtype] = None,
     ) -> np.ndarray:
         """
         Get the net land water yield array, inclusive of all cells that LUTO does not look at.
 
+        Only year `yr_idx` of the memory-mapped DR/SR projections is read. If `dtype` is given
+        (e.g., np.float32), the yields are cast to it before they are combined.
+
         Returns
         -------
         np.ndarray: shape (NCELLS,)
@@ -1900,4 +2252,9 @@ class Data:
         )
         dr_prop = self.DEEP_ROOTED_PROPORTION
 
+        if dtype is not None:
+            water_dr_yield = np.asarray(water_dr_yield, dtype=dtype)
+            water_sr_yield = np.asarray(water_sr_yield, dtype=dtype)
+            dr_prop = dr_prop.astype(dtype, copy=False)
+
         return (dr_prop * water_dr_yield + (1 - dr_prop) * water_sr_yield)
@@ -34,7 +34,8 @@ import shutil, os, time, h5py
 
 
 from joblib import Parallel, delayed
-from luto.settings import INPUT_DIR, RAW_DATA
+from luto.settings import INPUT_DIR, RAW_DATA, INPUT_STORE
+from luto.tools.npy_store import convert_hdf_to_npy_store
 
 
 
@@ -1083,6 +1084,12 @@ def create_new_dataset():
     cell_xy.to_hdf(outpath + 'cell_BECCS_df.h5', key='cell_BECCS_df', mode='w', format='table', index=False, complevel=9)
 
 
+    ############### Refresh the memory-mappable copy of the cell-level layers
+
+    if INPUT_STORE == 'npy':
+        convert_hdf_to_npy_store(outpath)
+
+
     # Complete processing and report back
     laps_time = round(time.time() - start_time)
     print('Completed input data refresh at', time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()), ', taking', laps_time, 'seconds')
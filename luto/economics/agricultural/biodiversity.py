@@ -149,7 +149,6 @@ def get_biochar_effect_b_mrj(data, ag_b_mrj: np.ndarray, yr_idx):
     """
     land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['Biochar']
     lu_codes = np.array([data.DESC2AGLU[lu] for lu in land_uses])
-    yr_cal = data.YR_CAL_BASE + yr_idx
 
     # Set up the effects matrix
     b_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
@@ -157,12 +156,9 @@ def get_biochar_effect_b_mrj(data, ag_b_mrj: np.ndarray, yr_idx):
     if not settings.AG_MANAGEMENTS['Biochar']:
         return b_mrj_effect
 
-    for lu_idx, lu in enumerate(land_uses):
-        biodiv_impact = data.BIOCHAR_DATA[lu].loc[yr_cal, 'Biodiversity_impact']
-
-        if biodiv_impact != 1:
-            j = lu_codes[lu_idx]
-            b_mrj_effect[:, :, lu_idx] = ag_b_mrj[:, :, j] * (biodiv_impact - 1)
+    biodiv_impacts = data.get_ag_man_coefs('Biochar', 'Biodiversity_impact', yr_idx)
+    lu_idx = np.flatnonzero(biodiv_impacts != 1)
+    b_mrj_effect[:, :, lu_idx] = ag_b_mrj[:, :, lu_codes[lu_idx]] * (biodiv_impacts[lu_idx] - 1)
 
     return b_mrj_effect
 
@@ -395,6 +391,9 @@ def get_GBF8_species_conservation_limits(
         - dict[int, np.ndarray]
             A dictionary mapping of each species index to the cells that the species applies to.
     """
+    if settings.BIODIVERSTIY_TARGET_GBF_8 != "on":
+        return np.empty(0), {}, {}
+
     species_limits = data.get_GBF8_target_inside_LUTO_by_yr(yr_cal)
     species_names = {s: spec_name for s, spec_name in enumerate(data.BIO_GBF8_SEL_SPECIES)}
     species_matrix = data.get_GBF8_bio_layers_by_yr(yr_cal)
@@ -448,9 +447,10 @@ def get_ag_management_biodiversity_contribution(
             for j_idx, lu in enumerate(settings.AG_MANAGEMENTS_TO_LAND_USES['AgTech EI'])
         }
     if settings.AG_MANAGEMENTS['Biochar']:
+        biodiv_impacts = data.get_ag_man_coefs('Biochar', 'Biodiversity_impact', yr_cal - data.YR_CAL_BASE)
         am_contr_dict['Biochar'] = {
-            j_idx: (data.BIOCHAR_DATA[lu].loc[yr_cal, 'Biodiversity_impact'] - 1) * np.ones(data.NCELLS).astype(np.float32)
-            for j_idx, lu in enumerate(settings.AG_MANAGEMENTS_TO_LAND_USES['Biochar'])
+            j_idx: (biodiv_impact - 1) * np.ones(data.NCELLS).astype(np.float32)
+            for j_idx, biodiv_impact in enumerate(biodiv_impacts)
         }
     if settings.AG_MANAGEMENTS['Beef - HIR']:
         am_contr_dict['Beef - HIR'] = {
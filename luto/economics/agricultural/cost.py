@@ -25,19 +25,20 @@ Pure functions to calculate costs of commodities and alt. land uses.
 
 
 
-import itertools
 import numpy as np
-import pandas as pd
 
 from luto.data import Data
 import luto.settings as settings
-from luto.economics.agricultural.quantity import get_yield_pot, lvs_veg_types, get_quantity
 from luto.settings import AG_MANAGEMENTS, AG_MANAGEMENTS_TO_LAND_USES
-from luto.economics.agricultural.quantity import get_yield_pot, get_quantity, lvs_veg_types
+from luto.economics.agricultural.quantity import get_yield_pot, get_quantity, lvs_veg_types, get_cached_quantity
+
+
+# Cost types of agricultural land uses, in the order of the cost type axis of `get_cost_matrices_by_type`.
+COST_TYPES = ['Area cost', 'Fixed cost', 'Water cost', 'Quantity cost']
 
 
 def get_cost_crop(data, lu, lm, yr_idx):
-    """Return crop production cost <unit: $/cell> of `lu`+`lm` in `yr_idx` as np array.
+    """Return crop production cost <unit: $/cell> of `lu`+`lm` in `yr_idx` by cost type.
 
     Args:
         data (object/module): Data object or module. Assumes fields like in `luto.data`.
@@ -46,22 +47,19 @@ def get_cost_crop(data, lu, lm, yr_idx):
         yr_idx (int): Number of years post base-year ('YR_CAL_BASE').
 
     Returns
-        pandas.DataFrame: Costs of the crop as a numpy array, with columns representing different cost types.
+        dict[str, np.ndarray]: Costs of the crop, keyed by cost type (see `COST_TYPES`).
 
     Raises:
         KeyError: If the passed `lm` is neither 'dry' nor 'irr'.
 
     Notes:
-        - If the land-use does not exist in AGEC_CROPS, zeros are returned.
+        - If the land-use does not exist in AGEC_CROPS, no costs (i.e., zeros) are returned.
 
     """
     
     # Check if land-use exists in AGEC_CROPS (e.g., dryland Pears/Rice do not occur), if not return zeros
-    if lu not in data.AGEC_CROPS['AC', lm].columns:
-        costs_t = np.zeros((data.NCELLS))
-        # The column name is irrelevant and only used to make the out df the same shape as the rest of crops.
-        return pd.DataFrame(costs_t,
-                            columns=pd.MultiIndex.from_product([[lu], [lm], ['Area cost']]))
+    if ('AC', lm, lu) not in data.AGEC_CROPS:
+        return {}
 
     else: # Calculate the total costs 
         yr_cal = data.YR_CAL_BASE + yr_idx
@@ -135,16 +133,12 @@ def get_cost_crop(data, lu, lm, yr_idx):
         # Quantity costs which has already been adjusted for REAL_AREA/resfactor via get_quantity
         costs_a, costs_f, costs_w = costs_a * data.REAL_AREA, costs_f * data.REAL_AREA, costs_w * data.REAL_AREA
 
-        costs_t = np.stack([(costs_a), (costs_f), (costs_w), (costs_q)]).T
-
-
-        # Return costs as numpy array.
-        return pd.DataFrame(costs_t,
-                            columns=pd.MultiIndex.from_product([[lu], [lm], ['Area cost', 'Fixed cost', 'Water cost', 'Quantity cost']]))
+        # Return costs by cost type.
+        return dict(zip(COST_TYPES, (costs_a, costs_f, costs_w, costs_q)))
 
 
 def get_cost_lvstk(data, lu, lm, yr_idx):
-    """Return lvstk prodution cost <unit: $/cell> of `lu`+`lm` in `yr_idx` as np array.
+    """Return lvstk prodution cost <unit: $/cell> of `lu`+`lm` in `yr_idx` by cost type.
 
     Args:
         data (object/module): Data object or module.
@@ -153,7 +147,7 @@ def get_cost_lvstk(data, lu, lm, yr_idx):
         yr_idx (int): Number of years post base-year ('YR_CAL_BASE').
 
     Returns
-        pandas.DataFrame: Costs as numpy array, with columns representing different cost types.
+        dict[str, np.ndarray]: Costs keyed by cost type (see `COST_TYPES`).
 
     Raises:
         KeyError: If the passed `lm` is neither 'dry' nor 'irr'.
@@ -195,15 +189,12 @@ def get_cost_lvstk(data, lu, lm, yr_idx):
     cost_a, cost_f, cost_w, cost_q = costs_a*data.REAL_AREA, costs_f*data.REAL_AREA,\
                                      costs_w*data.REAL_AREA, costs_q*data.REAL_AREA
 
-    costs = np.stack([(cost_a), (cost_f), (cost_w), (cost_q)]).T
-
-    # Return costs as numpy array.
-    return  pd.DataFrame(costs,
-                         columns=pd.MultiIndex.from_product([[lu], [lm], ['Area cost', 'Fixed cost', 'Water cost', 'Quantity cost']]))
+    # Return costs by cost type.
+    return dict(zip(COST_TYPES, (cost_a, cost_f, cost_w, cost_q)))
 
 
 def get_cost(data, lu, lm, yr_idx):
-    """Return production cost <unit: $/cell> of `lu`+`lm` in `yr_idx` as np array.
+    """Return production cost <unit: $/cell> of `lu`+`lm` in `yr_idx` by cost type.
 
     Args:
         data (object/module): Data object or module. Assumes fields like in `luto.data`.
@@ -212,7 +203,8 @@ def get_cost(data, lu, lm, yr_idx):
         yr_idx (int): Number of years post base-year ('YR_CAL_BASE').
 
     Returns
-        np.array: Production cost <unit: $/cell> of `lu`+`lm` in `yr_idx`.
+        dict[str, np.ndarray]: Production cost <unit: $/cell> of `lu`+`lm` in `yr_idx` keyed by cost type
+        (see `COST_TYPES`). Cost types that do not apply are omitted, i.e., they are zero.
 
     Raises:
         KeyError: If land use `lu` is not found in `data.LANDUSES`.
@@ -225,30 +217,44 @@ def get_cost(data, lu, lm, yr_idx):
         return get_cost_lvstk(data, lu, lm, yr_idx)
 
     elif lu in data.AGRICULTURAL_LANDUSES:
-        return pd.DataFrame(np.zeros(data.NCELLS),
-                            columns=pd.MultiIndex.from_product([[lu], [lm], ['Area cost']]))
+        return {}
 
     else:
         raise KeyError(f"Land use '{lu}' not found in any LANDUSES")
 
 
-def get_cost_matrix(data, lm, yr_idx):
+def get_cost_matrices_by_type(data, yr_idx):
     """
-    Return agricultural c_rj matrix <unit: $/cell> per lu under `lm` in `yr_idx`.
-    
-    Parameters
-        data (DataFrame): The input data containing agricultural land use information.
-        lm (str): The land use type.
-        yr_idx (int): The index of the year.
-    
-    Returns
-        DataFrame: The cost matrix representing the costs per cell for each land use under the given land use type and year index.
+    Return agricultural costs <unit: $/cell> by cost type as a 4D [cost type, m, r, j] float32 Numpy array,
+    with cost types ordered as `COST_TYPES`. NaNs are replaced by zeroes.
+
+    Only the output writer needs the costs by type, so this array is neither cached nor built for the c_mrj matrix.
     """
-    
-    cost = pd.concat([get_cost(data, lu, lm, yr_idx) for lu in data.AGRICULTURAL_LANDUSES], axis=1)
-        
-    # Make sure all NaNs are replaced by zeroes.
-    return cost.fillna(0)
+    c_tmrj = np.zeros((len(COST_TYPES), data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
+
+    for m, lm in enumerate(data.LANDMANS):
+        for j, lu in enumerate(data.AGRICULTURAL_LANDUSES):
+            costs = get_cost(data, lu, lm, yr_idx)
+            if costs:
+                c_tmrj[:, m, :, j] = np.nan_to_num(np.stack([np.asarray(costs[t], dtype=np.float64) for t in COST_TYPES]))
+
+    return c_tmrj
+
+
+def calc_cost_matrices(data, yr_idx):
+    """
+    Calculate the agricultural c_mrj matrix <unit: $/cell>; see `get_cost_matrices`.
+    """
+    c_mrj = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
+
+    for m, lm in enumerate(data.LANDMANS):
+        for j, lu in enumerate(data.AGRICULTURAL_LANDUSES):
+            costs = get_cost(data, lu, lm, yr_idx)
+            if costs:
+                # Make sure all NaNs are replaced by zeroes; the total is summed before casting to float32.
+                c_mrj[m, :, j] = np.nan_to_num(np.stack([np.asarray(costs[t], dtype=np.float64) for t in COST_TYPES])).sum(axis=0)
+
+    return c_mrj
 
 
 def get_cost_matrices(data, yr_idx, aggregate=True):
@@ -261,22 +267,18 @@ def get_cost_matrices(data, yr_idx, aggregate=True):
     - aggregate: A boolean value indicating whether to aggregate the cost matrices or not. Default is True.
 
     Returns
-    - If aggregate is True, returns a 3D Numpy array representing the aggregated cost matrix.
-    - If aggregate is False, returns a pandas DataFrame representing the cost matrix.
-
-    Raises:
-    - ValueError: If the value of aggregate is neither True nor False.
+    - If aggregate is True, returns a 3D [m, r, j] Numpy array representing the aggregated cost matrix.
+      It is read-only and cached per year.
+    - If aggregate is False, returns a 4D [cost type, m, r, j] Numpy array, with cost types ordered as `COST_TYPES`
+      (see `get_cost_matrices_by_type`).
     """
-    
-    # Concatenate the revenue from each land management into a single Multiindex DataFrame.
-    cost_rjms = pd.concat([get_cost_matrix(data, lm, yr_idx) for lm in data.LANDMANS], axis=1)
-    
     if not aggregate:
-        return cost_rjms
+        return get_cost_matrices_by_type(data, yr_idx)
 
-    df_jmr = cost_rjms.T.groupby(level=[0, 1]).sum()
-    arr_jmr = df_jmr.values.reshape(*(list(df_jmr.index.levshape) + [-1]))
-    return np.einsum('jmr->mrj', arr_jmr)
+    return get_cached_quantity(
+        data, yr_idx, 'cost_mrj',
+        lambda: calc_cost_matrices(data, yr_idx)
+    )
 
 
 
@@ -297,7 +299,6 @@ def get_asparagopsis_effect_c_mrj(data, yr_idx):
     animal, and the real area of the cell. The function returns the updated cost matrix.
     """
     land_uses = AG_MANAGEMENTS_TO_LAND_USES["Asparagopsis taxiformis"]
-    yr_cal = data.YR_CAL_BASE + yr_idx
 
     # Set up the effects matrix
     new_c_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
@@ -305,45 +306,42 @@ def get_asparagopsis_effect_c_mrj(data, yr_idx):
     if not AG_MANAGEMENTS['Asparagopsis taxiformis']:
         return new_c_mrj
 
+    cost_per_animal = data.get_ag_man_coefs('Asparagopsis taxiformis', 'Annual Cost Per Animal (A$2010/yr)', yr_idx)
+
     # Update values in the new matrix
     for lm in data.LANDMANS:
         m = 0 if lm == 'dry' else 1
         for lu_idx, lu in enumerate(land_uses):
             lvstype, vegtype = lvs_veg_types(lu)
             yield_pot = get_yield_pot(data, lvstype, vegtype, lm, yr_idx)
-            cost_per_animal = data.ASPARAGOPSIS_DATA[lu].loc[yr_cal, 'Annual Cost Per Animal (A$2010/yr)']
-            cost_per_cell = cost_per_animal * yield_pot * data.REAL_AREA
-
-            new_c_mrj[m, :, lu_idx] = cost_per_cell
+            new_c_mrj[m, :, lu_idx] = cost_per_animal[lu_idx] * yield_pot * data.REAL_AREA
 
     return new_c_mrj
 
 
-def get_precision_agriculture_effect_c_mrj(data, yr_idx):
+def get_cost_per_ha_effect_c_mrj(data, am: str, yr_idx):
     """
-    Applies the effects of using precision agriculture to the cost data
-    for all relevant agr. land uses.
+    Applies the annual per hectare cost of agricultural management option `am` (Precision Agriculture,
+    AgTech EI or Biochar) to the cost data for all relevant agr. land uses.
 
     Parameters
     - data: The data object containing the necessary information.
-    - yr_idx: The index of the year to calculate the effects for.
+    - am: The agricultural management option.
+    - yr_idx: The index of the year.
 
     Returns
-    - new_c_mrj: The updated cost data matrix <unit: $/cell>.
+    - new_c_mrj: The updated cost data <unit: $/cell>.
     """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Precision Agriculture']
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    land_uses = AG_MANAGEMENTS_TO_LAND_USES[am]
 
     # Set up the effects matrix
     new_c_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
 
-    if not AG_MANAGEMENTS['Precision Agriculture']:
+    if not AG_MANAGEMENTS[am]:
         return new_c_mrj
 
-    for m in range(data.NLMS):
-        for lu_idx, lu in enumerate(land_uses):
-            cost_per_ha = data.PRECISION_AGRICULTURE_DATA[lu].loc[yr_cal, 'AnnCost_per_Ha']
-            new_c_mrj[m, :, lu_idx] = cost_per_ha * data.REAL_AREA
+    cost_per_ha = data.get_ag_man_coefs(am, 'AnnCost_per_Ha', yr_idx)
+    new_c_mrj[:] = data.REAL_AREA[None, :, None] * cost_per_ha[None, None, :]
 
     return new_c_mrj
 
@@ -362,7 +360,6 @@ def get_ecological_grazing_effect_c_mrj(data, yr_idx):
     """
 
     land_uses = AG_MANAGEMENTS_TO_LAND_USES['Ecological Grazing'] if AG_MANAGEMENTS['Ecological Grazing'] else settings.REMOVED_DICT['Ecological Grazing']
-    yr_cal = data.YR_CAL_BASE + yr_idx
 
     # Set up the effects matrix
     new_c_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
@@ -370,22 +367,17 @@ def get_ecological_grazing_effect_c_mrj(data, yr_idx):
     if not AG_MANAGEMENTS['Ecological Grazing']:
         return new_c_mrj
 
-    for lu_idx, lu in enumerate(land_uses):
-        lvstype, _ = lvs_veg_types(lu)
+    operating_mult = data.get_ag_man_coefs('Ecological Grazing', 'Operating_cost_multiplier', yr_idx)
+    labour_mult = data.get_ag_man_coefs('Ecological Grazing', 'Labour_cost_mulitiplier', yr_idx)
+    lvstypes = [lvs_veg_types(lu)[0] for lu in land_uses]
 
-        # Get effects on operating costs
-        operating_mult = data.ECOLOGICAL_GRAZING_DATA[lu].loc[yr_cal, 'Operating_cost_multiplier']
-        operating_c_effect = data.AGEC_LVSTK['FOC', lvstype] * (operating_mult - 1) * data.REAL_AREA
+    # Combine the effects on operating and labour costs, per hectare
+    c_effect_per_ha = (
+        data.AGEC_LVSTK.select([('FOC', lvstype) for lvstype in lvstypes]) * (operating_mult - 1)[:, None]
+        + data.AGEC_LVSTK.select([('FLC', lvstype) for lvstype in lvstypes]) * (labour_mult - 1)[:, None]
+    )   # (j, r)
 
-        # Get effects on labour costs
-        labour_mult = data.ECOLOGICAL_GRAZING_DATA[lu].loc[yr_cal, 'Labour_cost_mulitiplier']
-        labour_c_effect = data.AGEC_LVSTK['FLC', lvstype] * (labour_mult - 1) * data.REAL_AREA
-
-        # Combine for total cost effect
-        total_c_effect = operating_c_effect + labour_c_effect
-
-        for m in range(data.NLMS):
-            new_c_mrj[m, :, lu_idx] = total_c_effect
+    new_c_mrj[:] = (c_effect_per_ha * data.REAL_AREA).T[None, :, :]
 
     return new_c_mrj
 
@@ -413,66 +405,7 @@ def get_savanna_burning_effect_c_mrj(data, yr_idx: int):
         * data.REAL_AREA
     )
 
-    for m, j in itertools.product(range(data.NLMS), range(nlus)):
-        new_c_mrj[m, :, j] = sav_burning_effect
-
-    return new_c_mrj
-
-
-def get_agtech_ei_effect_c_mrj(data, yr_idx):
-    """
-    Applies the effects of using AgTech EI to the cost data
-    for all relevant agr. land uses.
-
-    Parameters
-    - data: The data object containing the necessary information.
-    - yr_idx: The index of the year.
-
-    Returns
-    - new_c_mrj: The updated cost data <unit: $/cell>.
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['AgTech EI']
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_c_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    if not AG_MANAGEMENTS['AgTech EI']:
-        return new_c_mrj
-
-    for m in range(data.NLMS):
-        for lu_idx, lu in enumerate(land_uses):
-            cost_per_ha = data.AGTECH_EI_DATA[lu].loc[yr_cal, 'AnnCost_per_Ha']
-            new_c_mrj[m, :, lu_idx] = cost_per_ha * data.REAL_AREA
-
-    return new_c_mrj
-
-
-def get_biochar_effect_c_mrj(data, yr_idx: int):
-    """
-    Applies the effects of using Biochar to the cost data
-    for all relevant agr. land uses.
-
-    Parameters
-    - data: The data object containing the necessary information.
-    - yr_idx: The index of the year.
-
-    Returns
-    - new_c_mrj: The updated cost data <unit: $/cell>.
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Biochar']
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_c_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Biochar']:
-        return new_c_mrj
-
-    for m in range(data.NLMS):
-        for lu_idx, lu in enumerate(land_uses):
-            cost_per_ha = data.BIOCHAR_DATA[lu].loc[yr_cal, 'AnnCost_per_Ha']
-            new_c_mrj[m, :, lu_idx] = cost_per_ha * data.REAL_AREA
+    new_c_mrj[:] = sav_burning_effect[None, :, None]
 
     return new_c_mrj
 
@@ -535,11 +468,11 @@ def get_agricultural_management_cost_matrices(data: Data, c_mrj, yr_idx):
             The keys are the names of the practices and the values are the corresponding cost matrices.
     """
     asparagopsis_data = get_asparagopsis_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['Asparagopsis taxiformis'] else 0
-    precision_agriculture_data = get_precision_agriculture_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['Precision Agriculture'] else 0
+    precision_agriculture_data = get_cost_per_ha_effect_c_mrj(data, 'Precision Agriculture', yr_idx) if AG_MANAGEMENTS['Precision Agriculture'] else 0
     eco_grazing_data = get_ecological_grazing_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['Ecological Grazing'] else 0
     sav_burning_data = get_savanna_burning_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['Savanna Burning'] else 0
-    agtech_ei_data = get_agtech_ei_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['AgTech EI'] else 0
-    biochar_data = get_biochar_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['Biochar'] else 0
+    agtech_ei_data = get_cost_per_ha_effect_c_mrj(data, 'AgTech EI', yr_idx) if AG_MANAGEMENTS['AgTech EI'] else 0
+    biochar_data = get_cost_per_ha_effect_c_mrj(data, 'Biochar', yr_idx) if AG_MANAGEMENTS['Biochar'] else 0
     beef_hir_data = get_beef_hir_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['Beef - HIR'] else 0
     sheep_hir_data = get_sheep_hir_effect_c_mrj(data, yr_idx) if AG_MANAGEMENTS['Sheep - HIR'] else 0
 
@@ -26,27 +26,61 @@ Pure functions to calculate greenhouse gas emissions by lm, lu.
 
 import itertools
 import numpy as np
-import pandas as pd
 
 from luto.data import Data
-import luto.tools as tools
 from luto import settings
 from luto.economics.agricultural.quantity import get_yield_pot
 from luto.economics.agricultural.quantity import lvs_veg_types
 
 
-def get_ghg_crop(data, lu, lm, aggregate):
-    """Return crop GHG emissions <unit: t/cell>  of `lu`+`lm` in `yr_idx` 
-    as (np array|pd.DataFrame) depending on aggregate (True|False).
+def get_ghg_sources(data, lu, lm) -> list[str]:
+    """Return the GHG emission sources of `lu`+`lm`, in the order of the rows returned by `get_ghg`.
 
     Args:
         data (object/module): Data object or module. Assumes fields like in `luto.data`.
         lu (str): Land use (e.g. 'Winter cereals' or 'Beef - natural land').
         lm (str): Land management (e.g. 'dry', 'irr').
-        aggregate (bool): True -> return GHG emission as np.array, False -> return GHG emission as pd.DataFrame.
 
     Returns
-        np.array or pd.DataFrame: Crop GHG emissions <unit: t/cell>  of `lu`+`lm` in `yr_idx`.
+        list[str]: The GHG sources (e.g. 'CO2E_KG_HA_SOIL'); empty if the crop combination does not occur.
+
+    Raises:
+        KeyError: If land use `lu` is not found in `data.LANDUSES`.
+    """
+    if lu in data.LU_CROPS:
+        # Only crop land-use (lu) and land management (lm) combinations that exist have emissions (e.g., dryland Pears/Rice do not occur)
+        if ('CO2E_KG_HA_CHEM_APPL', lm, lu) not in data.AGGHG_CROPS:
+            return []
+        return [
+            col[0] for col in data.AGGHG_CROPS.columns
+            if col[1:] == (lm, lu) and (not settings.USE_GHG_SCOPE_1 or col[0] in settings.CROP_GHG_SCOPE_1)
+        ]
+    elif lu in data.LU_LVSTK:
+        lvstype, _ = lvs_veg_types(lu)
+        ghg_name_s = [
+            col[1] for col in data.AGGHG_LVSTK.columns
+            if col[0] == lvstype and (not settings.USE_GHG_SCOPE_1 or col[1] in settings.LVSTK_GHG_SCOPE_1)
+        ]
+        # Irrigated pastures also emit from irrigation.
+        if lm == 'irr':
+            ghg_name_s += [i for i in data.AGGHG_IRRPAST.columns if 'CO2E' in i]
+        return ghg_name_s
+    elif lu in data.AGRICULTURAL_LANDUSES:
+        return ['CO2E_KG_HA_CHEM_APPL']
+    else:
+        raise KeyError(f"Land use '{lu}' not found in data.LANDUSES")
+
+
+def get_ghg_crop(data, lu, lm):
+    """Return crop GHG emissions <unit: t/cell> of `lu`+`lm` by GHG source.
+
+    Args:
+        data (object/module): Data object or module. Assumes fields like in `luto.data`.
+        lu (str): Land use (e.g. 'Winter cereals').
+        lm (str): Land management (e.g. 'dry', 'irr').
+
+    Returns
+        np.ndarray: Crop GHG emissions <unit: t/cell>, shape (s, r) with sources `s` as in `get_ghg_sources`.
 
     Crop GHG emissions include:
         - 'CO2E_KG_HA_CHEM_APPL'
@@ -59,49 +93,26 @@ def get_ghg_crop(data, lu, lm, aggregate):
         - 'CO2E_KG_HA_SOIL'
         - 'CO2E_KG_HA_SOWING'
     """
-    
-    # Process GHG_crop only if the land-use (lu) and land management (lm) combination exists (e.g., dryland Pears/Rice do not occur)
-    if lu in data.AGGHG_CROPS['CO2E_KG_HA_CHEM_APPL', lm].columns:
-
-        # Get the data column {ghg_rs: r -> each pixel,  s -> each GHG source}
-        if settings.USE_GHG_SCOPE_1:
-            ghg_rs = data.AGGHG_CROPS.loc[:, (data.AGGHG_CROPS.columns.get_level_values(0).isin(settings.CROP_GHG_SCOPE_1)) & 
-                                             (data.AGGHG_CROPS.columns.get_level_values(1) == lm) & 
-                                             (data.AGGHG_CROPS.columns.get_level_values(2) == lu)]
-        else:
-            ghg_rs = data.AGGHG_CROPS.loc[:, (slice(None), lm, lu)]
-
-        # Convert kg CO2e per ha to tonnes. 
-        ghg_rs /= 1000
+    # Get the data rows {ghg_sr: s -> each GHG source, r -> each pixel}
+    ghg_sr = data.AGGHG_CROPS.select([(ghg, lm, lu) for ghg in get_ghg_sources(data, lu, lm)])
 
-        # Convert tonnes CO2 per ha to tonnes CO2 per cell including resfactor
-        ghg_rs *= data.REAL_AREA[:, np.newaxis]
-
-        # Convert to MultiIndex with levels [source, lm, lu]
-        ghg_rs.columns = pd.MultiIndex.from_tuples([[col[0], lm, lu] for col in ghg_rs.columns])
-
-        # Reset the dataframe index
-        ghg_rs.reset_index(drop=True, inplace=True)
-
-        # Return greenhouse gas emissions by individual source or summed over all sources (default)
-        return ghg_rs if aggregate == False else ghg_rs.sum(axis=1).values
+    # Convert kg CO2e per ha to tonnes, then to tonnes CO2 per cell including resfactor
+    return ghg_sr / 1000 * data.REAL_AREA[np.newaxis, :]
 
 
 
 def get_ghg_lvstk( data  # Data object.
                  , lu          # Land use.
                  , lm          # Land management.
-                 , yr_idx      # Number of years post base-year ('YR_CAL_BASE').
-                 , aggregate): # GHG calculated as a total (for the solver) or by individual source (for writing outputs)
-    """Return livestock GHG emissions <unit: t/cell>  of `lu`+`lm` in `yr_idx`
-            as (np array|pd.DataFrame) depending on aggregate (True|False).
+                 , yr_idx):    # Number of years post base-year ('YR_CAL_BASE').
+    """Return livestock GHG emissions <unit: t/cell> of `lu`+`lm` in `yr_idx` by GHG source.
 
     `data`: data object/module -- assumes fields like in `luto.data`.
     `lu`: land use (e.g. 'Winter cereals' or 'Beef - natural land').
     `lm`: land management (e.g. 'dry', 'irr').
     `yr_idx`: number of years from base year, counting from zero.
-    `aggregate`: True -> return GHG emission as np.array 
-                 False -> return GHG emission as pd.DataFrame.
+
+    Returns an array of shape (s, r) with sources `s` as in `get_ghg_sources`.
     
     Livestock GHG emissions include:    
                   'CO2E_KG_HEAD_DUNG_URINE',
@@ -119,61 +130,34 @@ def get_ghg_lvstk( data  # Data object.
     # Get the yield potential, i.e. the total number of livestock head per hectare.
     yield_pot = get_yield_pot(data, lvstype, vegtype, lm, yr_idx)
 
-    # Get GHG emissions by source in kg CO2e per head of livestock.  settings.LVSTK_GHG_SCOPE_1
-    # Note: ghg_rs (r -> each cell, s -> each GHG source)
-    if settings.USE_GHG_SCOPE_1:
-        ghg_raw = data.AGGHG_LVSTK.loc[:, (data.AGGHG_LVSTK.columns.get_level_values(0) == lvstype) &
-                                          (data.AGGHG_LVSTK.columns.get_level_values(1).isin(settings.LVSTK_GHG_SCOPE_1))]
-    else:
-        ghg_raw = data.AGGHG_LVSTK.loc[:, (lvstype, slice(None)) ]
-
-    # Get the names for each GHG source
-    ghg_name_s = [ i[1] for i in ghg_raw.columns ]
-
-    # Calculate the GHG emissions (kgCO2/head * head/ha = kgCO/ha)
-    ghg_rs = ghg_raw * yield_pot[:,np.newaxis]
+    # Get the names for each GHG source; the last ones are the pasture irrigation emissions if `lm` is irrigated.
+    ghg_name_s = get_ghg_sources(data, lu, lm)
+    ghg_lvstk_irr_cols = [i for i in data.AGGHG_IRRPAST.columns if 'CO2E' in i] if lm == 'irr' else []
+    ghg_lvstk_cols = ghg_name_s[:len(ghg_name_s) - len(ghg_lvstk_irr_cols)]
 
+    # Calculate the GHG emissions (kgCO2/head * head/ha = kgCO/ha); ghg_sr (s -> each GHG source, r -> each cell)
+    ghg_sr = data.AGGHG_LVSTK.select([(lvstype, ghg) for ghg in ghg_lvstk_cols]) * yield_pot[np.newaxis, :]
 
     # Add pasture irrigation emissions.
-    if lm == 'irr':
-        ghg_lvstk_irr = data.AGGHG_IRRPAST
-        ghg_lvstk_irr_cols = [i for i in ghg_lvstk_irr.columns if 'CO2E' in i]
-        
-        ghg_rs = pd.concat([ghg_rs, ghg_lvstk_irr[ghg_lvstk_irr_cols]], axis = 1)
-        ghg_name_s += ghg_lvstk_irr_cols
-        
-
-    # Convert to tonnes of CO2e per ha. 
-    ghg_rs = ghg_rs / 1000
-
-    # Convert to tonnes CO2e per cell including resfactor
-    ghg_rs *= data.REAL_AREA[:, np.newaxis]
-
-    # Convert to MultiIndex with levels [source, lm, lu]
-    ghg_rs = pd.DataFrame(ghg_rs)
-    ghg_rs.columns = pd.MultiIndex.from_tuples( [(ghg, lm, lu) for ghg in ghg_name_s ])
-
-    # Reset dataframe index
-    ghg_rs.reset_index(drop = True, inplace = True)
-    
-    # Return the full dataframe if Aggregate == False otherwise return the sum over all GHG sources
-    return ghg_rs if aggregate == False else ghg_rs.sum(axis = 1).values
+    if ghg_lvstk_irr_cols:
+        ghg_sr = np.vstack([ghg_sr, data.AGGHG_IRRPAST.select(ghg_lvstk_irr_cols)])
+
+    # Convert to tonnes of CO2e per ha, then to tonnes CO2e per cell including resfactor
+    return ghg_sr / 1000 * data.REAL_AREA[np.newaxis, :]
        
 
 
-def get_ghg(data, lu, lm, yr_idx, aggregate):
-    """Return GHG emissions [tCO2e/cell] of `lu`+`lm` in `yr_idx` 
-    as (np array|pd.DataFrame) depending on aggregate (True|False).
+def get_ghg(data, lu, lm, yr_idx):
+    """Return GHG emissions [tCO2e/cell] of `lu`+`lm` in `yr_idx` by GHG source.
 
     Args:
         data (object/module): Data object or module. Assumes fields like in `luto.data`.
         lu (str): Land use (e.g. 'Winter cereals').
         lm (str): Land management (e.g. 'dry', 'irr').
         yr_idx (int): Number of years from base year, counting from zero.
-        aggregate (bool): True -> return GHG emission as np.array, False -> return GHG emission as pd.DataFrame.
 
     Returns
-        np.array or pd.DataFrame: GHG emissions [tCO2e/cell] of `lu`+`lm` in `yr_idx`.
+        np.ndarray: GHG emissions [tCO2e/cell] of shape (s, r), with sources `s` as in `get_ghg_sources`.
 
     Raises:
         KeyError: If land use `lu` is not found in `data.LANDUSES`.
@@ -181,220 +165,120 @@ def get_ghg(data, lu, lm, yr_idx, aggregate):
 
     # If it is a crop, it is known how to get GHG emissions.
     if lu in data.LU_CROPS:
-        return get_ghg_crop(data, lu, lm, aggregate)
+        return get_ghg_crop(data, lu, lm)
     elif lu in data.LU_LVSTK:
-        return get_ghg_lvstk(data, lu, lm, yr_idx, aggregate)
+        return get_ghg_lvstk(data, lu, lm, yr_idx)
     elif lu in data.AGRICULTURAL_LANDUSES:
-        if aggregate:
-            return np.zeros(data.NCELLS)
-        else:
-            return pd.DataFrame({('CO2E_KG_HA_CHEM_APPL', lm, lu): np.zeros(data.NCELLS)})
+        return np.zeros((1, data.NCELLS))
     else:
         raise KeyError(f"Land use '{lu}' not found in data.LANDUSES")
 
 
 
-def get_ghg_matrix(data, lm, yr_idx, aggregate):
-    """
-    Return g_rj matrix <unit: t/cell> per lu under `lm` in `yr_idx`.
-
-    Parameters
-    - data: The data object containing the necessary information.
-    - lm: The land use model.
-    - yr_idx: The index of the year.
-    - aggregate: A boolean indicating whether to aggregate the results or not.
-
-    Returns
-    - If `aggregate` is True, returns a numpy array of shape (NCELLS, len(data.AGRICULTURAL_LANDUSES)).
-    - If `aggregate` is False, returns a pandas DataFrame with columns corresponding to each agricultural land use.
-
-    """
-    if aggregate == True: 
-        g_rj = np.zeros((data.NCELLS, len(data.AGRICULTURAL_LANDUSES)))
-        for j, lu in enumerate(data.AGRICULTURAL_LANDUSES):
-            g_rj[:, j] = get_ghg(data, lu, lm, yr_idx, aggregate)
-            
-        # Make sure all NaNs are replaced by zeroes.
-        g_rj = np.nan_to_num(g_rj)
-    
-        return g_rj
-    
-    elif aggregate == False:     
-        return pd.concat([get_ghg(data, lu, lm, yr_idx, aggregate) 
-                          for lu in data.AGRICULTURAL_LANDUSES],axis=1)
-        
-
-
-def get_ghg_matrices(data, yr_idx, aggregate=True):
+def get_ghg_matrices(data, yr_idx) -> np.ndarray:
     """
     Return g_mrj matrix <unit: t/cell> as 3D Numpy array.
+
+    The emissions of each (m, j) block are summed over sources as they are calculated, so the
+    emissions by source are never held for all blocks at once.
     
     Parameters
         data (object): The data object containing the necessary information.
         yr_idx (int): The index of the year.
-        aggregate (bool, optional): Whether to aggregate the results. Defaults to True.
     
     Returns
-        numpy.ndarray or pandas.DataFrame: The GHG emissions matrix as a 3D Numpy array if aggregate is True,
-        or as a pandas DataFrame if aggregate is False.
+        numpy.ndarray: The float32 GHG emissions matrix of shape (NLMS, NCELLS, N_AG_LUS).
     """
-    
-    if aggregate == True:  
-        return np.stack(
-            tuple(
-                get_ghg_matrix(data, lm, yr_idx, aggregate)
-                for lm in data.LANDMANS
-            )
-        )
-    elif aggregate == False:   
-        return pd.concat([get_ghg_matrix(data, lu, yr_idx, aggregate) 
-                          for lu in data.LANDMANS], axis=1)
-
+    g_mrj, _, _ = calc_ghg_matrices(data, yr_idx)
+    return g_mrj
 
 
-def get_ghg_penalties_lvstck_natural_to_unall_natural(data, lumap) -> np.ndarray:
-    """
-    Gets the one-off greenhouse gas penalties for transitioning livestock natural land to unallocated natural land.
-    
-    Parameters
-        data (object): The data object containing relevant information.
-        lumap (1D array): The lumap object containing land use mapping.
-
-    Returns
-        np.ndarray, <unit : t/cell>.
+def get_ghg_by_source(data, yr_idx, dvar_mrj: np.ndarray) -> tuple[np.ndarray, list[str], np.ndarray]:
     """
-    
-    ncells, n_ag_lus = data.REAL_AREA.shape[0], len(data.AGRICULTURAL_LANDUSES)
-    lvstk_natural_cells = tools.get_lvstk_natural_lu_cells(data, lumap)
-    penalties_lvstk_natural_to_unall_natural_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
-    
-    penalties_lvstk_natural_to_unall_natural_r = (
-          data.GHG_PENALTY_LVSTK_NATURAL_TO_UNALL_NATURAL[lvstk_natural_cells]
-        * data.REAL_AREA[lvstk_natural_cells]
-    )
-    
-    for lu in [data.DESC2AGLU["Unallocated - natural land"]]:
-        penalties_lvstk_natural_to_unall_natural_rj[lvstk_natural_cells, lu] = penalties_lvstk_natural_to_unall_natural_r
-        
-    return np.stack([penalties_lvstk_natural_to_unall_natural_rj] * 2)
+    Return the g_mrj matrix <unit: t/cell> together with the GHG emissions <unit: t> by source of the land
+    allocation `dvar_mrj`, in a single pass over the (m, j) blocks.
 
-
-
-
-def get_ghg_penalties_unall_natural_to_lvstk_natural(data, lumap) -> np.ndarray:
-    """
-    Gets the one-off greenhouse gas penalties for transitioning unallocated natural land to livestock natural land.
-    
     Parameters
-        data (object): The data object containing relevant information.
-        lumap (1D array): The lumap object containing land use mapping.
+        data (object): The data object containing the necessary information.
+        yr_idx (int): The index of the year.
+        dvar_mrj (np.ndarray): The agricultural decision variables (land allocation) of shape (NLMS, NCELLS, N_AG_LUS).
 
     Returns
-        np.ndarray, <unit : t/cell>.
+        tuple: (g_mrj, sources, ghg_smj), where `g_mrj` is `get_ghg_matrices(data, yr_idx)` and `ghg_smj` is a
+        float array of shape (len(sources), NLMS, N_AG_LUS) of the emissions summed over cells, which is zero for
+        the sources that do not apply to a land use and land management.
     """
-    
-    ncells, n_ag_lus = data.REAL_AREA.shape[0], len(data.AGRICULTURAL_LANDUSES)
-    unall_natural_cells = tools.get_unallocated_natural_lu_cells(data, lumap)
-    penalties_unall_natural_to_lvstk_natural_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
-    
-    penalties_unall_natural_to_lvstk_natural_r = (
-          data.GHG_PENALTY_UNALL_NATURAL_TO_LVSTK_NATURAL[unall_natural_cells]
-        * data.REAL_AREA[unall_natural_cells]
-    ) 
-    
-    for lu in data.LU_LVSTK_NATURAL:
-        penalties_unall_natural_to_lvstk_natural_rj[unall_natural_cells, lu] = penalties_unall_natural_to_lvstk_natural_r
-        
-    return np.stack([penalties_unall_natural_to_lvstk_natural_rj] * 2)
-
+    return calc_ghg_matrices(data, yr_idx, dvar_mrj)
 
-def get_ghg_penalties_lvstk_natural_to_modified(data, lumap) -> np.ndarray:
-    """
-    Gets the one-off greenhouse gas penalties for transitioning livestock natural land to modified land.
-    
-    Parameters
-        data (object): The data object containing relevant information.
-        lumap (1D array): The lumap object containing land use mapping.
 
-    Returns
-        np.ndarray, <unit : t/cell>.
+def calc_ghg_matrices(data, yr_idx, dvar_mrj: np.ndarray = None) -> tuple[np.ndarray, list[str], np.ndarray]:
     """
-    
-    ncells, n_ag_lus = data.REAL_AREA.shape[0], len(data.AGRICULTURAL_LANDUSES)
-    lvstk_natural_cells = tools.get_lvstk_natural_lu_cells(data, lumap)
-    penalties_lvstk_natural_to_modified_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
-    
-    penalties_lvstk_natural_to_modified_r = (
-          data.GHG_PENALTY_LVSTK_NATURAL_TO_MODIFIED[lvstk_natural_cells]
-        * data.REAL_AREA[lvstk_natural_cells]
-    )
-    
-    for lu in data.LU_MODIFIED_LAND:
-        penalties_lvstk_natural_to_modified_rj[lvstk_natural_cells, lu] = penalties_lvstk_natural_to_modified_r
-        
-    return np.stack([penalties_lvstk_natural_to_modified_rj] * 2)
-
-
-
-def get_ghg_penalties_unall_natural_to_modified(data, lumap) -> np.ndarray:
+    Calculate the g_mrj matrix one (m, j) block at a time and, if `dvar_mrj` is given, reduce each block's
+    emissions by source over the cells of `dvar_mrj`; see `get_ghg_matrices` and `get_ghg_by_source`.
     """
-    Gets the one-off greenhouse gas penalties for transitioning unallocated natural land to modified land.
+    g_mrj = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
 
-    Parameters
-        data (object): The data object containing relevant information.
-        lumap (1D array): The lumap object containing land use mapping.
-
-    Returns
-        np.ndarray, <unit : t/cell>.
-    """
-    ncells, n_ag_lus = data.REAL_AREA.shape[0], len(data.AGRICULTURAL_LANDUSES)
-    unall_natural_cells = tools.get_unallocated_natural_lu_cells(data, lumap)
-    penalties_unall_natural_to_modified_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
-
-    # Get GHG penalties from current land use to future land use
-    penalties_unall_natural_to_modified_r = (
-          data.GHG_PENALTY_UNALL_NATURAL_TO_MODIFIED[unall_natural_cells]
-        * data.REAL_AREA[unall_natural_cells]
-    )
+    sources_mj = {
+        (m, j): get_ghg_sources(data, lu, lm)
+        for m, lm in enumerate(data.LANDMANS)
+        for j, lu in enumerate(data.AGRICULTURAL_LANDUSES)
+    }
+    sources = list(dict.fromkeys(s for sources_s in sources_mj.values() for s in sources_s))
+    source2idx = {s: i for i, s in enumerate(sources)}
+    ghg_smj = np.zeros((len(sources), data.NLMS, data.N_AG_LUS)) if dvar_mrj is not None else None
 
-    # Assign the penalties to the transition matrices
-    for lu in data.LU_MODIFIED_LAND:
-        penalties_unall_natural_to_modified_rj[unall_natural_cells, lu] = penalties_unall_natural_to_modified_r
+    for m, lm in enumerate(data.LANDMANS):
+        for j, lu in enumerate(data.AGRICULTURAL_LANDUSES):
+            g_sr = get_ghg(data, lu, lm, yr_idx)
+            g_mrj[m, :, j] = np.nansum(g_sr, axis=0)
 
-    return np.stack([penalties_unall_natural_to_modified_rj] * 2)
+            if dvar_mrj is not None and sources_mj[m, j]:
+                ghg_smj[[source2idx[s] for s in sources_mj[m, j]], m, j] = (
+                    np.nan_to_num(g_sr).astype(np.float32) @ dvar_mrj[m, :, j]
+                )
 
+    # Make sure all NaNs are replaced by zeroes.
+    return np.nan_to_num(g_mrj), sources, ghg_smj
 
 
 
-def get_ghg_penalties_lvstk_natural_to_modified(data, lumap) -> np.ndarray:
+def get_ghg_transition_penalty_types(data) -> dict[str, tuple[list[int], list[int], np.ndarray]]:
     """
-    Gets the one-off greenhouse gas penalties for transitioning livestock natural land to modified land.
+    Gets the one-off greenhouse gas penalty of each type of transition between land uses.
 
     Parameters
         data (object): The data object containing relevant information.
-        lumap (1D array): The lumap object containing land use mapping.
 
     Returns
-        penalties (np.ndarray) : <unit : t/cell>.
+        dict: {transition type: (from land uses, to land uses, penalties_r <unit : t/cell>)}, where a cell
+            currently under one of the `from` land uses incurs `penalties_r` when switching to one of the `to` land uses.
     """
-    ncells, n_ag_lus = data.REAL_AREA.shape[0], len(data.AGRICULTURAL_LANDUSES)
-    lvstk_natural_cells = tools.get_lvstk_natural_lu_cells(data, lumap)
-    penalties_lvstk_natural_to_modified_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
-
-    # Get GHG penalties from current land use to future land use
-    penalties_lvstk_natural_to_modified_r = (
-          data.GHG_PENALTY_LVSTK_NATURAL_TO_MODIFIED[lvstk_natural_cells]
-        * data.REAL_AREA[lvstk_natural_cells]
-    )
-    
-    # Assign the penalties to the transition matrices
-    for lu in data.LU_MODIFIED_LAND:
-        penalties_lvstk_natural_to_modified_rj[lvstk_natural_cells, lu] = penalties_lvstk_natural_to_modified_r
-
-    return np.stack([penalties_lvstk_natural_to_modified_rj] * 2)
+    unall_natural_j = [data.DESC2AGLU["Unallocated - natural land"]]
+    return {
+        'Livestock natural to unallocated natural': (
+            data.LU_LVSTK_NATURAL,
+            unall_natural_j,
+            data.GHG_PENALTY_LVSTK_NATURAL_TO_UNALL_NATURAL * data.REAL_AREA * 0,   # TODO: BIARRI will implement new non-ag stratagies (destocked natural land) coverting this
+        ),
+        'Unallocated natural to livestock natural': (
+            unall_natural_j,
+            data.LU_LVSTK_NATURAL,
+            data.GHG_PENALTY_UNALL_NATURAL_TO_LVSTK_NATURAL * data.REAL_AREA,
+        ),
+        'Livestock natural to modified': (
+            data.LU_LVSTK_NATURAL,
+            data.LU_MODIFIED_LAND,
+            data.GHG_PENALTY_LVSTK_NATURAL_TO_MODIFIED * data.REAL_AREA,
+        ),
+        'Unallocated natural to modified': (
+            unall_natural_j,
+            data.LU_MODIFIED_LAND,
+            data.GHG_PENALTY_UNALL_NATURAL_TO_MODIFIED * data.REAL_AREA,
+        ),
+    }
 
 
-def get_ghg_transition_penalties(data, lumap, separate=False) -> np.ndarray:
+def get_ghg_transition_penalties(data, lumap, separate=False, cells=None) -> np.ndarray:
     """
     Get the one-off greenhouse gas penalties for transitioning between land uses.
 
@@ -402,31 +286,27 @@ def get_ghg_transition_penalties(data, lumap, separate=False) -> np.ndarray:
       data (object): The data object containing relevant information.
       lumap (np.ndarray): The lumap object containing land use mapping.
       separate (bool): Whether to return the penalties for each transition separately.
+      cells (np.ndarray, optional): Indices of the cells to get the penalties for, in which case the
+        r-axis of the output only holds these cells. All cells if None.
 
     Returns
-      greenhouse-gas-transition-penalties (np.ndarray): The greenhouse gas transition penalties.
+      greenhouse-gas-transition-penalties (np.ndarray): The greenhouse gas transition penalties <unit : t/cell>.
     """
-   
-    penalties_lvstck_natural_to_unall_natural = get_ghg_penalties_lvstck_natural_to_unall_natural(data, lumap) * 0 # TODO: BIARRI will implement new non-ag stratagies (destocked natural land) coverting this 
-    penalties_unall_natural_to_lvstck_natural = get_ghg_penalties_unall_natural_to_lvstk_natural(data, lumap)
-    penalties_lvstck_natural_to_modified = get_ghg_penalties_lvstk_natural_to_modified(data, lumap)
-    penalties_unall_natural_to_modified = get_ghg_penalties_unall_natural_to_modified(data, lumap)
-    
-    if separate:
-        ghg_trainsition_penalties = {
-            'Livestock natural to unallocated natural': penalties_lvstck_natural_to_unall_natural,
-            'Unallocated natural to livestock natural': penalties_unall_natural_to_lvstck_natural,
-            'Livestock natural to modified': penalties_lvstck_natural_to_modified,
-            'Unallocated natural to modified': penalties_unall_natural_to_modified
-        }
+    cells = slice(None) if cells is None else cells
+    lumap = lumap[cells]
+    ncells, n_ag_lus = lumap.shape[0], len(data.AGRICULTURAL_LANDUSES)
 
-    else:
-        ghg_trainsition_penalties = penalties_lvstck_natural_to_unall_natural \
-            + penalties_unall_natural_to_lvstck_natural \
-            + penalties_lvstck_natural_to_modified \
-            + penalties_unall_natural_to_modified \
-    
-    return ghg_trainsition_penalties
+    ghg_trainsition_penalties = {}
+    for t_type, (from_lus, to_lus, penalties_r) in get_ghg_transition_penalty_types(data).items():
+        penalties_r = penalties_r[cells]
+        from_cells = np.nonzero(np.isin(lumap, from_lus))[0]
+        penalties_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
+        penalties_rj[np.ix_(from_cells, to_lus)] = penalties_r[from_cells, np.newaxis]
+        ghg_trainsition_penalties[t_type] = np.stack([penalties_rj] * 2)
+
+    if separate:
+        return ghg_trainsition_penalties
+    return sum(ghg_trainsition_penalties.values())
     
     
     
@@ -446,6 +326,70 @@ def get_ghg_limits(data, target):
 
 
 
+def get_crop_emissions_effect_g_mrj(data, am, co2e_types, yr_idx):
+    """
+    Applies the reductions of crop emission sources of agricultural management option `am` to the GHG data
+    for all relevant agr. land uses.
+
+    Parameters
+    - data: The input data containing the necessary information.
+    - am: The agricultural management option.
+    - co2e_types: {emission source of `data.AGGHG_CROPS`: (column of the `am` coefficient table, land managements)},
+        where the reduction applies to the given land managements only.
+    - yr_idx: The index of the year to calculate the effects for.
+
+    Returns
+    - new_g_mrj: The matrix <unit: t/cell> containing the GHG reductions of `am`.
+    """
+    land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES[am]
+    first_source = data.AGGHG_CROPS.columns[0][0]
+
+    # Set up the effects matrix
+    new_g_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
+
+    for co2e_type, (coef_col, lms) in co2e_types.items():
+        reduction_perc = 1 - data.get_ag_man_coefs(am, coef_col, yr_idx)
+
+        for m, lm in enumerate(data.LANDMANS):
+            if lm not in lms:
+                continue
+
+            # Skip land-use/land management combinations that do not exist (e.g., dryland Pears/Rice do not occur)
+            lu_idx = [
+                j for j, lu in enumerate(land_uses)
+                if reduction_perc[j] != 0 and (first_source, lm, lu) in data.AGGHG_CROPS
+            ]
+            if not lu_idx:
+                continue
+
+            reduction_amnt = (
+                np.nan_to_num(data.AGGHG_CROPS.select([(co2e_type, lm, land_uses[j]) for j in lu_idx]))
+                * reduction_perc[lu_idx, None]
+                / 1000            # convert to tonnes
+                * data.REAL_AREA  # adjust for resfactor
+            )
+            new_g_mrj[m][:, lu_idx] -= reduction_amnt.T
+
+    return new_g_mrj
+
+
+def get_soil_carbon_effect_g_rj(data, am, yr_idx):
+    """
+    Return the soil carbon benefit <unit: t/cell> of agricultural management option `am`
+    for all relevant agr. land uses, as an (r, j) array.
+    """
+    soil_multiplier = data.get_ag_man_coefs(am, 'IMPACTS_soil_carbon', yr_idx) - 1
+
+    soil_reduction_rj = np.zeros((data.NCELLS, soil_multiplier.size))
+    lu_idx = np.flatnonzero(soil_multiplier != 0)
+    soil_reduction_rj[:, lu_idx] = (
+        data.SOIL_CARBON_AVG_T_CO2_HA[:, None]
+        * soil_multiplier[lu_idx]
+        * data.REAL_AREA[:, None]  # adjust for resfactor
+    )
+    return soil_reduction_rj
+
+
 def get_asparagopsis_effect_g_mrj(data, yr_idx):
     """
     Applies the effects of using asparagopsis to the GHG data
@@ -462,7 +406,6 @@ def get_asparagopsis_effect_g_mrj(data, yr_idx):
     the reduction amount for each land use and management type.
     """
     land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES["Asparagopsis taxiformis"]
-    yr_cal = data.YR_CAL_BASE + yr_idx
 
     # Set up the effects matrix
     new_g_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
@@ -470,26 +413,25 @@ def get_asparagopsis_effect_g_mrj(data, yr_idx):
     if not settings.AG_MANAGEMENTS['Asparagopsis taxiformis']:
         return new_g_mrj
 
+    ch4_reduction_percs = 1 - data.get_ag_man_coefs('Asparagopsis taxiformis', 'CO2E_KG_HEAD_ENTERIC', yr_idx)
+
     # Update values in the new matrix, taking into account the CH4 reduction of asparagopsis
-    for lu_idx, lu in enumerate(land_uses):
-        ch4_reduction_perc = 1 - data.ASPARAGOPSIS_DATA[lu].loc[yr_cal, "CO2E_KG_HEAD_ENTERIC"]
-
-        if ch4_reduction_perc != 0:
-            for lm in data.LANDMANS:
-                m = 0 if lm == 'irr' else 1
-                # Subtract enteric fermentation emissions multiplied by reduction multiplier
-                lvstype, vegtype = lvs_veg_types(lu)
-
-                yield_pot = get_yield_pot(data, lvstype, vegtype, lm, yr_idx)
-
-                reduction_amnt = (
-                    data.AGGHG_LVSTK[lvstype, "CO2E_KG_HEAD_ENTERIC"].to_numpy()
-                    * yield_pot
-                    * ch4_reduction_perc
-                    / 1000            # convert to tonnes
-                    * data.REAL_AREA  # adjust for resfactor
-                )
-                new_g_mrj[m, :, lu_idx] = -reduction_amnt
+    for lu_idx in np.flatnonzero(ch4_reduction_percs != 0):
+        lvstype, vegtype = lvs_veg_types(land_uses[lu_idx])
+
+        for lm in data.LANDMANS:
+            m = 0 if lm == 'irr' else 1
+            # Subtract enteric fermentation emissions multiplied by reduction multiplier
+            yield_pot = get_yield_pot(data, lvstype, vegtype, lm, yr_idx)
+
+            reduction_amnt = (
+                data.AGGHG_LVSTK[lvstype, "CO2E_KG_HEAD_ENTERIC"]
+                * yield_pot
+                * ch4_reduction_percs[lu_idx]
+                / 1000            # convert to tonnes
+                * data.REAL_AREA  # adjust for resfactor
+            )
+            new_g_mrj[m, :, lu_idx] = -reduction_amnt
 
     return new_g_mrj
 
@@ -506,42 +448,22 @@ def get_precision_agriculture_effect_g_mrj(data, yr_idx):
     Returns
     - new_g_mrj: The matrix <unit: t/cell> containing the updated GHG data after applying the effects of precision agriculture.
     """
-
     land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['Precision Agriculture']
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_g_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
 
     if not settings.AG_MANAGEMENTS['Precision Agriculture']:
-        return new_g_mrj
-
-    # Update values in the new matrix
-    for lu_idx, lu in enumerate(land_uses):
-        lu_data = data.PRECISION_AGRICULTURE_DATA[lu]
-
-        for lm in data.LANDMANS:
-            m = 0 if lm == 'dry' else 1
-            for co2e_type in [
-                'CO2E_KG_HA_CHEM_APPL',
-                'CO2E_KG_HA_CROP_MGT',
-                'CO2E_KG_HA_PEST_PROD',
-                'CO2E_KG_HA_SOIL'
-            ]:
-                # Check if land-use/land management combination exists (e.g., dryland Pears/Rice do not occur), if not use zeros
-                if lu not in data.AGGHG_CROPS[data.AGGHG_CROPS.columns[0][0], lm].columns:
-                    continue
-
-                reduction_perc = 1 - lu_data.loc[yr_cal, co2e_type]
-
-                if reduction_perc != 0:
-                    reduction_amnt = (
-                        np.nan_to_num(data.AGGHG_CROPS[co2e_type, lm, lu].to_numpy().copy(), 0)
-                        * reduction_perc
-                        / 1000            # convert to tonnes
-                        * data.REAL_AREA  # adjust for resfactor
-                    )
-                    new_g_mrj[m, :, lu_idx] -= reduction_amnt
+        return np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
+
+    new_g_mrj = get_crop_emissions_effect_g_mrj(
+        data,
+        'Precision Agriculture',
+        {co2e_type: (co2e_type, data.LANDMANS) for co2e_type in [
+            'CO2E_KG_HA_CHEM_APPL',
+            'CO2E_KG_HA_CROP_MGT',
+            'CO2E_KG_HA_PEST_PROD',
+            'CO2E_KG_HA_SOIL'
+        ]},
+        yr_idx
+    )
 
     if np.isnan(new_g_mrj).any():
         raise ValueError("Error in data: NaNs detected in agricultural management options' GHG effect matrix.")
@@ -563,7 +485,6 @@ def get_ecological_grazing_effect_g_mrj(data, yr_idx):
     """
 
     land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['Ecological Grazing']
-    yr_cal = data.YR_CAL_BASE + yr_idx
 
     # Set up the effects matrix
     new_g_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
@@ -571,36 +492,25 @@ def get_ecological_grazing_effect_g_mrj(data, yr_idx):
     if not settings.AG_MANAGEMENTS['Ecological Grazing']:
         return new_g_mrj
 
-    # Update values in the new matrix
-    for lu_idx, lu in enumerate(land_uses):
-        lu_data = data.ECOLOGICAL_GRAZING_DATA[lu]
+    # Subtract leach runoff carbon benefit
+    leach_reduction_percs = 1 - data.get_ag_man_coefs('Ecological Grazing', 'CO2E_KG_HEAD_IND_LEACH_RUNOFF', yr_idx)
+    for lu_idx in np.flatnonzero(leach_reduction_percs != 0):
+        lvstype, vegtype = lvs_veg_types(land_uses[lu_idx])
 
-        for lm in data.LANDMANS:
-            m = 0 if lm == 'dry' else 1
-            # Subtract leach runoff carbon benefit
-            leach_reduction_perc = 1 - lu_data.loc[yr_cal, 'CO2E_KG_HEAD_IND_LEACH_RUNOFF']
-            if leach_reduction_perc != 0:
-                lvstype, vegtype = lvs_veg_types(lu)
-                yield_pot = get_yield_pot(data, lvstype, vegtype, lm, yr_idx)
-
-                leach_reduction_amnt = (
-                    data.AGGHG_LVSTK[lvstype, 'CO2E_KG_HEAD_IND_LEACH_RUNOFF'].to_numpy()
-                    * yield_pot       # convert to HAs
-                    * leach_reduction_perc
-                    / 1000            # convert to tonnes
-                    * data.REAL_AREA  # adjust for resfactor
-                )
-                new_g_mrj[m, :, lu_idx] -= leach_reduction_amnt
-
-            # Subtract soil carbon benefit
-            soil_multiplier = lu_data.loc[yr_cal, 'IMPACTS_soil_carbon'] - 1
-            if soil_multiplier != 0:
-                soil_reduction_amnt = (
-                    data.SOIL_CARBON_AVG_T_CO2_HA
-                    * soil_multiplier
-                    * data.REAL_AREA  # adjust for resfactor
-                )
-                new_g_mrj[m, :, lu_idx] -= soil_reduction_amnt
+        for m, lm in enumerate(data.LANDMANS):
+            yield_pot = get_yield_pot(data, lvstype, vegtype, lm, yr_idx)
+
+            leach_reduction_amnt = (
+                data.AGGHG_LVSTK[lvstype, 'CO2E_KG_HEAD_IND_LEACH_RUNOFF']
+                * yield_pot       # convert to HAs
+                * leach_reduction_percs[lu_idx]
+                / 1000            # convert to tonnes
+                * data.REAL_AREA  # adjust for resfactor
+            )
+            new_g_mrj[m, :, lu_idx] -= leach_reduction_amnt
+
+    # Subtract soil carbon benefit
+    new_g_mrj -= get_soil_carbon_effect_g_rj(data, 'Ecological Grazing', yr_idx)[None, :, :]
 
     return new_g_mrj
 
@@ -645,63 +555,20 @@ def get_agtech_ei_effect_g_mrj(data, yr_idx):
     - new_g_mrj: The matrix <unit: t/cell> containing the updated GHG data after applying the AgTech EI effects.
     """
     land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['AgTech EI']
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_g_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
 
     if not settings.AG_MANAGEMENTS['AgTech EI']:
-        return new_g_mrj
-
-    # Update values in the new matrix
-    for lu_idx, lu in enumerate(land_uses):
-        lu_data = data.AGTECH_EI_DATA[lu]
+        return np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
 
-        for lm in data.LANDMANS:
-            m = 0 if lm == 'dry' else 1
-            for co2e_type in [
-                'CO2E_KG_HA_CHEM_APPL',
-                'CO2E_KG_HA_CROP_MGT',
-                'CO2E_KG_HA_PEST_PROD',
-                'CO2E_KG_HA_SOIL'
-            ]:    
-                # Check if land-use/land management combination exists (e.g., dryland Pears/Rice do not occur), if not use zeros
-                if lu not in data.AGGHG_CROPS[data.AGGHG_CROPS.columns[0][0], lm].columns:
-                    continue
-
-                reduction_perc = 1 - lu_data.loc[yr_cal, co2e_type]
-
-                if reduction_perc != 0:
-                    reduction_amnt = (
-                        np.nan_to_num(data.AGGHG_CROPS[co2e_type, lm, lu].to_numpy().copy(), 0) 
-                        * reduction_perc
-                        / 1000            # convert to tonnes
-                        * data.REAL_AREA  # adjust for resfactor
-                    )
-                    new_g_mrj[m, :, lu_idx] -= reduction_amnt
-
-            # Subtract extra 'CO2e_KG_HA_IRRIG' carbon for irrigated land uses
-            if m == 1:
-                if lu not in data.AGGHG_CROPS[data.AGGHG_CROPS.columns[0][0], lm].columns:
-                    continue
-
-                # Columns names for irrig. CO2e are inconsistent across sheets
-                irrig_co2e_col = 'CO2e_KG_HA_IRRIG'
-                if 'CO2E_KG_HA_IRRIG' in lu_data.columns:
-                    irrig_co2e_col = 'CO2E_KG_HA_IRRIG'
-
-                reduction_perc = 1 - lu_data.loc[yr_cal, irrig_co2e_col]
-
-                if reduction_perc != 0:
-                    reduction_amnt = (
-                        np.nan_to_num(data.AGGHG_CROPS['CO2E_KG_HA_IRRIG', lm, lu].copy().to_numpy(), 0) 
-                        * reduction_perc
-                        / 1000            # convert to tonnes
-                        * data.REAL_AREA  # adjust for resfactor
-                    )
-                    new_g_mrj[m, :, lu_idx] -= reduction_amnt
+    co2e_types = {co2e_type: (co2e_type, data.LANDMANS) for co2e_type in [
+        'CO2E_KG_HA_CHEM_APPL',
+        'CO2E_KG_HA_CROP_MGT',
+        'CO2E_KG_HA_PEST_PROD',
+        'CO2E_KG_HA_SOIL'
+    ]}
+    # Subtract extra 'CO2E_KG_HA_IRRIG' carbon for irrigated land uses
+    co2e_types['CO2E_KG_HA_IRRIG'] = ('CO2E_KG_HA_IRRIG', ['irr'])
 
-    return new_g_mrj
+    return get_crop_emissions_effect_g_mrj(data, 'AgTech EI', co2e_types, yr_idx)
 
 
 def get_biochar_effect_g_mrj(data, yr_idx):
@@ -717,51 +584,22 @@ def get_biochar_effect_g_mrj(data, yr_idx):
     - new_g_mrj: The matrix <unit: t/cell> containing the updated GHG data after applying the Biochar effects.
     """
     land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['Biochar']
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_g_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
 
     if not settings.AG_MANAGEMENTS['Biochar']:
-        return new_g_mrj
-
-    # Update values in the new matrix
-    for lu_idx, lu in enumerate(land_uses):
-        lu_data = data.BIOCHAR_DATA[lu]
+        return np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
+
+    new_g_mrj = get_crop_emissions_effect_g_mrj(
+        data,
+        'Biochar',
+        {
+            'CO2E_KG_HA_CROP_MGT': ('CO2E_KG_HA_CROP_MGT', data.LANDMANS),
+            'CO2E_KG_HA_SOIL': ('CO2E_KG_HA_SOIL_N_SURP', data.LANDMANS),
+        },
+        yr_idx
+    )
 
-        for lm in data.LANDMANS:
-            m = 0 if lm == 'dry' else 1
-            for co2e_type in [
-                'CO2E_KG_HA_CROP_MGT',
-                'CO2E_KG_HA_SOIL',  # TODO: the column in the data refers to CO2E_KG_HA_SOIL_N_SURP
-            ]:
-                # Check if land-use/land management combination exists (e.g., dryland Pears/Rice do not occur), if not use zeros
-                if lu not in data.AGGHG_CROPS[data.AGGHG_CROPS.columns[0][0], lm].columns:
-                    continue
-                
-                if co2e_type == 'CO2E_KG_HA_SOIL':
-                    reduction_perc = 1 - lu_data.loc[yr_cal, 'CO2E_KG_HA_SOIL_N_SURP']
-                else:
-                    reduction_perc = 1 - lu_data.loc[yr_cal, co2e_type]
-
-                if reduction_perc != 0:
-                    reduction_amnt = (
-                        np.nan_to_num(data.AGGHG_CROPS[co2e_type, lm, lu].to_numpy().copy(), 0) 
-                        * reduction_perc
-                        / 1000            # convert to tonnes
-                        * data.REAL_AREA  # adjust for resfactor
-                    )
-                    new_g_mrj[m, :, lu_idx] -= reduction_amnt
-
-            # Subtract soil carbon benefit
-            soil_multiplier = lu_data.loc[yr_cal, 'IMPACTS_soil_carbon'] - 1
-            if soil_multiplier != 0:
-                soil_reduction_amnt = (
-                    data.SOIL_CARBON_AVG_T_CO2_HA
-                    * soil_multiplier
-                    * data.REAL_AREA  # adjust for resfactor
-                )
-                new_g_mrj[m, :, lu_idx] -= soil_reduction_amnt
+    # Subtract soil carbon benefit
+    new_g_mrj -= get_soil_carbon_effect_g_rj(data, 'Biochar', yr_idx)[None, :, :]
 
     return new_g_mrj
 
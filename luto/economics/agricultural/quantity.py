@@ -25,11 +25,51 @@ Pure functions for calculating the production quantities of agricutlural commodi
 
 from typing import Dict
 import numpy as np
-from scipy.interpolate import interp1d
 
+import luto.settings as settings
 from luto.settings import AG_MANAGEMENTS, HIR_PRODUCTIVITY_PENALTY, AG_MANAGEMENTS_TO_LAND_USES
 
 
+def get_quantity_cache(data, yr_idx) -> dict:
+    """
+    Return the cache {key: array} of the quantities (and the costs and revenues derived from them)
+    already calculated for year index `yr_idx`.
+
+    The caches of the `settings.AG_QUANTITY_CACHE_YEARS` most recently used years are kept in
+    `data.AG_Q_BY_YR`; when a new year is added, the least recently used year is dropped.
+    """
+    cache = data.AG_Q_BY_YR
+    if yr_idx in cache:
+        cache[yr_idx] = cache.pop(yr_idx)   # Move to the end as the most recently used year
+        return cache[yr_idx]
+
+    while cache and len(cache) >= max(settings.AG_QUANTITY_CACHE_YEARS, 1):
+        cache.pop(next(iter(cache)))
+    cache[yr_idx] = {}
+    return cache[yr_idx]
+
+
+def get_cached_quantity(data, yr_idx, key, calc_func) -> np.ndarray:
+    """
+    Return the array `key` of year index `yr_idx` from the quantity cache, calculating it with `calc_func()`
+    if it is not cached yet. Cached arrays are read-only because they are shared by all callers.
+    """
+    cache = get_quantity_cache(data, yr_idx)
+    if key not in cache:
+        arr = np.asarray(calc_func())
+        arr.flags.writeable = False
+        cache[key] = arr
+    return cache[key]
+
+
+def clear_quantity_cache(data) -> None:
+    """
+    Drop all cached quantities. Call this after modifying any input of the quantity calculations
+    (e.g., yields, climate change impacts or productivity increases) on a loaded Data object.
+    """
+    data.AG_Q_BY_YR.clear()
+
+
 def lvs_veg_types(lu) -> tuple[str, str]:
     """Return livestock and vegetation types of the livestock land-use `lu`.
 
@@ -80,29 +120,61 @@ def get_ccimpact(data, lu, lm, yr_idx):
     - The climate change impact multiplier at the specified year index.
     """
 
-    # Check if land-use exists in CLIMATE_CHANGE_IMPACT (e.g., dryland Pears/Rice do not occur), if not return ones
-    if lu not in {t[0] for t in data.CLIMATE_CHANGE_IMPACT[lm].columns}:
+    # Check if land-use is an agricultural land-use, if not return ones
+    if lu not in data.DESC2AGLU:
         return np.ones((data.NCELLS))
 
+    return get_ccimpact_mrj(data, yr_idx)[data.LANDMANS.index(lm), :, data.DESC2AGLU[lu]]
+
+
+def get_ccimpact_mrj(data, yr_idx):
+    """
+    Return climate change impact multipliers of all land-managements and agricultural land-uses at (zero-based)
+    year index as a float32 [m, r, j] array. The result is cached per year; see `calc_ccimpact_mrj`.
+    """
+    return get_cached_quantity(
+        data, yr_idx, 'ccimpact_mrj',
+        lambda: calc_ccimpact_mrj(data, yr_idx)
+    )
+
+
+def calc_ccimpact_mrj(data, yr_idx):
+    """
+    Calculate climate change impact multipliers of all land-managements and agricultural land-uses at (zero-based)
+    year index as a float32 [m, r, j] array.
+
+    The multipliers are linearly interpolated between the two anchor years bracketing the year (e.g., 2010, 2020,
+    2050, 2080), and linearly extrapolated from the last two anchor years after the last one.
+    """
+
     # Convert year index to calendar year to match the climate impact data which is by calendar year.
     yr_cal = data.YR_CAL_BASE + yr_idx
 
-    # Interpolate climate change damage for lu, lm, and year for each cell using a linear function.
-    xs = {t[2] for t in data.CLIMATE_CHANGE_IMPACT.columns}  # Returns set {2020, 2050, 2080}
-    xs.add(2010)                                             # Adds the year 2010 and returns set {2010, 2020, 2050, 2080}
-    xs = sorted(xs)                                          # Returns list and ensures sorted lowest to highest [2010, 2020, 2050, 2080]
-    yys = data.CLIMATE_CHANGE_IMPACT[lm, lu].fillna(1)       # Grabs the column and replaces NaNs with ones to avoid issues with calculating water use limits
-    yys.insert(0, '2010', 1)                                 # Insert a new column for 2010 with value of 1 to ensure no climate change impact at 2010
-    yys = yys.astype(np.float32)
+    # Find the anchor years bracketing the year and the interpolation weight of the later one.
+    xs = data.CLIMATE_CHANGE_IMPACT_YEARS
+    i = int(np.clip(np.searchsorted(xs, yr_cal, side='right') - 1, 0, len(xs) - 2))
+    w = np.float32((yr_cal - xs[i]) / (xs[i + 1] - xs[i]))
 
-    # Create linear function f and interpolate climate change impact
-    f = interp1d(xs, yys, kind='linear', fill_value='extrapolate')
-    return f(yr_cal)
+    # The tensor does not store the first anchor year (2010), where the multipliers are all ones.
+    lo = data.CLIMATE_CHANGE_IMPACT_MRJ[i - 1] if i > 0 else np.float32(1)
+    hi = data.CLIMATE_CHANGE_IMPACT_MRJ[i]
+    return lo + w * (hi - lo)
 
 
 def get_yield_pot(data, lvstype, vegtype, lm, yr_idx):
     """
     Return the yield potential <unit: head/ha> for livestock by land cover type.
+    The result is cached per year; see `calc_yield_pot`.
+    """
+    return get_cached_quantity(
+        data, yr_idx, ('yield_pot', lvstype, vegtype, lm),
+        lambda: calc_yield_pot(data, lvstype, vegtype, lm, yr_idx)
+    )
+
+
+def calc_yield_pot(data, lvstype, vegtype, lm, yr_idx):
+    """
+    Calculate the yield potential <unit: head/ha> for livestock by land cover type.
 
     Parameters
     - data: Data object or module.
@@ -238,16 +310,14 @@ def get_quantity_crop(data, pr, lm, yr_idx):
     """
     
     # Check if land-use exists in AGEC_CROPS (e.g., dryland Pears/Rice do not occur), if not return zeros
-    if pr not in data.AGEC_CROPS['Yield', lm].columns:
+    if ('Yield', lm, pr) not in data.AGEC_CROPS:
         quantity = np.zeros((data.NCELLS)).astype(np.float32)
         
     else: # Calculate the quantities
         
-        # Get the raw quantities in tonnes/ha from data.
-        quantity = data.AGEC_CROPS['Yield', lm, pr].copy().to_numpy()
-        
-        # Apply climate change yield impact multiplier. Takes land use (lu) as input rather than product (pr) but lu == pr for crops
-        quantity *= get_ccimpact(data, pr, lm, yr_idx)
+        # Get the raw quantities in tonnes/ha from data, and apply climate change yield impact multiplier.
+        # Takes land use (lu) as input rather than product (pr) but lu == pr for crops
+        quantity = data.AGEC_CROPS['Yield', lm, pr] * get_ccimpact(data, pr, lm, yr_idx)
     
         # Convert to tonnes per cell including real_area and resfactor.
         quantity *= data.REAL_AREA 
@@ -257,6 +327,16 @@ def get_quantity_crop(data, pr, lm, yr_idx):
 
 def get_quantity(data, pr, lm, yr_idx):
     """Return yield <unit: t/cell> of `pr`+`lm` in `yr_idx` as 1D Numpy array.
+    The result is cached per year; see `calc_quantity`.
+    """
+    return get_cached_quantity(
+        data, yr_idx, ('quantity', pr, lm),
+        lambda: calc_quantity(data, pr, lm, yr_idx)
+    )
+
+
+def calc_quantity(data, pr, lm, yr_idx):
+    """Calculate yield <unit: t/cell> of `pr`+`lm` in `yr_idx` as 1D Numpy array.
 
     Args:
         data (object/module): Data object or module.
@@ -321,115 +401,74 @@ def get_quantity_matrices(data, yr_idx):
     - yr_idx: The index of the year.
 
     Returns
-    - q_mrp: A 3D Numpy array representing the matrix of quantities per cell.
+    - q_mrp: A 3D Numpy array representing the matrix of quantities per cell (read-only, cached per year).
     """
-    return np.stack(tuple( get_quantity_matrix(data, lm, yr_idx)
-                           for lm in data.LANDMANS ))
+    return get_cached_quantity(
+        data, yr_idx, 'q_mrp',
+        lambda: np.stack(tuple( get_quantity_matrix(data, lm, yr_idx)
+                                for lm in data.LANDMANS ))
+    )
 
 
-def get_asparagopsis_effect_q_mrp(data, q_mrp, yr_idx):
-    """
-    Applies the effects of using asparagopsis to the quantity data
-    for all relevant agr. land uses.
+# Agricultural management options whose effect on production is a productivity multiplier on the products of their land uses.
+PRODUCTIVITY_AMS = [
+    'Asparagopsis taxiformis', 'Precision Agriculture', 'Ecological Grazing', 'AgTech EI', 'Biochar', 'Beef - HIR', 'Sheep - HIR'
+]
 
-    Parameters
-    - data: The data object containing relevant information.
-    - q_mrp: The quantity data for all land uses and products.
-    - yr_idx: The index of the year.
 
-    Returns
-    - new_q_mrp: The updated quantity data after applying the effects of using asparagopsis.
+def get_ag_man_products(lu2pr_pj, am_j_list):
     """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES["Asparagopsis taxiformis"]
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_q_mrp = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Asparagopsis taxiformis']:
-        return new_q_mrp
+    Return the products (p) of the land uses `am_j_list` of an agricultural management option, in
+    ascending order, as 1D Numpy array. The quantity effects of the option are indexed (m, r, p_idx)
+    over these products.
+    """
+    return np.flatnonzero(lu2pr_pj[:, am_j_list].any(axis=1))
 
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu, j in zip(land_uses, lu_codes):
-        multiplier = data.ASPARAGOPSIS_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            # Apply to all products associated with land use
-            for p in range(data.NPRS):
-                if data.LU2PR[p, j]:
-                    # The effect is: effect value = old value * multiplier - old value
-                    # E.g. a multiplier of .95 means a 5% reduction in quantity produced
-                    new_q_mrp[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
 
-    return new_q_mrp
+def get_productivity_multipliers(data, am, yr_idx):
+    """
+    Return the productivity multiplier of agricultural management option `am` in `yr_idx` for each of
+    its land uses as 1D Numpy array. E.g. a multiplier of .95 means a 5% reduction in quantity produced.
+    """
+    if am in ('Beef - HIR', 'Sheep - HIR'):
+        return np.full(len(AG_MANAGEMENTS_TO_LAND_USES[am]), 1 - HIR_PRODUCTIVITY_PENALTY)
+    return data.get_ag_man_coefs(am, 'Productivity', yr_idx)
 
 
-def get_precision_agriculture_effect_q_mrp(data, q_mrp, yr_idx):
+def get_productivity_effect_q_mrp(data, q_mrp, am, yr_idx):
     """
-    Applies the effects of using precision agriculture to the quantity data
-    for all relevant agricultural land uses.
+    Applies the productivity effect of agricultural management option `am` to the quantity data
+    for all relevant agr. land uses.
 
     Parameters
     - data: The data object containing relevant information.
-    - q_mrp: The quantity data for all land uses.
+    - q_mrp: The quantity data for all land uses and products.
+    - am: The agricultural management option (one of `PRODUCTIVITY_AMS`).
     - yr_idx: The index of the year.
 
     Returns
-    - new_q_mrp: The updated quantity data after applying precision agriculture effects.
+    - new_q_mrp: The updated quantity data after applying the effects of `am`, indexed (m, r, p_idx)
+      over the products of the land uses of `am` (see `get_ag_man_products`).
     """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Precision Agriculture']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    lu_codes = [data.DESC2AGLU[lu] for lu in AG_MANAGEMENTS_TO_LAND_USES[am]]
+    am_p = get_ag_man_products(data.LU2PR, lu_codes)
 
     # Set up the effects matrix
-    new_q_mrp = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
+    new_q_mrp = np.zeros((data.NLMS, data.NCELLS, am_p.size)).astype(np.float32)
 
-    if not AG_MANAGEMENTS['Precision Agriculture']:
+    if not AG_MANAGEMENTS[am]:
         return new_q_mrp
 
-    # Update values in the new matrix    
-    for lu, j in zip(land_uses, lu_codes):
-        multiplier = data.PRECISION_AGRICULTURE_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            # Apply to all products associated with land use
-            for p in range(data.NPRS):
-                if data.LU2PR[p, j]:
-                    new_q_mrp[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
-
-    return new_q_mrp
-
-
-def get_ecological_grazing_effect_q_mrp(data, q_mrp, yr_idx):
-    """
-    Applies the effects of using ecological grazing to the quantity data
-    for all relevant agricultural land uses.
-
-    Parameters
-    - data: The data object containing relevant information.
-    - q_mrp: The quantity data to be updated.
-    - yr_idx: The index of the year to be used for calculations.
-
-    Returns
-    - new_q_mrp: The updated quantity data after applying ecological grazing effects.
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Ecological Grazing']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_q_mrp = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
+    multipliers = get_productivity_multipliers(data, am, yr_idx)
 
-    if not AG_MANAGEMENTS['Ecological Grazing']:
-        return new_q_mrp
+    # Products (p_idx) of each land use (lu_idx), keeping land uses whose multiplier is not 1
+    p_idx, lu_idx = np.nonzero(data.LU2PR[np.ix_(am_p, lu_codes)])
+    changed = multipliers[lu_idx] != 1
+    p_idx, lu_idx = p_idx[changed], lu_idx[changed]
 
-    # Update values in the new matrix    
-    for lu, j in zip(land_uses, lu_codes):
-        multiplier = data.ECOLOGICAL_GRAZING_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            # Apply to all products associated with land use
-            for p in range(data.NPRS):
-                if data.LU2PR[p, j]:
-                    new_q_mrp[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
+    # The effect is: effect value = old value * multiplier - old value
+    # E.g. a multiplier of .95 means a 5% reduction in quantity produced
+    new_q_mrp[:, :, p_idx] = q_mrp[:, :, am_p[p_idx]] * (multipliers[lu_idx] - 1)
 
     return new_q_mrp
 
@@ -445,121 +484,11 @@ def get_savanna_burning_effect_q_mrp(data):
     - data: The input data object containing information about the model
 
     Returns
-    - An array of zeros with shape (NLMS, NCELLS, NPRS)
-    """
-    return np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
-
-
-def get_agtech_ei_effect_q_mrp(data, q_mrp, yr_idx):
-    """
-    Applies the effects of using AgTech EI to the quantity data
-    for all relevant agr. land uses.
-
-    Parameters
-    - data: The data object containing relevant information.
-    - q_mrp: The quantity data to be updated.
-    - yr_idx: The index of the year.
-
-    Returns
-    - new_q_mrp: The updated quantity data
+    - An array of zeros indexed (m, r, p_idx) over the products of the land uses of EDS savanna burning
     """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['AgTech EI']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_q_mrp = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
-
-    if not AG_MANAGEMENTS['AgTech EI']:
-        return new_q_mrp
-
-    # Update values in the new matrix    
-    for lu, j in zip(land_uses, lu_codes):
-        multiplier = data.AGTECH_EI_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            # Apply to all products associated with land use
-            for p in range(data.NPRS):
-                if data.LU2PR[p, j]:
-                    new_q_mrp[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
-
-    return new_q_mrp
-
-
-def get_biochar_effect_q_mrp(data, q_mrp, yr_idx):
-    """
-    Applies the effects of using Biochar to the quantity data
-    for all relevant agricultural land uses.
-
-    Parameters
-    - data: The data object containing relevant information.
-    - q_mrp: The quantity data to be updated.
-    - yr_idx: The index of the year to be used for calculations.
-
-    Returns
-    - new_q_mrp: The updated quantity data after applying Biochar effects.
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Biochar']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_q_mrp = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Biochar']:
-        return new_q_mrp
-
-    # Update values in the new matrix    
-    for lu, j in zip(land_uses, lu_codes):
-        multiplier = data.BIOCHAR_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            # Apply to all products associated with land use
-            for p in range(data.NPRS):
-                if data.LU2PR[p, j]:
-                    new_q_mrp[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
-
-    return new_q_mrp
-
-
-def get_beef_hir_effect_q_mrp(data, q_mrp):
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Beef - HIR']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-
-    # Set up the effects matrix
-    q_mrp_effect = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Beef - HIR']:
-        return q_mrp_effect
-    
-    # Update values in the new matrix    
-    for lu, j in zip(land_uses, lu_codes):
-        multiplier = 1 - HIR_PRODUCTIVITY_PENALTY
-        # Apply to all products associated with land use
-        for p in range(data.NPRS):
-            if data.LU2PR[p, j]:
-                q_mrp_effect[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
-
-    return q_mrp_effect
-
-
-def get_sheep_hir_effect_q_mrp(data, q_mrp):
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Sheep - HIR']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-
-    # Set up the effects matrix
-    q_mrp_effect = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Sheep - HIR']:
-        return q_mrp_effect
-    
-    # Update values in the new matrix    
-    for lu, j in zip(land_uses, lu_codes):
-        multiplier = 1 - HIR_PRODUCTIVITY_PENALTY
-        # Apply to all products associated with land use
-        for p in range(data.NPRS):
-            if data.LU2PR[p, j]:
-                q_mrp_effect[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
-
-    return q_mrp_effect
+    lu_codes = [data.DESC2AGLU[lu] for lu in AG_MANAGEMENTS_TO_LAND_USES['Savanna Burning']]
+    am_p = get_ag_man_products(data.LU2PR, lu_codes)
+    return np.zeros((data.NLMS, data.NCELLS, am_p.size)).astype(np.float32)
 
 
 def get_agricultural_management_quantity_matrices(data, q_mrp, yr_idx) -> Dict[str, np.ndarray]:
@@ -575,22 +504,13 @@ def get_agricultural_management_quantity_matrices(data, q_mrp, yr_idx) -> Dict[s
         A dictionary containing the quantity matrices for different agricultural management practices.
         The keys of the dictionary represent the names of the practices, and the values are the corresponding quantity matrices.
     """
-    asparagopsis_data = get_asparagopsis_effect_q_mrp(data, q_mrp, yr_idx) if AG_MANAGEMENTS['Asparagopsis taxiformis'] else 0
-    precision_agriculture_data = get_precision_agriculture_effect_q_mrp(data, q_mrp, yr_idx) if AG_MANAGEMENTS['Precision Agriculture'] else 0
-    eco_grazing_data = get_ecological_grazing_effect_q_mrp(data, q_mrp, yr_idx) if AG_MANAGEMENTS['Ecological Grazing'] else 0
-    sav_burning_data = get_savanna_burning_effect_q_mrp(data) if AG_MANAGEMENTS['Savanna Burning'] else 0
-    agtech_ei_data = get_agtech_ei_effect_q_mrp(data, q_mrp, yr_idx) if AG_MANAGEMENTS['AgTech EI'] else 0
-    biochar_data = get_biochar_effect_q_mrp(data, q_mrp, yr_idx) if AG_MANAGEMENTS['Biochar'] else 0
-    beef_hir_data = get_beef_hir_effect_q_mrp(data, q_mrp) if AG_MANAGEMENTS['Beef - HIR'] else 0
-    sheep_hir_data = get_sheep_hir_effect_q_mrp(data, q_mrp) if AG_MANAGEMENTS['Sheep - HIR'] else 0
-
-    return {
-        'Asparagopsis taxiformis': asparagopsis_data,
-        'Precision Agriculture': precision_agriculture_data,
-        'Ecological Grazing': eco_grazing_data,
-        'Savanna Burning': sav_burning_data,
-        'AgTech EI': agtech_ei_data,
-        'Biochar': biochar_data,
-        'Beef - HIR': beef_hir_data,
-        'Sheep - HIR': sheep_hir_data,
-    }
+    ag_man_q_mrp = {}
+    for am, enabled in AG_MANAGEMENTS.items():
+        if not enabled:
+            ag_man_q_mrp[am] = 0
+        elif am in PRODUCTIVITY_AMS:
+            ag_man_q_mrp[am] = get_productivity_effect_q_mrp(data, q_mrp, am, yr_idx)
+        else:
+            ag_man_q_mrp[am] = get_savanna_burning_effect_q_mrp(data)
+
+    return ag_man_q_mrp
@@ -24,20 +24,26 @@ Pure functions to calculate economic profit from land use.
 """
 
 import numpy as np
-import pandas as pd
 
 from typing import Dict
-from luto.settings import AG_MANAGEMENTS, HIR_PRODUCTIVITY_PENALTY, AG_MANAGEMENTS_TO_LAND_USES
-from luto.data import Data
-from luto.economics.agricultural.quantity import get_yield_pot, get_quantity, lvs_veg_types
+from luto.settings import AG_MANAGEMENTS, AG_MANAGEMENTS_TO_LAND_USES
+from luto.economics.agricultural.quantity import (
+    get_yield_pot, get_quantity, lvs_veg_types, get_cached_quantity, get_productivity_multipliers, PRODUCTIVITY_AMS
+)
 from luto.economics.agricultural.ghg import get_savanna_burning_effect_g_mrj
 
+
+# Revenue types of agricultural land uses, in the order of the revenue type axis of `get_rev_matrices_by_type`.
+# Crops produce 'Revenue'; livestock produce 'Meat', 'Wool', 'Live Exports' and 'Milk'.
+REV_TYPES = ['Revenue', 'Meat', 'Wool', 'Live Exports', 'Milk']
+
+
 def get_rev_crop( data         # Data object.
                 , lu           # Land use.
                 , lm           # Land management.
                 , yr_idx       # Number of years post base-year ('YR_CAL_BASE').
                 ):
-    """Return crop profit [AUD/cell] of `lu`+`lm` in `yr_idx` as np array.
+    """Return crop profit [AUD/cell] of `lu`+`lm` in `yr_idx` by revenue type.
 
     `data`: data object/module -- assumes fields like in `luto.data`.
     `lu`: land use (e.g. 'Winter cereals' or 'Beef - natural land').
@@ -45,8 +51,8 @@ def get_rev_crop( data         # Data object.
     `yr_idx`: number of years from base year, counting from zero.
     """
     # Check if land-use exists in AGEC_CROPS (e.g., dryland Pears/Rice do not occur), if not return zeros
-    if lu not in data.AGEC_CROPS['P1', lm].columns:
-        rev_t = np.zeros((data.NCELLS)).astype(np.float32)
+    if ('P1', lm, lu) not in data.AGEC_CROPS:
+        return {}
         
     else:
         rev_multiplier = 1
@@ -59,17 +65,17 @@ def get_rev_crop( data         # Data object.
         rev_t = ( data.AGEC_CROPS['P1', lm, lu] 
                 * get_quantity( data, lu.upper(), lm, yr_idx )  # lu.upper() only for crops as needs to be in product format in get_quantity().
                 * rev_multiplier
-                ).values
+                )
     
-    # Return revenue as MultiIndexed DataFrame.
-    return pd.DataFrame(rev_t, columns=pd.MultiIndex.from_product([[lu],[lm],['Revenue']]))
+    # Return revenue keyed by revenue type.
+    return {'Revenue': rev_t}
 
 def get_rev_lvstk( data   # Data object.
                  , lu           # Land use.
                  , lm           # Land management.
                  , yr_idx       # Number of years post base-year ('YR_CAL_BASE').
                  ):
-    """Return livestock revenue [AUD/cell] of `lu`+`lm` in `yr_idx` as np array.
+    """Return livestock revenue [AUD/cell] of `lu`+`lm` in `yr_idx` by revenue type.
 
     `data`: data object/module -- assumes fields like in `luto.data`.
     `lu`: land use (e.g. 'Winter cereals' or 'Beef - natural land').
@@ -147,15 +153,11 @@ def get_rev_lvstk( data   # Data object.
     else:  # Livestock type is unknown.
         raise KeyError(f"Unknown {lvstype} livestock type. Check `lvstype`.")   
 
-    # Put the revenues into a MultiIndex DataFrame
-    rev_seperate = pd.DataFrame(np.stack((rev_meat, rev_wool, rev_lexp, rev_milk), axis=1), 
-                                columns=pd.MultiIndex.from_product([[lu], [lm], ['Meat', 'Wool', 'Live Exports', 'Milk']]))
-
-    # Revenue so far in AUD/ha. Now convert to AUD/cell including resfactor.
-    rev_seperate = rev_seperate * data.REAL_AREA.reshape(-1,1) # Convert to AUD/cell
-
-    # Return revenue as numpy array.
-    return rev_seperate
+    # Revenue so far in AUD/ha. Now convert to AUD/cell including resfactor, and return it keyed by revenue type.
+    return {
+        rev_type: rev * data.REAL_AREA
+        for rev_type, rev in zip(['Meat', 'Wool', 'Live Exports', 'Milk'], (rev_meat, rev_wool, rev_lexp, rev_milk))
+    }
 
 
 def get_rev( data    # Data object.
@@ -163,7 +165,8 @@ def get_rev( data    # Data object.
             , lm           # Land management.
             , yr_idx       # Number of years post base-year ('YR_CAL_BASE')
             ):
-    """Return revenue from production [AUD/cell] of `lu`+`lm` in `yr_idx` as np array.
+    """Return revenue from production [AUD/cell] of `lu`+`lm` in `yr_idx` keyed by revenue type
+    (see `REV_TYPES`). Revenue types that do not apply are omitted, i.e., they are zero.
 
     `data`: data object/module -- assumes fields like in `luto.data`.
     `lu`: land use (e.g. 'Winter cereals').
@@ -178,110 +181,87 @@ def get_rev( data    # Data object.
         return get_rev_lvstk(data, lu, lm, yr_idx)
 
     elif lu in data.AGRICULTURAL_LANDUSES:
-        return  pd.DataFrame(np.zeros((data.NCELLS, 1)).astype(np.float32),
-                             columns=pd.MultiIndex.from_product([[lu],[lm],['Revenue']]))
+        return {}
 
     else:
         raise KeyError(f"Land-use '{lu}' not found in data.LANDUSES")
 
 
-def get_rev_matrix(data, lm, yr_idx):
-    """Return r_rj matrix of revenue/cell per lu under `lm` in `yr_idx`."""
-    
-    # Concatenate the revenue from each land use into a single Multiindex DataFrame.
-    r_rjs = pd.concat([get_rev(data, lu, lm, yr_idx) for lu in data.AGRICULTURAL_LANDUSES], axis=1)
-    r_rjs = r_rjs.fillna(0)
-    return r_rjs
-
+def get_rev_matrices_by_type(data, yr_idx):
+    """
+    Return revenue [AUD/cell] by revenue type as a 4D [revenue type, m, r, j] float32 Numpy array, with
+    revenue types ordered as `REV_TYPES`. NaNs are replaced by zeroes.
 
-def get_rev_matrices(data, yr_idx, aggregate:bool = True):
-    """Return r_mrj matrix of revenue per cell as 3D Numpy array."""
+    Only the output writer needs the revenues by type, so this array is neither cached nor built for the r_mrj matrix.
+    """
+    r_tmrj = np.zeros((len(REV_TYPES), data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
 
-    # Concatenate the revenue from each land management into a single Multiindex DataFrame.
-    rev_rjms = pd.concat([get_rev_matrix(data, lm, yr_idx) for lm in data.LANDMANS], axis=1)
+    for m, lm in enumerate(data.LANDMANS):
+        for j, lu in enumerate(data.AGRICULTURAL_LANDUSES):
+            for rev_type, rev in get_rev(data, lu, lm, yr_idx).items():
+                r_tmrj[REV_TYPES.index(rev_type), m, :, j] = np.nan_to_num(np.asarray(rev, dtype=np.float64))
 
-    if not aggregate:
-        # Concatenate the revenue from each land management into a single Multiindex DataFrame.
-        return rev_rjms
-    
-    df_jmr = rev_rjms.T.groupby(level=[0, 1]).sum()
-    arr_jmr = df_jmr.values.reshape(*(list(df_jmr.index.levshape) + [-1]))
-    return np.einsum('jmr->mrj', arr_jmr)
+    return r_tmrj
 
 
-def get_asparagopsis_effect_r_mrj(data, r_mrj, yr_idx):
+def calc_rev_matrices(data, yr_idx):
     """
-    Applies the effects of using asparagopsis to the revenue data
-    for all relevant agr. land uses.
+    Calculate the r_mrj matrix of revenue [AUD/cell]; see `get_rev_matrices`.
     """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES["Asparagopsis taxiformis"]
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    r_mrj = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
 
-    # Set up the effects matrix
-    new_r_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
+    for m, lm in enumerate(data.LANDMANS):
+        for j, lu in enumerate(data.AGRICULTURAL_LANDUSES):
+            revs = get_rev(data, lu, lm, yr_idx)
+            if not revs:
+                continue
 
-    if not AG_MANAGEMENTS['Asparagopsis taxiformis']:
-        return new_r_mrj
+            # Make sure all NaNs are replaced by zeroes; the total is summed before casting to float32.
+            total = np.zeros(data.NCELLS)
+            for rev in revs.values():
+                total += np.nan_to_num(np.asarray(rev, dtype=np.float64))
+            r_mrj[m, :, j] = total
 
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.ASPARAGOPSIS_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            # The effect is: new value = old value * multiplier - old value
-            # E.g. a multiplier of .95 means a 5% reduction in quantity produced
-            new_r_mrj[:, :, lu_idx] = r_mrj[:, :, j] * (multiplier - 1)
-
-    return new_r_mrj
+    return r_mrj
 
 
-def get_precision_agriculture_effect_r_mrj(data, r_mrj, yr_idx):
-    """
-    Applies the effects of using precision agriculture to the revenue data
-    for all relevant agr. land uses.
+def get_rev_matrices(data, yr_idx, aggregate:bool = True):
     """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Precision Agriculture']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    Return r_mrj matrix of revenue per cell as 3D Numpy array. It is read-only and cached per year.
 
-    # Set up the effects matrix
-    new_r_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Precision Agriculture']:
-        return new_r_mrj
+    If `aggregate` is False, return the revenue by type as a 4D [revenue type, m, r, j] Numpy array instead,
+    with revenue types ordered as `REV_TYPES` (see `get_rev_matrices_by_type`).
+    """
+    if not aggregate:
+        return get_rev_matrices_by_type(data, yr_idx)
 
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.PRECISION_AGRICULTURE_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            new_r_mrj[:, :, lu_idx] = r_mrj[:, :, j] * (multiplier - 1)
+    return get_cached_quantity(
+        data, yr_idx, 'rev_mrj',
+        lambda: calc_rev_matrices(data, yr_idx)
+    )
 
-    return new_r_mrj
 
-
-def get_ecological_grazing_effect_r_mrj(data, r_mrj, yr_idx):
+def get_productivity_effect_r_mrj(data, r_mrj, am, yr_idx):
     """
-    Applies the effects of using ecologiacl grazing to the revenue data
+    Applies the productivity effect of agricultural management option `am` to the revenue data
     for all relevant agr. land uses.
     """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Ecological Grazing']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    land_uses = AG_MANAGEMENTS_TO_LAND_USES[am]
 
     # Set up the effects matrix
     new_r_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
 
-    if not AG_MANAGEMENTS['Ecological Grazing']:
+    if not AG_MANAGEMENTS[am]:
         return new_r_mrj
 
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.ECOLOGICAL_GRAZING_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            new_r_mrj[:, :, lu_idx] = r_mrj[:, :, j] * (multiplier - 1)
+    lu_codes = np.array([data.DESC2AGLU[lu] for lu in land_uses])
+    multipliers = get_productivity_multipliers(data, am, yr_idx)
+
+    # Update values in the new matrix for the land uses whose multiplier is not 1
+    # The effect is: new value = old value * multiplier - old value
+    # E.g. a multiplier of .95 means a 5% reduction in quantity produced
+    lu_idx = np.flatnonzero(multipliers != 1)
+    new_r_mrj[:, :, lu_idx] = r_mrj[:, :, lu_codes[lu_idx]] * (multipliers[lu_idx] - 1)
 
     return new_r_mrj
 
@@ -297,102 +277,6 @@ def get_savanna_burning_effect_r_mrj(data, yr_idx: int):
     return ghg_effect * data.get_carbon_price_by_yr_idx(yr_idx)
 
 
-def get_agtech_ei_effect_r_mrj(data, r_mrj, yr_idx):
-    """
-    Applies the effects of using AgTech EI to the revenue data
-    for all relevant agr. land uses.
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['AgTech EI']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_r_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    if not AG_MANAGEMENTS['AgTech EI']:
-        return new_r_mrj
-
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.AGTECH_EI_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            new_r_mrj[:, :, lu_idx] = r_mrj[:, :, j] * (multiplier - 1)
-
-    return new_r_mrj
-
-
-def get_biochar_effect_r_mrj(data, r_mrj, yr_idx):
-    """
-    Applies the effects of using Biochar to the revenue data
-    for all relevant agr. land uses.
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Biochar']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    # Set up the effects matrix
-    new_r_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Biochar']:
-        return new_r_mrj
-
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.BIOCHAR_DATA[lu].loc[yr_cal, 'Productivity']
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            new_r_mrj[:, :, lu_idx] = r_mrj[:, :, j] * (multiplier - 1)
-
-    return new_r_mrj
-
-
-def get_beef_hir_effect_r_mrj(data: Data, r_mrj):
-    """
-    Applies the effects of using HIR to the beef revenue data
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Beef - HIR']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-
-    # Set up the effects matrix
-    r_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Beef - HIR']:
-        return r_mrj_effect
-    
-    # Update values in the new matrix    
-    for lu_idx in range(len(land_uses)):
-        multiplier = 1 - HIR_PRODUCTIVITY_PENALTY
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            r_mrj_effect[:, :, lu_idx] = r_mrj[:, :, j] * (multiplier - 1)
-
-    return r_mrj_effect
-
-
-def get_sheep_hir_effect_r_mrj(data: Data, r_mrj):
-    """
-    Applies the effects of using HIR to the sheep revenue data
-    """
-    land_uses = AG_MANAGEMENTS_TO_LAND_USES['Sheep - HIR']
-    lu_codes = [data.DESC2AGLU[lu] for lu in land_uses]
-
-    # Set up the effects matrix
-    r_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    if not AG_MANAGEMENTS['Sheep - HIR']:
-        return r_mrj_effect
-    
-    # Update values in the new matrix    
-    for lu_idx in range(len(land_uses)):
-        multiplier = 1 - HIR_PRODUCTIVITY_PENALTY
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            r_mrj_effect[:, :, lu_idx] = r_mrj[:, :, j] * (multiplier - 1)
-
-    return r_mrj_effect
-
-
 def get_agricultural_management_revenue_matrices(data, r_mrj, yr_idx) -> dict[str, np.ndarray]:
     """
     Calculate the revenue matrices for different agricultural management practices.
@@ -407,22 +291,13 @@ def get_agricultural_management_revenue_matrices(data, r_mrj, yr_idx) -> dict[st
         The keys of the dictionary represent the management practices, and the values are numpy arrays.
 
     """
-    asparagopsis_data = get_asparagopsis_effect_r_mrj(data, r_mrj, yr_idx) if AG_MANAGEMENTS['Asparagopsis taxiformis'] else 0
-    precision_agriculture_data = get_precision_agriculture_effect_r_mrj(data, r_mrj, yr_idx) if AG_MANAGEMENTS['Precision Agriculture'] else 0
-    eco_grazing_data = get_ecological_grazing_effect_r_mrj(data, r_mrj, yr_idx) if AG_MANAGEMENTS['Ecological Grazing'] else 0
-    sav_burning_data = get_savanna_burning_effect_r_mrj(data, yr_idx) if AG_MANAGEMENTS['Savanna Burning'] else 0
-    agtech_ei_data = get_agtech_ei_effect_r_mrj(data, r_mrj, yr_idx) if AG_MANAGEMENTS['AgTech EI'] else 0
-    biochar_data = get_biochar_effect_r_mrj(data, r_mrj, yr_idx) if AG_MANAGEMENTS['Biochar'] else 0
-    beef_hir_data = get_beef_hir_effect_r_mrj(data, r_mrj) if AG_MANAGEMENTS['Beef - HIR'] else 0
-    sheep_hir_data = get_sheep_hir_effect_r_mrj(data, r_mrj) if AG_MANAGEMENTS['Sheep - HIR'] else 0
+    ag_man_r_mrj = {}
+    for am, enabled in AG_MANAGEMENTS.items():
+        if not enabled:
+            ag_man_r_mrj[am] = 0
+        elif am in PRODUCTIVITY_AMS:
+            ag_man_r_mrj[am] = get_productivity_effect_r_mrj(data, r_mrj, am, yr_idx)
+        else:
+            ag_man_r_mrj[am] = get_savanna_burning_effect_r_mrj(data, yr_idx)
 
-    return {
-        'Asparagopsis taxiformis': asparagopsis_data,
-        'Precision Agriculture': precision_agriculture_data,
-        'Ecological Grazing': eco_grazing_data,
-        'Savanna Burning': sav_burning_data,
-        'AgTech EI': agtech_ei_data,
-        'Biochar': biochar_data,
-        'Beef - HIR': beef_hir_data,
-        'Sheep - HIR': sheep_hir_data,       
-    }
+    return ag_man_r_mrj
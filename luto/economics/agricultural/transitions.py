@@ -27,7 +27,7 @@ import numpy as np
 from typing import Dict
 from copy import deepcopy
 
-from luto.data import Data, lumap2ag_l_mrj
+from luto.data import Data
 from luto.settings import AG_MANAGEMENTS, AG_MANAGEMENTS_TO_LAND_USES
 from luto.economics.agricultural.water import get_wreq_matrices
 import luto.economics.agricultural.ghg as ag_ghg
@@ -35,7 +35,7 @@ from luto import settings
 import luto.tools as tools
 
 
-def get_exclude_matrices(data: Data, lumap: np.ndarray):
+def get_exclude_matrices(data: Data, lumap: np.ndarray, cells: np.ndarray = None):
     """Return x_mrj exclude matrices.
 
     An exclude matrix indicates whether switching land-use for a certain cell r
@@ -46,10 +46,11 @@ def get_exclude_matrices(data: Data, lumap: np.ndarray):
     ----------
 
     data: Data object.
-    base_year: int
-        Current base year of the solve.
-    lumaps: dict[str, numpy.ndarray]
-        All previously generated land-use maps (shape = ncells, dtype=int).
+    lumap: numpy.ndarray
+        Land-use map of the base year of the solve (shape = ncells, dtype=int).
+    cells: numpy.ndarray, optional
+        Indices of the cells to calculate the exclusions for. All cells if None.
+        The exclusions of a cell only depend on the land use of that cell in `lumap`.
 
 
     Returns
@@ -59,16 +60,20 @@ def get_exclude_matrices(data: Data, lumap: np.ndarray):
         x_mrj exclude matrix. The m-slices correspond to the
         different land-management versions of the land-use `j` to switch _to_.
         With m==0 conventional dryland, m==1 conventional irrigated.
+        The r-axis only holds `cells` if given.
     """
+    cells = slice(None) if cells is None else cells
+
     # Boolean exclusion matrix based on SA2/NLUM agricultural land-use data (in mrj structure).
     # Effectively, this ensures that in any SA2 region the only combinations of land-use and land management
     # that can occur in the future are those that occur in 2010 (i.e., YR_CAL_BASE)
-    x_mrj = data.EXCLUDE.copy()
+    x_mrj = data.EXCLUDE[:, cells].copy()
 
     # Raw transition-cost matrix is in $/ha and lexicographically ordered by land-use (shape = 28 x 28).
     t_ij = data.AG_TMATRIX
 
-    lumap_2010 = data.LUMAP
+    lumap = lumap[cells]
+    lumap_2010 = data.LUMAP[cells]
     
     new_x_mrj = x_mrj.copy()
     if settings.EXCLUDE_NO_GO_LU:
@@ -76,8 +81,8 @@ def get_exclude_matrices(data: Data, lumap: np.ndarray):
         no_go_j = [data.DESC2AGLU.get(desc) for desc in data.NO_GO_LANDUSE_AG]
 
         for count, j in enumerate(no_go_j):
-            new_x_mrj[0, :, j] = x_mrj[0, :, j] * no_go_regions[count]
-            new_x_mrj[1, :, j] = x_mrj[1, :, j] * no_go_regions[count]
+            new_x_mrj[0, :, j] = x_mrj[0, :, j] * no_go_regions[count][cells]
+            new_x_mrj[1, :, j] = x_mrj[1, :, j] * no_go_regions[count][cells]
 
     # For the sake of exclusions only, treat destocked cells as unallocated cells
     unallocated_j = tools.get_unallocated_natural_land_code(data)
@@ -89,7 +94,7 @@ def get_exclude_matrices(data: Data, lumap: np.ndarray):
     ag_cells, non_ag_cells = tools.get_ag_and_non_ag_cells(new_lumap)
 
     # Transition costs from current land-use to all other land-uses j using current land-use map (in $/ha).
-    t_rj = np.zeros((data.NCELLS, len(data.AGRICULTURAL_LANDUSES))).astype(np.float32)
+    t_rj = np.zeros((lumap.shape[0], len(data.AGRICULTURAL_LANDUSES))).astype(np.float32)
     t_rj[ag_cells, :] = t_ij[new_lumap[ag_cells]]
 
     # For non-agricultural cells, use the original 2010 solve's LUs to determine what LUs are possible for a cell
@@ -112,7 +117,7 @@ def get_exclude_matrices(data: Data, lumap: np.ndarray):
     return x_mrj
 
 
-def get_transition_matrices_from_maps(data: Data, yr_idx: int, lumap: np.ndarray, lmmap: np.ndarray, separate=False):
+def get_transition_matrices_from_maps(data: Data, yr_idx: int, lumap: np.ndarray, lmmap: np.ndarray, separate=False, x_mrj: np.ndarray = None):
     """
     Calculate the transition matrices for land-use and land management transitions.
     Args:
@@ -122,91 +127,93 @@ def get_transition_matrices_from_maps(data: Data, yr_idx: int, lumap: np.ndarray
         lmmap (np.ndarray): Land management map of the base year for the transitions.
         separate (bool, optional): Whether to return separate cost matrices for each cost component.
                                    Defaults to False.
+        x_mrj (np.ndarray, optional): The exclude matrices of `lumap` (see `get_exclude_matrices`),
+                                   if already calculated. Defaults to None.
     Returns
         numpy.ndarray or dict: The transition matrices for land-use and land management transitions.
                                If `separate` is False, returns a numpy array representing the total costs.
                                If `separate` is True, returns a dictionary with separate cost matrices for
                                establishment costs, Water license cost, and carbon releasing costs.
+
+    Establishment and carbon costs only depend on the current land use of a cell, so they are gathered
+    from (from land use, to land use) tables by `lumap`. The cost components are only expanded into
+    separate [m, r, j] matrices when `separate` is True.
     """
     yr_cal = data.YR_CAL_BASE + yr_idx
 
-    # Return l_mrj (Boolean) for current land-use and land management
-    l_mrj = lumap2ag_l_mrj(lumap, lmmap)
-    l_mrj_not = np.logical_not(l_mrj)
-
-    # Get the exclusion matrix
-    x_mrj = get_exclude_matrices(data, lumap)
+    n_ag_lms, ncells, n_ag_lus = data.AG_L_MRJ.shape
 
     ag_cells, _ = tools.get_ag_and_non_ag_cells(lumap)
+    ag_j = lumap[ag_cells]
 
-    n_ag_lms, ncells, n_ag_lus = data.AG_L_MRJ.shape
+    # Transitions that incur costs: allowed by the exclusion matrix, and not remaining
+    # in the current land-use and land management (the transition cost for a cell that remain the same is 0).
+    t_mask_mrj = (get_exclude_matrices(data, lumap) if x_mrj is None else x_mrj).astype(bool)
+    t_mask_mrj[lmmap[ag_cells].astype(np.intp), ag_cells, ag_j] = False
 
     # -------------------------------------------------------------- #
     # Establishment costs (upfront, amortised to annual, per cell).  #
     # -------------------------------------------------------------- #
 
     # Raw transition-cost matrix is in $/ha and lexigraphically ordered (shape: land-use x land-use).
-    t_ij = data.AG_TMATRIX * data.TRANS_COST_MULTS[yr_cal]
+    # Amortise upfront costs to annualised costs; disallowed switches (NaN) are excluded by the mask.
+    e_ij = np.nan_to_num(tools.amortise(data.AG_TMATRIX * data.TRANS_COST_MULTS[yr_cal]))
 
-    # Non-irrigation related transition costs for cell r to change to land-use j calculated based on lumap (in $/ha).
+    # Non-irrigation related transition costs for cell r to change to land-use j calculated based on lumap (in $/cell).
     # Only consider for cells currently being used for agriculture.
-    e_rj = np.zeros((ncells, n_ag_lus)).astype(np.float32)
-    e_rj[ag_cells, :] = t_ij[lumap[ag_cells]]
-
-    # Amortise upfront costs to annualised costs and converted to $ per cell via REAL_AREA
-    e_rj = tools.amortise(e_rj) * data.REAL_AREA[:, np.newaxis]
-
-    # Repeat the establishment costs into dryland and irrigated land management types
-    e_mrj = np.stack([e_rj, e_rj], axis=0)
-
-    # Update the cost matrix with exclude matrices; the transition cost for a cell that remain the same is 0.
-    e_mrj = np.einsum('mrj,mrj,mrj->mrj', e_mrj, x_mrj, l_mrj_not).astype(np.float32)
-    e_mrj = np.nan_to_num(e_mrj)
+    e_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
+    e_rj[ag_cells] = e_ij[ag_j] * data.REAL_AREA[ag_cells, np.newaxis]
 
     # -------------------------------------------------------------- #
     # Water license cost (upfront, amortised to annual, per cell).   #
     # -------------------------------------------------------------- #
 
     w_mrj = get_wreq_matrices(data, yr_idx)                                     # <unit: ML/cell>
-    w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(w_mrj, l_mrj, data, yr_idx)
-    w_delta_mrj = np.einsum('mrj,mrj,mrj->mrj', w_delta_mrj, x_mrj, l_mrj_not).astype(np.float32)
+    w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(w_mrj, lumap, lmmap, data, yr_idx)
 
     # -------------------------------------------------------------- #
     # Carbon costs of transitioning cells.                           #
     # -------------------------------------------------------------- #
 
-    # Apply the cost of carbon released by transitioning natural land to modified land
-    ghg_transition = ag_ghg.get_ghg_transition_penalties(data, lumap, separate=True)        # <unit: t/ha>
-    
-    ghg_transition = {
-        k:np.einsum('mrj,mrj,mrj->mrj', v, x_mrj, l_mrj_not).astype(np.float32)             # No GHG penalty for cells that remain the same, or are prohibited from transitioning
-        for k, v in ghg_transition.items()
-    }
-    
-    ghg_transition = {
-    k:tools.amortise(v * data.get_carbon_price_by_yr_idx(yr_idx))                       # Amortise the GHG penalties
-    for k,v in ghg_transition.items()
-    }
-    
-    ghg_t_types = ghg_transition.keys()
-    ghg_t_smrj = np.stack([ghg_transition[t] for t in ghg_t_types], axis=0)                 # s: ghg_t_types, m: land management, r: cell, j: land use
-    ghg_t_mrj = np.einsum('smrj->mrj', ghg_t_smrj)
+    # Amortised cost of carbon released by transitioning natural land to modified land, by transition type
+    carbon_price = data.get_carbon_price_by_yr_idx(yr_idx)
+    ghg_t_cells = {}
+    for t_type, (from_lus, to_lus, penalties_r) in ag_ghg.get_ghg_transition_penalty_types(data).items():
+        from_cells = np.nonzero(np.isin(lumap, from_lus))[0]
+        ghg_t_cells[t_type] = (from_cells, to_lus, tools.amortise(penalties_r[from_cells] * carbon_price))
 
     # -------------------------------------------------------------- #
     # Total costs.                                                   #
     # -------------------------------------------------------------- #
 
     if separate:
-        return {'Establishment cost': e_mrj, 'Water license cost': w_delta_mrj, **ghg_transition}
-    else:
-        t_mrj = e_mrj + w_delta_mrj + ghg_t_mrj
-        # Ensure transition costs for destocked land cells are zero - already handled in 'non_ag_to_ag_t_mrj' in input_data.py
-        destocked_cells = tools.get_destocked_land_cells(lumap)
-        t_mrj[:, destocked_cells, :] = 0
-        return t_mrj
+        ghg_transition = {}
+        for t_type, (from_cells, to_lus, cost_r) in ghg_t_cells.items():
+            ghg_t_rj = np.zeros((ncells, n_ag_lus), dtype=np.float32)
+            ghg_t_rj[np.ix_(from_cells, to_lus)] = cost_r[:, np.newaxis]
+            ghg_transition[t_type] = np.where(t_mask_mrj, ghg_t_rj, 0).astype(np.float32)
+
+        return {
+            'Establishment cost': np.where(t_mask_mrj, e_rj, 0).astype(np.float32),
+            'Water license cost': np.where(t_mask_mrj, w_delta_mrj, 0).astype(np.float32),
+            **ghg_transition
+        }
+
+    # Costs that only depend on the current land use, then the water license cost, which also depends on the land management
+    for from_cells, to_lus, cost_r in ghg_t_cells.values():
+        e_rj[np.ix_(from_cells, to_lus)] += cost_r[:, np.newaxis]
+
+    t_mrj = w_delta_mrj.astype(np.float32)
+    t_mrj += e_rj
+    t_mrj[~t_mask_mrj] = 0
+
+    # Ensure transition costs for destocked land cells are zero - already handled in 'non_ag_to_ag_t_mrj' in input_data.py
+    destocked_cells = tools.get_destocked_land_cells(lumap)
+    t_mrj[:, destocked_cells, :] = 0
+    return t_mrj
 
 
-def get_transition_matrices_from_base_year(data: Data, yr_idx, base_year, separate=False):
+def get_transition_matrices_from_base_year(data: Data, yr_idx, base_year, separate=False, x_mrj: np.ndarray = None):
     """
     Calculate the transition matrices for land-use and land management transitions.
     Args:
@@ -215,6 +222,8 @@ def get_transition_matrices_from_base_year(data: Data, yr_idx, base_year, separa
         base_year (int): The base year for the transition calculations.
         separate (bool, optional): Whether to return separate cost matrices for each cost component.
                                    Defaults to False.
+        x_mrj (np.ndarray, optional): The exclude matrices of the base year land-use map, if already calculated.
+                                   Defaults to None.
     Returns:
         numpy.ndarray or dict: The transition matrices for land-use and land management transitions.
                                If `separate` is False, returns a numpy array representing the total costs.
@@ -223,7 +232,7 @@ def get_transition_matrices_from_base_year(data: Data, yr_idx, base_year, separa
     """
     lumap = data.lumaps[base_year]
     lmmap = data.lmmaps[base_year]
-    return get_transition_matrices_from_maps(data, yr_idx, lumap, lmmap, separate)
+    return get_transition_matrices_from_maps(data, yr_idx, lumap, lmmap, separate, x_mrj)
     
 
 
@@ -313,43 +322,35 @@ def get_agricultural_management_transition_matrices(data: Data, t_mrj, yr_idx) -
     }
 
 
+def get_table_adoption_limits(data: Data, am: str, column: str, yr_idx) -> dict[int, float]:
+    """
+    Gets the adoption limit of agricultural management option `am` for each possible land use,
+    read from the column `column` of its coefficient tables.
+    """
+    land_uses = AG_MANAGEMENTS_TO_LAND_USES[am]
+    limits = data.get_ag_man_coefs(am, column, yr_idx)
+    return dict(zip([data.DESC2AGLU[lu] for lu in land_uses], limits))
+
+
 def get_asparagopsis_adoption_limits(data: Data, yr_idx):
     """
     Gets the adoption limit of Asparagopsis taxiformis for each possible land use.
     """
-    asparagopsis_limits = {}
-    yr_cal = data.YR_CAL_BASE + yr_idx
-    for lu in AG_MANAGEMENTS_TO_LAND_USES['Asparagopsis taxiformis']:
-        j = data.DESC2AGLU[lu]
-        asparagopsis_limits[j] = data.ASPARAGOPSIS_DATA[lu].loc[yr_cal, 'Technical_Adoption']
-
-    return asparagopsis_limits
+    return get_table_adoption_limits(data, 'Asparagopsis taxiformis', 'Technical_Adoption', yr_idx)
 
 
 def get_precision_agriculture_adoption_limit(data: Data, yr_idx):
     """
     Gets the adoption limit of precision agriculture for each possible land use.
     """
-    prec_agr_limits = {}
-    yr_cal = data.YR_CAL_BASE + yr_idx
-    for lu in AG_MANAGEMENTS_TO_LAND_USES['Precision Agriculture']:
-        j = data.DESC2AGLU[lu]
-        prec_agr_limits[j] = data.PRECISION_AGRICULTURE_DATA[lu].loc[yr_cal, 'Technical_Adoption']
-
-    return prec_agr_limits
+    return get_table_adoption_limits(data, 'Precision Agriculture', 'Technical_Adoption', yr_idx)
 
 
 def get_ecological_grazing_adoption_limit(data: Data, yr_idx):
     """
     Gets the adoption limit of ecological grazing for each possible land use.
     """
-    eco_grazing_limits = {}
-    yr_cal = data.YR_CAL_BASE + yr_idx
-    for lu in AG_MANAGEMENTS_TO_LAND_USES['Ecological Grazing']:
-        j = data.DESC2AGLU[lu]
-        eco_grazing_limits[j] = data.ECOLOGICAL_GRAZING_DATA[lu].loc[yr_cal, 'Feasible Adoption (%)']
-
-    return eco_grazing_limits
+    return get_table_adoption_limits(data, 'Ecological Grazing', 'Feasible Adoption (%)', yr_idx)
 
 
 def get_savanna_burning_adoption_limit(data):
@@ -368,26 +369,14 @@ def get_agtech_ei_adoption_limit(data, yr_idx):
     """
     Gets the adoption limit of AgTech EI for each possible land use.
     """
-    agtech_ei_limits = {}
-    yr_cal = data.YR_CAL_BASE + yr_idx
-    for lu in AG_MANAGEMENTS_TO_LAND_USES['AgTech EI']:
-        j = data.DESC2AGLU[lu]
-        agtech_ei_limits[j] = data.AGTECH_EI_DATA[lu].loc[yr_cal, 'Technical_Adoption']
-
-    return agtech_ei_limits
+    return get_table_adoption_limits(data, 'AgTech EI', 'Technical_Adoption', yr_idx)
 
 
 def get_biochar_adoption_limit(data, yr_idx):
     """
     Gets the adoption limit of Biochar for each possible land use.
     """
-    biochar_limits = {}
-    yr_cal = data.YR_CAL_BASE + yr_idx
-    for lu in AG_MANAGEMENTS_TO_LAND_USES['Biochar']:
-        j = data.DESC2AGLU[lu]
-        biochar_limits[j] = data.BIOCHAR_DATA[lu].loc[yr_cal, 'Technical_Adoption']
-
-    return biochar_limits
+    return get_table_adoption_limits(data, 'Biochar', 'Technical_Adoption', yr_idx)
 
 
 def get_beef_hir_adoption_limit(data: Data):
@@ -453,8 +442,8 @@ def get_lower_bound_agricultural_management_matrices(data: Data, base_year) -> d
 
     if base_year == data.YR_CAL_BASE or base_year not in data.non_ag_dvars:
         return {
-            am: np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
-            for am in AG_MANAGEMENTS_TO_LAND_USES
+            am: np.zeros((data.NLMS, data.NCELLS, len(am_lus)), dtype=np.float32)
+            for am, am_lus in AG_MANAGEMENTS_TO_LAND_USES.items()
         }
 
     return {
@@ -473,8 +462,9 @@ def get_regional_adoption_limits(data: Data, yr_cal: int):
     ag_reg_adoption_constrs = []
     non_ag_reg_adoption_constrs = []
 
+    reg_index = data.REGIONAL_ADOPTION_ZONE_INDEX[settings.REGIONAL_ADOPTION_ZONE]
     for reg_id, lu_name, area_limit_ha in data.get_regional_adoption_limit_ha_by_year(yr_cal):
-        reg_ind = np.where(data.REGIONAL_ADOPTION_ZONES == reg_id)[0]
+        reg_ind = reg_index.cells(reg_id)
 
         if lu_name in data.DESC2AGLU:
             lu_code = data.DESC2AGLU[lu_name]
@@ -28,6 +28,7 @@ from typing import Optional
 
 import luto.settings as settings
 from luto.economics.agricultural.quantity import get_yield_pot, lvs_veg_types
+from luto.tools.region_index import RegionIndex
 
 
 
@@ -134,113 +135,47 @@ def get_water_net_yield_matrices(
     return get_wyield_matrices(data, yr_idx, water_dr_yield, water_sr_yield) - get_wreq_matrices(data, yr_idx)
 
 
-def get_asparagopsis_effect_w_mrj(data, yr_idx):
+# Column of the agricultural management tables holding the water use multiplier of each option.
+WATER_USE_COLUMNS = {
+    'Asparagopsis taxiformis': 'Water_use',
+    'Precision Agriculture': 'Water_use',
+    'Ecological Grazing': 'INPUT-wrt_water-required',
+    'AgTech EI': 'Water_use',
+    'Biochar': 'Water_use',
+}
+
+
+def get_water_use_effect_w_mrj(data, wreq_mrj, am, yr_idx):
     """
-    Applies the effects of using asparagopsis to the water net yield data
+    Applies the water use effect of agricultural management option `am` to the water net yield data
     for all relevant agr. land uses.
 
     Args:
         data (object): The data object containing relevant information.
-        w_mrj (ndarray, <unit:ML/cell>): The water net yield data for all land uses.
+        wreq_mrj (ndarray, <unit:ML/cell>): The water requirements of all land uses (see `get_wreq_matrices`).
+        am (str): The agricultural management option (one of `WATER_USE_COLUMNS`).
         yr_idx (int): The index of the year.
 
     Returns
-        ndarray <unit:ML/cell>: The updated water net yield data with the effects of using asparagopsis.
+        ndarray <unit:ML/cell>: The updated water net yield data with the effects of `am`.
 
     Notes:
-        Asparagopsis taxiformis has no effect on the water required.
-    """
-
-    land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES["Asparagopsis taxiformis"]
-    lu_codes = np.array([data.DESC2AGLU[lu] for lu in land_uses])
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    wreq_mrj = get_wreq_matrices(data, yr_idx)
-
-    # Set up the effects matrix
-    w_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.ASPARAGOPSIS_DATA[lu].loc[yr_cal, "Water_use"]
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            # The effect is: new value = old value * multiplier - old value
-            # E.g. a multiplier of .95 means a 5% reduction in water used.
-            # Since the effect applies to water use, it effects the net yield negatively.
-            w_mrj_effect[:, :, lu_idx] = wreq_mrj[:, :, j] * (1- multiplier)
-
-    return w_mrj_effect
-
-
-def get_precision_agriculture_effect_w_mrj(data, yr_idx):
-    """
-    Applies the effects of using precision agriculture to the water net yield data
-    for all relevant agricultural land uses.
-
-    Parameters
-    - data: The data object containing relevant information for the calculation.
-    - w_mrj <unit:ML/cell>: The original water net yield data for different land uses.
-    - yr_idx: The index representing the year for which the calculation is performed.
-
-    Returns
-    - w_mrj_effect <unit:ML/cell>: The updated water net yield data after applying precision agriculture effects.
+        The water use multipliers of each option are read from the column `WATER_USE_COLUMNS[am]`
+        of its coefficient tables.
     """
-
-    land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['Precision Agriculture']
+    land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES[am]
     lu_codes = np.array([data.DESC2AGLU[lu] for lu in land_uses])
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    wreq_mrj = get_wreq_matrices(data, yr_idx)
+    multipliers = data.get_ag_man_coefs(am, WATER_USE_COLUMNS[am], yr_idx)
 
     # Set up the effects matrix
     w_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
 
-    # Update values in the new matrix using the correct multiplier for each land use
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.PRECISION_AGRICULTURE_DATA[lu].loc[yr_cal, "Water_use"]
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            # The effect is: new value = old value * multiplier - old value
-            # E.g. a multiplier of .95 means a 5% reduction in water used.
-            # Since the effect applies to water use, it effects the net yield negatively.
-            w_mrj_effect[:, :, lu_idx] = wreq_mrj[:, :, j] * (1- multiplier)
-
-    return w_mrj_effect
-
-
-def get_ecological_grazing_effect_w_mrj(data, yr_idx):
-    """
-    Applies the effects of using ecological grazing to the water net yield data
-    for all relevant agricultural land uses.
-
-    Parameters
-    - data: The data object containing relevant information.
-    - w_mrj <unit:ML/cell>: The water net yield data for different land uses.
-    - yr_idx: The index of the year.
-
-    Returns
-    - w_mrj_effect <unit:ML/cell>: The updated water net yield data after applying ecological grazing effects.
-    """
-
-    land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['Ecological Grazing']
-    lu_codes = np.array([data.DESC2AGLU[lu] for lu in land_uses])
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    wreq_mrj = get_wreq_matrices(data, yr_idx)
-
-    # Set up the effects matrix
-    w_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    # Update values in the new matrix using the correct multiplier for each land use
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.ECOLOGICAL_GRAZING_DATA[lu].loc[yr_cal, "INPUT-wrt_water-required"]
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            # The effect is: new value = old value * multiplier - old value
-            # E.g. a multiplier of .95 means a 5% reduction in water used.
-            # Since the effect applies to water use, it effects the net yield negatively.
-            w_mrj_effect[:, :, lu_idx] = wreq_mrj[:, :, j] * (1- multiplier)
+    # Update values in the new matrix for the land uses whose multiplier is not 1
+    # The effect is: new value = old value * multiplier - old value
+    # E.g. a multiplier of .95 means a 5% reduction in water used.
+    # Since the effect applies to water use, it effects the net yield negatively.
+    lu_idx = np.flatnonzero(multipliers != 1)
+    w_mrj_effect[:, :, lu_idx] = wreq_mrj[:, :, lu_codes[lu_idx]] * (1 - multipliers[lu_idx])
 
     return w_mrj_effect
 
@@ -266,76 +201,6 @@ def get_savanna_burning_effect_w_mrj(data):
     return np.zeros((data.NLMS, data.NCELLS, nlus)).astype(np.float32)
 
 
-def get_agtech_ei_effect_w_mrj(data, yr_idx):
-    """
-    Applies the effects of using AgTech EI to the water net yield data
-    for all relevant agr. land uses.
-
-    Parameters
-    - data: The data object containing relevant information.
-    - w_mrj <unit:ML/cell>: The water net yield data for all land uses.
-    - yr_idx: The index of the year.
-
-    Returns
-    - w_mrj_effect <unit:ML/cell>: The updated water net yield data with AgTech EI effects applied.
-    """
-
-    land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['AgTech EI']
-    lu_codes = np.array([data.DESC2AGLU[lu] for lu in land_uses])
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    wreq_mrj = get_wreq_matrices(data, yr_idx)
-
-    # Set up the effects matrix
-    w_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.AGTECH_EI_DATA[lu].loc[yr_cal, "Water_use"]
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            # The effect is: new value = old value * multiplier - old value
-            # E.g. a multiplier of .95 means a 5% reduction in water used.
-            # Since the effect applies to water use, it effects the net yield negatively.
-            w_mrj_effect[:, :, lu_idx] = wreq_mrj[:, :, j] * (1- multiplier)
-
-
-    return w_mrj_effect
-
-
-def get_biochar_effect_w_mrj(data, yr_idx):
-    """
-    Applies the effects of using Biochar to the water net yield data
-    for all relevant agr. land uses.
-
-    Parameters
-    - data: The data object containing relevant information.
-    - w_mrj <unit:ML/cell>: The water net yield data for all land uses.
-    - yr_idx: The index of the year.
-
-    Returns
-    - w_mrj_effect <unit:ML/cell>: The updated water net yield data with Biochar applied.
-    """
-
-    land_uses = settings.AG_MANAGEMENTS_TO_LAND_USES['Biochar']
-    lu_codes = np.array([data.DESC2AGLU[lu] for lu in land_uses])
-    yr_cal = data.YR_CAL_BASE + yr_idx
-
-    wreq_mrj = get_wreq_matrices(data, yr_idx)
-
-    # Set up the effects matrix
-    w_mrj_effect = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
-
-    # Update values in the new matrix using the correct multiplier for each LU
-    for lu_idx, lu in enumerate(land_uses):
-        multiplier = data.BIOCHAR_DATA[lu].loc[yr_cal, "Water_use"]
-        if multiplier != 1:
-            j = lu_codes[lu_idx]
-            w_mrj_effect[:, :, lu_idx] = wreq_mrj[:, :, j] * (1- multiplier)
-
-    return w_mrj_effect
-
-
 def get_beef_hir_effect_w_mrj(data, yr_idx):
     """
     Applies the effects of using HIR to the water net yield data
@@ -413,57 +278,25 @@ def get_sheep_hir_effect_w_mrj(data, yr_idx):
 
 
 def get_agricultural_management_water_matrices(data, yr_idx) -> dict[str, np.ndarray]:
-    asparagopsis_data = (
-        get_asparagopsis_effect_w_mrj(data, yr_idx)
-        if settings.AG_MANAGEMENTS['Asparagopsis taxiformis']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.REMOVED_DICT['Asparagopsis taxiformis']))).astype(np.float32)
-    )
-    precision_agriculture_data = (
-        get_precision_agriculture_effect_w_mrj(data, yr_idx)
-        if settings.AG_MANAGEMENTS['Precision Agriculture']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.REMOVED_DICT['Precision Agriculture']))).astype(np.float32)
-    )
-    eco_grazing_data = (
-        get_ecological_grazing_effect_w_mrj(data, yr_idx)
-        if settings.AG_MANAGEMENTS['Ecological Grazing']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.REMOVED_DICT['Ecological Grazing']))).astype(np.float32)
-    )
-    sav_burning_data = (
-        get_savanna_burning_effect_w_mrj(data)
-        if settings.AG_MANAGEMENTS['Savanna Burning']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.REMOVED_DICT['Savanna Burning']))).astype(np.float32)
-    )
-    agtech_ei_data = (
-        get_agtech_ei_effect_w_mrj(data, yr_idx)
-        if settings.AG_MANAGEMENTS['AgTech EI']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.REMOVED_DICT['AgTech EI']))).astype(np.float32)
-    )
-    biochar_data = (
-        get_biochar_effect_w_mrj(data, yr_idx)
-        if settings.AG_MANAGEMENTS['Biochar']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.REMOVED_DICT['Biochar']))).astype(np.float32)
-    )
-    beef_hir_data = (
-        get_beef_hir_effect_w_mrj(data, yr_idx)
-        if settings.AG_MANAGEMENTS['Beef - HIR']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.AG_MANAGEMENTS_TO_LAND_USES['Beef - HIR']))).astype(np.float32)
-    )
-    sheep_hir_data = (
-        get_sheep_hir_effect_w_mrj(data, yr_idx)
-        if settings.AG_MANAGEMENTS['Sheep - HIR']
-        else np.zeros((data.NLMS, data.NCELLS, len(settings.AG_MANAGEMENTS_TO_LAND_USES['Sheep - HIR']))).astype(np.float32)
-    )
-
-    return {
-        'Asparagopsis taxiformis': asparagopsis_data,
-        'Precision Agriculture': precision_agriculture_data,
-        'Ecological Grazing': eco_grazing_data,
-        'Savanna Burning': sav_burning_data,
-        'AgTech EI': agtech_ei_data,
-        'Biochar': biochar_data,
-        'Beef - HIR': beef_hir_data,
-        'Sheep - HIR': sheep_hir_data,
-    }
+    # The water requirements are shared by all options with a water use multiplier
+    wreq_mrj = None
+    if any(settings.AG_MANAGEMENTS[am] for am in WATER_USE_COLUMNS):
+        wreq_mrj = get_wreq_matrices(data, yr_idx)
+
+    ag_man_w_mrj = {}
+    for am, enabled in settings.AG_MANAGEMENTS.items():
+        if not enabled:
+            ag_man_w_mrj[am] = np.zeros((data.NLMS, data.NCELLS, len(settings.REMOVED_DICT[am]))).astype(np.float32)
+        elif am in WATER_USE_COLUMNS:
+            ag_man_w_mrj[am] = get_water_use_effect_w_mrj(data, wreq_mrj, am, yr_idx)
+        elif am == 'Savanna Burning':
+            ag_man_w_mrj[am] = get_savanna_burning_effect_w_mrj(data)
+        elif am == 'Beef - HIR':
+            ag_man_w_mrj[am] = get_beef_hir_effect_w_mrj(data, yr_idx)
+        elif am == 'Sheep - HIR':
+            ag_man_w_mrj[am] = get_sheep_hir_effect_w_mrj(data, yr_idx)
+
+    return ag_man_w_mrj
 
 
 def get_water_outside_luto_study_area(data, yr_cal:int) ->  dict[int, float]:
@@ -518,8 +351,31 @@ def get_water_outside_luto_study_area_from_hist_level(data) -> dict[int, float]:
     return water_yield_arr
 
 
-def calc_water_net_yield_for_region(
-    region_ind: np.ndarray,
+def get_water_region_index(data) -> RegionIndex:
+    """
+    Return the cells of each water net yield region (River Regions or Drainage Divisions as specified in luto.settings.py).
+
+    Parameters
+        data (object): The data object containing the required data.
+
+    Returns
+        RegionIndex: The region index of `data.RIVREG_ID` or `data.DRAINDIV_ID`.
+    """
+    if settings.WATER_REGION_DEF == 'River Region':
+        return data.RIVREG_INDEX
+
+    elif settings.WATER_REGION_DEF == 'Drainage Division':
+        return data.DRAINDIV_INDEX
+
+    else:
+        raise ValueError(
+            f"Invalid value for setting WATER_REGION_DEF: '{settings.WATER_REGION_DEF}' "
+            f"(must be either 'River Region' or 'Drainage Division')."
+        )
+
+
+def calc_water_net_yield_by_region(
+    region_index: RegionIndex,
     am2j: dict[str, list[int]],
     ag_dvars: np.ndarray,
     non_ag_dvars: np.ndarray,
@@ -527,22 +383,28 @@ def calc_water_net_yield_for_region(
     ag_w_mrj: np.ndarray,
     non_ag_w_rk: np.ndarray,
     ag_man_w_mrj: dict[str, np.ndarray],
-    water_yield_outside_luto_study_area: float,
-) -> float:
+    water_yield_outside_luto_study_area: dict[int, float],
+) -> dict[int, float]:
     '''
-    This function calculates the net water yield for a given region. \n
+    This function calculates the net water yield of every region in `water_yield_outside_luto_study_area`. \n
 
     `Water_yield` = `ag_contr` + `non_ag_contr` + `ag_mam_contr` + `water_yield_outside_luto_study_area`
+
+    The contributions are summed per cell, then by region in one product with the region incidence matrix.
     '''
     
-    ag_contr = (ag_w_mrj[:, region_ind, :] * ag_dvars[:, region_ind, :]).sum()
-    non_ag_contr = (non_ag_w_rk[region_ind, :] * non_ag_dvars[region_ind, :]).sum()
-    ag_man_contr = sum(
-        (ag_man_w_mrj[am][:, region_ind, j_idx] * ag_man_dvars[am][:, region_ind, j]).sum()
-        for am, am_j_list in am2j.items()
-        for j_idx, j in enumerate(am_j_list)
+    ag_contr_r = np.einsum('mrj,mrj->r', ag_w_mrj, ag_dvars)
+    non_ag_contr_r = np.einsum('rk,rk->r', non_ag_w_rk, non_ag_dvars)
+    ag_man_contr_r = sum(
+        np.einsum('mrj,mrj->r', ag_man_w_mrj[am], ag_man_dvars[am])
+        for am in am2j
     )
-    return ag_contr + non_ag_contr + ag_man_contr + water_yield_outside_luto_study_area
+    wny_inside_LUTO_regions = region_index.totals(ag_contr_r + non_ag_contr_r + ag_man_contr_r)
+
+    return {
+        region: wny_inside_LUTO_regions.get(region, 0) + wny_outside
+        for region, wny_outside in water_yield_outside_luto_study_area.items()
+    }
 
 
 def calc_water_net_yield_BASE_YR(data) -> np.ndarray:
@@ -568,22 +430,24 @@ def calc_water_net_yield_BASE_YR(data) -> np.ndarray:
     ag_w_r = np.einsum('mrj,mrj->r', w_mrj, ag_dvar_mrj)
     
     # Get water net yield for each region
-    wny_inside_LUTO_regions = np.bincount(data.RIVREG_ID, ag_w_r)
-    wny_inside_LUTO_regions = {region: wny for region, wny in enumerate(wny_inside_LUTO_regions) if region != 0}
+    wny_inside_LUTO_regions = data.RIVREG_INDEX.totals(ag_w_r)
     
     # Get water yield from outside the LUTO study area
     wny_outside_LUTO_regions = get_water_outside_luto_study_area_from_hist_level(data)
     
-    return {
-        region: wny_inside_LUTO_regions[region]  + wny_outside_LUTO_regions[region] 
+    # Save the results in data to avoid recalculating
+    data.WATER_YIELD_RR_BASE_YR = {
+        region: wny_inside_LUTO_regions.get(region, 0) + wny_outside_LUTO_regions[region] 
         for region in wny_outside_LUTO_regions
     } 
+    
+    return data.WATER_YIELD_RR_BASE_YR
 
 
 
 def get_water_net_yield_limit_values(
     data,
-) -> dict[int, tuple[str, float, np.ndarray]]:
+) -> dict[int, tuple[str, float]]:
     """
     Return water net yield limits for regions (River Regions or Drainage Divisions as specified in luto.settings.py).
 
@@ -595,9 +459,10 @@ def get_water_net_yield_limit_values(
       region index:(
       - region name
       - water yield limit
-      - indices of cells in the region
       )
 
+      The cells of each region are given by `get_water_region_index(data)`.
+
     Raises:
     - None
 
@@ -609,22 +474,19 @@ def get_water_net_yield_limit_values(
     # Get historical yields of regions, stored in data.RIVREG_LIMITS and data.DRAINDIV_LIMITS
     if settings.WATER_REGION_DEF == 'River Region':
         wny_region_hist = data.RIVREG_LIMITS
-        region_id = data.RIVREG_ID
         region_names = data.RIVREG_DICT
 
     elif settings.WATER_REGION_DEF == 'Drainage Division':
         wny_region_hist = data.DRAINDIV_LIMITS
-        region_id = data.DRAINDIV_ID
         region_names = data.DRAINDIV_DICT
 
     # Calculate the water yield limits for each region
     limits_by_region = {}
     for region, name in region_names.items():
         hist_yield = wny_region_hist[region]
-        ind = np.flatnonzero(region_id == region).astype(np.int32)
         # Water yield limit calculated as a proportial of historical level based on planetary boundary theory
         limit_hist_level = hist_yield * (1 - settings.WATER_STRESS * settings.AG_SHARE_OF_WATER_USE)   
-        limits_by_region[region] = (name, limit_hist_level, ind)    
+        limits_by_region[region] = (name, limit_hist_level)    
 
     # Save the results in data to avoid recalculating
     data.WATER_YIELD_LIMITS = limits_by_region
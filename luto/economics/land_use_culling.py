@@ -21,6 +21,9 @@ import numpy as np
 from luto import settings
 
 
+CULL_BLOCK_SIZE = 2 ** 16       # Number of cells culled at a time
+
+
 def get_percentage_cost_mask(m, r, x_mrj_mask, costs_mrj):
     """
     Exclude the least profitable settings.LAND_USAGE_CULL_PERCENTAGE of land usage options for a given
@@ -64,11 +67,43 @@ def get_absolute_cost_mask(m, r, x_mrj_mask, costs_mrj):
     return cost_include_mask
 
 
+def get_cost_include_mask(x_mrj_mask, costs_mrj):
+    """
+    Get the land usage options to keep for every land management / cell at once, following
+    `get_absolute_cost_mask` or `get_percentage_cost_mask` depending on settings.CULL_MODE.
+    Land management / cell pairs that those functions leave untouched keep all options.
+
+    Returns
+        np.ndarray: Boolean (m, r, j) mask of the land usage options to keep.
+    """
+    n_allowed_mr = x_mrj_mask.sum(axis=2)
+
+    if settings.CULL_MODE == "absolute":
+        n_include_mr = np.full(n_allowed_mr.shape, settings.MAX_LAND_USES_PER_CELL)
+        cull_mr = n_allowed_mr >= settings.MAX_LAND_USES_PER_CELL
+    elif settings.CULL_MODE == "percentage":
+        include_percentage = 1 - settings.LAND_USAGE_CULL_PERCENTAGE
+        n_include_mr = np.maximum(np.round(include_percentage * n_allowed_mr), 1).astype(np.intp)
+        cull_mr = n_allowed_mr > 0
+    else:
+        raise ValueError(f"Unknown settings.CULL_MODE={settings.CULL_MODE}")
+
+    # Sort the allowed costs of each land management / cell; excluded options are NaN so they
+    # sort after every allowed cost, just like NaN costs do in the per-cell sort.
+    sorted_costs_mrj = np.sort(np.where(x_mrj_mask, costs_mrj, np.nan), axis=2)
+    max_cost_idx_mr = np.clip(n_include_mr - 1, 0, costs_mrj.shape[2] - 1)
+    max_cost_mr = np.take_along_axis(sorted_costs_mrj, max_cost_idx_mr[:, :, np.newaxis], axis=2)
+
+    return (costs_mrj <= max_cost_mr) | ~cull_mr[:, :, np.newaxis]
+
+
 def apply_agricultural_land_use_culling(x_mrj, c_mrj, t_mrj, r_mrj):
     """
     Refine the exclude matrix to cull unprofitable land uses based on the settings.CULL_MODE setting.
     This function modifies the x_mrj matrix in-place.
 
+    Cells are culled in blocks of CULL_BLOCK_SIZE to bound the memory of the sorted costs.
+
     Args:
         x_mrj (np.ndarray): The 'exclude' matrix returned by `get_exclude_matrices`. This will
             be modified in-place by this function.
@@ -80,26 +115,7 @@ def apply_agricultural_land_use_culling(x_mrj, c_mrj, t_mrj, r_mrj):
     if settings.CULL_MODE == "none":
         return
 
-    x_mrj_mask = x_mrj.astype(bool)
-    costs_mrj = (c_mrj + t_mrj) - r_mrj
-    for r in range(costs_mrj.shape[1]):
-        # Apply cost masks for every land management option
-        for m in range(costs_mrj.shape[0]):
-            if settings.CULL_MODE == "absolute":
-                cost_include_mask = get_absolute_cost_mask(
-                    m,
-                    r,
-                    x_mrj_mask,
-                    costs_mrj,
-                )
-            elif settings.CULL_MODE == "percentage":
-                cost_include_mask = get_percentage_cost_mask(
-                    m, r, x_mrj_mask, costs_mrj
-                )
-            else:
-                raise ValueError(f"Unknown settings.CULL_MODE={settings.CULL_MODE}")
-
-            if cost_include_mask is None:
-                continue
-
-            x_mrj[m, r, :] = x_mrj[m, r, :] & cost_include_mask
+    for start in range(0, x_mrj.shape[1], CULL_BLOCK_SIZE):
+        block = slice(start, start + CULL_BLOCK_SIZE)
+        costs_mrj = (c_mrj[:, block] + t_mrj[:, block]) - r_mrj[:, block]
+        x_mrj[:, block] &= get_cost_include_mask(x_mrj[:, block].astype(bool), costs_mrj)
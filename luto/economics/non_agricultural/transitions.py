@@ -19,8 +19,11 @@
 
 import numpy as np
 
+from dataclasses import dataclass
+from functools import cached_property
+
 from luto import settings
-from luto.data import Data, lumap2ag_l_mrj
+from luto.data import Data
 import luto.tools as tools
 import luto.economics.agricultural.water as ag_water
 import luto.economics.agricultural.ghg as ag_ghg
@@ -28,36 +31,97 @@ import luto.economics.agricultural.transitions as ag_transitions
 from luto.settings import NON_AG_LAND_USES
 
 
-def get_env_plant_transitions_from_ag(data: Data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, separate=False) -> np.ndarray|dict:
+@dataclass
+class NonAgTransitionContext:
+    """
+    Intermediate arrays shared by the non-agricultural transition cost and exclusion builders
+    for one (target year, base year land-use map). Each is calculated on first use and reused
+    by every builder afterwards.
+    
+    The arrays are shared between builders, so builders must not modify them in place.
+    """
+    data: Data
+    yr_idx: int                 # Index of the target year
+    lumap: np.ndarray           # Land-use map of the base year
+    lmmap: np.ndarray           # Land management map of the base year
+
+    @cached_property
+    def yr_cal(self) -> int:
+        return self.data.YR_CAL_BASE + self.yr_idx
+
+    @cached_property
+    def ag_cells(self) -> np.ndarray:
+        return tools.get_ag_cells(self.lumap)
+
+    @cached_property
+    def non_ag_lu_cells(self) -> dict[str, np.ndarray]:
+        """Cells currently used by each non-agricultural land use, keyed by land use."""
+        k_r = self.lumap.astype(np.int16) - settings.NON_AGRICULTURAL_LU_BASE_CODE
+        return {lu: np.nonzero(k_r == k)[0] for k, lu in enumerate(NON_AG_LAND_USES)}
+
+    @cached_property
+    def natural_x_r(self) -> np.ndarray:
+        return tools.get_exclusions_for_excluding_all_natural_cells(self.data, self.lumap)
+
+    @cached_property
+    def agroforestry_x_r(self) -> np.ndarray:
+        return tools.get_exclusions_agroforestry_base(self.data, self.lumap)
+
+    @cached_property
+    def cp_belt_x_r(self) -> np.ndarray:
+        return tools.get_exclusions_carbon_plantings_belt_base(self.data, self.lumap)
+
+    @cached_property
+    def w_req_mrj(self) -> np.ndarray:
+        return ag_water.get_wreq_matrices(self.data, self.yr_idx)
+
+    @cached_property
+    def ag_to_non_ag_w_costs_r(self) -> tuple[np.ndarray, np.ndarray]:
+        """Water license and irrigation removal costs of moving from the current land use to (dryland) plantings."""
+        return tools.get_ag_to_non_ag_water_delta_matrix(self.data, self.yr_idx, self.lumap, self.lmmap, self.w_req_mrj)
+
+    @cached_property
+    def ag_to_ep_t_r(self) -> np.ndarray:
+        """Amortised base transition costs from the current agricultural land use to plantings (zero for non-agricultural cells)."""
+        t_r = np.zeros(self.data.NCELLS, dtype=np.float32)
+        t_r[self.ag_cells] = self.data.AG2EP_TRANSITION_COSTS_HA[self.lumap[self.ag_cells]]
+        return np.nan_to_num(tools.amortise(t_r * self.data.REAL_AREA))
+
+    @cached_property
+    def non_ag_to_ag_w_delta_mrj(self) -> np.ndarray:
+        """Water license and irrigation costs of moving from the current land use to each agricultural land use (zero for agricultural cells)."""
+        w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(self.w_req_mrj, self.lumap, self.lmmap, self.data, self.yr_idx)
+        w_delta_mrj[:, self.ag_cells, :] = 0
+        return w_delta_mrj
+
+
+def get_env_plant_transitions_from_ag(ctx: NonAgTransitionContext, w_license_cost_r, w_rm_irrig_cost_r, separate=False) -> np.ndarray|dict:
     """
     Calculate the transition costs for transitioning from agricultural land to environmental plantings.
 
     Args:
-        data (object): The data object containing relevant information.
-        yr_idx (int): The index of the year.
-        lumap (np.ndarray): The land use map.
-        w_license_cost_r (np.ndarray): The water license costs.
-        w_rm_irrig_cost_r (np.ndarray): The costs of removing irrigation.
+        ctx (NonAgTransitionContext): The shared intermediates of the year and land-use map.
+        w_license_cost_r (np.ndarray): The water license costs; environmental plantings cells are zeroed in place.
+        w_rm_irrig_cost_r (np.ndarray): The costs of removing irrigation; environmental plantings cells are zeroed in place.
         separate (bool, optional): Whether to return separate costs or the total cost. Defaults to False.
 
     Returns
         np.ndarray|dict: The transition costs as either a numpy array or a dictionary, depending on the value of `separate`.
     """
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    data = ctx.data
+    ep_cells = ctx.non_ag_lu_cells['Environmental Plantings']
 
     # Establishment costs
-    est_costs_r = tools.amortise(data.EP_EST_COST_HA * data.REAL_AREA * data.EST_COST_MULTS[yr_cal]).astype(np.float32)
-    est_costs_r[tools.get_env_plantings_cells(lumap)] = 0.0
+    est_costs_r = tools.amortise(data.EP_EST_COST_HA * data.REAL_AREA * data.EST_COST_MULTS[ctx.yr_cal]).astype(np.float32)
+    est_costs_r[ep_cells] = 0.0
     
     # Transition costs
-    base_ag_to_ep_t_r = np.vectorize(dict(enumerate(data.AG2EP_TRANSITION_COSTS_HA)).get, otypes=['float32'])(lumap)
-    base_ag_to_ep_t_r = tools.amortise(base_ag_to_ep_t_r * data.REAL_AREA)
-    base_ag_to_ep_t_r = np.nan_to_num(base_ag_to_ep_t_r)
-    base_ag_to_ep_t_r[tools.get_env_plantings_cells(lumap)] = 0.0
+    base_ag_to_ep_t_r = ctx.ag_to_ep_t_r.copy()
+    base_ag_to_ep_t_r[ep_cells] = 0.0
     
     # Waster costs; Assume EP is dryland, and no 'REMOVE_IRRIG_COST' for EP
-    w_license_cost_r[tools.get_env_plantings_cells(lumap)] = 0.0
-    w_rm_irrig_cost_r[tools.get_env_plantings_cells(lumap)] = 0.0
+    w_license_cost_r[ep_cells] = 0.0
+    w_rm_irrig_cost_r[ep_cells] = 0.0
     w_cost_r = w_license_cost_r + w_rm_irrig_cost_r
 
     if separate:
@@ -190,7 +254,7 @@ def get_beef_agroforestry_transitions_from_ag(
         return t_r.astype(np.float32)
 
 
-def get_carbon_plantings_block_from_ag(data: Data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, separate=False) -> np.ndarray|dict:
+def get_carbon_plantings_block_from_ag(ctx: NonAgTransitionContext, w_license_cost_r, w_rm_irrig_cost_r, separate=False) -> np.ndarray|dict:
     """
     Get transition costs from agricultural land uses to carbon plantings (block) for each cell.
 
@@ -199,21 +263,20 @@ def get_carbon_plantings_block_from_ag(data: Data, yr_idx, lumap, w_license_cost
     np.ndarray
         1-D array, indexed by cell.
     """
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    data = ctx.data
+    cp_cells = ctx.non_ag_lu_cells['Carbon Plantings (Block)']
 
     # Establishment costs for each cell
-    est_costs_r = tools.amortise(data.CP_EST_COST_HA * data.REAL_AREA * data.EST_COST_MULTS[yr_cal] ).astype(np.float32)
-    est_costs_r[tools.get_carbon_plantings_block_cells(lumap)] = 0.0
+    est_costs_r = tools.amortise(data.CP_EST_COST_HA * data.REAL_AREA * data.EST_COST_MULTS[ctx.yr_cal] ).astype(np.float32)
+    est_costs_r[cp_cells] = 0.0
     
     # Transition costs
-    base_ag_to_cp_t_j = np.vectorize(dict(enumerate(data.AG2EP_TRANSITION_COSTS_HA)).get, otypes=['float32'])(lumap).astype(np.float32)
-    base_ag_to_cp_t_j = tools.amortise(base_ag_to_cp_t_j * data.REAL_AREA).copy()
-    base_ag_to_cp_t_j = np.nan_to_num(base_ag_to_cp_t_j)
-    base_ag_to_cp_t_j[tools.get_carbon_plantings_block_cells(lumap)] = 0.0
+    base_ag_to_cp_t_j = ctx.ag_to_ep_t_r.copy()
+    base_ag_to_cp_t_j[cp_cells] = 0.0
 
     # Water costs (pre-amortised)
-    w_license_cost_r[tools.get_carbon_plantings_block_cells(lumap)] = 0.0
-    w_rm_irrig_cost_r[tools.get_carbon_plantings_block_cells(lumap)] = 0.0
+    w_license_cost_r[cp_cells] = 0.0
+    w_rm_irrig_cost_r[cp_cells] = 0.0
     w_cost_r = w_license_cost_r + w_rm_irrig_cost_r
 
     if separate:
@@ -327,7 +390,7 @@ def get_beef_carbon_plantings_belt_from_ag(
         return t_r
 
 
-def get_beccs_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, separate=False) -> np.ndarray|dict:
+def get_beccs_from_ag(ctx: NonAgTransitionContext, w_license_cost_r, w_rm_irrig_cost_r, separate=False) -> np.ndarray|dict:
     """
     Get transition costs from agricultural land uses to carbon plantings (belt) for each cell.
 
@@ -337,7 +400,7 @@ def get_beccs_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r,
         1-D array, indexed by cell.
     """
 
-    return get_env_plant_transitions_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, separate)
+    return get_env_plant_transitions_from_ag(ctx, w_license_cost_r, w_rm_irrig_cost_r, separate)
 
 
 
@@ -373,11 +436,11 @@ def get_destocked_from_ag(data: Data, ag_t_mrj: np.ndarray | dict, separate: boo
 def get_from_ag_transition_matrix(
     data: Data,
     yr_idx: int,
-    base_year: int,
     lumap: np.ndarray,
     lmmap: np.ndarray,
     ag_t_mrj: np.ndarray | dict,
-    separate: bool = False
+    separate: bool = False,
+    ctx: NonAgTransitionContext = None,
 ) -> np.ndarray|dict:
     """
     Get the matrix containing transition costs from agricultural land uses to non-agricultural land uses.
@@ -393,11 +456,13 @@ def get_from_ag_transition_matrix(
     lmmap : dict
         The land management map.
     ag_t_mrj: np.ndarray | dict
-        Agricultural transitions: should be the ag_t_mrj array if separate==False and the separated agricultural
+        Agricultural transitions from the base year: should be the ag_t_mrj array if separate==False and the separated agricultural
         tranistions dictionary if separate==True
     separate : bool, optional
         If True, return a dictionary containing the transition costs for each non-agricultural land use.
         If False, return a 2-D array indexed by (r, k) where r is cell and k is non-agricultural land usage.
+    ctx : NonAgTransitionContext, optional
+        The shared intermediates of `yr_idx` and `lumap`/`lmmap`; created here if not given.
 
     Returns
     -------
@@ -405,26 +470,27 @@ def get_from_ag_transition_matrix(
         If separate is False, returns a 2-D array indexed by (r, k) where r is cell and k is non-agricultural land usage.
         If separate is True, returns a dictionary containing the transition costs for each non-agricultural land use.
     """
+    if ctx is None:
+        ctx = NonAgTransitionContext(data, yr_idx, lumap, lmmap)
+
+    agroforestry_x_r = ctx.agroforestry_x_r
+    cp_belt_x_r = ctx.cp_belt_x_r
+    w_license_cost_r, w_rm_irrig_cost_r = (arr.copy() for arr in ctx.ag_to_non_ag_w_costs_r)    # Zeroed in place by the EP, CP (block) and BECCS builders
     
-    ag_t_costs = ag_transitions.get_transition_matrices_from_base_year(data, yr_idx, base_year, separate)
-    agroforestry_x_r = tools.get_exclusions_agroforestry_base(data, lumap)
-    cp_belt_x_r = tools.get_exclusions_carbon_plantings_belt_base(data, lumap)
-    w_license_cost_r, w_rm_irrig_cost_r = tools.get_ag_to_non_ag_water_delta_matrix(data, yr_idx, lumap, lmmap)
-    
-    env_plant_transitions_from_ag = get_env_plant_transitions_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, separate)                           # Base EP transition 
+    env_plant_transitions_from_ag = get_env_plant_transitions_from_ag(ctx, w_license_cost_r, w_rm_irrig_cost_r, separate)                                          # Base EP transition 
     rip_plant_transitions_from_ag = get_rip_plant_transitions_from_ag(data, env_plant_transitions_from_ag, yr_idx, lumap, separate)                                 # Base EP transition plus RF fencing costs
     agroforestry_costs = get_agroforestry_transitions_from_ag_base(data, env_plant_transitions_from_ag, yr_idx, lumap, separate)                                    # Base EP transition plus AF fencing costs
     
-    sheep_agroforestry_transitions_from_ag = get_sheep_agroforestry_transitions_from_ag(data, agroforestry_x_r, agroforestry_costs, ag_t_costs, lumap, separate)    # Base EP transition plus RF fencing costs + sheep grazing
-    beef_agroforestry_transitions_from_ag = get_beef_agroforestry_transitions_from_ag( data, agroforestry_x_r, agroforestry_costs, ag_t_costs, lumap, separate)     # Base EP transition plus RF fencing costs + beef grazing
+    sheep_agroforestry_transitions_from_ag = get_sheep_agroforestry_transitions_from_ag(data, agroforestry_x_r, agroforestry_costs, ag_t_mrj, lumap, separate)      # Base EP transition plus RF fencing costs + sheep grazing
+    beef_agroforestry_transitions_from_ag = get_beef_agroforestry_transitions_from_ag( data, agroforestry_x_r, agroforestry_costs, ag_t_mrj, lumap, separate)       # Base EP transition plus RF fencing costs + beef grazing
     
-    carbon_plantings_block_transitions_from_ag = get_carbon_plantings_block_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, separate)             # Base CP transition 
+    carbon_plantings_block_transitions_from_ag = get_carbon_plantings_block_from_ag(ctx, w_license_cost_r, w_rm_irrig_cost_r, separate)                            # Base CP transition 
     cp_belt_costs = get_carbon_plantings_belt_from_ag_base(data, carbon_plantings_block_transitions_from_ag, yr_idx, lumap, separate)                               # Base CP transition plus CP fencing costs
     
-    sheep_carbon_plantings_belt_transitions_from_ag = get_sheep_carbon_plantings_belt_from_ag(data, cp_belt_x_r, cp_belt_costs, ag_t_costs, lumap, separate)        # Base CP transition plus CP fencing costs + sheep grazing
-    beef_carbon_plantings_belt_transitions_from_ag = get_beef_carbon_plantings_belt_from_ag( data, cp_belt_x_r, cp_belt_costs, ag_t_costs, lumap, separate)         # Base CP transition plus CP fencing costs + beef grazing
+    sheep_carbon_plantings_belt_transitions_from_ag = get_sheep_carbon_plantings_belt_from_ag(data, cp_belt_x_r, cp_belt_costs, ag_t_mrj, lumap, separate)          # Base CP transition plus CP fencing costs + sheep grazing
+    beef_carbon_plantings_belt_transitions_from_ag = get_beef_carbon_plantings_belt_from_ag( data, cp_belt_x_r, cp_belt_costs, ag_t_mrj, lumap, separate)           # Base CP transition plus CP fencing costs + beef grazing
     
-    beccs_transitions_from_ag = get_beccs_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, separate)                                               # Base EP transition (the same)
+    beccs_transitions_from_ag = get_beccs_from_ag(ctx, w_license_cost_r, w_rm_irrig_cost_r, separate)                                                              # Base EP transition (the same)
     destocked_from_ag = get_destocked_from_ag(data, ag_t_mrj, separate)
 
     if separate:
@@ -457,79 +523,39 @@ def get_from_ag_transition_matrix(
 
 
 # TODO: Need to check the logic of transition cost, espcially the water cost.
-def get_env_plantings_to_ag(data: Data, yr_idx, lumap, lmmap, separate=False) -> np.ndarray|dict:
+def get_env_plantings_to_ag(ctx: NonAgTransitionContext, separate=False) -> np.ndarray|dict:
     """
     Get transition costs from environmental plantings to agricultural land uses for each cell.
+    
+    Note: riparian plantings, agroforestry, carbon plantings and BECCS use the same costs.
 
     Returns
     -------
     np.ndarray
         3-D array, indexed by (m, r, j).
     """
-    yr_cal = data.YR_CAL_BASE + yr_idx
-    l_mrj = lumap2ag_l_mrj(lumap, lmmap)
-    l_mrj_not = np.logical_not(l_mrj)           # This ensures the lu remains the same has 0 cost
+    data = ctx.data
 
-    # Get base transition costs: add cost of installing irrigation
-    base_ep_to_ag_t = data.EP2AG_TRANSITION_COSTS_HA * data.TRANS_COST_MULTS[yr_cal]
+    # Get base transition costs: add cost of installing irrigation; amortise upfront costs to annualised costs
+    base_ep_to_ag_t_j = tools.amortise(data.EP2AG_TRANSITION_COSTS_HA * data.TRANS_COST_MULTS[ctx.yr_cal])
 
-    # Get the agricultural cells, and the env-ag can not happen on these cells
-    ag_cells, _ = tools.get_ag_and_non_ag_cells(lumap)
+    # The env-ag transition can not happen on agricultural cells
+    area_r = data.REAL_AREA.copy()
+    area_r[ctx.ag_cells] = 0
 
     # Get water license price and costs of installing/removing irrigation where appropriate
-    w_mrj = ag_water.get_wreq_matrices(data, yr_idx)
-    w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(w_mrj, l_mrj, data, yr_idx)
-    w_delta_mrj[:, ag_cells, :] = 0
-
-    # Reshape and amortise upfront costs to annualised costs
-    base_ep_to_ag_t_mrj = np.broadcast_to(base_ep_to_ag_t, (data.NLMS, data.NCELLS, base_ep_to_ag_t.shape[0]))
-    base_ep_to_ag_t_mrj = tools.amortise(base_ep_to_ag_t_mrj).copy()
-    base_ep_to_ag_t_mrj[:, ag_cells, :] = 0
+    w_delta_mrj = ctx.non_ag_to_ag_w_delta_mrj
 
     if separate:
-        return {'Non-Ag2Ag Transition cost':np.nan_to_num(np.einsum('mrj,mrj,r->mrj', base_ep_to_ag_t_mrj, l_mrj_not, data.REAL_AREA)), 
-                'Non-Ag2Ag Water license cost': np.nan_to_num(np.einsum('mrj,mrj,r->mrj', w_delta_mrj, l_mrj_not, data.REAL_AREA))}
+        return {'Non-Ag2Ag Transition cost': np.nan_to_num(np.broadcast_to(base_ep_to_ag_t_j[np.newaxis, :] * area_r[:, np.newaxis], w_delta_mrj.shape)), 
+                'Non-Ag2Ag Water license cost': np.nan_to_num(w_delta_mrj * area_r[np.newaxis, :, np.newaxis])}
         
     # Add cost of water license and cost of installing/removing irrigation where relevant (pre-amortised)
-    ep_to_ag_t_mrj = (base_ep_to_ag_t_mrj + w_delta_mrj) * l_mrj_not * data.REAL_AREA[np.newaxis, :, np.newaxis]
-    return np.nan_to_num(ep_to_ag_t_mrj) 
-
-
-def get_rip_plantings_to_ag(data: Data, yr_idx, lumap, lmmap, separate=False) -> np.ndarray|dict:
-    """
-    Get transition costs from riparian plantings to agricultural land uses for each cell.
-    
-    Note: this is the same as for environmental plantings.
-
-    Returns
-    -------
-    np.ndarray
-        3-D array, indexed by (m, r, j).
-    """
-    if separate:
-        return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap, separate)
-    else:
-        return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap)
-
-
-def get_agroforestry_to_ag_base(data: Data, yr_idx, lumap, lmmap, separate) -> np.ndarray|dict:
-    """
-    Get transition costs from agroforestry to agricultural land uses for each cell.
-    
-    Note: this is the same as for environmental plantings.
-
-    Returns
-    -------
-    np.ndarray
-        3-D array, indexed by (m, r, j).
-    """
-    if separate:
-        return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap, separate)
-    else:
-        return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap)
+    ep_to_ag_t_mrj = (base_ep_to_ag_t_j[np.newaxis, np.newaxis, :] + w_delta_mrj) * area_r[np.newaxis, :, np.newaxis]
+    return np.nan_to_num(ep_to_ag_t_mrj)
 
 
-def get_sheep_to_ag_base(data: Data, yr_idx: int, lumap, separate=False) -> np.ndarray|dict:
+def get_sheep_to_ag_base(ctx: NonAgTransitionContext, separate=False) -> np.ndarray|dict:
     """
     Get sheep contribution to transition costs to agricultural land uses.
     Used for getting transition costs for Sheep Agroforestry and CP (Belt).
@@ -542,48 +568,34 @@ def get_sheep_to_ag_base(data: Data, yr_idx: int, lumap, separate=False) -> np.n
         Dictionary of separated out transition costs.
     ------
     """
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    data = ctx.data
     sheep_j = tools.get_sheep_code(data)
 
-    all_sheep_lumap = (np.ones(data.NCELLS) * sheep_j).astype(np.int8)
-    all_dry_lmmap = np.zeros(data.NCELLS).astype(np.float32)
-    l_mrj = lumap2ag_l_mrj(all_sheep_lumap, all_dry_lmmap)
-    l_mrj_not = np.logical_not(l_mrj)
+    all_sheep_lumap = np.full(data.NCELLS, sheep_j, dtype=np.int8)
+    all_dry_lmmap = np.zeros(data.NCELLS, dtype=np.int8)
 
-    t_ij = data.AG_TMATRIX * data.TRANS_COST_MULTS[yr_cal]
-    x_mrj = ag_transitions.get_exclude_matrices(data, all_sheep_lumap)
+    # Allowed transitions, excluding staying as dryland sheep
+    t_mask_mrj = ag_transitions.get_exclude_matrices(data, all_sheep_lumap).astype(bool)
+    t_mask_mrj[0, :, sheep_j] = False
+    # Ensure transition costs are zero for all agricultural cells 
+    t_mask_mrj[:, ctx.ag_cells, :] = False
 
     # Calculate sheep contribution to transition costs
-    # Establishment costs
-    ag_cells = tools.get_ag_cells(lumap)
-
-    e_rj = np.zeros((data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-    e_rj[ag_cells, :] = t_ij[all_sheep_lumap[ag_cells]]
-
-    e_rj = tools.amortise(e_rj) * data.REAL_AREA[:, np.newaxis]
-    e_rj_dry = np.einsum('rj,r->rj', e_rj, all_sheep_lumap == 0)
-    e_rj_irr = np.einsum('rj,r->rj', e_rj, all_dry_lmmap == 1)
-    e_mrj = np.stack([e_rj_dry, e_rj_irr], axis=0)
-    e_mrj = np.einsum('mrj,mrj,mrj->mrj', e_mrj, x_mrj, l_mrj_not)
+    # Establishment costs are only calculated for agricultural cells, which are all excluded above
+    e_mrj = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
 
     # Water license cost
-    w_mrj = ag_water.get_wreq_matrices(data, yr_idx)
-    w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(w_mrj, l_mrj, data, yr_idx)
-    w_delta_mrj = np.einsum('mrj,mrj,mrj->mrj', w_delta_mrj, x_mrj, l_mrj_not)
+    w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(ctx.w_req_mrj, all_sheep_lumap, all_dry_lmmap, data, ctx.yr_idx)
+    w_delta_mrj = np.where(t_mask_mrj, w_delta_mrj, 0)
 
     # Carbon costs
     ghg_t_mrj = ag_ghg.get_ghg_transition_penalties(data, all_sheep_lumap)               # <unit: t/ha>      
-    ghg_t_mrj_cost = tools.amortise(ghg_t_mrj * data.get_carbon_price_by_yr_idx(yr_idx))     
-    ghg_t_mrj_cost = np.einsum('mrj,mrj,mrj->mrj', ghg_t_mrj_cost, x_mrj, l_mrj_not)
-
-    # Ensure transition costs are zero for all agricultural cells 
-    e_mrj[:, ag_cells, :] = np.zeros((data.NLMS, ag_cells.shape[0], data.N_AG_LUS)).astype(np.float32)
-    w_delta_mrj[:, ag_cells, :] = np.zeros((data.NLMS, ag_cells.shape[0], data.N_AG_LUS)).astype(np.float32)
-    ghg_t_mrj_cost[:, ag_cells, :] = np.zeros((data.NLMS, ag_cells.shape[0], data.N_AG_LUS)).astype(np.float32)
+    ghg_t_mrj_cost = tools.amortise(ghg_t_mrj * data.get_carbon_price_by_yr_idx(ctx.yr_idx))     
+    ghg_t_mrj_cost = np.where(t_mask_mrj, ghg_t_mrj_cost, 0)
 
     if separate:
         return {
-            'Non-Ag2Ag Establishment cost': np.nan_to_num(e_mrj), 
+            'Non-Ag2Ag Establishment cost': e_mrj, 
             'Water license cost': np.nan_to_num(w_delta_mrj), 
             'GHG emissions cost': np.nan_to_num(ghg_t_mrj_cost)
         }
@@ -592,7 +604,7 @@ def get_sheep_to_ag_base(data: Data, yr_idx: int, lumap, separate=False) -> np.n
         return np.nan_to_num(e_mrj + w_delta_mrj + ghg_t_mrj_cost)
 
 
-def get_beef_to_ag_base(data: Data, yr_idx, lumap, separate) -> np.ndarray|dict:
+def get_beef_to_ag_base(ctx: NonAgTransitionContext, separate=False) -> np.ndarray|dict:
     """
     Get beef contribution to transition costs to agricultural land uses.
     Used for getting transition costs for Beef Agroforestry and CP (Belt).
@@ -604,49 +616,34 @@ def get_beef_to_ag_base(data: Data, yr_idx, lumap, separate) -> np.ndarray|dict:
     dict (separate = True)
         Dictionary of separated out transition costs.
     """
-    yr_cal = data.YR_CAL_BASE + yr_idx
+    data = ctx.data
     beef_j = tools.get_beef_code(data)
 
-    all_beef_lumap = (np.ones(data.NCELLS) * beef_j).astype(np.int8)
-    all_dry_lmmap = np.zeros(data.NCELLS).astype(np.float32)
-    l_mrj = lumap2ag_l_mrj(all_beef_lumap, all_dry_lmmap)
-    l_mrj_not = np.logical_not(l_mrj)
+    all_beef_lumap = np.full(data.NCELLS, beef_j, dtype=np.int8)
+    all_dry_lmmap = np.zeros(data.NCELLS, dtype=np.int8)
 
-    t_ij = data.AG_TMATRIX * data.TRANS_COST_MULTS[yr_cal]
-    x_mrj = ag_transitions.get_exclude_matrices(data, all_beef_lumap)
-
-    # Calculate sheep contribution to transition costs
-    # Establishment costs
-    ag_cells = tools.get_ag_cells(lumap)
-
-    e_rj = np.zeros((data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-    e_rj[ag_cells, :] = t_ij[all_beef_lumap[ag_cells]]
+    # Allowed transitions, excluding staying as dryland beef
+    t_mask_mrj = ag_transitions.get_exclude_matrices(data, all_beef_lumap).astype(bool)
+    t_mask_mrj[0, :, beef_j] = False
+    # Ensure transition costs are zero for all agricultural cells 
+    t_mask_mrj[:, ctx.ag_cells, :] = False
 
-    e_rj = tools.amortise(e_rj) * data.REAL_AREA[:, np.newaxis]
-    e_mrj = np.stack([e_rj] * data.NLMS, axis=0)
-    e_mrj = np.einsum('mrj,mrj,mrj->mrj', e_mrj, x_mrj, l_mrj_not)
+    # Calculate beef contribution to transition costs
+    # Establishment costs are only calculated for agricultural cells, which are all excluded above
+    e_mrj = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS), dtype=np.float32)
 
     # Water license cost
-    w_mrj = ag_water.get_wreq_matrices(data, yr_idx)
-    w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(w_mrj, l_mrj, data, yr_idx)
-    w_delta_mrj = np.einsum('mrj,mrj,mrj->mrj', w_delta_mrj, x_mrj, l_mrj_not)
+    w_delta_mrj = tools.get_ag_to_ag_water_delta_matrix(ctx.w_req_mrj, all_beef_lumap, all_dry_lmmap, data, ctx.yr_idx)
+    w_delta_mrj = np.where(t_mask_mrj, w_delta_mrj, 0)
 
     # Carbon costs
     ghg_t_mrj = ag_ghg.get_ghg_transition_penalties(data, all_beef_lumap)               # <unit: t/ha>      
-    ghg_t_mrj_cost = tools.amortise(ghg_t_mrj * data.get_carbon_price_by_yr_idx(yr_idx))     
-    ghg_t_mrj_cost = np.einsum('mrj,mrj,mrj->mrj', ghg_t_mrj_cost, x_mrj, l_mrj_not)
-
-    beef_af_cells = tools.get_beef_agroforestry_cells(lumap)
-    non_beef_af_cells = np.array([r for r in range(data.NCELLS) if r not in beef_af_cells])
-
-    # Ensure transition costs are zero for all agricultural cells 
-    e_mrj[:, ag_cells, :] = np.zeros((data.NLMS, ag_cells.shape[0], data.N_AG_LUS)).astype(np.float32)
-    w_delta_mrj[:, ag_cells, :] = np.zeros((data.NLMS, ag_cells.shape[0], data.N_AG_LUS)).astype(np.float32)
-    ghg_t_mrj_cost[:, ag_cells, :] = np.zeros((data.NLMS, ag_cells.shape[0], data.N_AG_LUS)).astype(np.float32)
+    ghg_t_mrj_cost = tools.amortise(ghg_t_mrj * data.get_carbon_price_by_yr_idx(ctx.yr_idx))     
+    ghg_t_mrj_cost = np.where(t_mask_mrj, ghg_t_mrj_cost, 0)
 
     if separate:
         return {
-            'Non-Ag2Ag Establishment cost': np.nan_to_num(e_mrj), 
+            'Non-Ag2Ag Establishment cost': e_mrj, 
             'Non-Ag2Ag Water license cost': np.nan_to_num(w_delta_mrj), 
             'Non-Ag2Ag GHG emissions cost': np.nan_to_num(ghg_t_mrj_cost)
         }
@@ -654,15 +651,19 @@ def get_beef_to_ag_base(data: Data, yr_idx, lumap, separate) -> np.ndarray|dict:
     else:
         t_mrj = e_mrj + w_delta_mrj + ghg_t_mrj_cost
         # Set all costs for non-beef-agroforestry cells to zero
-        t_mrj[:, non_beef_af_cells, :] = 0
+        beef_af_r = np.zeros(data.NCELLS, dtype=bool)
+        beef_af_r[ctx.non_ag_lu_cells['Beef Agroforestry']] = True
+        t_mrj[:, ~beef_af_r, :] = 0
         return np.nan_to_num(t_mrj)
 
 
-def get_sheep_agroforestry_to_ag(
-    data: Data, yr_idx, lumap, lmmap, agroforestry_x_r, separate=False
+def get_lvstk_non_ag_to_ag_costs(
+    non_ag_x_r: np.ndarray, non_ag_tcosts: np.ndarray|dict, lvstk_tcosts: np.ndarray|dict, separate=False
 ) -> np.ndarray|dict:
     """
-    Get transition costs of Sheep Agroforestry to all agricultural land uses.
+    Combine the transition costs to agricultural land uses of a livestock non-agricultural land use
+    (agroforestry or carbon plantings (belt)) from its non-agricultural portion `non_ag_x_r` and
+    its livestock portion (1 - `non_ag_x_r`).
 
     Returns
     -------
@@ -671,47 +672,31 @@ def get_sheep_agroforestry_to_ag(
     dict (separate = True)
         Dictionary of separated out transition costs.
     """
-    sheep_tcosts = get_sheep_to_ag_base(data, yr_idx, lumap, separate)
-    agroforestry_tcosts = get_agroforestry_to_ag_base(data, yr_idx, lumap, lmmap, separate)
+    non_ag_x_mrj = non_ag_x_r[np.newaxis, :, np.newaxis]
+    lvstk_x_mrj = (1 - non_ag_x_r)[np.newaxis, :, np.newaxis]
 
     if separate:
         # Combine and return separated costs
-        combined_costs = {}
-        for key, array in agroforestry_tcosts.items():
-            combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] = array[m, :, j] * agroforestry_x_r
-
-        for key, array in sheep_tcosts.items():
+        combined_costs = {key: (array * non_ag_x_mrj).astype(np.float32) for key, array in non_ag_tcosts.items()}
+        for key, array in lvstk_tcosts.items():
             if key not in combined_costs:
                 combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] += array[m, :, j] * (1 - agroforestry_x_r)
+            combined_costs[key] += array * lvstk_x_mrj
 
         return combined_costs
-    
-    else:
-        sheep_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                sheep_contr[m, :, j] = (1 - agroforestry_x_r) * sheep_tcosts[m, :, j]
-
-        agroforestry_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                agroforestry_contr[m, :, j] = agroforestry_x_r * agroforestry_tcosts[m, :, j]
 
-        return sheep_contr + agroforestry_contr
+    else:
+        lvstk_contr = (lvstk_x_mrj * lvstk_tcosts).astype(np.float32)
+        non_ag_contr = (non_ag_x_mrj * non_ag_tcosts).astype(np.float32)
+        return lvstk_contr + non_ag_contr
 
 
-def get_beef_agroforestry_to_ag(
-    data: Data, yr_idx, lumap, lmmap, agroforestry_x_r, separate=False
+def get_sheep_agroforestry_to_ag(
+    agroforestry_x_r, agroforestry_tcosts, sheep_tcosts, separate=False
 ) -> np.ndarray|dict:
     """
-    Get transition costs of Beef Agroforestry to all agricultural land uses.
-    
+    Get transition costs of Sheep Agroforestry to all agricultural land uses.
+
     Returns
     -------
     np.ndarray separate = False
@@ -719,71 +704,27 @@ def get_beef_agroforestry_to_ag(
     dict (separate = True)
         Dictionary of separated out transition costs.
     """
-    beef_tcosts = get_beef_to_ag_base(data, yr_idx, lumap, separate)
-    agroforestry_tcosts = get_agroforestry_to_ag_base(data, yr_idx, lumap, lmmap, separate)
+    return get_lvstk_non_ag_to_ag_costs(agroforestry_x_r, agroforestry_tcosts, sheep_tcosts, separate)
 
-    if separate:
-        # Combine and return separated costs
-        combined_costs = {}
-        for key, array in agroforestry_tcosts.items():
-            combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] = array[m, :, j] * agroforestry_x_r
-
-        for key, array in beef_tcosts.items():
-            if key not in combined_costs:
-                combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] += array[m, :, j] * (1 - agroforestry_x_r)
 
-        return combined_costs
-    
-    else:
-        beef_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                beef_contr[m, :, j] = (1 - agroforestry_x_r) * beef_tcosts[m, :, j]
-
-        agroforestry_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                agroforestry_contr[m, :, j] = agroforestry_x_r * agroforestry_tcosts[m, :, j]
-
-        return beef_contr + agroforestry_contr
-
-
-def get_carbon_plantings_block_to_ag(data: Data, yr_idx, lumap, lmmap, separate=False):
-    """
-    Get transition costs from carbon plantings (block) to agricultural land uses for each cell.
-    
-    Note: this is the same as for environmental plantings.
-
-    Returns
-    -------
-    np.ndarray
-        3-D array, indexed by (m, r, j).
-    """
-    return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap, separate)
-
-
-def get_carbon_plantings_belt_to_ag_base(data, yr_idx, lumap, lmmap, separate=False) -> np.ndarray|dict:
+def get_beef_agroforestry_to_ag(
+    agroforestry_x_r, agroforestry_tcosts, beef_tcosts, separate=False
+) -> np.ndarray|dict:
     """
-    Get transition costs from carbon plantings (belt) to agricultural land uses for each cell.
+    Get transition costs of Beef Agroforestry to all agricultural land uses.
     
-    Note: this is the same as for environmental plantings.
-
     Returns
     -------
-    np.ndarray
+    np.ndarray separate = False
         3-D array, indexed by (m, r, j).
+    dict (separate = True)
+        Dictionary of separated out transition costs.
     """
-    return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap, separate)
+    return get_lvstk_non_ag_to_ag_costs(agroforestry_x_r, agroforestry_tcosts, beef_tcosts, separate)
 
 
 def get_sheep_carbon_plantings_belt_to_ag(
-    data: Data, yr_idx, lumap, lmmap, cp_belt_x_r, separate
+    cp_belt_x_r, cp_belt_tcosts, sheep_tcosts, separate=False
 ) -> np.ndarray|dict:
     """
     Get transition costs of Sheep Carbon Plantings (Belt) to all agricultural land uses.
@@ -795,43 +736,11 @@ def get_sheep_carbon_plantings_belt_to_ag(
     dict (separate = True)
         Dictionary of separated out transition costs.
     """
-    sheep_tcosts = get_sheep_to_ag_base(data, yr_idx, lumap, separate)
-    cp_belt_tcosts = get_carbon_plantings_belt_to_ag_base(data, yr_idx, lumap, lmmap, separate)
-
-    if separate:
-        # Combine and return separated costs
-        combined_costs = {}
-        for key, array in cp_belt_tcosts.items():
-            combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] = array[m, :, j] * cp_belt_x_r
-
-        for key, array in sheep_tcosts.items():
-            if key not in combined_costs:
-                combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] += array[m, :, j] * (1 - cp_belt_x_r)
-
-        return combined_costs
-    
-    else:
-        sheep_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                sheep_contr[m, :, j] = (1 - cp_belt_x_r) * sheep_tcosts[m, :, j]
-
-        cp_belt_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                cp_belt_contr[m, :, j] = cp_belt_x_r * cp_belt_tcosts[m, :, j]
-
-        return sheep_contr + cp_belt_contr
+    return get_lvstk_non_ag_to_ag_costs(cp_belt_x_r, cp_belt_tcosts, sheep_tcosts, separate)
     
 
 def get_beef_carbon_plantings_belt_to_ag(
-    data: Data, yr_idx, lumap, lmmap, cp_belt_x_r, separate
+    cp_belt_x_r, cp_belt_tcosts, beef_tcosts, separate=False
 ) -> np.ndarray|dict:
     """
     Get transition costs of Beef Carbon Plantings (Belt) to all agricultural land uses.
@@ -843,59 +752,10 @@ def get_beef_carbon_plantings_belt_to_ag(
     dict (separate = True)
         Dictionary of separated out transition costs.
     """
-    beef_tcosts = get_beef_to_ag_base(data, yr_idx, lumap, separate)
-    cp_belt_tcosts = get_carbon_plantings_belt_to_ag_base(data, yr_idx, lumap, lmmap, separate)
+    return get_lvstk_non_ag_to_ag_costs(cp_belt_x_r, cp_belt_tcosts, beef_tcosts, separate)
 
-    if separate:
-        # Combine and return separated costs
-        combined_costs = {}
-        for key, array in cp_belt_tcosts.items():
-            combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] = array[m, :, j] * cp_belt_x_r
-
-        for key, array in beef_tcosts.items():
-            if key not in combined_costs:
-                combined_costs[key] = np.zeros(array.shape).astype(np.float32)
-            for m in range(data.NLMS):
-                for j in range(data.N_AG_LUS):
-                    combined_costs[key][m, :, j] += array[m, :, j] * (1 - cp_belt_x_r)
-
-        return combined_costs
-    
-    else:
-        beef_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                beef_contr[m, :, j] = (1 - cp_belt_x_r) * beef_tcosts[m, :, j]
-
-        cp_belt_contr = np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32)
-        for m in range(data.NLMS):
-            for j in range(data.N_AG_LUS):
-                cp_belt_contr[m, :, j] = cp_belt_x_r * cp_belt_tcosts[m, :, j]
-
-        return beef_contr + cp_belt_contr
-
-
-def get_beccs_to_ag(data: Data, yr_idx, lumap, lmmap, separate=False) -> np.ndarray|dict:
-    """
-    Get transition costs from BECCS to agricultural land uses for each cell.
-    
-    Note: this is the same as for environmental plantings.
-
-    Returns
-    -------
-    np.ndarray
-        3-D array, indexed by (m, r, j).
-    """
-    if separate:
-        return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap, separate)
-    else:
-        return get_env_plantings_to_ag(data, yr_idx, lumap, lmmap)
-    
 
-def get_destocked_to_ag(data: Data, yr_idx: int, lumap: np.ndarray, separate: bool = False) -> np.ndarray:
+def get_destocked_to_ag(ctx: NonAgTransitionContext, separate: bool = False) -> np.ndarray:
     """
     Get transition costs from destocked land to agricultural land uses for each cell.
     Transition costs are based on the transition costs of unallocated natural land to agricultural land.
@@ -905,17 +765,18 @@ def get_destocked_to_ag(data: Data, yr_idx: int, lumap: np.ndarray, separate: bo
     np.ndarray
         3-D array, indexed by (m, r, j).
     """
+    data = ctx.data
     unallocated_j = tools.get_unallocated_natural_land_code(data)
     all_unallocated_lumap = (np.ones(data.NCELLS) * unallocated_j).astype(np.int8)
     all_dry_lmmap = (np.zeros(data.NCELLS)).astype(np.int8)
 
-    destocked_cells = tools.get_destocked_land_cells(lumap)
+    destocked_cells = ctx.non_ag_lu_cells['Destocked - natural land']
     if destocked_cells.size == 0 and separate == False:
         return np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS))
     
     # Get transition costs from destocked cells by using transition costs from unallocated land
     unallocated_t_mrj = ag_transitions.get_transition_matrices_from_maps(
-        data, yr_idx, all_unallocated_lumap, all_dry_lmmap, separate=separate
+        data, ctx.yr_idx, all_unallocated_lumap, all_dry_lmmap, separate=separate
     )
 
     if separate == False:
@@ -938,7 +799,7 @@ def get_destocked_to_ag(data: Data, yr_idx: int, lumap: np.ndarray, separate: bo
     )
 
 
-def get_to_ag_transition_matrix(data: Data, yr_idx, lumap, lmmap, separate=False) -> np.ndarray|dict:
+def get_to_ag_transition_matrix(data: Data, yr_idx, lumap, lmmap, separate=False, ctx: NonAgTransitionContext = None) -> np.ndarray|dict:
     """
     Get the matrix containing transition costs from non-agricultural land uses to agricultural land uses.
 
@@ -955,6 +816,8 @@ def get_to_ag_transition_matrix(data: Data, yr_idx, lumap, lmmap, separate=False
     separate : bool, optional
         If True, returns a dictionary of transition matrices for each land use category.
         If False, returns a single aggregated transition matrix.
+    ctx : NonAgTransitionContext, optional
+        The shared intermediates of `yr_idx` and `lumap`/`lmmap`; created here if not given.
 
     Returns
     -------
@@ -963,25 +826,28 @@ def get_to_ag_transition_matrix(data: Data, yr_idx, lumap, lmmap, separate=False
         If `separate` is False, returns a single aggregated transition matrix.
 
     """
-    
-    non_ag_to_agr_t_matrices = {lu: np.zeros((data.NLMS, data.NCELLS, data.N_AG_LUS)).astype(np.float32) for lu in NON_AG_LAND_USES}
+    if ctx is None:
+        ctx = NonAgTransitionContext(data, yr_idx, lumap, lmmap)
 
-    agroforestry_x_r = tools.get_exclusions_agroforestry_base(data, lumap)
-    cp_belt_x_r = tools.get_exclusions_carbon_plantings_belt_base(data, lumap)
+    # Riparian plantings, agroforestry, carbon plantings and BECCS have the same base costs as environmental plantings
+    env_plantings_tcosts = get_env_plantings_to_ag(ctx, separate)
+    sheep_tcosts = get_sheep_to_ag_base(ctx, separate)
+    beef_tcosts = get_beef_to_ag_base(ctx, separate)
 
-    # reshape each non-agricultural matrix to be indexed (r, k) and concatenate on the k indexing
-    non_ag_to_agr_t_matrices['Environmental Plantings'] = get_env_plantings_to_ag(data, yr_idx, lumap, lmmap, separate)
-    non_ag_to_agr_t_matrices['Riparian Plantings'] = get_rip_plantings_to_ag(data, yr_idx, lumap, lmmap, separate)
-    non_ag_to_agr_t_matrices['Sheep Agroforestry'] = get_sheep_agroforestry_to_ag(data, yr_idx, lumap, lmmap, agroforestry_x_r, separate)
-    non_ag_to_agr_t_matrices['Beef Agroforestry'] = get_beef_agroforestry_to_ag(data, yr_idx, lumap, lmmap, agroforestry_x_r, separate)
-    non_ag_to_agr_t_matrices['Carbon Plantings (Block)'] = get_carbon_plantings_block_to_ag(data, yr_idx, lumap, lmmap, separate)
-    non_ag_to_agr_t_matrices['Sheep Carbon Plantings (Belt)'] = get_sheep_carbon_plantings_belt_to_ag(data, yr_idx, lumap, lmmap, cp_belt_x_r, separate)
-    non_ag_to_agr_t_matrices['Beef Carbon Plantings (Belt)'] = get_beef_carbon_plantings_belt_to_ag(data, yr_idx, lumap, lmmap, cp_belt_x_r, separate)
-    non_ag_to_agr_t_matrices['BECCS'] = get_beccs_to_ag(data, yr_idx, lumap, lmmap, separate)
-    non_ag_to_agr_t_matrices['Destocked - natural land'] = get_destocked_to_ag(data, yr_idx, lumap, separate)
+    # Note: The order of the keys in the dictionary must match the order of the non-agricultural land uses
+    non_ag_to_agr_t_matrices = {
+        'Environmental Plantings': env_plantings_tcosts,
+        'Riparian Plantings': env_plantings_tcosts,
+        'Sheep Agroforestry': get_sheep_agroforestry_to_ag(ctx.agroforestry_x_r, env_plantings_tcosts, sheep_tcosts, separate),
+        'Beef Agroforestry': get_beef_agroforestry_to_ag(ctx.agroforestry_x_r, env_plantings_tcosts, beef_tcosts, separate),
+        'Carbon Plantings (Block)': env_plantings_tcosts,
+        'Sheep Carbon Plantings (Belt)': get_sheep_carbon_plantings_belt_to_ag(ctx.cp_belt_x_r, env_plantings_tcosts, sheep_tcosts, separate),
+        'Beef Carbon Plantings (Belt)': get_beef_carbon_plantings_belt_to_ag(ctx.cp_belt_x_r, env_plantings_tcosts, beef_tcosts, separate),
+        'BECCS': env_plantings_tcosts,
+        'Destocked - natural land': get_destocked_to_ag(ctx, separate),
+    }
 
     if separate:
-        # Note: The order of the keys in the dictionary must match the order of the non-agricultural land uses
         return non_ag_to_agr_t_matrices
             
     non_ag_to_agr_t_matrices = list(non_ag_to_agr_t_matrices.values())
@@ -1002,17 +868,18 @@ def get_non_ag_transition_matrix(data: Data) -> np.ndarray:
     return np.zeros((data.NCELLS, data.N_NON_AG_LUS)).astype(np.float32)
 
 
-def get_exclusions_environmental_plantings(data: Data, lumap) -> np.ndarray:
+def get_exclusions_environmental_plantings(ctx: NonAgTransitionContext) -> np.ndarray:
     """
     Get the exclusion array for the environmental plantings land use.
 
     Parameters
-    - data: The data object containing information about land use transitions.
-    - lumap: The land use map.
+    - ctx: The shared intermediates of the land-use map.
 
     Returns
     - exclude: The exclusion array where 0 represents excluded land uses and 1 represents allowed land uses.
     """
+    data, lumap = ctx.data, ctx.lumap
+
     # Get (agricultural) land uses that cannot transition to environmental plantings
     excluded_ag_lus_cells = np.where(np.isnan(data.AG2EP_TRANSITION_COSTS_HA))[0]
 
@@ -1023,177 +890,156 @@ def get_exclusions_environmental_plantings(data: Data, lumap) -> np.ndarray:
     exclude[tools.get_non_ag_natural_lu_cells(data, lumap)] = 0
 
     # Ensure cells being used for environmental plantings may retain that LU
-    exclude[tools.get_env_plantings_cells(lumap)] = 1
+    exclude[ctx.non_ag_lu_cells['Environmental Plantings']] = 1
 
     return exclude
 
 
-def get_exclusions_riparian_plantings(data: Data, lumap) -> np.ndarray:
+def get_exclusions_riparian_plantings(ctx: NonAgTransitionContext) -> np.ndarray:
     """
     Get the exclusion array for the Riparian plantings land use.
     
     This function calculates and returns a 1-D array indexed by r that represents how much Riparian Plantings (RP) land use can be utilized.
     
     Parameters
-        data (DataFrame): The data containing information about the land use.
-        lumap (array-like): The land use map.
+        ctx (NonAgTransitionContext): The shared intermediates of the land-use map.
         
     Returns
         np.ndarray: The exclusion array for Riparian Plantings land use.
     """
+    data = ctx.data
     exclude = (data.RP_PROPORTION).astype(np.float32)
 
     # Exclude all cells used for natural land uses
     # TODO - this means natural LU cells cannot transition to agriculture/RP splits, even though
     # they may transition to agriculture without the RP portion.
-    exclude *= tools.get_exclusions_for_excluding_all_natural_cells(data, lumap)
+    exclude *= ctx.natural_x_r
 
     # Ensure cells being used for riparian plantings may retain that LU
-    rp_cells = tools.get_riparian_plantings_cells(lumap)
+    rp_cells = ctx.non_ag_lu_cells['Riparian Plantings']
     exclude[rp_cells] = data.RP_PROPORTION[rp_cells]
 
     return exclude
 
 
 def get_exclusions_sheep_agroforestry(
-    data: Data, ag_x_mrj: np.ndarray, lumap: np.ndarray
+    ctx: NonAgTransitionContext, ag_x_mrj: np.ndarray
 ) -> np.ndarray:
     """
     Calculate exclusions for sheep and agroforestry land use transitions.
 
     Args:
-        data (Data): The data object containing information about the model.
+        ctx (NonAgTransitionContext): The shared intermediates of the land-use map.
         ag_x_mrj (np.ndarray): The agroforestry land use matrix.
-        lumap (np.ndarray): The land use map.
 
     Returns
         np.ndarray: An array of exclusions indicating which cells cannot utilize both agroforestry and sheep.
 
     """
-    sheep_j = tools.get_sheep_code(data)
+    sheep_j = tools.get_sheep_code(ctx.data)
     sheep_x_r = ag_x_mrj[0, :, sheep_j]
-    agroforestry_x_r = tools.get_exclusions_agroforestry_base(data, lumap)
-
-    exclusions = np.zeros(data.NCELLS).astype(np.float32)
+    agroforestry_x_r = ctx.agroforestry_x_r
 
     # Block cells that can't utilise both agroforestry and sheep - natural land.
-    intersect = np.intersect1d(np.nonzero(sheep_x_r)[0], np.nonzero(agroforestry_x_r)[0])
-    exclusions[intersect] = 1
-    return exclusions
+    return ((sheep_x_r != 0) & (agroforestry_x_r != 0)).astype(np.float32)
 
 
 def get_exclusions_beef_agroforestry(
-    data: Data, ag_x_mrj: np.ndarray, lumap: np.ndarray
+    ctx: NonAgTransitionContext, ag_x_mrj: np.ndarray
 ) -> np.ndarray:
     """
     Calculate exclusions for cells that cannot utilize both agroforestry and beef.
 
     Args:
-        data (Data): The data object containing relevant information.
+        ctx (NonAgTransitionContext): The shared intermediates of the land-use map.
         ag_x_mrj (np.ndarray): The ag_x_mrj array.
-        lumap (np.ndarray): The lumap array.
 
     Returns
         np.ndarray: An array of exclusions, where 1 represents cells that cannot utilize both agroforestry and beef.
     """
-    beef_j = tools.get_beef_code(data)
+    beef_j = tools.get_beef_code(ctx.data)
     beef_x_r = ag_x_mrj[0, :, beef_j]
-    agroforestry_x_r = tools.get_exclusions_agroforestry_base(data, lumap)
-
-    exclusions = np.zeros(data.NCELLS).astype(np.float32)
+    agroforestry_x_r = ctx.agroforestry_x_r
 
     # Block cells that can't utilise both agroforestry and beef - natural land.
-    intersect = np.intersect1d(np.nonzero(beef_x_r)[0], np.nonzero(agroforestry_x_r)[0])
-    exclusions[intersect] = 1
-    return exclusions
+    return ((beef_x_r != 0) & (agroforestry_x_r != 0)).astype(np.float32)
 
 
-def get_exclusions_carbon_plantings_block(data, lumap) -> np.ndarray:
+def get_exclusions_carbon_plantings_block(ctx: NonAgTransitionContext) -> np.ndarray:
     """
     Return a 1-D array indexed by r that represents how much carbon plantings (block) can possibly 
     be done at each cell.
 
     Parameters
-    - data: The data object containing information about the cells.
-    - lumap: The land use map.
+    - ctx: The shared intermediates of the land-use map.
 
     Returns
     - exclude: A 1-D numpy array
     """
-    exclude = np.ones(data.NCELLS)
-    exclude *= tools.get_exclusions_for_excluding_all_natural_cells(data, lumap)
+    exclude = np.ones(ctx.data.NCELLS)
+    exclude *= ctx.natural_x_r
 
     # Ensure cells being used for carbon plantings (block) may retain that LU
-    exclude[tools.get_carbon_plantings_block_cells(lumap)] = 1
+    exclude[ctx.non_ag_lu_cells['Carbon Plantings (Block)']] = 1
 
     return exclude
 
 
 def get_exclusions_sheep_carbon_plantings_belt(
-    data: Data, ag_x_mrj: np.ndarray, lumap: np.ndarray
+    ctx: NonAgTransitionContext, ag_x_mrj: np.ndarray
 ) -> np.ndarray:
     """
     Calculate exclusions for sheep and carbon plantings belt.
 
     Args:
-        data (Data): The data object containing relevant information.
+        ctx (NonAgTransitionContext): The shared intermediates of the land-use map.
         ag_x_mrj (np.ndarray): The ag_x_mrj array.
-        lumap (np.ndarray): The lumap array.
 
     Returns
         np.ndarray: The exclusions array.
 
     """
-    sheep_j = tools.get_sheep_code(data)
+    sheep_j = tools.get_sheep_code(ctx.data)
     sheep_x_r = ag_x_mrj[0, :, sheep_j]
-    cp_x_r = tools.get_exclusions_carbon_plantings_belt_base(data, lumap)
-
-    exclusions = np.zeros(data.NCELLS).astype(np.float32)
+    cp_x_r = ctx.cp_belt_x_r
 
     # Block cells that can't utilise both agroforestry and sheep - natural land.
-    intersect = np.intersect1d(np.nonzero(sheep_x_r)[0], np.nonzero(cp_x_r)[0])
-    exclusions[intersect] = 1
-    return exclusions
+    return ((sheep_x_r != 0) & (cp_x_r != 0)).astype(np.float32)
 
 
 def get_exclusions_beef_carbon_plantings_belt(
-    data: Data, ag_x_mrj: np.ndarray, lumap: np.ndarray
+    ctx: NonAgTransitionContext, ag_x_mrj: np.ndarray
 ) -> np.ndarray:
     """
     Calculate exclusions for cells that cannot utilize both agroforestry and beef.
 
     Parameters
-        data (Data): The data object containing necessary information.
+        ctx (NonAgTransitionContext): The shared intermediates of the land-use map.
         ag_x_mrj (np.ndarray): The agroforestry matrix.
-        lumap (np.ndarray): The land use map.
 
     Returns
         np.ndarray: An array of exclusions, where 1 represents cells that cannot utilize both agroforestry and beef.
     """
-    beef_j = tools.get_beef_code(data)
+    beef_j = tools.get_beef_code(ctx.data)
     beef_x_r = ag_x_mrj[0, :, beef_j]
-    cp_x_r = tools.get_exclusions_carbon_plantings_belt_base(data, lumap)
-
-    exclusions = np.zeros(data.NCELLS).astype(np.float32)
+    cp_x_r = ctx.cp_belt_x_r
 
     # Block cells that can't utilise both agroforestry and beef - natural land.
-    intersect = np.intersect1d(np.nonzero(beef_x_r)[0], np.nonzero(cp_x_r)[0])
-    exclusions[intersect] = 1
-    return exclusions
+    return ((beef_x_r != 0) & (cp_x_r != 0)).astype(np.float32)
 
 
-def get_exclusions_beccs(data, lumap) -> np.ndarray:
+def get_exclusions_beccs(ctx: NonAgTransitionContext) -> np.ndarray:
     """
     Return a 1-D array indexed by r that represents how much BECCS can possibly 
     be done at each cell.
 
     Parameters
-    - data: The data object containing BECCS costs and other relevant information.
-    - lumap: The land use map object.
+    - ctx: The shared intermediates of the land-use map.
 
     Returns
     - exclude: A 1-D array
     """
+    data = ctx.data
     exclude = np.zeros(data.NCELLS).astype(np.float32)
 
     # All cells with NaN BECCS data should be excluded from eligibility
@@ -1201,39 +1047,32 @@ def get_exclusions_beccs(data, lumap) -> np.ndarray:
     exclude[beccs_cells] = 1
 
     # Exclude all cells used for natural land uses
-    exclude *= tools.get_exclusions_for_excluding_all_natural_cells(data, lumap)
+    exclude *= ctx.natural_x_r
 
     # Ensure cells being used for BECCS may retain that LU
-    exclude[tools.get_beccs_cells(lumap)] = 1
+    exclude[ctx.non_ag_lu_cells['BECCS']] = 1
 
     return exclude
 
 
-def get_exclusions_destocked(data: Data, lumap: np.ndarray):
+def get_exclusions_destocked(ctx: NonAgTransitionContext):
     """
     Return a 1-D array indexed by r that represents how much of a cell may be used for destocked land.
 
     Parameters:
-    - data: The data object containing BECCS costs and other relevant information.
-    - lumap: The land use map object.
+    - ctx: The shared intermediates of the land-use map.
 
     Returns:
     - exclude: A 1-D array
     """
-    destocked_x_r = np.zeros(data.NCELLS).astype(np.int8)
-    
-    sheep_j = tools.get_natural_sheep_code(data)
-    sheep_cells = tools.get_cells_using_ag_landuse(lumap, sheep_j)
-    destocked_x_r[sheep_cells] = 1
+    data = ctx.data
 
-    beef_j = tools.get_natural_beef_code(data)
-    beef_cells = tools.get_cells_using_ag_landuse(lumap, beef_j)
-    destocked_x_r[beef_cells] = 1
+    # Only cells currently used for natural land livestock may be destocked
+    lvstk_natural_j = [tools.get_natural_sheep_code(data), tools.get_natural_beef_code(data)]
+    return np.isin(ctx.lumap, lvstk_natural_j).astype(np.int8)
 
-    return destocked_x_r
 
-
-def get_exclude_matrices(data: Data, ag_x_mrj, lumap) -> np.ndarray:
+def get_exclude_matrices(data: Data, ag_x_mrj, lumap, ctx: NonAgTransitionContext = None) -> np.ndarray:
     """
     Get the non-agricultural exclusions matrix.
 
@@ -1243,6 +1082,8 @@ def get_exclude_matrices(data: Data, ag_x_mrj, lumap) -> np.ndarray:
         The data object containing information about the model.
     lumap : object
         The lumap object containing land usage mapping information.
+    ctx : NonAgTransitionContext, optional
+        The shared intermediates of `lumap`; created here if not given.
 
     Returns
     -------
@@ -1255,27 +1096,30 @@ def get_exclude_matrices(data: Data, ag_x_mrj, lumap) -> np.ndarray:
     related to different non-agricultural land uses. The resulting matrix is a concatenation of these matrices
     along the k indexing.
     """
+    if ctx is None:
+        ctx = NonAgTransitionContext(data, None, lumap, None)
+
     non_ag_x_matrices = {lu: np.zeros(data.NCELLS).astype(np.float32) for lu in NON_AG_LAND_USES}
 
     # Environmental plantings exclusions. Note: the order must be consistent with the NON_AG_LAND_USES order.
     if NON_AG_LAND_USES['Environmental Plantings']:
-        non_ag_x_matrices['Environmental Plantings'] = get_exclusions_environmental_plantings(data, lumap)
+        non_ag_x_matrices['Environmental Plantings'] = get_exclusions_environmental_plantings(ctx)
     if NON_AG_LAND_USES['Riparian Plantings']:
-        non_ag_x_matrices['Riparian Plantings'] = get_exclusions_riparian_plantings(data, lumap)
+        non_ag_x_matrices['Riparian Plantings'] = get_exclusions_riparian_plantings(ctx)
     if NON_AG_LAND_USES['Sheep Agroforestry']:
-        non_ag_x_matrices['Sheep Agroforestry'] = get_exclusions_sheep_agroforestry(data, ag_x_mrj, lumap)
+        non_ag_x_matrices['Sheep Agroforestry'] = get_exclusions_sheep_agroforestry(ctx, ag_x_mrj)
     if NON_AG_LAND_USES['Beef Agroforestry']:
-        non_ag_x_matrices['Beef Agroforestry'] = get_exclusions_beef_agroforestry(data, ag_x_mrj, lumap)
+        non_ag_x_matrices['Beef Agroforestry'] = get_exclusions_beef_agroforestry(ctx, ag_x_mrj)
     if NON_AG_LAND_USES['Carbon Plantings (Block)']:
-        non_ag_x_matrices['Carbon Plantings (Block)'] = get_exclusions_carbon_plantings_block(data, lumap)
+        non_ag_x_matrices['Carbon Plantings (Block)'] = get_exclusions_carbon_plantings_block(ctx)
     if NON_AG_LAND_USES['Sheep Carbon Plantings (Belt)']:
-        non_ag_x_matrices['Sheep Carbon Plantings (Belt)'] = get_exclusions_sheep_carbon_plantings_belt(data, ag_x_mrj, lumap)
+        non_ag_x_matrices['Sheep Carbon Plantings (Belt)'] = get_exclusions_sheep_carbon_plantings_belt(ctx, ag_x_mrj)
     if NON_AG_LAND_USES['Beef Carbon Plantings (Belt)']:
-        non_ag_x_matrices['Beef Carbon Plantings (Belt)'] = get_exclusions_beef_carbon_plantings_belt(data, ag_x_mrj, lumap)
+        non_ag_x_matrices['Beef Carbon Plantings (Belt)'] = get_exclusions_beef_carbon_plantings_belt(ctx, ag_x_mrj)
     if NON_AG_LAND_USES['BECCS']:
-        non_ag_x_matrices['BECCS'] = get_exclusions_beccs(data, lumap)
+        non_ag_x_matrices['BECCS'] = get_exclusions_beccs(ctx)
     if NON_AG_LAND_USES['Destocked - natural land']:
-        non_ag_x_matrices['Destocked - natural land'] = get_exclusions_destocked(data, lumap)
+        non_ag_x_matrices['Destocked - natural land'] = get_exclusions_destocked(ctx)
 
     if settings.EXCLUDE_NO_GO_LU:
         no_go_regions = data.NO_GO_REGION_NON_AG
@@ -52,6 +52,51 @@ DATA_DIR = 'input'
 RAW_DATA = '../raw_data'
 
 
+# ---------------------------------------------------------------------------- #
+# Data loading and caching.                                                    #
+# ---------------------------------------------------------------------------- #
+
+DATA_CACHE = True                               # Cache the initialised Data object to disk and reuse it in later runs: True or False
+DATA_CACHE_DIR = f'{INPUT_DIR}/data_cache'      # Directory to store the cached Data objects
+'''
+The cache key is a hash of all settings that can affect the Data object, the size and modification time
+of every input file, and the source of `luto/data.py`. Changing any of these creates a new cache entry;
+old entries are not removed automatically and can be deleted from DATA_CACHE_DIR at any time.
+
+Parsed Excel parameter workbooks are also cached under DATA_CACHE_DIR/excel, keyed by a hash of each workbook's
+content. This cache is used regardless of DATA_CACHE.
+
+The projected water yield layers (one column per year) are also copied once to DATA_CACHE_DIR/year_layers as
+memory-mapped (year, cell) arrays, so only the simulated years are read into memory. This copy is used regardless of DATA_CACHE.
+'''
+
+PARALLEL_READ = True            # If to read the cell-level input layers concurrently when building the Data object: True or False
+READ_THREADS = 8                # The number of processes used to read input layers, only work with PARALLEL_READ = True
+'''
+Like WRITE_THREADS, READ_THREADS counts worker processes, not threads: PyTables is not thread-safe, so the HDF5
+layers are decompressed in separate processes. Each worker writes its masked layer to a temporary npy store under
+DATA_CACHE_DIR and returns the path, so layers are not pickled back to the main process, and each layer is only
+loaded into memory when it is used. Not used with INPUT_STORE = 'npy', where the layers are memory-mapped instead.
+'''
+
+INPUT_STORE = 'hdf'                       # Where to read the cell-level input layers from: 'hdf' (compressed HDF5 tables) or 'npy' (memory-mapped columns)
+NPY_STORE_DIR = f'{INPUT_DIR}/npy_store'  # Directory of the npy store, only work with INPUT_STORE = 'npy'
+'''
+The npy store is an uncompressed copy of the cell-level HDF5 layers that is sliced by cell index instead of
+queried through PyTables. Create it with `luto.tools.npy_store.convert_hdf_to_npy_store()` (`dataprep.create_new_dataset`
+does this automatically when INPUT_STORE = 'npy'). A layer whose HDF5 file has changed since it was converted is
+converted again when it is read.
+'''
+
+AG_QUANTITY_CACHE_YEARS = 3     # The number of years of agricultural quantities (and the costs and revenues derived from them) kept in memory for reuse
+'''
+Agricultural quantities, costs and revenues are reused by the solver input, production and output-writing calculations of the same year.
+A timeseries step uses up to 3 years (the base year 2010, the base year of the step and its target year), so keep
+at least 3 to avoid recalculating them. The least recently used year is dropped when more years are needed. Use `ag_quantity.clear_quantity_cache(data)`
+after modifying any input of the quantity calculations on a loaded Data object.
+'''
+
+
 # ---------------------------------------------------------------------------- #
 # Scenario parameters.                                                                  #
 # ---------------------------------------------------------------------------- #
@@ -40,6 +40,12 @@ from luto.solvers.input_data import get_input_data
 from luto.solvers.solver import LutoSolver
 from luto.tools.create_task_runs.helpers import log_memory_usage
 from luto.tools.write import write_outputs
+from luto.tools.data_cache import (
+    OBJECTS_FNAME,
+    get_data_cache_dir,
+    save_data_cache,
+    load_data_cache
+)
 
 import luto.settings as settings
 
@@ -67,7 +73,19 @@ def load_data() -> Data:
         except:
             print(f"Error removing file {f}")
 
-    return Data()
+    if not settings.DATA_CACHE:
+        return Data()
+
+    # Reuse the Data object from a previous run with the same settings and input files
+    cache_dir = get_data_cache_dir()
+    if os.path.exists(os.path.join(cache_dir, OBJECTS_FNAME)):
+        print(f'\nLoading cached data from {cache_dir}...', flush=True)
+        return load_data_cache(cache_dir)
+
+    data = Data()
+    print(f'Saving data to cache {cache_dir}...', flush=True)
+    save_data_cache(data, cache_dir)
+    return data
 
 
 @LogToFile(f"{settings.OUTPUT_DIR}/run_{read_timestamp()}", 'a')
@@ -20,13 +20,14 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 import numpy as np
 
 from luto import settings
 from luto.economics import land_use_culling
 from luto.settings import AG_MANAGEMENTS, AG_MANAGEMENTS_TO_LAND_USES
 from luto.data import Data
+from luto.tools.region_index import RegionIndex
 
 import luto.economics.agricultural.cost as ag_cost
 import luto.economics.agricultural.ghg as ag_ghg
@@ -68,14 +69,15 @@ class SolverInputData:
     non_ag_lb_rk: np.ndarray                                            # Non-agricultural lower bound matrices.
 
     ag_man_g_mrj: dict                                                  # Agricultural management options' GHG emission effects.
-    ag_man_q_mrp: dict                                                  # Agricultural management options' quantity effects.
+    ag_man_q_mrp: dict                                                  # Agricultural management options' quantity effects, indexed [m, r, p_idx] over the products in `am2p`.
     ag_man_w_mrj: dict                                                  # Agricultural management options' water yield effects.
     ag_man_b_mrj: dict                                                  # Agricultural management options' biodiversity effects.
     ag_man_limits: dict                                                 # Agricultural management options' adoption limits.
-    ag_man_lb_mrj: dict                                                 # Agricultural management options' lower bounds.
+    ag_man_lb_mrj: dict                                                 # Agricultural management options' lower bounds, indexed [m, r, j_idx] over the land uses in `am2j`.
 
     water_yield_RR_BASE_YR: dict                                        # Water yield for the BASE_YR based on historical water yield layers .
     water_yield_outside_study_area: dict[int, float]                    # Water yield from outside LUTO study area -> dict. Key: region.
+    water_region_index: RegionIndex                                     # Cells of each water net yield region (River Regions or Drainage Divisions).
       
     biodiv_contr_ag_j: np.ndarray                                       # Biodiversity contribution scale from agricultural land uses.
     biodiv_contr_non_ag_k: dict[int, float]                             # Biodiversity contribution scale from non-agricultural land uses.
@@ -140,6 +142,14 @@ class SolverInputData:
             if AG_MANAGEMENTS[am]
         }
 
+    @cached_property
+    def am2p(self):
+        # Map of agricultural management options to the product codes of their land uses
+        return {
+            am: ag_quantity.get_ag_man_products(self.lu2pr_pj, am_j_list)
+            for am, am_j_list in self.am2j.items()
+        }
+
     @cached_property
     def j2am(self):
         _j2am = defaultdict(list)
@@ -189,6 +199,46 @@ class SolverInputData:
 
         return dict(cells2non_ag_lu) 
     
+def get_base_yr_constant(data: Data, name: str, calc_func: Callable[[], Any]) -> Any:
+    """
+    Return the solver input `name`, calculating it with `calc_func()` only on the first call for `data`.
+
+    Only for inputs that do not depend on the base or target year of the solve; they are kept in
+    `data.SOLVER_BASE_YR_CONSTANTS`. Cached arrays are read-only because they are shared by all solves.
+    """
+    cache = data.SOLVER_BASE_YR_CONSTANTS
+    if name not in cache:
+        val = calc_func()
+        if isinstance(val, np.ndarray):
+            val.flags.writeable = False
+        cache[name] = val
+    return cache[name]
+
+
+def get_lumap_component(data: Data, name: str, lumap: np.ndarray, calc_func: Callable[[Optional[np.ndarray]], np.ndarray]) -> np.ndarray:
+    """
+    Return the solver input `name` of the base year land-use map `lumap`, where `calc_func(cells)` calculates its
+    values for the given cells (all cells if None) along axis 1, and each cell only depends on its own land use.
+
+    The value of the previous solve is kept in `data.SOLVER_LUMAP_COMPONENTS`, so only the cells whose land use
+    changed since are recalculated. The returned array is read-only because it is shared with the next solve.
+    """
+    cache = data.SOLVER_LUMAP_COMPONENTS
+    if name not in cache:
+        val = calc_func(None)
+    else:
+        prev_lumap, val = cache[name]
+        cells = np.flatnonzero(prev_lumap != lumap)
+        if cells.size == 0:
+            return val
+        val = val.copy()
+        val[:, cells] = calc_func(cells)
+
+    val.flags.writeable = False
+    cache[name] = (lumap.copy(), val)
+    return val
+
+
 def get_ag_c_mrj(data: Data, target_index):
     print('Getting agricultural cost matrices...', flush = True)
     output = ag_cost.get_cost_matrices(data, target_index)
@@ -233,27 +283,29 @@ def get_ag_w_mrj(data: Data, target_index, water_dr_yield: Optional[np.ndarray]
 
 def get_w_outside_luto(data: Data, yr_cal: int):
     print('Getting water yield from outside LUTO study area...', flush = True)
-    return ag_water.get_water_outside_luto_study_area_from_hist_level(data)
+    return get_base_yr_constant(data, 'water_yield_outside_study_area', lambda: ag_water.get_water_outside_luto_study_area_from_hist_level(data))
 
 def get_w_BASE_YR(data: Data):
     print('Getting water yield for the BASE_YR based on historical water yield layers...', flush = True)
-    return ag_water.calc_water_net_yield_BASE_YR(data)
+    return get_base_yr_constant(data, 'water_yield_RR_BASE_YR', lambda: ag_water.calc_water_net_yield_BASE_YR(data))
+
+def get_w_region_index(data: Data) -> RegionIndex:
+    return ag_water.get_water_region_index(data)
 
 
 def get_ag_b_mrj(data: Data):
     print('Getting agricultural biodiversity requirement matrices...', flush = True)
-    output = ag_biodiversity.get_bio_overall_priority_score_matrices_mrj(data)
-    return output.astype(np.float32)
+    return get_base_yr_constant(data, 'ag_b_mrj', lambda: ag_biodiversity.get_bio_overall_priority_score_matrices_mrj(data).astype(np.float32))
 
 
 def get_ag_biodiv_contr_j(data: Data) -> dict[int, float]:
     print('Getting biodiversity degredation data for agricultural land uses...', flush = True)
-    return ag_biodiversity.get_ag_biodiversity_contribution(data)
+    return get_base_yr_constant(data, 'biodiv_contr_ag_j', lambda: ag_biodiversity.get_ag_biodiversity_contribution(data))
 
 
 def get_non_ag_biodiv_impact_k(data: Data) -> dict[int, float]:
     print('Getting biodiversity benefits data for non-agricultural land uses...', flush = True)
-    return non_ag_biodiversity.get_non_ag_lu_biodiv_contribution(data)
+    return get_base_yr_constant(data, 'biodiv_contr_non_ag_k', lambda: non_ag_biodiversity.get_non_ag_lu_biodiv_contribution(data))
 
 
 def get_ag_man_biodiv_impacts(data: Data, target_year: int) -> dict[str, dict[str, float]]:
@@ -264,27 +316,27 @@ def get_GBF2_priority_degrade_area_r(data: Data) -> np.ndarray:
     if settings.BIODIVERSTIY_TARGET_GBF_2 != "on":
         return np.empty(0)
     print('Getting priority degrade area matrices...', flush = True)
-    output = ag_biodiversity.get_GBF2_bio_priority_degraded_areas_r(data)
+    output = get_base_yr_constant(data, 'GBF2_raw_priority_degraded_area_r', lambda: ag_biodiversity.get_GBF2_bio_priority_degraded_areas_r(data))
     return output
 
 def get_GBF3_MVG_area_vr(data: Data):
     if settings.BIODIVERSTIY_TARGET_GBF_3 != "on":
         return np.empty(0)
     print('Getting agricultural major vegetation groups matrices...', flush = True)
-    output = ag_biodiversity.get_GBF3_major_vegetation_matrices_vr(data)
+    output = get_base_yr_constant(data, 'GBF3_raw_MVG_area_vr', lambda: ag_biodiversity.get_GBF3_major_vegetation_matrices_vr(data))
     return output
 
 
 def get_GBF4_snes_xr(data: Data) -> np.ndarray:
     if settings.BIODIVERSTIY_TARGET_GBF_4_SNES != "on":
         return np.empty(0)
-    return ag_biodiversity.get_GBF4_SNES_matrix_sr(data)
+    return get_base_yr_constant(data, 'GBF4_snes_xr', lambda: ag_biodiversity.get_GBF4_SNES_matrix_sr(data))
 
 
 def get_GBF4_ecnes_xr(data: Data) -> np.ndarray:
     if settings.BIODIVERSTIY_TARGET_GBF_4_ECNES != "on":
         return np.empty(0)
-    return ag_biodiversity.get_GBF4_ECNES_matrix_sr(data)
+    return get_base_yr_constant(data, 'GBF4_ecnes_xr', lambda: ag_biodiversity.get_GBF4_ECNES_matrix_sr(data))
 
 def get_GBF8_species_area_sr(data: Data, target_year: int) -> np.ndarray:
     if settings.BIODIVERSTIY_TARGET_GBF_8 != "on":
@@ -327,8 +379,10 @@ def get_non_ag_q_crk(data: Data, ag_q_mrp: np.ndarray, base_year: int):
 
 def get_ag_ghg_t_mrj(data: Data, base_year):
     print('Getting agricultural transitions GHG emissions...', flush = True)
-    output = ag_ghg.get_ghg_transition_penalties(data, data.lumaps[base_year])
-    return output.astype(np.float32)
+    lumap = data.lumaps[base_year]
+    return get_lumap_component(
+        data, 'ag_ghg_t_mrj', lumap, lambda cells: ag_ghg.get_ghg_transition_penalties(data, lumap, cells=cells).astype(np.float32)
+    )
 
 
 def get_ag_t_mrj(data: Data, target_index, base_year):
@@ -337,26 +391,27 @@ def get_ag_t_mrj(data: Data, target_index, base_year):
     ag_t_mrj = ag_transition.get_transition_matrices_from_base_year(
         data, 
         target_index, 
-        base_year
+        base_year,
+        x_mrj=get_lumap_ag_x_mrj(data, base_year)
     ).astype(np.float32)
     # Transition costs occures if the base year is not the target year
     return ag_t_mrj if (base_year - data.YR_CAL_BASE != target_index) else np.zeros_like(ag_t_mrj).astype(np.float32)
 
 
-def get_ag_to_non_ag_t_rk(data: Data, target_index, base_year, ag_t_mrj):
+def get_ag_to_non_ag_t_rk(data: Data, target_index, base_year, ag_t_mrj, non_ag_t_ctx: non_ag_transition.NonAgTransitionContext = None):
     print('Getting agricultural to non-agricultural transition cost matrices...', flush = True)
     non_ag_t_mrj = non_ag_transition.get_from_ag_transition_matrix( 
         data, 
         target_index, 
-        base_year, 
         data.lumaps[base_year], 
         data.lmmaps[base_year],
-        ag_t_mrj).astype(np.float32)
+        ag_t_mrj,
+        ctx=non_ag_t_ctx).astype(np.float32)
     # Transition costs occures if the base year is not the target year
     return non_ag_t_mrj if (base_year - data.YR_CAL_BASE != target_index) else np.zeros_like(non_ag_t_mrj).astype(np.float32)
 
 
-def get_non_ag_to_ag_t_mrj(data: Data, base_year:int, target_index: int):
+def get_non_ag_to_ag_t_mrj(data: Data, base_year:int, target_index: int, non_ag_t_ctx: non_ag_transition.NonAgTransitionContext = None):
     print('Getting non-agricultural to agricultural transition cost matrices...', flush = True)
     
     non_ag_to_ag_mrj = non_ag_transition.get_to_ag_transition_matrix(
@@ -364,6 +419,7 @@ def get_non_ag_to_ag_t_mrj(data: Data, base_year:int, target_index: int):
         target_index, 
         data.lumaps[base_year], 
         data.lmmaps[base_year],
+        ctx=non_ag_t_ctx,
     ).astype(np.float32)
     # Transition costs occures if the base year is not the target year
     return non_ag_to_ag_mrj if (base_year - data.YR_CAL_BASE != target_index) else np.zeros_like(non_ag_to_ag_mrj).astype(np.float32)
@@ -371,19 +427,23 @@ def get_non_ag_to_ag_t_mrj(data: Data, base_year:int, target_index: int):
 
 def get_non_ag_t_rk(data: Data, base_year):
     print('Getting non-agricultural transition cost matrices...', flush = True)
-    output = non_ag_transition.get_non_ag_transition_matrix(data)
-    return output.astype(np.float32)
+    return get_base_yr_constant(data, 'non_ag_t_rk', lambda: non_ag_transition.get_non_ag_transition_matrix(data).astype(np.float32))
+
+
+def get_lumap_ag_x_mrj(data: Data, base_year) -> np.ndarray:
+    lumap = data.lumaps[base_year]
+    return get_lumap_component(data, 'ag_x_mrj', lumap, lambda cells: ag_transition.get_exclude_matrices(data, lumap, cells))
 
 
 def get_ag_x_mrj(data: Data, base_year):
     print('Getting agricultural exclude matrices...', flush = True)
-    output = ag_transition.get_exclude_matrices(data, data.lumaps[base_year])
-    return output
+    # Copy because the exclude matrices are culled in place for each solve
+    return get_lumap_ag_x_mrj(data, base_year).copy()
 
 
-def get_non_ag_x_rk(data: Data, ag_x_mrj, base_year):
+def get_non_ag_x_rk(data: Data, ag_x_mrj, base_year, non_ag_t_ctx: non_ag_transition.NonAgTransitionContext = None):
     print('Getting non-agricultural exclude matrices...', flush = True)
-    output = non_ag_transition.get_exclude_matrices(data, ag_x_mrj, data.lumaps[base_year])
+    output = non_ag_transition.get_exclude_matrices(data, ag_x_mrj, data.lumaps[base_year], non_ag_t_ctx)
     return output
 
 
@@ -520,8 +580,9 @@ def get_commodity_prices(data: Data) -> np.ndarray:
         commodity_prices[commodity] = prices
 
     # Get the median price of each crop; here need to use 'irr' because dry-Rice does exist in the data
-    for name, col in data.AGEC_CROPS['P1','irr'].items():
-        commodity_prices[name.lower()] = np.nanpercentile(col, 50)
+    for field, lm, name in data.AGEC_CROPS.columns:
+        if field == 'P1' and lm == 'irr':
+            commodity_prices[name.lower()] = np.nanpercentile(data.AGEC_CROPS[field, lm, name], 50)
 
     return np.array([commodity_prices[k] for k in data.COMMODITIES])
     
@@ -564,13 +625,13 @@ def get_BASE_YR_production_t(data: Data):
 
 
 def get_savanna_eligible_r(data: Data) -> np.ndarray:
-    return np.where(data.SAVBURN_ELIGIBLE == 1)[0]
+    return get_base_yr_constant(data, 'savanna_eligible_r', lambda: np.where(data.SAVBURN_ELIGIBLE == 1)[0])
 
 def get_hir_eligible_r(data: Data) -> np.ndarray:
-    return np.where(data.HIR_MASK == 1)[0]
+    return get_base_yr_constant(data, 'hir_eligible_r', lambda: np.where(data.HIR_MASK == 1)[0])
 
 def get_priority_degraded_mask_idx(data: Data) -> np.ndarray:
-    return np.where(data.BIO_PRIORITY_DEGRADED_AREAS_MASK)[0]
+    return get_base_yr_constant(data, 'priority_degraded_mask_idx', lambda: np.where(data.BIO_PRIORITY_DEGRADED_AREAS_MASK)[0])
 
 
 def get_limits(
@@ -619,19 +680,29 @@ def get_limits(
 def get_input_data(data: Data, base_year: int, target_year: int) -> SolverInputData:
     """
     Using the given Data object, prepare a SolverInputData object for the solver.
+
+    The inputs are rebuilt according to what they depend on:
+    - the target year (e.g., costs, revenues, emissions, production): calculated for every solve;
+    - only the base year land-use map (exclusions, transition emissions): calculated once, then only the cells
+      whose land use changed since the previous solve are updated (see `get_lumap_component`);
+    - neither (e.g., biodiversity scores, GBF matrices, savanna and HIR eligibility): calculated once per
+      Data object (see `get_base_yr_constant`).
     """
 
     target_index = target_year - data.YR_CAL_BASE
     
+    # Intermediates shared by the non-agricultural transition and exclusion matrices
+    non_ag_t_ctx = non_ag_transition.NonAgTransitionContext(data, target_index, data.lumaps[base_year], data.lmmaps[base_year])
+    
     ag_c_mrj = get_ag_c_mrj(data, target_index)
     ag_r_mrj = get_ag_r_mrj(data, target_index)
     ag_t_mrj = get_ag_t_mrj(data, target_index, base_year)
-    ag_to_non_ag_t_rk = get_ag_to_non_ag_t_rk(data, target_index, base_year, ag_t_mrj)
+    ag_to_non_ag_t_rk = get_ag_to_non_ag_t_rk(data, target_index, base_year, ag_t_mrj, non_ag_t_ctx)
     
     non_ag_c_rk = get_non_ag_c_rk(data, ag_c_mrj, data.lumaps[base_year], target_year)
     non_ag_r_rk = get_non_ag_r_rk(data, ag_r_mrj, base_year, target_year)
     non_ag_t_rk = get_non_ag_t_rk(data, base_year)
-    non_ag_to_ag_t_mrj = get_non_ag_to_ag_t_mrj(data, base_year, target_index)
+    non_ag_to_ag_t_mrj = get_non_ag_to_ag_t_mrj(data, base_year, target_index, non_ag_t_ctx)
     
     ag_man_c_mrj = get_ag_man_c_mrj(data, target_index, ag_c_mrj)
     ag_man_r_mrj = get_ag_man_r_mrj(data, target_index, ag_r_mrj)
@@ -675,7 +746,7 @@ def get_input_data(data: Data, base_year: int, target_year: int) -> SolverInputD
         non_ag_g_rk=get_non_ag_g_rk(data, ag_g_mrj, base_year),
         non_ag_w_rk=get_non_ag_w_rk(data, ag_w_mrj, base_year, target_year, data.WATER_YIELD_HIST_DR, data.WATER_YIELD_HIST_SR),  # Calculate non-ag water yield matrices based on historical water yield layers
         non_ag_b_rk=get_non_ag_b_rk(data, ag_b_mrj, base_year),
-        non_ag_x_rk=get_non_ag_x_rk(data, ag_x_mrj, base_year),
+        non_ag_x_rk=get_non_ag_x_rk(data, ag_x_mrj, base_year, non_ag_t_ctx),
         non_ag_q_crk=get_non_ag_q_crk(data, ag_q_mrp, base_year),
         non_ag_lb_rk=get_non_ag_lb_rk(data, base_year),
         
@@ -688,6 +759,7 @@ def get_input_data(data: Data, base_year: int, target_year: int) -> SolverInputD
         
         water_yield_outside_study_area=get_w_outside_luto(data, data.YR_CAL_BASE),      # Use the water net yield outside LUTO study area for the YR_CAL_BASE year
         water_yield_RR_BASE_YR=get_w_BASE_YR(data),                                     # Calculate water net yield for the BASE_YR (2010) based on historical water yield layers
+        water_region_index=get_w_region_index(data),
         
         biodiv_contr_ag_j=get_ag_biodiv_contr_j(data),
         biodiv_contr_non_ag_k=get_non_ag_biodiv_impact_k(data),
@@ -704,13 +776,13 @@ def get_input_data(data: Data, base_year: int, target_year: int) -> SolverInputD
         priority_degraded_mask_idx=get_priority_degraded_mask_idx(data),
 
         economic_contr_mrj=(ag_obj_mrj, non_ag_obj_rk,  ag_man_objs),
-        economic_BASE_YR_prices=get_commodity_prices(data),
+        economic_BASE_YR_prices=get_base_yr_constant(data, 'economic_BASE_YR_prices', lambda: get_commodity_prices(data)),
         economic_target_yr_carbon_price=get_target_yr_carbon_price(data, target_year), 
         
         base_yr_prod = {
-            "BASE_YR Economy(AUD)": get_BASE_YR_economic_value(data),
-            "BASE_YR Biodiversity (score)": get_BASE_YR_biodiv_value(data),
-            "BASE_YR Production (t)": get_BASE_YR_production_t(data),
+            "BASE_YR Economy(AUD)": get_base_yr_constant(data, f'BASE_YR Economy(AUD) {settings.OBJECTIVE}', lambda: get_BASE_YR_economic_value(data)),
+            "BASE_YR Biodiversity (score)": get_base_yr_constant(data, 'BASE_YR Biodiversity (score)', lambda: get_BASE_YR_biodiv_value(data)),
+            "BASE_YR Production (t)": get_base_yr_constant(data, 'BASE_YR Production (t)', lambda: get_BASE_YR_production_t(data)),
         },
         
         offland_ghg=data.OFF_LAND_GHG_EMISSION_C[target_index],
@@ -249,7 +249,7 @@ class LutoSolver:
                     dry_x_lb = (
                         0
                         if AG_MANAGEMENTS_REVERSIBLE[am]
-                        else self._input_data.ag_man_lb_mrj[am][0, r, j]
+                        else self._input_data.ag_man_lb_mrj[am][0, r, j_idx]
                     )
                     dry_var_name = f"X_ag_man_dry_{am_name}_{j}_{r}"
 
@@ -263,7 +263,7 @@ class LutoSolver:
                     irr_x_lb = (
                         0
                         if AG_MANAGEMENTS_REVERSIBLE[am]
-                        else self._input_data.ag_man_lb_mrj[am][1, r, j]
+                        else self._input_data.ag_man_lb_mrj[am][1, r, j_idx]
                     )
                     irr_var_name = f"X_ag_man_irr_{am_name}_{j}_{r}"
 
@@ -581,31 +581,33 @@ class LutoSolver:
                         X_ag_man_dry_pr[p, :] = self.X_ag_man_dry_vars_jr[am][j_idx, :]
                         X_ag_man_irr_pr[p, :] = self.X_ag_man_irr_vars_jr[am][j_idx, :]
 
-            ag_man_q_dry_p = [
-                gp.quicksum(
-                    self._input_data.ag_man_q_mrp[am][0, :, p] * X_ag_man_dry_pr[p, :]
+            # The quantity effects of `am` only cover the products of its land uses
+            am_p_list = self._input_data.am2p[am]
+            ag_man_q_dry_p = {
+                p: gp.quicksum(
+                    self._input_data.ag_man_q_mrp[am][0, :, p_idx] * X_ag_man_dry_pr[p, :]
                 )
-                for p in range(self._input_data.nprs)
-            ]
-            ag_man_q_irr_p = [
-                gp.quicksum(
-                    self._input_data.ag_man_q_mrp[am][1, :, p] * X_ag_man_irr_pr[p, :]
+                for p_idx, p in enumerate(am_p_list)
+            }
+            ag_man_q_irr_p = {
+                p: gp.quicksum(
+                    self._input_data.ag_man_q_mrp[am][1, :, p_idx] * X_ag_man_irr_pr[p, :]
                 )
-                for p in range(self._input_data.nprs)
-            ]
+                for p_idx, p in enumerate(am_p_list)
+            }
 
             for c in range(self.ncms):
                 self.ag_man_q_dry_c[c] += (
                     gp.quicksum(
                         ag_man_q_dry_p[p]
-                        for p in range(self._input_data.nprs)
+                        for p in am_p_list
                         if self._input_data.pr2cm_cp[c, p]
                     )   
                 )
                 self.ag_man_q_irr_c[c] += (
                     gp.quicksum(
                         ag_man_q_irr_p[p]
-                        for p in range(self._input_data.nprs)
+                        for p in am_p_list
                         if self._input_data.pr2cm_cp[c, p]
                     )
                 )
@@ -653,49 +655,50 @@ class LutoSolver:
                 'DEMAND_CONSTRAINT_TYPE not specified in settings, needs to be "hard" or "soft"'
             )
 
-    def _get_water_net_yield_expr_for_region(
-        self,
-        ind: np.ndarray,
-        region: int,
-    ) -> gp.LinExpr:
+    def _get_water_net_yield_exprs(self) -> dict[int, gp.LinExpr]:
         """
-        Get the Gurobi linear expression for the net water yield of a given region.
+        Get the Gurobi linear expressions for the net water yield of every region in the water limits.
+
+        The (coefficient, variable) terms of every land use are gathered over the cells where the land use
+        has variables, then grouped by region in one pass with `water_region_index`.
         """
-        ag_contr = gp.quicksum(
-            gp.quicksum(
-                self._input_data.ag_w_mrj[0, ind, j] * self.X_ag_dry_vars_jr[j, ind]
-            )  # Dryland agriculture contribution
-            + gp.quicksum(
-                self._input_data.ag_w_mrj[1, ind, j] * self.X_ag_irr_vars_jr[j, ind]
-            )  # Irrigated agriculture contribution
-            for j in range(self._input_data.n_ag_lus)
-        )
+        coef_list, var_list, cell_list = [], [], []
 
-        ag_man_contr = gp.quicksum(
-            gp.quicksum(
-                self._input_data.ag_man_w_mrj[am][0, ind, j_idx]
-                * self.X_ag_man_dry_vars_jr[am][j_idx, ind]
-            )  # Dryland alt. ag. management contributions
-            + gp.quicksum(
-                self._input_data.ag_man_w_mrj[am][1, ind, j_idx]
-                * self.X_ag_man_irr_vars_jr[am][j_idx, ind]
-            )  # Irrigated alt. ag. management contributions
-            for am, am_j_list in self._input_data.am2j.items()
-            for j_idx in range(len(am_j_list))
-        )
+        for j in range(self._input_data.n_ag_lus):
+            for m, X_ag_vars_jr in enumerate((self.X_ag_dry_vars_jr, self.X_ag_irr_vars_jr)):
+                lu_cells = self._input_data.ag_lu2cells[m, j]
+                coef_list.append(self._input_data.ag_w_mrj[m, lu_cells, j])     # Agriculture contribution
+                var_list.append(X_ag_vars_jr[j, lu_cells])
+                cell_list.append(lu_cells)
 
-        non_ag_contr = gp.quicksum(
-            gp.quicksum(
-                self._input_data.non_ag_w_rk[ind, k] * self.X_non_ag_vars_kr[k, ind]
-            )  # Non-agricultural contribution
-            for k in range(self._input_data.n_non_ag_lus)
-        )
+        for am, am_j_list in self._input_data.am2j.items():
+            for j_idx, j in enumerate(am_j_list):
+                for m, X_ag_man_vars_jr in enumerate((self.X_ag_man_dry_vars_jr[am], self.X_ag_man_irr_vars_jr[am])):
+                    lu_cells = self._input_data.ag_lu2cells[m, j]
+                    coef_list.append(self._input_data.ag_man_w_mrj[am][m, lu_cells, j_idx])    # Alt. ag. management contributions
+                    var_list.append(X_ag_man_vars_jr[j_idx, lu_cells])
+                    cell_list.append(lu_cells)
 
-        # Get the water yield outside the study area in the Base Year (2010) of the whole simulation
-        outside_luto_study_contr = self._input_data.water_yield_outside_study_area[region]
+        for k in range(self._input_data.n_non_ag_lus):
+            lu_cells = self._input_data.non_ag_lu2cells[k]
+            coef_list.append(self._input_data.non_ag_w_rk[lu_cells, k])         # Non-agricultural contribution
+            var_list.append(self.X_non_ag_vars_kr[k, lu_cells])
+            cell_list.append(lu_cells)
+
+        coefs = np.concatenate(coef_list)
+        x_vars = np.concatenate(var_list)
+        region_terms = self._input_data.water_region_index.split(np.concatenate(cell_list))
+
+        water_nyield_exprs = {}
+        for region in self._input_data.limits["water"]:
+            # Get the water yield outside the study area in the Base Year (2010) of the whole simulation
+            expr = gp.LinExpr(self._input_data.water_yield_outside_study_area[region])
+            if region in region_terms:
+                terms = region_terms[region]
+                expr += coefs[terms] @ x_vars[terms]
+            water_nyield_exprs[region] = expr
 
-        # Sum of all water yield contributions
-        return ag_contr + ag_man_contr + non_ag_contr + outside_luto_study_contr
+        return water_nyield_exprs
 
     def _add_hard_water_usage_limit_constraints(self) -> None:
         """
@@ -711,8 +714,8 @@ class LutoSolver:
             return
 
         # Ensure water use remains below limit for each region
-        for region, (reg_name, limit_hist_level, ind) in self._input_data.limits["water"].items():
-            self.water_nyiled_exprs[region] = self._get_water_net_yield_expr_for_region(ind, region)
+        self.water_nyiled_exprs = self._get_water_net_yield_exprs()
+        for region, (reg_name, limit_hist_level) in self._input_data.limits["water"].items():
 
             # Under River Regions, we need to update the water constraint when the wny_hist_level < wny_BASE_YR_level
             if settings.WATER_REGION_DEF == "Drainage Division":
@@ -740,11 +743,11 @@ class LutoSolver:
                 )
 
     def _add_soft_water_usage_limit_constraints(self) -> None:
+        self.water_nyiled_exprs = self._get_water_net_yield_exprs()
         for region_idx, region_data in enumerate(
             self._input_data.limits["water"].items()
         ):
-            region, (reg_name, limit_hist_level, ind) = region_data
-            self.water_nyiled_exprs[region] = self._get_water_net_yield_expr_for_region(ind, region)
+            region, (reg_name, limit_hist_level) = region_data
 
             # Under River Regions, we need to update the water constraint when the wny_hist_level < wny_BASE_YR_level
             if settings.WATER_REGION_DEF == "Drainage Division":
@@ -1383,15 +1386,15 @@ class LutoSolver:
                     # Get snake_case version of the AM name for the variable name
                     am_name = am.lower().replace(" ", "_")
 
+                    j_idx = self._input_data.am2j[am].index(j)
                     x_lb = (
                         0
                         if AG_MANAGEMENTS_REVERSIBLE[am]
-                        else self._input_data.ag_man_lb_mrj[am][m, r, j]
+                        else self._input_data.ag_man_lb_mrj[am][m, r, j_idx]
                     )
                     m_str = "dry" if m == 0 else "irr"
                     var_name = f"X_ag_man_{m_str}_{am_name}_{j}_{r}"
 
-                    j_idx = self._input_data.am2j[am].index(j)
                     if m == 0:
                         self.X_ag_man_dry_vars_jr[am][j_idx, r] = (
                             self.gurobi_model.addVar(
@@ -1512,17 +1515,18 @@ class LutoSolver:
         non_ag_X_sol_rk = np.zeros(
             (self._input_data.ncells, self._input_data.n_non_ag_lus)
         ).astype(np.float32)
+        # Agricultural management variables only cover the land uses of each option, indexed as in `am2j`
         am_X_dry_sol_rj = {
-            am: np.zeros((self._input_data.ncells, self._input_data.n_ag_lus)).astype(
+            am: np.zeros((self._input_data.ncells, len(am_j_list))).astype(
                 np.float32
             )
-            for am in self._input_data.am2j
+            for am, am_j_list in self._input_data.am2j.items()
         }
         am_X_irr_sol_rj = {
-            am: np.zeros((self._input_data.ncells, self._input_data.n_ag_lus)).astype(
+            am: np.zeros((self._input_data.ncells, len(am_j_list))).astype(
                 np.float32
             )
-            for am in self._input_data.am2j
+            for am, am_j_list in self._input_data.am2j.items()
         }
 
         # Get agricultural results
@@ -1566,11 +1570,11 @@ class LutoSolver:
                     )
 
                 for r in eligible_dry_cells:
-                    am_X_dry_sol_rj[am][r, j] = self.X_ag_man_dry_vars_jr[am][
+                    am_X_dry_sol_rj[am][r, j_idx] = self.X_ag_man_dry_vars_jr[am][
                         j_idx, r
                     ].X
                 for r in eligible_irr_cells:
-                    am_X_irr_sol_rj[am][r, j] = self.X_ag_man_irr_vars_jr[am][
+                    am_X_irr_sol_rj[am][r, j_idx] = self.X_ag_man_irr_vars_jr[am][
                         j_idx, r
                     ].X
 
@@ -1658,6 +1662,10 @@ class LutoSolver:
             am: np.zeros(self._input_data.ncells, dtype=np.int8)
             for am in AG_MANAGEMENTS_TO_LAND_USES
         }
+        am2j_idx = {
+            am: {j: j_idx for j_idx, j in enumerate(am_j_list)}
+            for am, am_j_list in self._input_data.am2j.items()
+        }
         for r in range(self._input_data.ncells):
             cell_j = lumap[r]
             cell_m = lmmap[r]
@@ -1667,10 +1675,11 @@ class LutoSolver:
                 continue
 
             for am in self._input_data.j2am[cell_j]:
+                j_idx = am2j_idx[am][cell_j]
                 if cell_m == 0:
-                    am_var_val = am_X_dry_sol_rj[am][r, cell_j]
+                    am_var_val = am_X_dry_sol_rj[am][r, j_idx]
                 else:
-                    am_var_val = am_X_irr_sol_rj[am][r, cell_j]
+                    am_var_val = am_X_irr_sol_rj[am][r, j_idx]
 
                 if am_var_val >= settings.AGRICULTURAL_MANAGEMENT_USE_THRESHOLD:
                     ammaps[am][r] = 1
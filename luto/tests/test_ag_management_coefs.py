@@ -0,0 +1,109 @@
+from types import MethodType, SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from luto.settings import AG_MANAGEMENTS_TO_LAND_USES
+from luto.data import AG_MAN_DATA_ATTRS, Data
+from luto.economics.agricultural import cost as ag_cost
+from luto.economics.agricultural import quantity as ag_quantity
+
+NCELLS = 50
+NPRS = 12
+YR_CAL_BASE = 2010
+YEARS = range(YR_CAL_BASE, YR_CAL_BASE + 5)
+
+
+@pytest.fixture
+def data() -> SimpleNamespace:
+    """
+    A mock of the Data fields used by the coefficient-driven agricultural management effects, with the
+    per-land-use parameter tables of every table-driven option. Some multipliers are exactly 1, and
+    some products are shared by several land uses.
+    """
+    rng = np.random.default_rng(0)
+    land_uses = sorted({lu for am in AG_MAN_DATA_ATTRS for lu in AG_MANAGEMENTS_TO_LAND_USES[am]})
+
+    data = SimpleNamespace(
+        YR_CAL_BASE=YR_CAL_BASE,
+        NLMS=2,
+        NCELLS=NCELLS,
+        NPRS=NPRS,
+        DESC2AGLU={lu: j for j, lu in enumerate(land_uses)},
+        LU2PR=rng.random((NPRS, len(land_uses))) < 0.15,
+        REAL_AREA=rng.random(NCELLS) + 1,
+        AG_MAN_COEFS={},
+    )
+    for am, attr in AG_MAN_DATA_ATTRS.items():
+        tables = {}
+        for lu in AG_MANAGEMENTS_TO_LAND_USES[am]:
+            productivity = np.where(rng.random(len(YEARS)) < 0.3, 1.0, rng.uniform(0.8, 1.2, len(YEARS)))
+            tables[lu] = pd.DataFrame(
+                {'Productivity': productivity, 'AnnCost_per_Ha': rng.uniform(0, 100, len(YEARS))},
+                index=pd.Index(YEARS, name='Year'),
+            )
+        setattr(data, attr, tables)
+    data.get_ag_man_coefs = MethodType(Data.get_ag_man_coefs, data)
+    return data
+
+
+def _per_land_use_productivity_effect_q_mrp(data, q_mrp, am, yr_idx) -> np.ndarray:
+    """
+    The per-land-use loop that calculated the productivity effects before they were driven by coefficient arrays.
+    """
+    new_q_mrp = np.zeros((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
+    for lu in AG_MANAGEMENTS_TO_LAND_USES[am]:
+        multiplier = getattr(data, AG_MAN_DATA_ATTRS[am])[lu].loc[YR_CAL_BASE + yr_idx, 'Productivity']
+        if multiplier != 1:
+            for p in range(data.NPRS):
+                if data.LU2PR[p, data.DESC2AGLU[lu]]:
+                    new_q_mrp[:, :, p] = q_mrp[:, :, p] * (multiplier - 1)
+    return new_q_mrp
+
+
+def _per_land_use_cost_per_ha_effect_c_mrj(data, am, yr_idx) -> np.ndarray:
+    """
+    The per-land-use loop that calculated the per hectare cost effects before they were driven by coefficient arrays.
+    """
+    land_uses = AG_MANAGEMENTS_TO_LAND_USES[am]
+    new_c_mrj = np.zeros((data.NLMS, data.NCELLS, len(land_uses))).astype(np.float32)
+    for m in range(data.NLMS):
+        for lu_idx, lu in enumerate(land_uses):
+            cost_per_ha = getattr(data, AG_MAN_DATA_ATTRS[am])[lu].loc[YR_CAL_BASE + yr_idx, 'AnnCost_per_Ha']
+            new_c_mrj[m, :, lu_idx] = cost_per_ha * data.REAL_AREA
+    return new_c_mrj
+
+
+@pytest.mark.parametrize("am", list(AG_MAN_DATA_ATTRS))
+@pytest.mark.parametrize("yr_idx", [0, 3])
+def test_productivity_effect_matches_per_land_use_loop(data, am, yr_idx):
+    """
+    Ensure that the vectorised productivity effect gives the same quantities as the per-land-use loop,
+    over the products of the land uses of `am`
+    """
+    q_mrp = np.random.default_rng(1).random((data.NLMS, data.NCELLS, data.NPRS)).astype(np.float32)
+
+    # The effects are only kept for the products of the land uses of `am`
+    am_p = ag_quantity.get_ag_man_products(data.LU2PR, [data.DESC2AGLU[lu] for lu in AG_MANAGEMENTS_TO_LAND_USES[am]])
+    full_q_mrp = _per_land_use_productivity_effect_q_mrp(data, q_mrp, am, yr_idx)
+    assert not np.delete(full_q_mrp, am_p, axis=2).any()
+
+    expected = full_q_mrp[:, :, am_p]
+    result = ag_quantity.get_productivity_effect_q_mrp(data, q_mrp, am, yr_idx)
+
+    assert result.dtype == expected.dtype
+    assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("am", ['Precision Agriculture', 'AgTech EI', 'Biochar'])
+@pytest.mark.parametrize("yr_idx", [0, 3])
+def test_cost_per_ha_effect_matches_per_land_use_loop(data, am, yr_idx):
+    """
+    Ensure that the vectorised per hectare cost effect gives the same costs as the per-land-use loop
+    """
+    expected = _per_land_use_cost_per_ha_effect_c_mrj(data, am, yr_idx)
+    result = ag_cost.get_cost_per_ha_effect_c_mrj(data, am, yr_idx)
+
+    assert result.dtype == expected.dtype
+    assert np.array_equal(result, expected)
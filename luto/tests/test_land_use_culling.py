@@ -27,6 +27,7 @@ import numpy as np
 from hypothesis import given
 import pytest
 
+from luto import settings
 from luto.economics import land_use_culling
 
 MAX_M = 2
@@ -88,7 +89,7 @@ def test_percentage_cost_mask(
 
     # get and validate the cost mask with the given percentage settings
     with patch(
-        "luto.economics.land_use_culling.LAND_USAGE_CULL_PERCENTAGE",
+        "luto.settings.LAND_USAGE_CULL_PERCENTAGE",
         land_use_cull_percentage,
     ):
         cost_mask = land_use_culling.get_percentage_cost_mask(
@@ -141,7 +142,7 @@ def test_absolute_cost_mask(
 
     # get and validate the cost mask with the given percentage settings
     with patch(
-        "luto.economics.land_use_culling.MAX_LAND_USES_PER_CELL",
+        "luto.settings.MAX_LAND_USES_PER_CELL",
         max_land_uses,
     ):
         cost_mask = land_use_culling.get_absolute_cost_mask(m, r, x_mrj_mask, costs_mrj)
@@ -185,8 +186,8 @@ def test_apply_agricultural_land_use_culling(
     c_mrj = t_mrj = r_mrj = _generate_mock_mrj_matrix(cost_values, m=m, r=r)
 
     with (
-        patch("luto.economics.land_use_culling.CULL_MODE", cull_mode),
-        patch(f"luto.economics.land_use_culling.{cull_param}", cull_param_value),
+        patch("luto.settings.CULL_MODE", cull_mode),
+        patch.dict(vars(settings), {cull_param: cull_param_value} if cull_param else {}),
     ):
         land_use_culling.apply_agricultural_land_use_culling(x_mrj, c_mrj, t_mrj, r_mrj)
 
@@ -196,3 +197,60 @@ def test_apply_agricultural_land_use_culling(
     else:
         assert sum(x_mrj[m, r, :]) < MAX_J
         assert (x_mrj != old_x_mrj).any()
+
+
+def _apply_culling_per_cell(x_mrj: np.ndarray, costs_mrj: np.ndarray) -> None:
+    """
+    Reference implementation of the culling: applies the per-cell cost masks to every
+    land management / cell in turn.
+    """
+    x_mrj_mask = x_mrj.astype(bool)
+    for r in range(costs_mrj.shape[1]):
+        for m in range(costs_mrj.shape[0]):
+            if settings.CULL_MODE == "absolute":
+                cost_include_mask = land_use_culling.get_absolute_cost_mask(m, r, x_mrj_mask, costs_mrj)
+            else:
+                cost_include_mask = land_use_culling.get_percentage_cost_mask(m, r, x_mrj_mask, costs_mrj)
+
+            if cost_include_mask is not None:
+                x_mrj[m, r, :] = x_mrj[m, r, :] & cost_include_mask
+
+
+@given(
+    st.integers(min_value=0, max_value=2**32 - 1),
+    st.floats(min_value=0.0, max_value=0.5),
+    st.integers(min_value=1, max_value=MAX_J + 2),
+    st.integers(min_value=1, max_value=MAX_R),
+)
+@pytest.mark.parametrize("cull_mode", ["percentage", "absolute"])
+def test_apply_agricultural_land_use_culling_matches_per_cell(
+    cull_mode: str,
+    seed: int,
+    land_use_cull_percentage: float,
+    max_land_uses: int,
+    block_size: int,
+):
+    """
+    Ensure the vectorised culling keeps exactly the land usage options that the per-cell
+    cost masks keep, including tied costs and land management / cells with few or no
+    valid options, whatever the block size.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Integer costs produce many ties
+    x_mrj = (rng.random((MAX_M, MAX_R, MAX_J)) < rng.random((MAX_M, MAX_R, 1))).astype(np.int8)
+    c_mrj = rng.integers(0, 10, (MAX_M, MAX_R, MAX_J)).astype(np.float32)
+    t_mrj = rng.integers(0, 3, (MAX_M, MAX_R, MAX_J)).astype(np.float32)
+    r_mrj = rng.integers(0, 10, (MAX_M, MAX_R, MAX_J)).astype(np.float32)
+
+    expected_x_mrj = x_mrj.copy()
+    with (
+        patch("luto.settings.CULL_MODE", cull_mode),
+        patch("luto.settings.LAND_USAGE_CULL_PERCENTAGE", land_use_cull_percentage),
+        patch("luto.settings.MAX_LAND_USES_PER_CELL", max_land_uses),
+        patch("luto.economics.land_use_culling.CULL_BLOCK_SIZE", block_size),
+    ):
+        _apply_culling_per_cell(expected_x_mrj, (c_mrj + t_mrj) - r_mrj)
+        land_use_culling.apply_agricultural_land_use_culling(x_mrj, c_mrj, t_mrj, r_mrj)
+
+    assert (x_mrj == expected_x_mrj).all()
@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from luto import settings
+import luto.tools as tools
+from luto.economics.non_agricultural import transitions as non_ag_transitions
+from luto.economics.non_agricultural.transitions import NonAgTransitionContext
+
+NCELLS = 200
+N_AG_LUS = 28
+YR_CAL_BASE = 2010
+YR_IDX = 20
+
+EP = settings.NON_AGRICULTURAL_LU_BASE_CODE + list(settings.NON_AG_LAND_USES).index('Environmental Plantings')
+CP = settings.NON_AGRICULTURAL_LU_BASE_CODE + list(settings.NON_AG_LAND_USES).index('Carbon Plantings (Block)')
+
+
+@pytest.fixture
+def ctx() -> NonAgTransitionContext:
+    """
+    A context over a mock of the Data fields used by the plantings transition costs, with
+    the water costs of moving each cell to plantings given directly.
+    """
+    rng = np.random.default_rng(0)
+    lumap = rng.integers(0, N_AG_LUS, NCELLS).astype(np.int8)
+    non_ag = rng.random(NCELLS) < 0.4
+    lumap[non_ag] = rng.choice([EP, CP, EP + 1, EP + 2], non_ag.sum())
+
+    ag2ep_costs_ha = rng.random(N_AG_LUS) * 500
+    ag2ep_costs_ha[[2, 5]] = np.nan
+    data = SimpleNamespace(
+        YR_CAL_BASE=YR_CAL_BASE,
+        NCELLS=NCELLS,
+        REAL_AREA=rng.random(NCELLS) * 100,
+        EP_EST_COST_HA=rng.random(NCELLS) * 100,
+        CP_EST_COST_HA=rng.random(NCELLS) * 90,
+        AG2EP_TRANSITION_COSTS_HA=ag2ep_costs_ha,
+        EST_COST_MULTS={YR_CAL_BASE + YR_IDX: 1.05},
+        FENCE_COST_MULTS={YR_CAL_BASE + YR_IDX: 1.1},
+        RP_FENCING_LENGTH=rng.random(NCELLS) * 10,
+    )
+    ctx = NonAgTransitionContext(data, YR_IDX, lumap, np.zeros(NCELLS, dtype=np.int8))
+    ctx.ag_to_non_ag_w_costs_r = (
+        (rng.random(NCELLS) * 50).astype(np.float32),
+        (rng.random(NCELLS) * 20).astype(np.float32),
+    )
+    return ctx
+
+
+def _baseline_plantings_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, est_cost_ha, lu_cells, separate):
+    """
+    The EP and CP (block) transition costs from agricultural land as calculated before the shared context.
+    """
+    yr_cal = data.YR_CAL_BASE + yr_idx
+
+    est_costs_r = tools.amortise(est_cost_ha * data.REAL_AREA * data.EST_COST_MULTS[yr_cal]).astype(np.float32)
+    est_costs_r[lu_cells] = 0.0
+
+    base_ag_to_ep_t_r = np.vectorize(dict(enumerate(data.AG2EP_TRANSITION_COSTS_HA)).get, otypes=['float32'])(lumap)
+    base_ag_to_ep_t_r = tools.amortise(base_ag_to_ep_t_r * data.REAL_AREA)
+    base_ag_to_ep_t_r = np.nan_to_num(base_ag_to_ep_t_r)
+    base_ag_to_ep_t_r[lu_cells] = 0.0
+
+    w_license_cost_r[lu_cells] = 0.0
+    w_rm_irrig_cost_r[lu_cells] = 0.0
+    w_cost_r = w_license_cost_r + w_rm_irrig_cost_r
+
+    if separate:
+        return {'Establishment cost (Ag2Non-Ag)': est_costs_r,
+                'Transition cost (Ag2Non-Ag)': base_ag_to_ep_t_r,
+                'Water license cost (Ag2Non-Ag)': w_license_cost_r,
+                'Remove irrigation cost (Ag2Non-Ag)': w_rm_irrig_cost_r}
+    else:
+        return est_costs_r + base_ag_to_ep_t_r + w_cost_r
+
+
+def _baseline_from_ag_costs(data, yr_idx, lumap, w_costs_r, separate) -> dict:
+    """
+    The EP, RP, CP (block) and BECCS costs in the order `get_from_ag_transition_matrix` calculated them before
+    the shared context, all zeroing their cells in the same pair of water cost arrays.
+    """
+    w_license_cost_r, w_rm_irrig_cost_r = (arr.copy() for arr in w_costs_r)
+    ep_cells = np.flatnonzero(lumap == EP)
+    cp_cells = np.flatnonzero(lumap == CP)
+
+    ep_costs = _baseline_plantings_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, data.EP_EST_COST_HA, ep_cells, separate)
+    rp_costs = non_ag_transitions.get_rip_plant_transitions_from_ag(data, ep_costs, yr_idx, lumap, separate)
+    cp_costs = _baseline_plantings_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, data.CP_EST_COST_HA, cp_cells, separate)
+    beccs_costs = _baseline_plantings_from_ag(data, yr_idx, lumap, w_license_cost_r, w_rm_irrig_cost_r, data.EP_EST_COST_HA, ep_cells, separate)
+    return {'EP': ep_costs, 'RP': rp_costs, 'CP': cp_costs, 'BECCS': beccs_costs}
+
+
+@pytest.mark.parametrize("separate", [False, True])
+def test_plantings_from_ag_match_baseline(ctx: NonAgTransitionContext, separate):
+    """
+    Ensure that the EP, RP, CP (block) and BECCS transition costs from agricultural land match the costs
+    calculated before the shared context, and that the context's water cost arrays are left unchanged
+    """
+    w_costs_r = tuple(arr.copy() for arr in ctx.ag_to_non_ag_w_costs_r)
+    expected = _baseline_from_ag_costs(ctx.data, YR_IDX, ctx.lumap, w_costs_r, separate)
+
+    # Same order and water cost arrays as get_from_ag_transition_matrix
+    w_license_cost_r, w_rm_irrig_cost_r = (arr.copy() for arr in ctx.ag_to_non_ag_w_costs_r)
+    ep_costs = non_ag_transitions.get_env_plant_transitions_from_ag(ctx, w_license_cost_r, w_rm_irrig_cost_r, separate)
+    rp_costs = non_ag_transitions.get_rip_plant_transitions_from_ag(ctx.data, ep_costs, YR_IDX, ctx.lumap, separate)
+    cp_costs = non_ag_transitions.get_carbon_plantings_block_from_ag(ctx, w_license_cost_r, w_rm_irrig_cost_r, separate)
+    beccs_costs = non_ag_transitions.get_beccs_from_ag(ctx, w_license_cost_r, w_rm_irrig_cost_r, separate)
+    result = {'EP': ep_costs, 'RP': rp_costs, 'CP': cp_costs, 'BECCS': beccs_costs}
+
+    for lu, costs in result.items():
+        if separate:
+            assert list(costs) == list(expected[lu]), lu
+            for key, cost_r in costs.items():
+                assert np.array_equal(cost_r, expected[lu][key]), (lu, key)
+        else:
+            assert np.array_equal(costs, expected[lu]), lu
+
+    for arr, arr_before in zip(ctx.ag_to_non_ag_w_costs_r, w_costs_r):
+        assert np.array_equal(arr, arr_before)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from luto.tools.region_index import RegionIndex
+
+NCELLS = 500
+
+
+@pytest.fixture
+def region_id() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    # Non-contiguous region IDs, in random cell order
+    return rng.choice([3, 7, 8, 15, 42], NCELLS)
+
+
+def test_aggregate_matches_per_region_slicing(region_id: np.ndarray):
+    """
+    Ensure that aggregating by region gives the same sums as slicing the array by the cells of each region,
+    along any cell axis and for regions without cells
+    """
+    rng = np.random.default_rng(1)
+    index = RegionIndex(region_id, np.ones(NCELLS))
+    arr_mrj = rng.random((2, NCELLS, 4))
+
+    agg_mxj = index.aggregate(arr_mrj, axis=1)
+    for i, region in enumerate(index.regions):
+        region_ind = np.flatnonzero(region_id == region)
+        assert np.allclose(agg_mxj[:, i, :], arr_mrj[:, region_ind, :].sum(axis=1))
+        assert np.array_equal(index.cells(region), region_ind)
+
+    regions = [42, 99, 3]                       # Region 99 has no cells
+    agg_mxj = index.aggregate(arr_mrj, axis=1, regions=regions)
+    assert agg_mxj.shape == (2, len(regions), 4)
+    for i, region in enumerate(regions):
+        region_ind = np.flatnonzero(region_id == region)
+        assert np.allclose(agg_mxj[:, i, :], arr_mrj[:, region_ind, :].sum(axis=1))
+    assert not agg_mxj[:, 1, :].any()
+
+    arr_r = rng.random(NCELLS)
+    totals = index.totals(arr_r)
+    assert totals.keys() == set(np.unique(region_id).tolist())
+    for region, total in totals.items():
+        assert total == pytest.approx(arr_r[region_id == region].sum())
+
+
+def test_split_matches_per_region_slicing(region_id: np.ndarray):
+    """
+    Ensure that splitting cell indices (with repeats) by region gives, for every region, the positions of the
+    cells in that region, in their original order
+    """
+    rng = np.random.default_rng(2)
+    index = RegionIndex(region_id, np.ones(NCELLS))
+    cells = rng.choice(NCELLS, 300)
+
+    split = index.split(cells)
+    assert split.keys() == set(np.unique(region_id[cells]).tolist())
+    for region, pos in split.items():
+        assert np.array_equal(pos, np.flatnonzero(region_id[cells] == region))
+
+    assert index.split(np.empty(0, dtype=np.int64)) == {}
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from luto.economics.agricultural import water as ag_water
+from luto.tools.region_index import RegionIndex
+
+NCELLS = 200
+
+
+@pytest.fixture
+def data() -> SimpleNamespace:
+    rng = np.random.default_rng(0)
+    rivreg_id = rng.choice([1, 2, 3], NCELLS)
+    return SimpleNamespace(
+        WATER_YIELD_RR_BASE_YR=None,
+        AG_L_MRJ=rng.random((2, NCELLS, 5)) < 0.3,
+        RIVREG_ID=rivreg_id,
+        RIVREG_INDEX=RegionIndex(rivreg_id, np.ones(NCELLS)),
+        WATER_OUTSIDE_LUTO_RR_HIST={1: 100.0, 2: 200.0, 3: 300.0, 4: 400.0},
+    )
+
+
+def test_water_net_yield_BASE_YR_by_river_region(data):
+    """
+    Ensure that the BASE_YR water net yield of each river region is the yield of the region's cells
+    plus the historical yield outside the LUTO study area
+    """
+    w_mrj = np.random.default_rng(1).random(data.AG_L_MRJ.shape)
+    ag_w_r = (w_mrj * data.AG_L_MRJ).sum(axis=(0, 2))
+
+    with patch("luto.settings.WATER_REGION_DEF", "River Region"), \
+         patch.object(ag_water, "get_water_net_yield_matrices", return_value=w_mrj):
+        wny = ag_water.calc_water_net_yield_BASE_YR(data)
+
+    expected = {
+        region: ag_w_r[data.RIVREG_ID == region].sum() + outside
+        for region, outside in data.WATER_OUTSIDE_LUTO_RR_HIST.items()
+    }
+    assert wny.keys() == expected.keys()
+    for region in expected:
+        assert wny[region] == pytest.approx(expected[region])
@@ -40,6 +40,8 @@ from datetime import datetime
 import luto.economics.agricultural.water as ag_water
 import luto.economics.non_agricultural.water as non_ag_water
 
+from luto.tools.lu_lookup import get_lu_lookup
+
 
 def write_timestamp():
     timestamp = datetime.now().strftime('%Y_%m_%d__%H_%M_%S')
@@ -248,24 +250,31 @@ def get_non_ag_cells(lumap) -> np.ndarray:
     return np.nonzero(lumap >= settings.NON_AGRICULTURAL_LU_BASE_CODE)[0]
 
 
-def get_ag_to_ag_water_delta_matrix(w_mrj, l_mrj, data, yr_idx):
+def get_ag_to_ag_water_delta_matrix(w_mrj, lumap, lmmap, data, yr_idx):
     """
     Gets the water delta matrix ($/cell) that applies the cost of installing/removing irrigation to
     base transition costs. Includes the costs of water license fees.
 
     Parameters
      w_mrj (numpy.ndarray, <unit:ML/cell>): Water requirements matrix for target year.
-     l_mrj (numpy.ndarray): Land-use and land management matrix for the base_year.
+     lumap (numpy.ndarray): Land-use map of the base_year.
+     lmmap (numpy.ndarray): Land management map of the base_year.
      data (object): Data object containing necessary information.
 
     Returns
      w_delta_mrj (numpy.ndarray, <unit:$/cell>).
     """
     yr_cal = data.YR_CAL_BASE + yr_idx
+
+    # Current land use and land management of each agricultural cell
+    ag_cells = get_ag_cells(lumap)
+    ag_j = lumap[ag_cells]
+    ag_m = lmmap[ag_cells].astype(np.intp)
     
     # Get water requirements from current agriculture, converting water requirements for LVSTK from ML per head to ML per cell (inc. REAL_AREA).
-    # Sum total water requirements of current land-use and land management
-    w_r = (w_mrj * l_mrj).sum(axis=0).sum(axis=1)
+    # Water requirements of current land-use and land management (zero for non-agricultural cells)
+    w_r = np.zeros(w_mrj.shape[1], dtype=w_mrj.dtype)
+    w_r[ag_cells] = w_mrj[ag_m, ag_cells, ag_j]
 
     # Net water requirements calculated as the diff in water requirements between current land-use and all other land-uses j.
     w_net_mrj = w_mrj - w_r[:, np.newaxis]
@@ -274,27 +283,28 @@ def get_ag_to_ag_water_delta_matrix(w_mrj, l_mrj, data, yr_idx):
     w_delta_mrj = w_net_mrj * data.WATER_LICENCE_PRICE[:, np.newaxis] * data.WATER_LICENSE_COST_MULTS[yr_cal] * settings.INCLUDE_WATER_LICENSE_COSTS
 
     # When land-use changes from dryland to irrigated add <settings.NEW_IRRIG_COST> per hectare for establishing irrigation infrastructure
+    dry_cells, irr_cells = ag_cells[ag_m == 0], ag_cells[ag_m == 1]
     new_irrig = (
         settings.NEW_IRRIG_COST
         * data.IRRIG_COST_MULTS[yr_cal]
-        * data.REAL_AREA[:, np.newaxis]  # <unit:$/cell>
+        * data.REAL_AREA[dry_cells]  # <unit:$/cell>
     )
-    w_delta_mrj[1] = np.where(l_mrj[0], w_delta_mrj[1] + new_irrig, w_delta_mrj[1])
+    w_delta_mrj[1, dry_cells, lumap[dry_cells]] += new_irrig
 
     # When land-use changes from irrigated to dryland add <settings.REMOVE_IRRIG_COST> per hectare for removing irrigation infrastructure
     remove_irrig = (
         settings.REMOVE_IRRIG_COST
         * data.IRRIG_COST_MULTS[yr_cal]
-        * data.REAL_AREA[:, np.newaxis]  # <unit:$/cell>
+        * data.REAL_AREA[irr_cells]  # <unit:$/cell>
     )
-    w_delta_mrj[0] = np.where(l_mrj[1], w_delta_mrj[0] + remove_irrig, w_delta_mrj[0])
+    w_delta_mrj[0, irr_cells, lumap[irr_cells]] += remove_irrig
     
     # Amortise upfront costs to annualised costs
     w_delta_mrj = amortise(w_delta_mrj)
     
     return w_delta_mrj  # <unit:$/cell>
 
-def get_ag_to_non_ag_water_delta_matrix(data, yr_idx, lumap, lmmap)->tuple[np.ndarray, np.ndarray]:
+def get_ag_to_non_ag_water_delta_matrix(data, yr_idx, lumap, lmmap, w_req_mrj=None)->tuple[np.ndarray, np.ndarray]:
     """
     Gets the water delta matrix ($/cell) that applies the cost of installing/removing irrigation to
     base transition costs. Includes the costs of water license fees.
@@ -304,6 +314,7 @@ def get_ag_to_non_ag_water_delta_matrix(data, yr_idx, lumap, lmmap)->tuple[np.nd
      yr_idx (int): Index of the target year.
      lumap (numpy.ndarray): Land-use map.
      lmmap (numpy.ndarray): Land management map.
+     w_req_mrj (numpy.ndarray, optional): Water requirements of the target year (ML/cell), if already calculated.
     
     Returns
      w_license_cost_r (numpy.ndarray) : Water license cost for each cell.
@@ -313,11 +324,15 @@ def get_ag_to_non_ag_water_delta_matrix(data, yr_idx, lumap, lmmap)->tuple[np.nd
     """
     
     yr_cal = data.YR_CAL_BASE + yr_idx
-    l_mrj = lumap2ag_l_mrj(lumap, lmmap)
-    non_ag_cells = get_non_ag_cells(lumap)
     
-    w_req_mrj = ag_water.get_wreq_matrices(data, yr_idx).astype(np.float32)     # <unit: ML/CELL>
-    w_req_r = (w_req_mrj * l_mrj).sum(axis=0).sum(axis=1)
+    if w_req_mrj is None:
+        w_req_mrj = ag_water.get_wreq_matrices(data, yr_idx)                    # <unit: ML/CELL>
+    w_req_mrj = w_req_mrj.astype(np.float32, copy=False)
+
+    # Water requirements of the current land-use and land management (zero for non-agricultural cells)
+    ag_cells = get_ag_cells(lumap)
+    w_req_r = np.zeros(lumap.shape[0], dtype=np.float32)
+    w_req_r[ag_cells] = w_req_mrj[lmmap[ag_cells].astype(np.intp), ag_cells, lumap[ag_cells]]
     w_yield_r = non_ag_water.get_w_net_yield_matrix_env_planting(data, yr_idx)  # <unit: ML/CELL>
     w_delta_r = - (w_req_r + w_yield_r)
     
@@ -516,7 +531,8 @@ def get_out_resfactor(dvar_path:str):
     
 def calc_water(
     data, 
-    ind:np.ndarray, 
+    region_index, 
+    regions:list,
     ag_w_mrj:np.ndarray, 
     non_ag_w_rk:np.ndarray, 
     ag_man_w_mrj:np.ndarray, 
@@ -528,32 +544,34 @@ def calc_water(
     '''
     Note
         This function is only used for the `write_water` in the `luto.tools.write` module.
-        Calculate water yields for year given the index. 
+        Calculate water yields for year of each region in `regions`, summed by region
+        with the (region x cell) matrix of `region_index` (a `RegionIndex`).
     
     Return
-     pd.DataFrame, the water yields for year and region.
+     pd.DataFrame, the water yields for year by region, in the order of `regions`.
     '''
     
     # Calculate water yields for year and region.
-    index_levels = ['Landuse Type', 'Landuse', 'Water_supply',  'Water Net Yield (ML)']
+    index_levels = ['region', 'Landuse Type', 'Landuse', 'Water_supply',  'Water Net Yield (ML)']
 
     # Agricultural contribution
-    ag_mrj = ag_w_mrj[:, ind, :] * ag_dvar[:, ind, :]   
-    ag_jm = np.einsum('mrj->jm', ag_mrj)                             
+    ag_mRj = region_index.aggregate(ag_w_mrj * ag_dvar, axis=1, regions=regions)   # Sum over cells of each region
+    ag_Rjm = np.einsum('mRj->Rjm', ag_mRj)
     ag_df = pd.DataFrame(
-        ag_jm.reshape(-1).tolist(),
-        index=pd.MultiIndex.from_product(
-            [['Agricultural Landuse'],
+        ag_Rjm.reshape(-1).tolist(),
+        index=pd.MultiIndex.from_product([
+                regions,
+                ['Agricultural Landuse'],
                 data.AGRICULTURAL_LANDUSES,
                 data.LANDMANS])).reset_index()
     ag_df.columns = index_levels
 
     # Non-agricultural contribution
-    non_ag_rk = non_ag_w_rk[ind, :] * non_ag_dvar[ind, :]  # Non-agricultural contribution
-    non_ag_k = np.einsum('rk->k', non_ag_rk)                             # Sum over cells
+    non_ag_Rk = region_index.aggregate(non_ag_w_rk * non_ag_dvar, axis=0, regions=regions)
     non_ag_df = pd.DataFrame(
-        non_ag_k, 
+        non_ag_Rk.reshape(-1).tolist(), 
         index= pd.MultiIndex.from_product([
+                regions,
                 ['Non-agricultural Landuse'],
                 settings.NON_AG_LAND_USES.keys() ,
                 ['dry']  # non-agricultural land is always dry
@@ -563,13 +581,13 @@ def calc_water(
     # Agricultural managements contribution
     AM_dfs = []
     for am, am_lus in settings.AG_MANAGEMENTS_TO_LAND_USES.items():  # Agricultural managements contribution
-        am_j = np.array([data.DESC2AGLU[lu] for lu in am_lus])
-        am_mrj = ag_man_w_mrj[am][:, ind, :] * am_dvar[am][:, ind, :][:, :, am_j] 
-        am_jm = np.einsum('mrj->jm', am_mrj)
+        am_mRj = region_index.aggregate(ag_man_w_mrj[am] * am_dvar[am], axis=1, regions=regions)
+        am_Rjm = np.einsum('mRj->Rjm', am_mRj)
         # water yields for each agricultural management in long dataframe format
         df_am = pd.DataFrame(
-            am_jm.reshape(-1).tolist(),
+            am_Rjm.reshape(-1).tolist(),
             index=pd.MultiIndex.from_product([
+                regions,
                 ['Agricultural Management'],
                 am_lus,
                 data.LANDMANS
@@ -578,7 +596,13 @@ def calc_water(
         AM_dfs.append(df_am)
     AM_df = pd.concat(AM_dfs)
     
-    return pd.concat([ag_df, non_ag_df, AM_df])
+    # Order the rows by region, keeping the ag, non-ag and ag management rows of each region together
+    region_order = {region: i for i, region in enumerate(regions)}
+    return (
+        pd.concat([ag_df, non_ag_df, AM_df])
+        .sort_values('region', key=lambda x: x.map(region_order), kind='stable')
+        .reset_index(drop=True)
+    )
 
 
 def calc_major_vegetation_group_ag_area_for_year(
@@ -588,8 +612,8 @@ def calc_major_vegetation_group_ag_area_for_year(
 
     ag_biodiv_impacts_j = {j: 1 - x for j, x in biodiv_contr_ag_rj.items()}
 
-    # Numpy magic
-    ag_biodiv_degr_r = np.vectorize(ag_biodiv_impacts_j.get)(lumap)
+    # Map each cell's land use to its impact
+    ag_biodiv_degr_r = get_lu_lookup(ag_biodiv_impacts_j)[lumap]
     
     for v in range(GBF3_raw_MVG_area_vr.shape[0]):
         prod_data[v] = GBF3_raw_MVG_area_vr[v, :] * ag_biodiv_degr_r
@@ -604,8 +628,8 @@ def calc_species_ag_area_for_year(
 
     ag_biodiv_impacts_j = {j: 1 - x for j, x in biodiv_contr_ag_rj.items()}
 
-    # Numpy magic
-    ag_biodiv_degr_r = np.vectorize(ag_biodiv_impacts_j.get)(lumap)
+    # Map each cell's land use to its impact
+    ag_biodiv_degr_r = get_lu_lookup(ag_biodiv_impacts_j)[lumap]
     
     for s in range(GBF8_raw_species_area_sr.shape[0]):
         prod_data[s] = GBF8_raw_species_area_sr[s, :] * ag_biodiv_degr_r
@@ -620,8 +644,8 @@ def calc_nes_ag_area_for_year(
 
     ag_biodiv_impacts_j = {j: 1 - x for j, x in ag_biodiv_degr_j.items()}
 
-    # Numpy magic
-    ag_biodiv_degr_r = np.vectorize(ag_biodiv_impacts_j.get)(lumap)
+    # Map each cell's land use to its impact
+    ag_biodiv_degr_r = get_lu_lookup(ag_biodiv_impacts_j)[lumap]
     
     for x in range(nes_xr.shape[0]):
         prod_data[x] = nes_xr[x, :] * ag_biodiv_degr_r
@@ -0,0 +1,97 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""
+Array-native copy of the cell-level parameter tables (e.g., `agec_crops.h5`,
+`agGHG_lvstk.h5`) whose columns are addressed by label.
+
+An `ArrayTable` holds the numeric columns of a table as one contiguous float32 block
+of shape (column, cell), so every column is a contiguous 1D array, and a dict from
+the column label (e.g., `('Yield', 'dry', 'Winter cereals')`) to its row in the block.
+Looking up a column is a dict lookup plus a view, instead of a MultiIndex lookup
+on a float64 DataFrame followed by a copy.
+"""
+
+
+import numpy as np
+import pandas as pd
+
+
+class ArrayTable:
+    """
+    Float32 column block of a cell-level table, indexed by column label.
+
+    Parameters
+    ----
+    values: 2D array, shape (c, r)
+        Values of each column `c` for each cell `r`.
+    columns: list, length c
+        Label of each column; tuples for tables with MultiIndex columns.
+
+    Attributes
+    ----
+    values: the (column, cell) block; read-only.
+    columns: the column labels, in the order of the rows of `values`.
+    col_idx: {column label: row in `values`}.
+    """
+
+    def __init__(self, values: np.ndarray, columns: list):
+        self.values = values
+        self.values.flags.writeable = False
+        self.columns = list(columns)
+        self.col_idx = {col: i for i, col in enumerate(self.columns)}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'ArrayTable':
+        """
+        Build the table from the numeric columns of `df` (rows are cells); other columns are dropped.
+        """
+        df = df.select_dtypes(include='number')
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float32).T)
+        return cls(values, df.columns.to_list())
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __contains__(self, key) -> bool:
+        return key in self.col_idx
+
+    def __getitem__(self, key) -> np.ndarray:
+        """
+        Return the column `key` as a read-only 1D array of shape (r,).
+        """
+        return self.values[self.col_idx[key]]
+
+    def select(self, keys: list) -> np.ndarray:
+        """
+        Return the columns `keys` as a 2D array of shape (len(keys), r).
+        """
+        return self.values[[self.col_idx[key] for key in keys]]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the table as a (cell x column) DataFrame, with MultiIndex columns if the labels are tuples.
+        """
+        if self.columns and isinstance(self.columns[0], tuple):
+            columns = pd.MultiIndex.from_tuples(self.columns)
+        else:
+            columns = pd.Index(self.columns)
+        return pd.DataFrame(self.values.T, columns=columns)
@@ -0,0 +1,167 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+On-disk cache of the fully initialised (i.e., masked and resfactored) `Data` object.
+
+Each cache entry is a directory under `settings.DATA_CACHE_DIR` named by a hash of
+every setting that can affect the `Data` object, the metadata (size, mtime) of every
+input file, and the source of every module of the `luto` package (`Data.__init__` calls
+into `luto.tools`, `luto.economics`, etc., and pickled attributes are instances of their
+classes). Numpy arrays (and the value blocks of `ArrayTable` attributes) are stored as
+individual `.npy` files so they can be memory-mapped on load; all other attributes are
+pickled (uncompressed) with dill.
+"""
+
+
+import os
+import shutil
+import hashlib
+import dill
+import numpy as np
+
+import luto.settings as settings
+
+from luto.data import Data
+from luto.tools import read_timestamp
+from luto.tools.array_table import ArrayTable
+
+
+# Settings that only control solving, culling and output writing. These do not change
+# the content of the `Data` object, so they are left out of the cache key.
+RUN_ONLY_SETTINGS = {
+    'OUTPUT_DIR', 'SIM_YERAS', 'MODE', 'OBJECTIVE', 'DEMAND_CONSTRAINT_TYPE',
+    'WRITE_OUTPUT_GEOTIFFS', 'PARALLEL_WRITE', 'WRITE_THREADS', 'KEEP_OUTPUTS',
+    'SOLVE_METHOD', 'PRESOLVE', 'AGGREGATE', 'VERBOSE', 'FEASIBILITY_TOLERANCE', 'OPTIMALITY_TOLERANCE',
+    'BARRIER_CONVERGENCE_TOLERANCE', 'CROSSOVER', 'SCALE_FLAG', 'NUMERIC_FOCUS', 'BARHOMOGENOUS', 'THREADS',
+    'GHG_CONSTRAINT_TYPE', 'WATER_CONSTRAINT_TYPE', 'GBF2_CONSTRAINT_TYPE', 'WATER_PENALTY', 'GBF2_PENALTY',
+    'SOLVE_WEIGHT_ALPHA', 'SOLVE_WEIGHT_BETA', 'BIODIVERSITY_BIG_CONSTR_DIV_FACTOR',
+    'CULL_MODE', 'MAX_LAND_USES_PER_CELL', 'LAND_USAGE_CULL_PERCENTAGE',
+    'DATA_CACHE', 'DATA_CACHE_DIR', 'PARALLEL_READ', 'READ_THREADS',
+    'INPUT_STORE', 'NPY_STORE_DIR', 'AG_QUANTITY_CACHE_YEARS',
+}
+
+# File holding all attributes of the `Data` object that are not plain numpy arrays.
+OBJECTS_FNAME = 'objects.pkl'
+
+# Suffix of the files holding the value block of an `ArrayTable` attribute; its column labels are pickled.
+TABLE_SUFFIX = '.table.npy'
+
+
+def get_data_cache_key() -> str:
+    """
+    Return the hash identifying the `Data` object built under the current settings and input files.
+    """
+    sha = hashlib.sha256()
+
+    # Settings that may affect the Data object
+    for name in sorted(i for i in dir(settings) if i.isupper()):
+        if name not in RUN_ONLY_SETTINGS:
+            sha.update(f'{name}={getattr(settings, name)!r}\n'.encode())
+
+    # Size and modification time of every input file (excluding the cache itself and the npy store copy)
+    input_files = []
+    skip_dirs = {os.path.abspath(settings.DATA_CACHE_DIR), os.path.abspath(settings.NPY_STORE_DIR)}
+    for root, dirs, files in os.walk(settings.INPUT_DIR):
+        dirs[:] = sorted(d for d in dirs if os.path.abspath(os.path.join(root, d)) not in skip_dirs)
+        input_files.extend(os.path.join(root, f) for f in sorted(files))
+    input_files.extend(settings.NO_GO_VECTORS.values())
+
+    for fpath in input_files:
+        if os.path.exists(fpath):
+            stat = os.stat(fpath)
+            sha.update(f'{fpath}|{stat.st_size}|{stat.st_mtime_ns}\n'.encode())
+
+    # The code that builds the Data object, and the classes of its pickled attributes
+    pkg_dir = os.path.dirname(os.path.abspath(settings.__file__))
+    for root, dirs, files in os.walk(pkg_dir):
+        dirs[:] = sorted(d for d in dirs if d not in {'__pycache__', 'tests'})
+        for fname in sorted(f for f in files if f.endswith('.py')):
+            fpath = os.path.join(root, fname)
+            sha.update(f'{os.path.relpath(fpath, pkg_dir)}\n'.encode())
+            with open(fpath, 'rb') as f:
+                sha.update(f.read())
+
+    return sha.hexdigest()[:16]
+
+
+def get_data_cache_dir() -> str:
+    """
+    Return the cache directory of the `Data` object built under the current settings and input files.
+    """
+    return os.path.join(settings.DATA_CACHE_DIR, f'Data_RES{settings.RESFACTOR}_{get_data_cache_key()}')
+
+
+def save_data_cache(data: Data, cache_dir: str) -> None:
+    """
+    Save the `Data` object to `cache_dir`. Numpy arrays are saved as separate `.npy` files,
+    and all other attributes are pickled together.
+
+    The entry is written to a temporary directory first and then moved into place, so
+    an interrupted or concurrent write never leaves a partial cache entry behind.
+    """
+    tmp_dir = f'{cache_dir}.tmp{os.getpid()}'
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    objects = {}
+    for name, val in data.__dict__.items():
+        if isinstance(val, np.ndarray) and val.dtype != object:
+            np.save(os.path.join(tmp_dir, f'{name}.npy'), val, allow_pickle=False)
+        elif isinstance(val, ArrayTable):
+            np.save(os.path.join(tmp_dir, f'{name}{TABLE_SUFFIX}'), val.values, allow_pickle=False)
+            objects[name] = val.columns
+        else:
+            objects[name] = val
+
+    with open(os.path.join(tmp_dir, OBJECTS_FNAME), 'wb') as f:
+        dill.dump(objects, f)
+
+    try:
+        os.replace(tmp_dir, cache_dir)
+    except OSError:
+        # Another run has already written the same cache entry
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def load_data_cache(cache_dir: str) -> Data:
+    """
+    Restore a `Data` object from `cache_dir` without running `Data.__init__`.
+
+    Arrays are memory-mapped in copy-on-write mode, so they are only read from disk
+    when accessed, and in-place modifications never reach the cache files.
+    """
+    data = Data.__new__(Data)
+
+    with open(os.path.join(cache_dir, OBJECTS_FNAME), 'rb') as f:
+        data.__dict__.update(dill.load(f))
+
+    for fname in os.listdir(cache_dir):
+        if fname.endswith(TABLE_SUFFIX):
+            name = fname[:-len(TABLE_SUFFIX)]
+            data.__dict__[name] = ArrayTable(np.load(os.path.join(cache_dir, fname), mmap_mode='c'), data.__dict__[name])
+        elif fname.endswith('.npy'):
+            data.__dict__[fname[:-4]] = np.load(os.path.join(cache_dir, fname), mmap_mode='c')
+
+    # The Data object belongs to the current simulation
+    data.timestamp = read_timestamp().strip()
+    data.path = None
+    data.path_begin_end_compare = None
+
+    return data
@@ -0,0 +1,86 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Parameter tables read from the Excel workbooks in the input directory.
+
+Each workbook is parsed once, with all of its sheets extracted in a single pass, and
+the parsed sheets are pickled to `<DATA_CACHE_DIR>/excel/<workbook>.<hash>.pkl`. The
+hash is taken over the workbook's content, so editing a workbook invalidates its cache
+entry. Within a process the parsed sheets are also kept in memory, so reading several
+sheets of the same workbook never reparses it.
+"""
+
+
+import os
+import hashlib
+import dill
+import pandas as pd
+
+import luto.settings as settings
+
+
+# {(path, size, mtime): {sheet name: dataframe}}
+_WORKBOOKS: dict[tuple, dict[str, pd.DataFrame]] = {}
+
+
+def get_excel_cache_path(fpath: str) -> str:
+    """
+    Return the cache file of the workbook at `fpath`, named by the hash of its content.
+    """
+    with open(fpath, 'rb') as f:
+        file_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+    return os.path.join(settings.DATA_CACHE_DIR, 'excel', f'{os.path.basename(fpath)}.{file_hash}.pkl')
+
+
+def read_excel_sheets(fpath: str) -> dict[str, pd.DataFrame]:
+    """
+    Return all sheets of the workbook at `fpath` as {sheet name: dataframe}, each read with
+    the default `pd.read_excel` arguments (first row as header, no index column).
+    """
+    stat = os.stat(fpath)
+    key = (os.path.abspath(fpath), stat.st_size, stat.st_mtime_ns)
+    if key in _WORKBOOKS:
+        return _WORKBOOKS[key]
+
+    cache_path = get_excel_cache_path(fpath)
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            sheets = dill.load(f)
+    else:
+        sheets = pd.read_excel(fpath, sheet_name=None)
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f'{cache_path}.tmp{os.getpid()}'
+        with open(tmp_path, 'wb') as f:
+            dill.dump(sheets, f)
+        os.replace(tmp_path, cache_path)
+
+    _WORKBOOKS[key] = sheets
+    return sheets
+
+
+def read_excel_sheet(fpath: str, sheet_name: str, index_col: str = None) -> pd.DataFrame:
+    """
+    Return a copy of sheet `sheet_name` of the workbook at `fpath`, optionally indexed by
+    the column `index_col`. Equivalent to `pd.read_excel(fpath, sheet_name, index_col=index_col)`.
+    """
+    df = read_excel_sheets(fpath)[sheet_name].copy()
+    return df.set_index(index_col) if index_col is not None else df
@@ -0,0 +1,49 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Dense lookup arrays for mapping land-use codes to per-land-use values.
+
+A {land-use code: value} dict is compiled into an array indexed by code, covering
+the agricultural codes and the non-agricultural codes from `NON_AGRICULTURAL_LU_BASE_CODE`,
+so a land-use map is mapped to values with a single fancy-indexing pass
+(`get_lu_lookup(value_lu)[lumap]`) instead of a Python call per cell.
+"""
+
+
+import numpy as np
+
+import luto.settings as settings
+
+
+def get_lu_lookup(value_lu: dict[int, float], fill_value: float = np.nan, dtype=np.float64) -> np.ndarray:
+    """
+    Return the lookup array of `value_lu` ({land-use code: value}), indexed by land-use code.
+
+    The array covers every code up to the last non-agricultural land use (and any larger key
+    of `value_lu`); codes missing from `value_lu` map to `fill_value`.
+    """
+    n_codes = max(
+        settings.NON_AGRICULTURAL_LU_BASE_CODE + len(settings.NON_AG_LAND_USES),
+        max(value_lu, default=-1) + 1
+    )
+    lookup = np.full(n_codes, fill_value, dtype=dtype)
+    lookup[np.fromiter(value_lu.keys(), dtype=np.int64, count=len(value_lu))] = list(value_lu.values())
+    return lookup
@@ -0,0 +1,205 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Memory-mappable columnar copy of the cell-level HDF5 input layers.
+
+Each `<name>.h5` table with one row per land cell is stored as a directory
+`<NPY_STORE_DIR>/<name>/` holding one uncompressed `.npy` file per column, one
+`index_<level>.npy` file per level of the row index, and the column labels (or Series name),
+index names and the size and modification time of the source file in `meta.pkl`.
+Reading a layer memory-maps the column files and gathers the masked cells by
+position, which avoids the decompression and PyTables query of `pd.read_hdf(where=...)`.
+
+Columns or index levels of Python objects (e.g., strings) cannot be memory-mapped; they are
+pickled into their `.npy` file and loaded in full. A layer whose source file has changed since
+it was converted is converted again when it is read.
+"""
+
+
+import os
+import pickle
+import numpy as np
+import pandas as pd
+
+import luto.settings as settings
+
+from joblib import Parallel, delayed
+
+
+META_FNAME = 'meta.pkl'
+
+
+def get_npy_store_path(h5_path: str) -> str:
+    """
+    Return the npy store directory of the HDF5 file `h5_path`.
+    """
+    return os.path.join(settings.NPY_STORE_DIR, os.path.splitext(os.path.basename(h5_path))[0])
+
+
+def get_source_stat(h5_path: str) -> tuple[int, int]:
+    """
+    Return the (size, modification time in ns) of `h5_path`, which is recorded in the metadata of its npy store copy.
+    """
+    stat = os.stat(h5_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def load_npy_store_meta(store_dir: str) -> dict:
+    """
+    Return the metadata of the npy store layer at `store_dir`.
+    """
+    with open(os.path.join(store_dir, META_FNAME), 'rb') as f:
+        return pickle.load(f)
+
+
+def save_npy_array(path: str, arr: np.ndarray) -> bool:
+    """
+    Save `arr` to `path`; arrays of Python objects are pickled. Returns whether `arr` was pickled.
+    """
+    arr = np.asarray(arr)
+    pickled = arr.dtype.hasobject
+    np.save(path, arr, allow_pickle=pickled)
+    return pickled
+
+
+def write_npy_store(obj: pd.Series | pd.DataFrame, out_dir: str, **meta) -> None:
+    """
+    Write the Series or DataFrame `obj` to `out_dir` as a directory of `.npy` columns and index levels.
+    Extra `meta` entries are added to its metadata.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Remove the metadata first; its existence marks a complete conversion
+    meta_path = os.path.join(out_dir, META_FNAME)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    if isinstance(obj, pd.Series):
+        meta.update(kind='series', name=obj.name, n_cols=1)
+        cols = [obj.to_numpy()]
+    else:
+        meta.update(kind='frame', columns=obj.columns, n_cols=obj.shape[1])
+        cols = [obj.iloc[:, i].to_numpy() for i in range(obj.shape[1])]
+
+    pickled = set()
+    for i, col in enumerate(cols):
+        if save_npy_array(os.path.join(out_dir, f'{i}.npy'), col):
+            pickled.add(f'{i}.npy')
+
+    meta['index_names'] = list(obj.index.names)
+    for i in range(obj.index.nlevels):
+        fname = f'index_{i}.npy'
+        if save_npy_array(os.path.join(out_dir, fname), obj.index.get_level_values(i).to_numpy()):
+            pickled.add(fname)
+    meta['pickled'] = pickled
+
+    with open(meta_path, 'wb') as f:
+        pickle.dump(meta, f)
+
+
+def hdf_to_npy(h5_path: str, out_dir: str) -> None:
+    """
+    Convert the HDF5 table at `h5_path` to a directory of `.npy` columns at `out_dir`.
+    """
+    write_npy_store(pd.read_hdf(h5_path), out_dir, source=get_source_stat(h5_path))
+
+
+def is_npy_store_current(h5_path: str, store_dir: str) -> bool:
+    """
+    Return whether `store_dir` holds a complete conversion of the current version of `h5_path`.
+    """
+    if not os.path.exists(os.path.join(store_dir, META_FNAME)):
+        return False
+    return load_npy_store_meta(store_dir).get('source') == get_source_stat(h5_path)
+
+
+def get_checked_npy_store_path(h5_path: str) -> str:
+    """
+    Return the npy store directory of `h5_path`, converting the layer again if `h5_path` has changed since
+    it was converted. Raises a FileNotFoundError if the layer is not in the npy store.
+    """
+    store_dir = get_npy_store_path(h5_path)
+    if not os.path.exists(os.path.join(store_dir, META_FNAME)):
+        raise FileNotFoundError(
+            f"'{h5_path}' is not in the npy store at '{settings.NPY_STORE_DIR}'. Run "
+            f"`luto.tools.npy_store.convert_hdf_to_npy_store()` to create it, or set INPUT_STORE = 'hdf'."
+        )
+    if not is_npy_store_current(h5_path, store_dir):
+        print(f"\t\t'{h5_path}' has changed since it was converted to the npy store, converting it again...", flush=True)
+        hdf_to_npy(h5_path, store_dir)
+    return store_dir
+
+
+def convert_hdf_to_npy_store(input_dir: str = settings.INPUT_DIR, n_jobs: int = settings.READ_THREADS) -> None:
+    """
+    Convert every cell-level HDF5 table (i.e., one row per land cell, the same length
+    as `lumap.h5`) in `input_dir` to the npy store at `settings.NPY_STORE_DIR`.
+    Layers already converted from the current version of their HDF5 file are skipped.
+    """
+    n_cells = pd.read_hdf(os.path.join(input_dir, 'lumap.h5')).shape[0]
+
+    h5_paths = []
+    for fname in sorted(os.listdir(input_dir)):
+        if not fname.endswith('.h5'):
+            continue
+        fpath = os.path.join(input_dir, fname)
+        with pd.HDFStore(fpath, 'r') as store:
+            key = store.keys()[0]
+            if store.get_storer(key).nrows == n_cells:
+                h5_paths.append(fpath)
+
+    h5_paths = [fpath for fpath in h5_paths if not is_npy_store_current(fpath, get_npy_store_path(fpath))]
+    if not h5_paths:
+        return
+
+    print(f'Converting {len(h5_paths)} cell-level HDF5 layers to {settings.NPY_STORE_DIR}...', flush=True)
+    Parallel(n_jobs=min(n_jobs, len(h5_paths)))(
+        delayed(hdf_to_npy)(fpath, get_npy_store_path(fpath)) for fpath in h5_paths
+    )
+
+
+def read_npy_store_array(store_dir: str, fname: str, meta: dict, cell_idx: np.ndarray | slice) -> np.ndarray:
+    """
+    Read the rows `cell_idx` of the column or index file `fname` of the npy store layer at `store_dir`.
+    """
+    fpath = os.path.join(store_dir, fname)
+    if fname in meta['pickled']:
+        return np.load(fpath, allow_pickle=True)[cell_idx]
+    return np.load(fpath, mmap_mode='r')[cell_idx]
+
+
+def read_npy_store(store_dir: str, cell_idx: np.ndarray | slice) -> pd.Series | pd.DataFrame:
+    """
+    Read the rows `cell_idx` (positions of the kept cells) from the npy store layer at `store_dir`.
+    Returns the same object as `pd.read_hdf(<h5 file>, where=cell_idx)`.
+    """
+    meta = load_npy_store_meta(store_dir)
+
+    levels = [read_npy_store_array(store_dir, f'index_{i}.npy', meta, cell_idx) for i in range(len(meta['index_names']))]
+    if len(levels) == 1:
+        index = pd.Index(levels[0], name=meta['index_names'][0])
+    else:
+        index = pd.MultiIndex.from_arrays(levels, names=meta['index_names'])
+    cols = [read_npy_store_array(store_dir, f'{i}.npy', meta, cell_idx) for i in range(meta['n_cols'])]
+
+    if meta['kind'] == 'series':
+        return pd.Series(cols[0], index=index, name=meta['name'])
+    return pd.DataFrame(dict(enumerate(cols)), index=index).set_axis(meta['columns'], axis=1)
@@ -0,0 +1,128 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""
+Cell membership of the regions of a zoning (e.g., regional adoption zones, river regions
+and drainage divisions).
+
+A `RegionIndex` is built once per zoning from the per-cell region IDs. It holds the cells
+of every region in CSR form (cells sorted by region, plus the offset of each region), the
+total area of every region, and a sparse (region x cell) aggregation matrix, so that
+region-level lookups and sums never need a full pass over the cells.
+"""
+
+
+import numpy as np
+from scipy import sparse
+
+
+class RegionIndex:
+    """
+    Cells, areas and aggregation matrix of the regions of one zoning.
+
+    Parameters
+    ----
+    region_id: 1D array, shape (r,)
+        Region ID of each cell.
+    cell_area: 1D array, shape (r,)
+        Area (ha) of each cell.
+
+    Attributes
+    ----
+    region_id: the region ID of each cell, as given.
+    regions: the unique region IDs, sorted; position `i` is the region's row in `agg_mat`.
+    region_pos: position in `regions` of the region of each cell.
+    cell_order: cell indices grouped by region (ascending within each region).
+    offsets: cells of region `regions[i]` are `cell_order[offsets[i]:offsets[i+1]]`.
+    areas: total area (ha) of each region.
+    agg_mat: sparse (region x cell) matrix of ones; `agg_mat @ arr` sums `arr` by region.
+    """
+
+    def __init__(self, region_id: np.ndarray, cell_area: np.ndarray):
+        self.region_id = np.asarray(region_id)
+        n_cells = self.region_id.shape[0]
+
+        self.regions, region_pos = np.unique(self.region_id, return_inverse=True)
+        self.region_pos = region_pos.reshape(-1)
+        n_regions = self.regions.shape[0]
+
+        self.cell_order = np.argsort(self.region_pos, kind='stable').astype(np.int32)
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(self.region_pos, minlength=n_regions))])
+        self.areas = np.bincount(self.region_pos, weights=cell_area, minlength=n_regions)
+        self.agg_mat = sparse.csr_array(
+            (np.ones(n_cells), (self.region_pos, np.arange(n_cells))),
+            shape=(n_regions, n_cells)
+        )
+        self._pos = {reg: i for i, reg in enumerate(self.regions.tolist())}
+
+    def __len__(self) -> int:
+        return self.regions.shape[0]
+
+    def cells(self, region) -> np.ndarray:
+        """
+        Return the indices (ascending, int32) of the cells in `region`; empty if the region has no cells.
+        """
+        i = self._pos.get(region)
+        if i is None:
+            return np.empty(0, dtype=np.int32)
+        return self.cell_order[self.offsets[i]:self.offsets[i + 1]]
+
+    def area(self, region) -> float:
+        """
+        Return the total area (ha) of `region`; 0 if the region has no cells.
+        """
+        i = self._pos.get(region)
+        return 0.0 if i is None else self.areas[i]
+
+    def aggregate(self, arr: np.ndarray, axis: int = 0, regions=None) -> np.ndarray:
+        """
+        Sum `arr` over the cells of each region along the cell axis `axis`.
+        The result has the cell axis replaced by a region axis of length `len(self)`, or, if `regions`
+        (a list of region IDs) is given, by one entry per region in `regions` (0 for regions without cells).
+        """
+        arr = np.moveaxis(np.asarray(arr), axis, 0)
+        out = self.agg_mat @ arr.reshape(arr.shape[0], -1)
+        if regions is not None:
+            # Regions without cells read the appended row of zeros
+            pos = [self._pos.get(reg, len(self)) for reg in regions]
+            out = np.vstack([out, np.zeros((1, out.shape[1]), dtype=out.dtype)])[pos]
+        return np.moveaxis(out.reshape((out.shape[0],) + arr.shape[1:]), 0, axis)
+
+    def totals(self, arr: np.ndarray) -> dict:
+        """
+        Return {region ID: sum of the 1D per-cell array `arr` over the region's cells}.
+        """
+        return dict(zip(self.regions.tolist(), self.aggregate(arr).tolist()))
+
+    def split(self, cells: np.ndarray) -> dict:
+        """
+        Group the cell indices `cells` (repeats allowed) by region.
+        Returns {region ID: positions in `cells` of the entries in that region, ascending}, for the regions
+        with at least one entry.
+        """
+        cell_pos = self.region_pos[cells]
+        order = np.argsort(cell_pos, kind='stable')
+        counts = np.bincount(cell_pos, minlength=len(self))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        return {
+            self.regions[i].item(): order[offsets[i]:offsets[i + 1]]
+            for i in np.flatnonzero(counts)
+        }
@@ -26,6 +26,7 @@ import numpy as np
 import luto.settings as settings
 
 from affine import Affine
+from scipy import sparse
 from scipy.ndimage import distance_transform_edt
 
 
@@ -182,6 +183,50 @@ def replace_with_nearest(map_: np.ndarray, filler: int) -> np.ndarray:
 
 
 
+def get_linear_interp_weights_1d(coords:np.ndarray, pts:np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the linear interpolation weights of `pts` on the 1D grid `coords` (ascending or descending).
+
+    Returns
+        - idx_lo, idx_hi (np.ndarray): The indices of the bracketing grid points.
+        - w_hi (np.ndarray): The weight of the `idx_hi` point; the weight of `idx_lo` is 1 - w_hi.
+        - inside (np.ndarray): True where the point is within the grid extent.
+    """
+    n = coords.size
+    ascending = coords[0] <= coords[-1]
+    c = coords if ascending else coords[::-1]
+
+    i = np.clip(np.searchsorted(c, pts, side='right') - 1, 0, n - 2)
+    w_hi = (pts - c[i]) / (c[i + 1] - c[i])
+    inside = (pts >= c[0]) & (pts <= c[-1])
+
+    if ascending:
+        return i, i + 1, w_hi, inside
+    return n - 1 - i, n - 2 - i, w_hi, inside
+
+
+def get_bilinear_interp_matrix(x_coords:np.ndarray, y_coords:np.ndarray, x_pts:np.ndarray, y_pts:np.ndarray) -> tuple[sparse.csr_array, np.ndarray]:
+    """
+    Get the sparse (points, y*x) matrix that bilinearly interpolates a 2D (y, x) grid onto the given points,
+    i.e., the same result as `xr.DataArray.interp(x=..., y=..., method='linear')`, but reusable for any number
+    of layers on the same grid.
+
+    Returns
+        - sparse.csr_array: The interpolation matrix; multiply it with a (y*x, layers) array of grid values.
+        - np.ndarray: True for points outside the grid extent (which `xarray` would fill with NaN).
+    """
+    x_lo, x_hi, wx, x_inside = get_linear_interp_weights_1d(np.asarray(x_coords), np.asarray(x_pts))
+    y_lo, y_hi, wy, y_inside = get_linear_interp_weights_1d(np.asarray(y_coords), np.asarray(y_pts))
+
+    nx = len(x_coords)
+    rows = np.tile(np.arange(len(x_pts)), 4)
+    cols = np.concatenate([y_lo * nx + x_lo, y_lo * nx + x_hi, y_hi * nx + x_lo, y_hi * nx + x_hi])
+    vals = np.concatenate([(1 - wy) * (1 - wx), (1 - wy) * wx, wy * (1 - wx), wy * wx])
+
+    interp_mat = sparse.csr_array((vals, (rows, cols)), shape=(len(x_pts), len(y_coords) * nx))
+    return interp_mat, ~(x_inside & y_inside)
+
+
 def write_gtiff(map_:np.ndarray, fname:str, data):
     """
     Write a GeoTiff file with the given map data.
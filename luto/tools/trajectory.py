@@ -0,0 +1,79 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""
+Piecewise-linear target trajectories.
+
+The user-defined targets (e.g., GBF3/4/8 and regional adoption) are given as a table
+with one row per target and one column per key year (e.g., 2010, 2030, 2050, 2100).
+A `Trajectory` is built once per table and evaluates every row for any year in a
+single vectorised operation, extrapolating linearly beyond the first and last key years.
+"""
+
+
+import numpy as np
+
+
+class Trajectory:
+    """
+    Piecewise-linear trajectories of `n` targets through the key years `xs`.
+
+    Evaluating a `Trajectory` at year `yr` gives the same values as
+    `interp1d(xs, ys[i], kind='linear', fill_value='extrapolate')(yr)` for every row `i`.
+
+    Parameters
+    ----
+    xs: 1D array-like, length k
+        Key years of the trajectories, k >= 2.
+    ys: 2D array-like, shape (n, k)
+        Values of each target at the key years.
+    """
+
+    def __init__(self, xs, ys):
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64).reshape(-1, xs.size)
+
+        if xs.ndim != 1 or xs.size < 2:
+            raise ValueError(f"At least two key years are required, got {xs.tolist()}.")
+        if np.unique(xs).size != xs.size:
+            raise ValueError(f"Key years must be unique, got {xs.tolist()}.")
+
+        order = np.argsort(xs)
+        self.xs = xs[order]
+        self.ys = ys[:, order]
+        self.slopes = np.diff(self.ys, axis=1) / np.diff(self.xs)   # (n, k-1)
+
+    def __len__(self) -> int:
+        return self.ys.shape[0]
+
+    def __call__(self, yr: int) -> np.ndarray:
+        """
+        Return the value of each target at year `yr`, shape (n,).
+        """
+        return self.matrix([yr])[0]
+
+    def matrix(self, years=range(2010, 2101)) -> np.ndarray:
+        """
+        Return the values of each target at each of `years`, shape (len(years), n).
+        """
+        years = np.asarray(years, dtype=np.float64)
+        seg = np.clip(np.searchsorted(self.xs, years, side='right') - 1, 0, self.xs.size - 2)
+        return (self.ys[:, seg] + self.slopes[:, seg] * (years - self.xs[seg])).T
@@ -108,6 +108,8 @@ def write_data(data: Data):
 
     # Parallel write the outputs for each year
     num_jobs = min(len(jobs), settings.WRITE_THREADS) if settings.PARALLEL_WRITE else 1   # Use the minimum between jobs_num and threads for parallel writing
+    if num_jobs > 1:
+        ag_quantity.clear_quantity_cache(data)      # Each worker process recalculates its own years; avoid pickling the cached arrays into every job
     Parallel(n_jobs=num_jobs)(jobs)
 
     # Copy the base-year outputs to the path_begin_end_compare
@@ -318,7 +320,7 @@ def write_files_separate(data: Data, yr_cal, path, ammap_separate=False):
 
     # Get the desc2dvar table for agricultural management
     ag_man_maps = [
-        tools.map_desc_to_dvar_index(am, {desc: data.DESC2AGLU[desc] for desc in AG_MANAGEMENTS_TO_LAND_USES[am]}, am_dvar.sum(1)[:, np.newaxis])
+        tools.map_desc_to_dvar_index(am, {desc: j_idx for j_idx, desc in enumerate(AG_MANAGEMENTS_TO_LAND_USES[am])}, am_dvar.sum(1)[:, np.newaxis])
         if ammap_separate else
         tools.map_desc_to_dvar_index('Ag_Mgt', {am: 0}, am_dvar.sum(1)[:, np.newaxis])
         for am, am_dvar in ag_man_rj_dict.items()
@@ -404,26 +406,22 @@ def write_revenue_cost_ag(data: Data, yr_cal, path):
     yr_idx = yr_cal - data.YR_CAL_BASE
     ag_dvar_mrj = data.ag_dvars[yr_cal]
 
-    # Get agricultural revenue/cost for year in mrjs format
-    ag_rev_df_rjms = ag_revenue.get_rev_matrices(data, yr_idx, aggregate=False)
-    ag_cost_df_rjms = ag_cost.get_cost_matrices(data, yr_idx, aggregate=False)
+    # Get agricultural revenue/cost for year by type in smrj format
+    ag_rev_smrj = ag_revenue.get_rev_matrices(data, yr_idx, aggregate=False)
+    ag_cost_smrj = ag_cost.get_cost_matrices(data, yr_idx, aggregate=False)
 
-    # Expand the original df with zero values to convert it to a **mrjs** array
-    ag_rev_rjms = ag_rev_df_rjms.reindex(columns=pd.MultiIndex.from_product(ag_rev_df_rjms.columns.levels), fill_value=0).values.reshape(-1, *ag_rev_df_rjms.columns.levshape)
-    ag_cost_rjms = ag_cost_df_rjms.reindex(columns=pd.MultiIndex.from_product(ag_cost_df_rjms.columns.levels), fill_value=0).values.reshape(-1, *ag_cost_df_rjms.columns.levshape)
-
-    # Multiply the ag_dvar_mrj with the ag_rev_mrj to get the ag_rev_jm
-    ag_rev_jms = np.einsum('mrj,rjms -> jms', ag_dvar_mrj, ag_rev_rjms)
-    ag_cost_jms = np.einsum('mrj,rjms -> jms', ag_dvar_mrj, ag_cost_rjms)
+    # Multiply the ag_dvar_mrj with the ag_rev_smrj to get the ag_rev_jms
+    ag_rev_jms = np.einsum('mrj,smrj -> jms', ag_dvar_mrj, ag_rev_smrj)
+    ag_cost_jms = np.einsum('mrj,smrj -> jms', ag_dvar_mrj, ag_cost_smrj)
 
     # Put the ag_rev_jms into a dataframe
     df_rev = pd.DataFrame(ag_rev_jms.reshape(ag_rev_jms.shape[0],-1),
-                          columns=pd.MultiIndex.from_product(ag_rev_df_rjms.columns.levels[1:]),
-                          index=ag_rev_df_rjms.columns.levels[0])
+                          columns=pd.MultiIndex.from_product([data.LANDMANS, ag_revenue.REV_TYPES]),
+                          index=data.AGRICULTURAL_LANDUSES)
 
     df_cost = pd.DataFrame(ag_cost_jms.reshape(ag_cost_jms.shape[0],-1),
-                           columns=pd.MultiIndex.from_product(ag_cost_df_rjms.columns.levels[1:]),
-                           index=ag_cost_df_rjms.columns.levels[0])
+                           columns=pd.MultiIndex.from_product([data.LANDMANS, ag_cost.COST_TYPES]),
+                           index=data.AGRICULTURAL_LANDUSES)
 
     # Reformat the revenue/cost matrix into a long dataframe
     df_rev = df_rev.melt(ignore_index=False).reset_index()
@@ -463,15 +461,12 @@ def write_revenue_cost_ag_management(data: Data, yr_cal, path):
         if not AG_MANAGEMENTS[am]:
             continue
 
-        # Get the land use codes for the agricultural management
-        am_code = [data.DESC2AGLU[desc] for desc in am_desc]
-
         # Get the revenue/cost matrix for the agricultural management
         am_rev = np.nan_to_num(am_revenue_mat[am])  # Replace NaNs with 0
         am_cost = np.nan_to_num(am_cost_mat[am])  # Replace NaNs with 0
 
         # Get the decision variable for each agricultural management
-        am_dvar = data.ag_man_dvars[yr_cal][am][:, :, am_code]
+        am_dvar = data.ag_man_dvars[yr_cal][am]
 
         # Multiply the decision variable by revenue matrix
         am_rev_yr = np.einsum('mrj,mrj->jm', am_dvar, am_rev)
@@ -605,7 +600,7 @@ def write_cost_transition(data: Data, yr_cal, path, yr_cal_sim_pre=None):
     else:
         ag_t_mrj = ag_transitions.get_transition_matrices_from_base_year(data, yr_idx, yr_cal_sim_pre, separate=True)
         non_ag_transitions_cost_mat = non_ag_transitions.get_from_ag_transition_matrix(
-            data,yr_idx, yr_cal_sim_pre, data.lumaps[yr_cal_sim_pre], data.lmmaps[yr_cal_sim_pre], ag_t_mrj, separate=True
+            data,yr_idx, data.lumaps[yr_cal_sim_pre], data.lmmaps[yr_cal_sim_pre], ag_t_mrj, separate=True
         )
     
     # Get all land use decision variables
@@ -761,7 +756,7 @@ def write_dvar_area(data: Data, yr_cal, path):
                                 index=pd.MultiIndex.from_product([[yr_cal],
                                                                 [am],
                                                                 data.LANDMANS,
-                                                                data.AGRICULTURAL_LANDUSES],
+                                                                AG_MANAGEMENTS_TO_LAND_USES[am]],
                                                                 names=['Year', 'Type', 'Water_supply','Land-use']),
                                 columns=['Area (ha)']).reset_index()
         am_areas.append(df_am_area)
@@ -932,13 +927,9 @@ def write_water(data: Data, yr_cal, path):
     w_net_yield_limits = ag_water.get_water_net_yield_limit_values(data)
 
 
-    # Loop through specified water regions
-    df_water_seperate_dfs = []
+    # Get the water yield limits and public land water yield of each region
     df_water_limits_and_public_land_dfs = []
-    for region, (reg_name, limit_hist_level, ind) in w_net_yield_limits.items():
-        
-
-        # Get the water yield limits and public land water yield
+    for region, (reg_name, limit_hist_level) in w_net_yield_limits.items():
         water_limit_pub = pd.DataFrame({
             ('WNY LIMIT','HIST (ML)'):[limit_hist_level],
             ('WNY Pubulic','HIST (ML)'):[wny_outside_luto_study_area_base_yr[region]],
@@ -948,43 +939,44 @@ def write_water(data: Data, yr_cal, path):
         water_limit_pub.columns = ['Type','CCI Existence','REGION','Value (ML)']
         water_limit_pub = water_limit_pub[['REGION','Type','CCI Existence','Value (ML)']]
         water_limit_pub.insert(0, 'Year', yr_cal)
+        df_water_limits_and_public_land_dfs.append(water_limit_pub)
+    
+    
+    # Calculate water yield of all regions at once and save to dataframe
+    region_index = ag_water.get_water_region_index(data)
+    regions = list(w_net_yield_limits.keys())
+    df_region = tools.calc_water(
+        data,
+        region_index,
+        regions,
+        ag_w_mrj_base_yr,
+        non_ag_w_rk_base_yr,
+        ag_man_w_mrj,
+        data.ag_dvars[yr_cal],
+        data.non_ag_dvars[yr_cal],
+        data.ag_man_dvars[yr_cal])
     
-        
-        # Calculate water yield for region and save to dataframe
-        df_region = tools.calc_water(
-            data,
-            ind,
-            ag_w_mrj_base_yr,
-            non_ag_w_rk_base_yr,
-            ag_man_w_mrj,
-            data.ag_dvars[yr_cal],
-            data.non_ag_dvars[yr_cal],
-            data.ag_man_dvars[yr_cal])
-        
 
-        # Fix the land-use to the base year
-        # so that we can calculate water-yield only under climate change impact.
-        df_region_CCI = tools.calc_water(
-            data,
-            ind,
-            ag_w_mrj_CCI,
-            non_ag_w_rk_CCI,
-            ag_man_w_mrj,
-            data.ag_dvars[yr_cal],
-            data.non_ag_dvars[yr_cal],
-            data.ag_man_dvars[yr_cal])
-
-        # Calculate the water yield under different impacts
-        df_region['Without CCI'] = df_region['Water Net Yield (ML)']
-        df_region['With CCI'] = df_region_CCI['Water Net Yield (ML)']
-        
-        # Add the region name and year to the dataframe
-        df_region.insert(0, 'region', region_dict[region])
-        df_region.insert(0, 'Year', yr_cal)
-        
-        # Add dfs to list
-        df_water_seperate_dfs.append(df_region)
-        df_water_limits_and_public_land_dfs.append(water_limit_pub)
+    # Fix the land-use to the base year
+    # so that we can calculate water-yield only under climate change impact.
+    df_region_CCI = tools.calc_water(
+        data,
+        region_index,
+        regions,
+        ag_w_mrj_CCI,
+        non_ag_w_rk_CCI,
+        ag_man_w_mrj,
+        data.ag_dvars[yr_cal],
+        data.non_ag_dvars[yr_cal],
+        data.ag_man_dvars[yr_cal])
+
+    # Calculate the water yield under different impacts
+    df_region['Without CCI'] = df_region['Water Net Yield (ML)']
+    df_region['With CCI'] = df_region_CCI['Water Net Yield (ML)']
+    
+    # Replace the region IDs by names and add the year to the dataframe
+    df_region['region'] = df_region['region'].map(region_dict)
+    df_region.insert(0, 'Year', yr_cal)
 
     
     # Write the water limits and public land water yield to CSV
@@ -992,8 +984,7 @@ def write_water(data: Data, yr_cal, path):
     df_water_limits_and_public_land.to_csv( os.path.join(path, f'water_yield_limits_and_public_land_{yr_cal}.csv'), index=False)
 
     # Write the separate water use to CSV
-    df_water_seperate = pd.concat(df_water_seperate_dfs)
-    df_water_seperate = df_water_seperate.melt(
+    df_water_seperate = df_region.melt(
         id_vars=['Year','region','Landuse Type','Landuse','Water_supply'],
         value_vars=['Without CCI', 'With CCI'],
         var_name='Climate Change existence',
@@ -1659,7 +1650,7 @@ def write_ghg(data: Data, yr_cal, path):
     if yr_cal >= data.YR_CAL_BASE + 1:
         ghg_emissions = data.prod_data[yr_cal]['GHG Emissions']
     else:
-        ghg_emissions = (ag_ghg.get_ghg_matrices(data, yr_idx, aggregate=True) * data.ag_dvars[settings.SIM_YERAS[0]]).sum()
+        ghg_emissions = (ag_ghg.get_ghg_matrices(data, yr_idx) * data.ag_dvars[settings.SIM_YERAS[0]]).sum()
 
     # Save GHG emissions to file
     df = pd.DataFrame({
@@ -1691,29 +1682,20 @@ def write_ghg_separate(data: Data, yr_cal, path):
     # Get greenhouse gas emissions from agricultural landuse #
     # -------------------------------------------------------#
 
-    # Get ghg array
-    ag_g_mrj = ag_ghg.get_ghg_matrices(data, yr_idx, aggregate=True)
-    # Get the ghg_df
-    ag_g_df = ag_ghg.get_ghg_matrices(data, yr_idx, aggregate=False)
-
-    GHG_cols = []
-    for col in ag_g_df.columns:
-        # Get the index of each column
-        s,m,j = [ag_g_df.columns.levels[i].get_loc(col[i]) for i in range(len(col))]
-        # Get the GHG emissions
-        ghg_col = np.nan_to_num(ag_g_df.loc[slice(None), col])
-        # Get the dvar coresponding to the (m,j) dimension
-        dvar = data.ag_dvars[yr_cal][m,:,j]
-        # Multiply the GHG emissions by the dvar
-        ghg_e = (ghg_col * dvar).sum()
-        # Create a dataframe with the GHG emissions
-        ghg_col = pd.DataFrame([ghg_e], index=pd.MultiIndex.from_tuples([col]))
-
-        GHG_cols.append(ghg_col)
-
-    # Concatenate the GHG emissions
-    ghg_df = pd.concat(GHG_cols).reset_index()
-    ghg_df.columns = ['Source','Water_supply','Landuse','GHG Emissions (t)']
+    # Get the GHG emissions multiplied by the dvar and summed over cells {ghg_smj: s -> each GHG source, m -> lm, j -> lu}
+    ag_g_mrj, ghg_sources, ghg_smj = ag_ghg.get_ghg_by_source(data, yr_idx, data.ag_dvars[yr_cal])
+
+    # Get the GHG emissions of each (source, lm, lu) combination that has the source
+    source2idx = {source: s for s, source in enumerate(ghg_sources)}
+    ghg_df = pd.DataFrame(
+        [
+            (source, lm, lu, ghg_smj[source2idx[source], m, j])
+            for m, lm in enumerate(data.LANDMANS)
+            for j, lu in enumerate(data.AGRICULTURAL_LANDUSES)
+            for source in ag_ghg.get_ghg_sources(data, lu, lm)
+        ],
+        columns=['Source','Water_supply','Landuse','GHG Emissions (t)']
+    )
 
     # Pivot the dataframe
     ghg_df = ghg_df.pivot(index='Landuse', columns=['Water_supply','Source'], values='GHG Emissions (t)')
@@ -1806,11 +1788,8 @@ def write_ghg_separate(data: Data, yr_cal, path):
     am_dfs = []
     for am, am_lus in AG_MANAGEMENTS_TO_LAND_USES.items():
 
-        # Get the lucc_code for this the agricultural management in this loop
-        am_j = np.array([data.DESC2AGLU[lu] for lu in am_lus])
-
         # Get the GHG emission from agricultural management, then reshape it to starte with row (r) dimension
-        am_ghg_mrj = ag_man_g_mrj[am] * data.ag_man_dvars[yr_cal][am][:, :, am_j]
+        am_ghg_mrj = ag_man_g_mrj[am] * data.ag_man_dvars[yr_cal][am]
         am_ghg_mj = np.einsum('mrj -> mj', am_ghg_mrj)
 
         am_ghg_df = pd.DataFrame(am_ghg_mj.flatten(), index=pd.MultiIndex.from_product([data.LANDMANS, am_lus])).reset_index()
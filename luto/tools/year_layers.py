@@ -0,0 +1,86 @@
+# Copyright 2025 Bryan, B.A., Williams, N., Archibald, C.L., de Haan, F., Wang, J.,
+# van Schoten, N., Hadjikakou, M., Sanson, J.,  Zyngier, R., Marcos-Martinez, R.,
+# Navarro, J.,  Gao, L., Aghighi, H., Armstrong, T., Bohl, H., Jaffe, P., Khan, M.S.,
+# Moallemi, E.A., Nazari, A., Pan, X., Steyl, D., and Thiruvady, D.R.
+#
+# This file is part of LUTO2 - Version 2 of the Australian Land-Use Trade-Offs model
+#
+# LUTO2 is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# LUTO2 is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# LUTO2. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Year-major, memory-mapped copy of the cell-level layers with one column per year (e.g., the
+projected water yields `water_yield_ssp<SSP>_2010-2100_<dr|sr>_ml_ha.h5`).
+
+The masked cells of such a layer are written once to `<DATA_CACHE_DIR>/year_layers/` as a
+(year, cell) `.npy` file, named by the layer and a hash of the source file metadata and the
+kept cells. The file is then opened with `np.load(mmap_mode='r')`, so indexing it by year
+index reads only that year's cells from disk instead of holding every year in memory.
+"""
+
+
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+
+import luto.settings as settings
+
+from luto.tools.npy_store import get_checked_npy_store_path, load_npy_store_meta, read_npy_store_array
+
+
+def get_year_layer_path(fpath: str, cell_idx: np.ndarray) -> str:
+    """
+    Return the year-major copy of the layer `fpath` restricted to the cells `cell_idx`.
+    """
+    stat = os.stat(fpath)
+    sha = hashlib.sha256(f'{stat.st_size}|{stat.st_mtime_ns}|'.encode())
+    sha.update(np.ascontiguousarray(cell_idx, dtype=np.int64).tobytes())
+    fname = os.path.splitext(os.path.basename(fpath))[0]
+    return os.path.join(settings.DATA_CACHE_DIR, 'year_layers', f'{fname}.{sha.hexdigest()[:16]}.npy')
+
+
+def write_year_layer(fpath: str, cell_idx: np.ndarray, out_path: str) -> None:
+    """
+    Write the cells `cell_idx` of the layer `fpath` to `out_path` as a (year, cell) float64 array,
+    one year (column) at a time. Reads from the npy store if `settings.INPUT_STORE` is 'npy'.
+    """
+    store_dir = get_checked_npy_store_path(fpath) if settings.INPUT_STORE == 'npy' else None
+    if store_dir is not None:
+        meta = load_npy_store_meta(store_dir)
+        n_years = meta['n_cols']
+        get_year = lambda i: read_npy_store_array(store_dir, f'{i}.npy', meta, cell_idx)
+    else:
+        df = pd.read_hdf(fpath, where=cell_idx)
+        n_years = df.shape[1]
+        get_year = lambda i: df.iloc[:, i].to_numpy()
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = f'{out_path}.tmp{os.getpid()}.npy'
+    out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float64, shape=(n_years, len(cell_idx)))
+    for i in range(n_years):
+        out[i] = get_year(i)
+    out.flush()
+    del out
+    os.replace(tmp_path, out_path)
+
+
+def read_year_layer(fpath: str, cell_idx: np.ndarray) -> np.ndarray:
+    """
+    Return the cells `cell_idx` of the layer `fpath` as a read-only, memory-mapped (year, cell) array,
+    i.e., the same values as `pd.read_hdf(fpath, where=cell_idx).T.values`.
+    """
+    out_path = get_year_layer_path(fpath, cell_idx)
+    if not os.path.exists(out_path):
+        write_year_layer(fpath, cell_idx, out_path)
+    return np.load(out_path, mmap_mode='r')